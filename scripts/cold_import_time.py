@@ -0,0 +1,34 @@
+"""Measure the cold start time of `import omnipy` in fresh interpreter processes.
+
+Usage: python scripts/cold_import_time.py [NUM_RUNS] [STATEMENT]
+
+Prints the median wall-clock time of running the import statement (default: `import omnipy`),
+with the startup time of a bare interpreter subtracted. See also `import_performance.sh` for a
+per-module breakdown of the import time. The cold import time is also recorded in the benchmark
+history by `tests/benchmarks/test_bench_import.py`.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+
+def _median_run_time(statement: str, num_runs: int) -> float:
+    run_times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True)
+        run_times.append(time.perf_counter() - start)
+    return statistics.median(run_times)
+
+
+def cold_import_time(statement: str = 'import omnipy', num_runs: int = 5) -> float:
+    return _median_run_time(statement, num_runs) - _median_run_time('pass', num_runs)
+
+
+if __name__ == '__main__':
+    num_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    statement = sys.argv[2] if len(sys.argv) > 2 else 'import omnipy'
+    print(f'{statement!r}: {cold_import_time(statement, num_runs) * 1000:.1f} ms '
+          f'(median of {num_runs} runs)')
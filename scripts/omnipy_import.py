@@ -1,5 +1,6 @@
 def omnipy_import() -> None:
-    import omnipy._dynamic_all  # noqa: F401
+    from omnipy._dynamic_all import add_dynamic_exports
+    add_dynamic_exports()
 
 
 omnipy_import()
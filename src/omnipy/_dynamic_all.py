@@ -1,12 +1,8 @@
 """Experimental helpers for building Omnipy's dynamic public export list."""
 
+import ast
 import os
 from types import ModuleType
-from typing import TYPE_CHECKING
-
-import omnipy
-from omnipy.util.literal_enum import LiteralEnum
-from omnipy.util.pydantic import lenient_isinstance, lenient_issubclass
 
 # TODO: Finish implementation of dynamic __all__ generation. Possibly useful together with Poe the
 #       Poet (https://poethepoet.natn.io/poetry_plugin.html) for generating a fixed __all__ list as
@@ -77,47 +73,44 @@ _exclude_attrs: set[str] = {
 
 _all_modules: dict[str, ModuleType] = {}
 
-if not __all__:
-    from omnipy.components.raw.utils import RegexMatch
-    from omnipy.components.tables.models import PydanticRecordModel
+
+def lazy_imports_from_type_checking_block(init_file_path: str) -> dict[str, str]:
+    """Map the names imported in the top-level ``TYPE_CHECKING`` block of a module to the modules
+    they are imported from.
+
+    The public names of ``omnipy/__init__.py`` are imported there for type checkers only, and are
+    served lazily at runtime from the resulting table. Only the standard library is imported here,
+    so that the table can be derived without importing the rest of Omnipy.
+    """
+    with open(init_file_path) as init_file:
+        tree = ast.parse(init_file.read(), filename=init_file_path)
+
+    lazy_imports: dict[str, str] = {}
+    for node in tree.body:
+        if isinstance(node, ast.If) \
+                and isinstance(node.test, ast.Name) and node.test.id == 'TYPE_CHECKING':
+            for stmt in node.body:
+                if isinstance(stmt, ast.ImportFrom) and stmt.module is not None:
+                    for alias in stmt.names:
+                        lazy_imports[alias.asname or alias.name] = stmt.module
+    return lazy_imports
+
+
+def add_dynamic_exports() -> None:
+    """Import all Omnipy modules and add the public models, datasets, jobs and literal enums
+    that are missing from the hardcoded export lists."""
+    global __all__, _all_element_names
+
+    if __all__:
+        return
+
+    import omnipy
     from omnipy.compute._job import JobTemplateMixin
-    from omnipy.compute.flow import (DagFlow,
-                                     DagFlowTemplate,
-                                     FuncFlow,
-                                     FuncFlowTemplate,
-                                     LinearFlow,
-                                     LinearFlowTemplate)
-    from omnipy.compute.helpers import Void
-    from omnipy.compute.task import Task, TaskTemplate
-    from omnipy.data.dataset import Dataset, is_dataset_instance, is_dataset_subclass
-    from omnipy.data.model import (is_model_instance,
-                                   is_model_subclass,
-                                   is_non_omnipy_pydantic_model,
-                                   is_pure_pydantic_model,
-                                   Model)
-    from omnipy.data.multi import MultiModelDataset
-    from omnipy.data.param import (bind_adjust_dataset_func,
-                                   bind_adjust_model_func,
-                                   params_dataclass,
-                                   ParamsBase)
-    from omnipy.hub.runtime import runtime
-    from omnipy.hub.ui import setup_jupyter_ui
-    from omnipy.shared.enums.data import BackoffStrategy
-    from omnipy.shared.enums.job import (ConfigOutputStorageProtocolOptions,
-                                         ConfigPersistOutputsOptions,
-                                         ConfigRestoreOutputsOptions,
-                                         EngineChoice,
-                                         OutputStorageProtocolOptions,
-                                         PersistOutputsOptions,
-                                         RestoreOutputsOptions,
-                                         RunState)
-    from omnipy.util._placeholder import F, m, x
-    from omnipy.util.contexts import print_exception
+    from omnipy.data.dataset import Dataset
+    from omnipy.data.model import Model
     from omnipy.util.helpers import recursive_module_import_new
-    from omnipy.util.literal_enum_generator import generate_literal_enum_code
-
-    if TYPE_CHECKING:
-        from omnipy.data._typing.mimic_models import PlainModel
+    from omnipy.util.literal_enum import LiteralEnum
+    from omnipy.util.pydantic import lenient_isinstance, lenient_issubclass
 
     __all__ = [
         'DagFlow',
@@ -164,6 +157,9 @@ if not __all__:
     ]
     _all_element_names = set(__all__)
 
+    # `PlainModel` is only defined for type checkers
+    globals().update({name: getattr(omnipy, name) for name in __all__ if name != 'PlainModel'})
+
     _omnipy_all = set(omnipy.__all__)
 
     recursive_module_import_new([ROOT_DIR], _all_modules, _exclude_modules)
@@ -187,5 +183,3 @@ if not __all__:
     print(f'Missing elements in omnipy.__init__(): {_all_element_names - _omnipy_all}')
     print(f'Missing elements in hardcoded __all__ in _dynamic_all(): '
           f'{_omnipy_all - _all_element_names}')
-
-    del JobTemplateMixin
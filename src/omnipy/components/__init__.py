@@ -7,7 +7,9 @@ def register_serializers(registry: IsSerializerRegistry):
     """Register the built-in component serializers with a registry."""
 
     from .json.serializers import JsonDatasetToTarFileSerializer
-    from .pandas.serializers import PandasDatasetToTarFileSerializer
+    from .pandas.serializers import (is_pyarrow_available,
+                                     PandasDatasetToParquetTarFileSerializer,
+                                     PandasDatasetToTarFileSerializer)
     from .raw.serializers import (RawBytesDatasetToTarFileSerializer,
                                   RawStrDatasetToTarFileSerializer)
 
@@ -16,6 +18,12 @@ def register_serializers(registry: IsSerializerRegistry):
     registry.register(JsonDatasetToTarFileSerializer)
     registry.register(PandasDatasetToTarFileSerializer)
 
+    # Registered after the CSV serializer, which is thus used for persisting pandas datasets
+    # unless the `job.output_storage.prefer_parquet` config entry is set. Parquet archives are
+    # loaded based on their file suffix.
+    if is_pyarrow_available():
+        registry.register(PandasDatasetToParquetTarFileSerializer)
+
 
 def get_serializer_registry():
     """Return the active serializer registry, creating it on demand if needed."""
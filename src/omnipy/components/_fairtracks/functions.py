@@ -1,49 +1,260 @@
-"""Internal FAIRtracks API helpers for ENCODE and GDC integrations."""
+"""Internal FAIRtracks API helpers for ENCODE and GDC integrations.
 
-import requests
+Records are fetched page by page through the retrying, rate-limited HTTP clients of the remote
+component. The first page of an endpoint announces the total number of records, after which
+the remaining pages are requested concurrently by a bounded number of workers, so that the
+import speed is bounded by the rate limit configured for the API host rather than by the latency
+of each request. Records of completed pages are appended to the result in order as soon as all
+preceding pages have arrived, so that only pages arriving out of order are kept aside. Completed
+pages can be saved to a progress directory, from which an interrupted import is resumed.
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from omnipy.components.remote.models import HttpUrlModel
+from omnipy.shared.typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from omnipy.components.remote.lazy_import import RetryClient
 
 ENCODE_HEADERS = {'accept': 'application/json'}
 ENCODE_BASE_URL = 'https://www.encodeproject.org/'
 GDC_BASE_URL = 'https://api.gdc.cancer.gov/'
 
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_CONCURRENT_PAGES = 10
+
+JsonRecord = dict[str, Any]
+
+
+@dataclass
+class PagedApi(ABC):
+    """Pagination scheme of a JSON API with offset-based paging.
+
+    Args:
+        base_url: Base URL of the API.
+        headers: Headers to send with each request.
+    """
+
+    base_url: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @abstractmethod
+    def get_page_url(self, endpoint: str, offset: int, size: int) -> HttpUrlModel:
+        """Return the URL of a page of records from an endpoint."""
+
+        ...
+
+    @abstractmethod
+    def parse_page(self, url: HttpUrlModel, status: int,
+                   content: Any) -> tuple[list[JsonRecord], int]:
+        """Return the records of a page together with the total number of records.
+
+        Raises:
+            ConnectionError: If the response signals an error.
+        """
+
+        ...
+
+
+@dataclass
+class EncodeApi(PagedApi):
+    """Paging through the search API of the ENCODE portal, with object types as endpoints."""
+
+    base_url: str = ENCODE_BASE_URL
+    headers: dict[str, str] = field(default_factory=lambda: dict(ENCODE_HEADERS))
+    frame: str = 'object'
+
+    def get_page_url(self, endpoint: str, offset: int, size: int) -> HttpUrlModel:
+        url = HttpUrlModel(self.base_url)
+        url.path // 'search'
+        url.query['type'] = endpoint
+        url.query['format'] = 'json'
+        url.query['frame'] = self.frame
+        url.query['from'] = str(offset)
+        url.query['limit'] = str(size)
+        return url
+
+    def parse_page(self, url: HttpUrlModel, status: int,
+                   content: Any) -> tuple[list[JsonRecord], int]:
+        # The ENCODE portal responds with '404 Not Found' for searches without results
+        if status == 404 and isinstance(content, dict) and '@graph' in content:
+            return [], content.get('total', 0)
+
+        if status != 200 or not isinstance(content, dict) \
+                or content.get('notification') != 'Success':
+            raise ConnectionError(f'Failed to get ENCODE records. HTTP status: {status}. '
+                                  f'URL: {url}')
+        return content['@graph'], content['total']
+
+
+@dataclass
+class GdcApi(PagedApi):
+    """Paging through the collection endpoints of the GDC API, e.g. 'projects' or 'cases'."""
+
+    base_url: str = GDC_BASE_URL
+
+    def get_page_url(self, endpoint: str, offset: int, size: int) -> HttpUrlModel:
+        url = HttpUrlModel(self.base_url)
+        url.path // endpoint
+        url.query['format'] = 'json'
+        url.query['from'] = str(offset)
+        url.query['size'] = str(size)
+        if endpoint == 'cases':
+            url.query['expand'] = 'project'
+        return url
+
+    def parse_page(self, url: HttpUrlModel, status: int,
+                   content: Any) -> tuple[list[JsonRecord], int]:
+        if status != 200 or not isinstance(content, dict):
+            raise ConnectionError(f'Failed to get GDC records. HTTP status: {status}. '
+                                  f'URL: {url}')
+        if content.get('warnings'):
+            raise ConnectionError(f'GDC API responded with warnings: {content["warnings"]}. '
+                                  f'URL: {url}')
+        return content['data']['hits'], content['data']['pagination']['total']
+
+
+class ImportProgress:
+    """Pages of records that have been fetched so far, saved as JSON files in a directory.
+
+    Each endpoint gets a subdirectory with one file per page, named by the offset and size of
+    the page, and a file with the total number of records announced by the API.
+    """
+    def __init__(self, dir_path: str | Path) -> None:
+        self._dir_path = Path(dir_path)
+
+    def load_total(self, endpoint: str) -> int | None:
+        """Return the saved total number of records for an endpoint, if any."""
+
+        content = self._load(self._get_endpoint_dir_path(endpoint) / 'total.json')
+        return content if isinstance(content, int) else None
+
+    def save_total(self, endpoint: str, total: int) -> None:
+        """Save the total number of records for an endpoint."""
+
+        self._save(self._get_endpoint_dir_path(endpoint) / 'total.json', total)
+
+    def load_page(self, endpoint: str, offset: int, size: int) -> list[JsonRecord] | None:
+        """Return the saved records of a page, or ``None`` if the page has not been fetched."""
+
+        content = self._load(self._get_page_file_path(endpoint, offset, size))
+        return content if isinstance(content, list) else None
+
+    def save_page(self, endpoint: str, offset: int, size: int, records: list[JsonRecord]) -> None:
+        """Save the records of a page."""
+
+        self._save(self._get_page_file_path(endpoint, offset, size), records)
+
+    def _get_endpoint_dir_path(self, endpoint: str) -> Path:
+        return self._dir_path / endpoint.replace('/', '_')
+
+    def _get_page_file_path(self, endpoint: str, offset: int, size: int) -> Path:
+        return self._get_endpoint_dir_path(endpoint) / f'page_{offset:09d}_{size}.json'
+
+    @staticmethod
+    def _load(file_path: Path) -> Any:
+        try:
+            return json.loads(file_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save(file_path: Path, content: Any) -> None:
+        # Writing to a temporary file first, so that an interruption never leaves a partial page
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file_path = file_path.with_name(file_path.name + '.tmp')
+        tmp_file_path.write_text(json.dumps(content), encoding='utf-8')
+        os.replace(tmp_file_path, file_path)
+
+
+async def fetch_all_records(
+    api: PagedApi,
+    endpoint: str,
+    retry_client: 'RetryClient',
+    max_item_count: int | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    progress: ImportProgress | None = None,
+    max_concurrent_pages: int = DEFAULT_MAX_CONCURRENT_PAGES,
+) -> list[JsonRecord]:
+    """Fetch all records from a paged API endpoint, with all pages but the first concurrently.
+
+    Args:
+        api: Pagination scheme of the API.
+        endpoint: Endpoint to fetch records from.
+        retry_client: Retrying, rate-limited client used for the requests.
+        max_item_count: Maximum number of records to fetch. All records if ``None``.
+        page_size: Number of records per request.
+        progress: Optional saved progress. Pages found here are not requested again, while
+            newly fetched pages are saved as soon as they arrive.
+        max_concurrent_pages: Maximum number of pages requested concurrently.
+
+    Returns:
+        list[JsonRecord]: Records in the order provided by the API.
+
+    Raises:
+        ConnectionError: If a page could not be fetched.
+    """
+    if max_item_count is not None:
+        page_size = min(page_size, max_item_count)
+
+    async def _get_page(offset: int) -> tuple[list[JsonRecord], int | None]:
+        if progress is not None:
+            saved_page = progress.load_page(endpoint, offset, page_size)
+            if saved_page is not None:
+                return saved_page, progress.load_total(endpoint)
+
+        records, total = await _fetch_page(api, endpoint, retry_client, offset, page_size)
+        if progress is not None:
+            # Saving the total first, so that it is always available for saved pages
+            progress.save_total(endpoint, total)
+            progress.save_page(endpoint, offset, page_size, records)
+        return records, total
+
+    first_page, total = await _get_page(0)
+    if total is None:
+        first_page, total = await _fetch_page(api, endpoint, retry_client, 0, page_size)
+
+    num_items = total if max_item_count is None else min(total, max_item_count)
+    all_records = first_page[:num_items]
+    offsets = range(page_size, num_items, page_size)
+    pending_offsets = iter(offsets)
+    out_of_order_pages: dict[int, list[JsonRecord]] = {}
+    next_offset = page_size
+
+    async def _get_pages() -> None:
+        nonlocal next_offset
+
+        # Offsets are handed out in order, one page at a time per worker
+        for offset in pending_offsets:
+            records, _ = await _get_page(offset)
+            out_of_order_pages[offset] = records
+            while next_offset in out_of_order_pages:
+                all_records.extend(out_of_order_pages.pop(next_offset))
+                next_offset += page_size
+
+    await asyncio.gather(*(_get_pages() for _ in range(min(max_concurrent_pages, len(offsets)))))
+    del all_records[num_items:]
+    return all_records
+
 
-# ['experiments', 'biosample']
-def encode_api(endpoint='experiments', id=None, limit=None, format='json', frame='object'):
-    """Fetch records from the ENCODE API for an endpoint or object id."""
-
-    api_url = ENCODE_BASE_URL + endpoint + '/' + (id if id else '@@listing') + '?' + '&'.join(
-        (['limit=' + limit] if limit else []) + (['format=' + format] if format else [])
-        + (['frame=' + frame] if frame else []))
-    print(api_url)
-    response = requests.get(api_url, headers=ENCODE_HEADERS)
-    if response.status_code == 200:
-        results = response.json()
-        if results['notification'] == 'Success':
-            graph = results['@graph']
-            return graph
-    else:
-        print('No result found')
-
-
-# ['projects', 'cases', 'files', 'annotations'], starting_point='0', size='25'
-def gdc_api(object_type='projects', starting_point=None, size=None):
-    """Fetch records from a GDC collection endpoint."""
-
-    api_url = GDC_BASE_URL + object_type + '/' + '?' + '&'.join(
-        (['from=' + starting_point] if starting_point else []) + (['size=' + size] if size else [])
-        + ([+ 'project'] if object_type == 'cases' else []))
-    print(api_url)
-    response = requests.get(api_url)
-    if response.status_code != 200:
-        print('No result found')
-        return None
-
-    results = response.json()
-
-    if len(results['warnings']) > 0:
-        print('The following warnings have been encountered:')
-        print(results['warnings'])
-        return None
-
-    hits = (results['data']['hits'])
-    return hits
+async def _fetch_page(
+    api: PagedApi,
+    endpoint: str,
+    retry_client: 'RetryClient',
+    offset: int,
+    size: int,
+) -> tuple[list[JsonRecord], int]:
+    url = api.get_page_url(endpoint, offset, size)
+    async with retry_client.get(str(url), headers=api.headers) as response:
+        try:
+            content = await response.json(content_type=None)
+        except ValueError:
+            content = None
+        return api.parse_page(url, response.status, content)
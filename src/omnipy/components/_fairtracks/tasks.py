@@ -1,24 +1,145 @@
-"""Internal FAIRtracks task templates for importing ENCODE datasets."""
+"""Internal FAIRtracks task templates for importing ENCODE and GDC datasets."""
 
+import asyncio
 from collections.abc import Iterable
+from pathlib import Path
 
 from omnipy.compute.task import TaskTemplate
+from omnipy.shared.typing import TYPE_CHECKING
 import omnipy.util.pydantic as pyd
 
 from ..json.datasets import JsonDataset
-from .functions import encode_api
+from ..remote.models import HttpUrlModel
+from ..remote.session_pool import retry_client_for_host
+from .functions import (DEFAULT_MAX_CONCURRENT_PAGES,
+                        DEFAULT_PAGE_SIZE,
+                        ENCODE_BASE_URL,
+                        EncodeApi,
+                        fetch_all_records,
+                        GDC_BASE_URL,
+                        GdcApi,
+                        ImportProgress,
+                        PagedApi)
+
+if TYPE_CHECKING:
+    from ..remote.lazy_import import RetryClient
+
+
+@TaskTemplate()
+async def import_dataset_from_encode(
+    endpoints: Iterable[pyd.constr(min_length=1)],
+    max_data_item_count: pyd.PositiveInt | None = None,
+    page_size: pyd.PositiveInt = DEFAULT_PAGE_SIZE,
+    max_concurrent_pages: pyd.PositiveInt = DEFAULT_MAX_CONCURRENT_PAGES,
+    progress_dir_path: str | Path | None = None,
+    base_url: str = ENCODE_BASE_URL,
+    retry_client: 'RetryClient | None' = None,
+) -> JsonDataset:
+    """Import records of ENCODE object types, e.g. 'Experiment', into a JSON dataset.
+
+    Endpoints are fetched concurrently, page by page. With ``progress_dir_path``, fetched pages
+    are saved as they arrive, and a repeated import with the same arguments continues where an
+    interrupted import stopped.
+
+    Args:
+        endpoints: ENCODE object types to import, e.g. 'Experiment'.
+        max_data_item_count: Maximum number of records to import per endpoint. All records are
+            imported if ``None``.
+        page_size: Number of records requested per page.
+        max_concurrent_pages: Maximum number of pages requested concurrently per endpoint.
+        progress_dir_path: Optional directory where fetched pages are saved, to resume an
+            interrupted import from.
+        base_url: Base URL of the ENCODE portal.
+        retry_client: Optional retry-enabled client used to make the requests. Defaults to a
+            client following the request policy configured for the API host.
+
+    Returns:
+        A JSON dataset with a data item per endpoint, containing the list of its records.
+    """
+
+    return await _import_dataset(
+        EncodeApi(base_url=base_url),
+        endpoints,
+        max_data_item_count,
+        page_size,
+        max_concurrent_pages,
+        progress_dir_path,
+        retry_client,
+    )
 
 
 @TaskTemplate()
-def import_dataset_from_encode(endpoints: Iterable[pyd.constr(min_length=1)],
-                               max_data_item_count: pyd.PositiveInt) -> JsonDataset:
-    """Import ENCODE endpoint payloads into a JSON dataset."""
+async def import_dataset_from_gdc(
+    endpoints: Iterable[pyd.constr(min_length=1)],
+    max_data_item_count: pyd.PositiveInt | None = None,
+    page_size: pyd.PositiveInt = DEFAULT_PAGE_SIZE,
+    max_concurrent_pages: pyd.PositiveInt = DEFAULT_MAX_CONCURRENT_PAGES,
+    progress_dir_path: str | Path | None = None,
+    base_url: str = GDC_BASE_URL,
+    retry_client: 'RetryClient | None' = None,
+) -> JsonDataset:
+    """Import records of GDC endpoints, e.g. 'projects' or 'cases', into a JSON dataset.
+
+    Endpoints are fetched concurrently, page by page. With ``progress_dir_path``, fetched pages
+    are saved as they arrive, and a repeated import with the same arguments continues where an
+    interrupted import stopped.
+
+    Args:
+        endpoints: GDC collection endpoints to import, e.g. 'projects'.
+        max_data_item_count: Maximum number of records to import per endpoint. All records are
+            imported if ``None``.
+        page_size: Number of records requested per page.
+        max_concurrent_pages: Maximum number of pages requested concurrently per endpoint.
+        progress_dir_path: Optional directory where fetched pages are saved, to resume an
+            interrupted import from.
+        base_url: Base URL of the GDC API.
+        retry_client: Optional retry-enabled client used to make the requests. Defaults to a
+            client following the request policy configured for the API host.
+
+    Returns:
+        A JSON dataset with a data item per endpoint, containing the list of its records.
+    """
+
+    return await _import_dataset(
+        GdcApi(base_url=base_url),
+        endpoints,
+        max_data_item_count,
+        page_size,
+        max_concurrent_pages,
+        progress_dir_path,
+        retry_client,
+    )
+
+
+async def _import_dataset(
+    api: PagedApi,
+    endpoints: Iterable[str],
+    max_data_item_count: int | None,
+    page_size: int,
+    max_concurrent_pages: int,
+    progress_dir_path: str | Path | None,
+    retry_client: 'RetryClient | None',
+) -> JsonDataset:
+    """Fetch the records of all endpoints concurrently into a JSON dataset."""
+
+    endpoints = list(endpoints)
+    progress = ImportProgress(progress_dir_path) if progress_dir_path is not None else None
+
+    async with retry_client_for_host(HttpUrlModel(api.base_url).host, retry_client) as client:
+        fetches = [
+            fetch_all_records(
+                api,
+                endpoint,
+                client,
+                max_item_count=max_data_item_count,
+                page_size=page_size,
+                progress=progress,
+                max_concurrent_pages=max_concurrent_pages,
+            ) for endpoint in endpoints
+        ]
+        records_per_endpoint = await asyncio.gather(*fetches)
 
     dataset = JsonDataset()
-    for endpoint in endpoints:
-        dataset[endpoint] = encode_api(
-            endpoint,
-            limit=str(max_data_item_count),
-            format='json',
-        )
+    for endpoint, records in zip(endpoints, records_per_endpoint):
+        dataset[endpoint] = records
     return dataset
@@ -1,10 +1,14 @@
 """General tasks for splitting, importing, and creating datasets and models."""
 from _operator import iadd, ior
 from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from fnmatch import fnmatchcase
 from functools import reduce
 from io import IOBase
 from itertools import chain
+import locale
+import mmap
 import os
 from pathlib import Path
 from typing import Any, cast
@@ -43,18 +47,12 @@ def split_dataset(
         datafile_names_for_b: Names that should be placed in the second output dataset.
 
     Returns:
-        A tuple containing the remaining items first and the selected items second.
+        A tuple containing the remaining items first and the selected items second. Both are
+        datasets of the same class as the input, referencing its already validated items.
     """
-    _type = dataset.get_type()
-    datafile_names_for_a = set(dataset.keys()) - set(datafile_names_for_b)
-    dataset_a = Dataset[_type](  # type: ignore[valid-type]
-        {
-            name: dataset[name] for name in dataset.keys() if name in datafile_names_for_a
-        })
-    dataset_b = Dataset[_type](  # type: ignore[valid-type]
-        {
-            name: dataset[name] for name in dataset.keys() if name in datafile_names_for_b
-        })
+    names_for_b = set(datafile_names_for_b)
+    dataset_a = dataset[[name for name in dataset.keys() if name not in names_for_b]]
+    dataset_b = dataset[[name for name in dataset.keys() if name in names_for_b]]
     return dataset_a, dataset_b
 
 
@@ -64,30 +62,132 @@ def import_directory(
         exclude_prefixes: tuple[str, ...] = ('.', '_'),
         include_suffixes: tuple[str, ...] = (),
         dataset_cls: type[_DatasetT] = Dataset[Model[str]],  # type: ignore
-        open_func: Callable[[str], IOBase] = open) -> _DatasetT:
+        open_func: Callable[[str], IOBase] = open,
+        include_patterns: tuple[str, ...] = (),
+        recursive: bool = False,
+        max_workers: int | None = None,
+        memory_map_min_size: int | None = None) -> _DatasetT:
     """Import files from a directory into a dataset keyed by filename stem.
 
+    Files are read concurrently in a thread pool, so that importing many files from e.g.
+    network storage is limited by I/O parallelism. The dataset is then validated in one pass.
+
     Args:
         directory: Directory to scan for files.
-        exclude_prefixes: Filename prefixes to skip.
+        exclude_prefixes: Filename prefixes to skip. Also applies to subdirectory names.
         include_suffixes: Optional filename suffixes to include.
         dataset_cls: Dataset type to instantiate for the imported content.
         open_func: Callable used to open each matching file.
+        include_patterns: Optional glob patterns to include, matched against file paths
+            relative to ``directory``, using ``/`` as separator.
+        recursive: Whether to also import files in subdirectories. The keys of such files are
+            prefixed with their relative directory path, e.g. ``'subdir/name'``.
+        max_workers: Maximum number of threads reading files. Defaults to the
+            ``ThreadPoolExecutor`` default.
+        memory_map_min_size: If set, text files of at least this size in bytes are decoded
+            directly from a memory map, avoiding an intermediate copy of the file content. The
+            content is decoded as by ``open()`` in text mode. Only applies with the default
+            ``open_func``.
 
     Returns:
         A dataset containing one item per imported file.
     """
-    dataset = dataset_cls()
-    for import_filename in os.listdir(directory):
-        if not exclude_prefixes or \
-                not any(import_filename.startswith(prefix) for prefix in exclude_prefixes):
-            if not include_suffixes or \
-                    any(import_filename.endswith(suffix) for suffix in include_suffixes):
-                with open_func(os.path.join(directory, import_filename)) as open_file:
-                    dataset_name = '_'.join(import_filename.split('.')[:-1])
-                    print(f"{import_filename} -> Dataset['{dataset_name}']")
-                    dataset[dataset_name] = open_file.read()
-    return dataset
+    file_paths = _scan_directory(
+        Path(directory), exclude_prefixes, include_suffixes, include_patterns, recursive)
+
+    def _read_file(file_path: Path) -> object:
+        if memory_map_min_size is not None and open_func is open \
+                and file_path.stat().st_size >= max(memory_map_min_size, 1):
+            return _read_text_file_via_memory_map(file_path)
+        with open_func(str(file_path)) as open_file:
+            return open_file.read()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = executor.map(_read_file, file_paths)
+        data = {
+            _get_data_file_name(file_path.relative_to(directory)): content
+            for file_path, content in zip(file_paths, contents)
+        }
+    return dataset_cls(data)
+
+
+def _scan_directory(
+    directory: Path,
+    exclude_prefixes: tuple[str, ...],
+    include_suffixes: tuple[str, ...],
+    include_patterns: tuple[str, ...],
+    recursive: bool,
+) -> list[Path]:
+    """Return the sorted paths of all matching files in a directory tree."""
+
+    file_paths: list[Path] = []
+    dir_paths = [directory]
+    visited_dir_ids: set[tuple[int, int]] = set()
+    while dir_paths:
+        dir_path = dir_paths.pop()
+
+        # Symlinks to directories are followed, but each directory is only scanned once, so
+        # that symlink cycles do not recurse forever
+        dir_stat = dir_path.stat()
+        dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+        if dir_id in visited_dir_ids:
+            continue
+        visited_dir_ids.add(dir_id)
+
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if exclude_prefixes and entry.name.startswith(exclude_prefixes):
+                    continue
+                if entry.is_dir():
+                    if recursive:
+                        dir_paths.append(Path(entry.path))
+                elif _file_matches(
+                        Path(entry.path).relative_to(directory).as_posix(),
+                        include_suffixes,
+                        include_patterns,
+                ):
+                    file_paths.append(Path(entry.path))
+    return sorted(file_paths)
+
+
+def _file_matches(rel_path: str,
+                  include_suffixes: tuple[str, ...],
+                  include_patterns: tuple[str, ...]) -> bool:
+    """Check a relative file path against the suffix and glob pattern filters."""
+
+    if include_suffixes and not rel_path.endswith(include_suffixes):
+        return False
+    return not include_patterns \
+        or any(fnmatchcase(rel_path, pattern) for pattern in include_patterns)
+
+
+def _get_data_file_name(rel_path: Path) -> str:
+    """Create a data file name from a relative path by removing the last file suffix.
+
+    Examples:
+        >>> _get_data_file_name(Path('sub/my.data.txt'))
+        'sub/my_data'
+        >>> _get_data_file_name(Path('README'))
+        'README'
+    """
+    name = '_'.join(rel_path.name.split('.')[:-1]) if '.' in rel_path.name else rel_path.name
+    return (rel_path.parent / name).as_posix() if rel_path.parent != Path('.') else name
+
+
+def _read_text_file_via_memory_map(file_path: Path) -> str:
+    """Decode a text file directly from a read-only memory map.
+
+    As with ``open()`` in text mode, the file is decoded with the preferred encoding of the
+    locale, and ``'\\r\\n'`` and ``'\\r'`` line endings are translated to ``'\\n'``.
+    """
+
+    with open(file_path, 'rb') as open_file:
+        with mmap.mmap(open_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            content = str(mapped_file, locale.getpreferredencoding(False))
+
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
 
 
 @TaskTemplate()
@@ -8,9 +8,53 @@ from .typedefs import (JsonDict,
                        JsonDictOfScalars,
                        JsonList,
                        JsonListOfDicts,
+                       JsonListOfDictsOfScalars,
                        JsonScalar)
 
 
+def flatten_nested_data_files(
+    data_files: JsonDictOfListsOfDicts,
+    id_key: str,
+    ref_key: str,
+    default_key: str,
+) -> dict[str, JsonListOfDictsOfScalars]:
+    """Flatten nested records of all data files into related data files of scalar records.
+
+    Every record is visited once. Child records split off from the records of one nesting level
+    are collected into the pending data files of the next level, which are processed in turn
+    until no nested content remains. Records are thus numbered in the same order as when
+    flattening the data files one level at a time.
+    """
+
+    flattened_data_files: dict[str, JsonListOfDictsOfScalars] = {}
+    pending_data_files: JsonDictOfListsOfDicts = data_files
+
+    while pending_data_files:
+        child_data_files: JsonDictOfListsOfDicts = {}
+
+        for data_file_title, data_file in pending_data_files.items():
+            records_of_scalars: JsonListOfDictsOfScalars = []
+            flattened_data_files[data_file_title] = records_of_scalars
+
+            for record_id, nested_record in enumerate(data_file):
+                record_of_scalars, new_data_files = flatten_outer_level_of_nested_record(
+                    nested_record,
+                    str(record_id),
+                    data_file_title,
+                    id_key,
+                    ref_key,
+                    default_key,
+                )
+                records_of_scalars.append(record_of_scalars)
+
+                for new_data_file_title, new_data_file in new_data_files.items():
+                    child_data_files.setdefault(new_data_file_title, []).extend(new_data_file)
+
+        pending_data_files = child_data_files
+
+    return flattened_data_files
+
+
 def flatten_outer_level_of_nested_record(
     nested_record: JsonDict,
     record_id: str,
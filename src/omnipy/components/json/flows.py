@@ -7,7 +7,7 @@ from .datasets import (JsonDictOfDictsDataset,
                        JsonDictOfListsOfDictsDataset,
                        JsonListOfDictsDataset,
                        JsonListOfDictsOfScalarsDataset)
-from .tasks import _flatten_outer_level_of_all_data_files, transpose_dicts_2_lists
+from .tasks import _flatten_all_data_files, transpose_dicts_2_lists
 
 
 @FuncFlowTemplate(fixed_params=dict(id_key=ID_KEY, ref_key=REF_KEY, default_key=DEFAULT_KEY))
@@ -19,19 +19,11 @@ def flatten_nested_json(
 ) -> JsonListOfDictsOfScalarsDataset:
     """Flatten nested JSON records into scalar-only records.
 
-    Repeatedly flattens one nesting level at a time until only dictionaries of scalars remain.
+    Walks each record once, splitting nested content into related child data files named by
+    their path (e.g. ``items.tags``). Records get generated ids under ``id_key``, and child
+    records refer to the id of their parent record under ``ref_key``.
     """
-    all_data_files_of_scalar_records_ds = JsonListOfDictsOfScalarsDataset()
-    data_files_of_any_ds = dataset
-
-    while len(data_files_of_any_ds) > 0:
-        data_files_of_scalar_records_ds, data_files_of_any_ds = \
-            _flatten_outer_level_of_all_data_files(
-                data_files_of_any_ds, id_key, ref_key, default_key)
-
-        all_data_files_of_scalar_records_ds |= data_files_of_scalar_records_ds
-
-    return all_data_files_of_scalar_records_ds
+    return _flatten_all_data_files(dataset, id_key, ref_key, default_key)
 
 
 @FuncFlowTemplate()
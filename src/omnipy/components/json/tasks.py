@@ -1,26 +1,19 @@
 """JSON tasks for parsing datasets and reshaping nested JSON structures."""
 
-from collections import defaultdict
 from typing import cast
 
 from omnipy.compute.task import TaskTemplate
 from omnipy.data.dataset import Dataset
 from omnipy.data.model import Model, obj_or_model_content_isinstance
 
-from ._functions import flatten_outer_level_of_nested_record
+from ._functions import flatten_nested_data_files
 from .constants import ID_KEY
 from .datasets import (JsonDataset,
                        JsonDictDataset,
                        JsonListDataset,
                        JsonListOfDictsDataset,
                        JsonListOfDictsOfScalarsDataset)
-from .typedefs import (Json,
-                       JsonDict,
-                       JsonDictOfListsOfDicts,
-                       JsonDictOfScalars,
-                       JsonList,
-                       JsonListOfDicts,
-                       JsonListOfDictsOfScalars)
+from .typedefs import Json, JsonDict, JsonDictOfListsOfDicts, JsonList
 
 
 @TaskTemplate()
@@ -66,46 +59,18 @@ def transpose_dicts_2_lists(dataset: JsonDictDataset, id_key: str = ID_KEY) -> J
 
 
 @TaskTemplate()
-def _flatten_outer_level_of_all_data_files(
-        dataset: JsonListOfDictsDataset, id_key: str, ref_key: str,
-        default_key: str) -> tuple[JsonListOfDictsOfScalarsDataset, JsonListOfDictsDataset]:
-    """Flatten one outer nesting level for every record in a dataset.
-
-    Returns scalar-only records for the current level together with any remaining nested records.
+def _flatten_all_data_files(dataset: JsonListOfDictsDataset,
+                            id_key: str,
+                            ref_key: str,
+                            default_key: str) -> JsonListOfDictsOfScalarsDataset:
+    """Flatten all nesting levels of every record in a dataset.
+
+    Records are flattened as plain Python data, and the resulting data files of scalar records
+    are validated once, when creating the output dataset.
     """
 
-    data_files_of_scalar_records: defaultdict[str, JsonListOfDictsOfScalars] = \
-        defaultdict(JsonListOfDictsOfScalars)
-    data_files_of_any: defaultdict[str, JsonListOfDicts] = defaultdict(JsonListOfDicts)
-
     dataset_as_data: JsonDictOfListsOfDicts = \
         cast(JsonDictOfListsOfDicts, dataset.to_data())
 
-    for data_file_title, item in dataset_as_data.items():
-        data_file: JsonListOfDicts = item
-
-        if len(data_file) == 0:
-            data_files_of_scalar_records[data_file_title] = JsonListOfDictsOfScalars()
-
-        for record_id, nested_record in enumerate(data_file):
-            record_of_scalars: JsonDictOfScalars
-            new_data_files_of_any: JsonDictOfListsOfDicts
-            record_of_scalars, new_data_files_of_any = flatten_outer_level_of_nested_record(
-                nested_record,
-                str(record_id),
-                data_file_title,
-                id_key,
-                ref_key,
-                default_key,
-            )
-
-            new_data_file_title: str
-            new_data_file_of_any: JsonListOfDicts
-            for new_data_file_title, new_data_file_of_any in new_data_files_of_any.items():
-                data_files_of_any[new_data_file_title] += new_data_file_of_any
-            data_files_of_scalar_records[data_file_title].append(record_of_scalars)
-
-    data_files_of_scalar_records_ds = JsonListOfDictsOfScalarsDataset(data_files_of_scalar_records)
-    data_files_of_any_ds = JsonListOfDictsDataset(data_files_of_any)
-
-    return data_files_of_scalar_records_ds, data_files_of_any_ds
+    return JsonListOfDictsOfScalarsDataset(
+        flatten_nested_data_files(dataset_as_data, id_key, ref_key, default_key))
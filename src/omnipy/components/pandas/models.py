@@ -4,17 +4,23 @@ from collections.abc import Iterable
 from io import StringIO
 from typing import Any
 
+from typing_extensions import override, Self
+
 from omnipy.data.model import is_model_instance, Model
 from omnipy.shared.exceptions import ShouldNotOccurException
 from omnipy.shared.typing import TYPE_CHECKING
+import omnipy.util.pydantic as pyd
 
 from ..tables.models import (ColumnWiseTableWithColNamesAndIndexModel,
                              JsonScalarColumnWiseTableWithColNamesModel,
                              PrintableTable,
                              RowWiseTableModel,
                              RowWiseTableWithColNamesModel)
+from .snapshot import copy_pandas_content, PandasSnapshotWrapper
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .lazy_import import pd
 
 __all__ = ['PandasModel']
@@ -100,8 +106,12 @@ class PandasModel(Model['pd.DataFrame | pd.Series | AnyJsonTableType'], Printabl
     def to_data(self) -> Any:
         """Convert pandas content to plain Python data structures.
 
+        Columns are converted one at a time with ``tolist()``, and missing values are replaced
+        with ``None`` only in the columns that contain them. NaN values of plain numpy float
+        columns are kept as they are.
+
         Returns:
-            For DataFrames, a list of row dictionaries. For Series, a key-value
+            For DataFrames, a dictionary of column lists. For Series, a key-value
             dictionary.
 
         Raises:
@@ -111,12 +121,30 @@ class PandasModel(Model['pd.DataFrame | pd.Series | AnyJsonTableType'], Printabl
 
         from .lazy_import import pd
 
-        df = self.content.replace({pd.NA: None})
-        if isinstance(df, pd.DataFrame):
-            # return df.to_dict(orient='records')
-            return df.to_dict(orient='list')
-        elif isinstance(df, pd.Series):
-            return df.to_dict()
+        content = self.content
+        if isinstance(content, pd.DataFrame):
+            return {col_name: _column_to_list(col) for col_name, col in content.items()}
+        elif isinstance(content, pd.Series):
+            return dict(zip(content.index.tolist(), _column_to_list(content)))
+
+    def to_columns(self) -> 'dict[Any, np.ndarray]':
+        """Export DataFrame content as a mapping of column names to arrays.
+
+        Each array is a view of the data of the column whenever pandas can provide one, i.e. for
+        numpy-backed columns without missing values, so no data is copied. With copy-on-write
+        enabled, the arrays are read-only.
+
+        Returns:
+            Dictionary mapping column names to numpy arrays. A Series is exported as a single
+            column keyed by its name.
+        """
+
+        from .lazy_import import pd
+
+        content = self.content
+        if isinstance(content, pd.Series):
+            return {content.name: content.to_numpy(copy=False)}
+        return {col_name: col.to_numpy(copy=False) for col_name, col in content.items()}
 
     def from_data(self, data: Iterable) -> None:
         """Replace model content from iterable table data.
@@ -146,6 +174,56 @@ class PandasModel(Model['pd.DataFrame | pd.Series | AnyJsonTableType'], Printabl
 
         self._validate_and_set_value(pd.read_json(StringIO(json_content)).convert_dtypes())
 
+    @override
+    def _take_snapshot_of_validated_content(self) -> None:
+        """Store a copy-on-write snapshot of the pandas content in interactive mode.
+
+        Bypasses the deepcopy-based snapshot machinery of ``Model``, as a shallow copy of
+        pandas content is enough with copy-on-write enabled.
+        """
+
+        if self.config.model.interactive:
+            self.snapshot_holder.store_snapshot(self, PandasSnapshotWrapper.from_obj(self))
+
+    @override
+    def copy(self, *, deep: bool = False, **kwargs) -> Self:
+        """Copy the model, sharing the pandas data buffers if copy-on-write is enabled.
+
+        Args:
+            deep: When ``True``, perform a deep copy.
+            **kwargs: Additional keyword arguments forwarded to pydantic's
+                ``copy()`` implementation.
+
+        Returns:
+            A copied model instance.
+        """
+
+        if deep:
+            return super().copy(deep=True, **kwargs)
+
+        pydantic_copy = pyd.GenericModel.copy(self, deep=False, **kwargs)
+        pydantic_copy.content = copy_pandas_content(pydantic_copy.content)
+        return pydantic_copy  # pyright: ignore[reportReturnType]
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        """Compare two pandas models by concrete class and ``equals()`` of their content.
+
+        Missing values in the same locations are considered equal, while differences in
+        labels or dtypes make the models unequal.
+
+        Args:
+            other: Object to compare with this model.
+
+        Returns:
+            ``True`` when ``other`` is the same concrete model class with equal content.
+        """
+
+        if is_model_instance(other):
+            return self.__class__ == other.__class__ and self.content.equals(other.content)
+        else:
+            return False
+
     def to_json(self, pretty=True) -> str:
         """Serialize model content to JSON.
 
@@ -171,6 +249,16 @@ class PandasModel(Model['pd.DataFrame | pd.Series | AnyJsonTableType'], Printabl
             raise ShouldNotOccurException()
 
 
+def _column_to_list(col: 'pd.Series') -> list:
+    from .lazy_import import pd
+
+    if col.dtype.kind in 'fc' and not pd.api.types.is_extension_array_dtype(col.dtype):
+        return col.tolist()
+    if col.hasnans:
+        return col.astype(object).where(col.notna(), None).tolist()
+    return col.tolist()
+
+
 def _update_forward_refs():
     from .lazy_import import pd
 
@@ -0,0 +1,55 @@
+"""Snapshot support for pandas-backed models, based on copy-on-write and ``DataFrame.equals``."""
+
+from dataclasses import dataclass
+
+from omnipy.data.snapshot import SnapshotWrapper
+from omnipy.shared.protocols.data import HasContentT
+from omnipy.shared.typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .lazy_import import pd
+
+__all__ = ['is_copy_on_write_enabled', 'copy_pandas_content', 'PandasSnapshotWrapper']
+
+
+def is_copy_on_write_enabled() -> bool:
+    """Return whether pandas copy-on-write semantics are in effect.
+
+    Copy-on-write is always enabled from pandas 3.0, and can be enabled for pandas 2.x through
+    the ``mode.copy_on_write`` option.
+    """
+
+    from .lazy_import import pd
+
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True
+
+
+def copy_pandas_content(content: 'pd.DataFrame | pd.Series') -> 'pd.DataFrame | pd.Series':
+    """Return an independent copy of a pandas object as cheaply as possible.
+
+    With copy-on-write enabled, a shallow copy shares the underlying buffers until either object
+    is modified, so no data is copied up front. Otherwise, a deep copy is needed.
+    """
+
+    return content.copy(deep=not is_copy_on_write_enabled())
+
+
+@dataclass
+class PandasSnapshotWrapper(SnapshotWrapper[HasContentT, 'pd.DataFrame | pd.Series']):
+    """Snapshot of pandas content, compared using ``equals()`` instead of element-wise ``==``.
+
+    Unlike element-wise comparison, ``equals()`` treats missing values in the same location as
+    equal, and reports differently labelled or typed objects as different instead of raising.
+    """
+    @classmethod
+    def from_obj(cls, obj: HasContentT) -> 'PandasSnapshotWrapper[HasContentT]':
+        """Create a snapshot of the pandas content of ``obj``."""
+
+        return cls(id(obj), copy_pandas_content(obj.content))
+
+    def differs_from(self, obj: 'pd.DataFrame | pd.Series') -> bool:
+        """Return whether the pandas object ``obj`` differs from the stored snapshot."""
+
+        return not self.snapshot.equals(obj)
@@ -0,0 +1,240 @@
+"""Declarative line transforms, applied in a single pass over large chunks of text.
+
+A :class:`LineTransformPipeline` is built from operations such as regex substitution, line
+filtering, field selection and line prefixes/suffixes. Instead of calling a Python function
+per line, each operation is compiled into a function transforming a chunk of many complete
+lines at once, using the bulk methods of ``re`` and ``str`` that run at C speed. All operations
+are applied to one chunk before moving on to the next, so that the text is traversed only once.
+Chunks are independent of each other and may also be transformed in parallel processes.
+
+Lines are separated by ``'\\n'``. Regular expressions are compiled in multiline mode, so that
+``^`` and ``$`` match at the start and end of each line, and should not match line breaks.
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import re
+from typing import Callable, Iterator
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_ChunkTransform = Callable[[str], str]
+
+
+@dataclass(frozen=True)
+class _LineOp(ABC):
+    @abstractmethod
+    def compile(self) -> _ChunkTransform:
+        ...
+
+
+@dataclass(frozen=True)
+class _Substitute(_LineOp):
+    pattern: str
+    repl: str
+    flags: int = 0
+
+    def compile(self) -> _ChunkTransform:
+        regex = re.compile(self.pattern, self.flags | re.MULTILINE)
+        return partial(regex.sub, self.repl)
+
+
+@dataclass(frozen=True)
+class _FilterLines(_LineOp):
+    pattern: str
+    keep: bool
+    flags: int = 0
+
+    def compile(self) -> _ChunkTransform:
+        # Both variants remove complete lines, including line breaks, through a single
+        # substitution. Lines to keep are found by negative lookahead.
+        search = rf'[^\n]*?(?:{self.pattern})'
+        line_start = rf'^(?!{search})' if self.keep else rf'^(?={search})'
+        regex = re.compile(line_start + r'[^\n]*(?:\n|\Z)', self.flags | re.MULTILINE)
+        return partial(regex.sub, '')
+
+
+@dataclass(frozen=True)
+class _SelectFields(_LineOp):
+    indices: tuple[int, ...]
+    delimiter: str
+    output_delimiter: str
+
+    def compile(self) -> _ChunkTransform:
+        delimiter = re.escape(self.delimiter)
+        if len(self.delimiter) == 1:
+            field = rf'([^{delimiter}\n]*)'
+        else:
+            field = rf'((?:(?!{delimiter})[^\n])*)'
+
+        # One regex matching all fields up to the last selected field. Missing fields are
+        # unmatched optional groups, which are substituted with empty strings. Empty lines
+        # are left as they are.
+        num_fields = max(self.indices) + 1
+        pattern = r'^(?=[^\n])' + field + rf'(?:{delimiter}{field})?' * (num_fields - 1) \
+            + r'[^\n]*'
+        template = self.output_delimiter.replace('\\', '\\\\').join(
+            rf'\g<{index + 1}>' for index in self.indices)
+
+        regex = re.compile(pattern, re.MULTILINE)
+        return partial(regex.sub, template)
+
+
+@dataclass(frozen=True)
+class _AddPrefix(_LineOp):
+    prefix: str
+
+    def compile(self) -> _ChunkTransform:
+        prefix = self.prefix
+
+        def _add_prefix(chunk: str) -> str:
+            if not chunk or not prefix:
+                return chunk
+            prefixed = prefix + chunk.replace('\n', '\n' + prefix)
+            return prefixed[:-len(prefix)] if chunk.endswith('\n') else prefixed
+
+        return _add_prefix
+
+
+@dataclass(frozen=True)
+class _AddSuffix(_LineOp):
+    suffix: str
+
+    def compile(self) -> _ChunkTransform:
+        suffix = self.suffix
+
+        def _add_suffix(chunk: str) -> str:
+            if not chunk or not suffix:
+                return chunk
+            suffixed = chunk.replace('\n', suffix + '\n')
+            return suffixed if chunk.endswith('\n') else suffixed + suffix
+
+        return _add_suffix
+
+
+class LineTransformPipeline:
+    """Immutable sequence of line transforms, applied to text in a single chunked pass.
+
+    Pipelines are built by chaining the operation methods, each returning a new pipeline.
+
+    Examples:
+        >>> pipeline = (LineTransformPipeline()
+        ...             .drop_lines(r'^#')
+        ...             .substitute(r' +', '\\t')
+        ...             .select_fields(2, 0)
+        ...             .add_prefix('> '))
+        >>> pipeline.transform('# comment\\na b c\\nd e f\\n')
+        '> c\\ta\\n> f\\td\\n'
+    """
+    def __init__(self, ops: tuple[_LineOp, ...] = ()) -> None:
+        self._ops = ops
+        self._chunk_transforms: tuple[_ChunkTransform, ...] | None = None
+
+    def _with_op(self, op: _LineOp) -> 'LineTransformPipeline':
+        return LineTransformPipeline(self._ops + (op,))
+
+    def substitute(self, pattern: str, repl: str, flags: int = 0) -> 'LineTransformPipeline':
+        """Replace all matches of a regular expression, as with ``re.sub()``."""
+
+        return self._with_op(_Substitute(pattern, repl, flags))
+
+    def keep_lines(self, pattern: str, flags: int = 0) -> 'LineTransformPipeline':
+        """Keep only lines containing a match of a regular expression."""
+
+        return self._with_op(_FilterLines(pattern, keep=True, flags=flags))
+
+    def drop_lines(self, pattern: str, flags: int = 0) -> 'LineTransformPipeline':
+        """Remove lines containing a match of a regular expression."""
+
+        return self._with_op(_FilterLines(pattern, keep=False, flags=flags))
+
+    def select_fields(self,
+                      *indices: int,
+                      delimiter: str = '\t',
+                      output_delimiter: str | None = None) -> 'LineTransformPipeline':
+        """Split lines into fields and keep the fields at the given zero-based indices, in order.
+
+        Fields missing from a line are output as empty fields, while empty lines are kept as
+        they are. The selected fields are joined with ``output_delimiter``, which defaults to
+        ``delimiter``.
+
+        Raises:
+            ValueError: If no indices are given, an index is negative, or the delimiter is
+                empty or contains a line break.
+        """
+
+        if not indices or min(indices) < 0:
+            raise ValueError(f'Field indices must be one or more non-negative ints: {indices}')
+        if not delimiter or '\n' in delimiter:
+            raise ValueError(f'Invalid field delimiter: {delimiter!r}')
+        if output_delimiter is None:
+            output_delimiter = delimiter
+        return self._with_op(_SelectFields(indices, delimiter, output_delimiter))
+
+    def add_prefix(self, prefix: str) -> 'LineTransformPipeline':
+        """Add a prefix to the start of each line."""
+
+        return self._with_op(_AddPrefix(prefix))
+
+    def add_suffix(self, suffix: str) -> 'LineTransformPipeline':
+        """Add a suffix to the end of each line, before the line break."""
+
+        return self._with_op(_AddSuffix(suffix))
+
+    def transform_chunk(self, chunk: str) -> str:
+        """Apply all transforms to a chunk of text consisting of complete lines."""
+
+        if self._chunk_transforms is None:
+            self._chunk_transforms = tuple(op.compile() for op in self._ops)
+        for chunk_transform in self._chunk_transforms:
+            chunk = chunk_transform(chunk)
+        return chunk
+
+    def transform(self,
+                  text: str,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  max_workers: int = 1) -> str:
+        """Apply all transforms to the text, chunk by chunk.
+
+        Args:
+            text: Text to transform.
+            chunk_size: Approximate number of characters per chunk. Chunks are extended to
+                the end of the line.
+            max_workers: Number of processes transforming chunks in parallel. With the
+                default of 1, all chunks are transformed in the current process.
+
+        Returns:
+            str: The transformed text.
+        """
+
+        chunks = _split_into_chunks(text, chunk_size)
+        if max_workers > 1 and len(text) > chunk_size:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return ''.join(executor.map(self.transform_chunk, chunks))
+        return ''.join(self.transform_chunk(chunk) for chunk in chunks)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LineTransformPipeline):
+            return NotImplemented
+        return self._ops == other._ops
+
+    def __hash__(self) -> int:
+        return hash(self._ops)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._ops!r})'
+
+    def __reduce__(self) -> tuple[type['LineTransformPipeline'], tuple[tuple[_LineOp, ...]]]:
+        # Compiled transforms are not picklable and are recompiled by worker processes
+        return type(self), (self._ops,)
+
+
+def _split_into_chunks(text: str, chunk_size: int) -> Iterator[str]:
+    start = 0
+    while start < len(text):
+        line_break_index = text.find('\n', start + max(chunk_size, 1) - 1)
+        end = len(text) if line_break_index < 0 else line_break_index + 1
+        yield text[start:end]
+        start = end
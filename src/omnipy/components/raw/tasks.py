@@ -4,14 +4,14 @@ from io import StringIO
 import os
 from textwrap import dedent
 
-from chardet import UniversalDetector
-
 from omnipy.compute.task import TaskTemplate
 from omnipy.data.model import Model
 
 from ...util.helpers import is_package_editable
 from .datasets import StrDataset
+from .line_transforms import DEFAULT_CHUNK_SIZE, LineTransformPipeline
 from .protocols import IsModifyAllLinesCallable, IsModifyContentCallable, IsModifyEachLineCallable
+from .utils import decode_with_detected_encoding
 
 if is_package_editable('omnipy'):
     os.environ['OMNIPY_MACRO_CONCAT_DESCRIPTION'] = dedent("""\
@@ -26,30 +26,25 @@ if is_package_editable('omnipy'):
 
 @TaskTemplate(iterate_over_data_files=True, output_dataset_cls=StrDataset)
 def decode_bytes(data: Model[bytes], encoding: str | None = None) -> str:
-    """Decode each binary data file to text, auto-detecting encoding when none is supplied."""
+    """Decode each binary data file to text, auto-detecting encoding when none is supplied.
+
+    Auto-detection follows byte order marks and otherwise decodes valid UTF-8 (including ASCII)
+    directly. Only for other data is the encoding predicted by the "chardet" library, from a
+    bounded sample of the data.
+    """
 
     if encoding is None:
-        detector = UniversalDetector()
-        for line in data.splitlines():  # type: ignore[attr-defined]
-            detector.feed(line)
-            if detector.done:
-                break
-        detector.close()
-        result = detector.result
-
-        encoding = result['encoding']
-        confidence = result['confidence']
-        language = result['language']
+        text, detected = decode_with_detected_encoding(data.content)
 
         # TODO: Implement simple solution to log from a task/flow.
         # TODO: Implement solution to add information to the dataset metadata and apply this to
         #       decode_bytes() for storing detected encoding etc.
-        print(f'Automatically detected text encoding to be "{encoding}" with confidence '
-              f'"{confidence}". The language is predicted to be "{language}". '
-              f'(All predictions have been made by the "chardet" library.)')
-
-        if encoding is None:
-            encoding = 'ascii'
+        if detected.confidence < 1.0:  # Only predictions by chardet are uncertain
+            print(f'Automatically detected text encoding to be "{detected.encoding}" with '
+                  f'confidence "{detected.confidence}". The language is predicted to be '
+                  f'"{detected.language}". (All predictions have been made by the "chardet" '
+                  'library.)')
+        return text
 
     return data.decode(encoding)  # type: ignore[attr-defined]
 
@@ -71,7 +66,11 @@ def modify_each_line(
     modify_line_func: IsModifyEachLineCallable,
     **kwargs: object,
 ) -> str:
-    """Apply a callable to each line and rebuild the text from returned lines."""
+    """Apply a callable to each line and rebuild the text from returned lines.
+
+    For large data, prefer `transform_lines()` if the modification can be expressed as a
+    `LineTransformPipeline`, which avoids calling a Python function per line.
+    """
 
     output_data = StringIO()
     for i, line in enumerate(StringIO(str(data_file))):
@@ -92,3 +91,18 @@ def modify_all_lines(
     all_lines = [line.strip() for line in StringIO(str(data_file))]
     modified_lines = modify_all_lines_func(all_lines, **kwargs)
     return os.linesep.join(modified_lines)
+
+
+@TaskTemplate(iterate_over_data_files=True)
+def transform_lines(
+    data_file: Model[str],
+    pipeline: LineTransformPipeline,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 1,
+) -> str:
+    """Apply a declarative line transform pipeline to each text data file in large chunks.
+
+    With `max_workers` larger than 1, chunks are transformed in parallel processes.
+    """
+
+    return pipeline.transform(str(data_file), chunk_size=chunk_size, max_workers=max_workers)
@@ -1,4 +1,19 @@
+import codecs
+from functools import lru_cache
 import re
+from typing import NamedTuple
+
+from chardet import UniversalDetector
+
+DEFAULT_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
 
 
 class RegexMatch:
@@ -26,3 +41,132 @@ class RegexMatch:
 
     def __eq__(self, pattern: re.Pattern[str]) -> bool:  # type: ignore[override]
         return re.search(pattern, self._text) is not None
+
+
+class DetectedEncoding(NamedTuple):
+    """Result of text encoding detection.
+
+    Attributes:
+        encoding: Name of the codec to decode the data with.
+        confidence: Confidence of the detection, between 0.0 and 1.0.
+        language: Language predicted by ``chardet``, if any.
+    """
+    encoding: str
+    confidence: float = 1.0
+    language: str | None = None
+
+
+def sniff_bom_encoding(data: bytes) -> str | None:
+    """Return the codec indicated by a byte order mark at the start of the data, if any.
+
+    The returned codecs all strip the byte order mark when decoding.
+
+    Examples:
+        >>> sniff_bom_encoding(b'\\xef\\xbb\\xbfabc')
+        'utf-8-sig'
+        >>> sniff_bom_encoding(b'abc') is None
+        True
+    """
+    # UTF-32 LE is checked before UTF-16 LE, as their byte order marks share the first two bytes
+    for bom, encoding in _BOM_ENCODINGS:
+        if data.startswith(bom):
+            return encoding
+    return None
+
+
+def sample_for_encoding_detection(data: bytes,
+                                  sample_size: int = DEFAULT_ENCODING_SAMPLE_SIZE) -> bytes:
+    """Return a bounded sample of the head, middle and tail of the data.
+
+    Data no larger than three samples is returned as is. Otherwise, the middle and tail samples
+    start after the first line break within them, if any, so that samples mostly consist of
+    complete lines.
+
+    Examples:
+        >>> len(sample_for_encoding_detection(bytes(1000), sample_size=100))
+        300
+    """
+    if len(data) <= 3 * sample_size:
+        return data
+
+    samples = [data[:sample_size]]
+    for start in ((len(data) - sample_size) // 2, len(data) - sample_size):
+        sample = data[start:start + sample_size]
+        line_break_index = sample.find(b'\n')
+        if line_break_index >= 0:
+            sample = sample[line_break_index + 1:]
+        samples.append(sample)
+    return b''.join(samples)
+
+
+def _run_chardet(data: bytes) -> DetectedEncoding | None:
+    detector = UniversalDetector()
+    for line in data.splitlines(keepends=True):
+        detector.feed(line)
+        if detector.done:
+            break
+    detector.close()
+    result = detector.result
+
+    if result['encoding'] is None:
+        return None
+    return DetectedEncoding(result['encoding'], result['confidence'], result['language'])
+
+
+# Samples are bounded in size, which also bounds the memory held by the cache keys
+_detect_encoding_of_sample = lru_cache(maxsize=32)(_run_chardet)
+
+
+def decode_with_detected_encoding(
+        data: bytes,
+        sample_size: int = DEFAULT_ENCODING_SAMPLE_SIZE) -> tuple[str, DetectedEncoding]:
+    """Decode binary data to text, detecting the encoding with the cheapest methods first.
+
+    Data starting with a byte order mark is decoded accordingly. Otherwise, the data is decoded
+    as strict UTF-8, which covers plain ASCII and runs at the speed of ``bytes.decode()``. Only
+    if this fails is the ``chardet`` library consulted, with a bounded sample of the head,
+    middle and tail of the data (see :func:`sample_for_encoding_detection`). Detection results
+    are cached per sample, so that repeated decoding of the same data skips ``chardet``. In the
+    rare case that the encoding detected from the sample fails to decode the full data,
+    detection is repeated on the full data.
+
+    Args:
+        data: Binary data to decode.
+        sample_size: Size in bytes of each of the head, middle and tail samples.
+
+    Returns:
+        tuple[str, DetectedEncoding]: The decoded text and the detected encoding.
+
+    Raises:
+        UnicodeDecodeError: If the data cannot be decoded with the detected encoding.
+
+    Examples:
+        >>> decode_with_detected_encoding(b'ASCII string')
+        ('ASCII string', DetectedEncoding(encoding='ascii', confidence=1.0, language=None))
+        >>> decode_with_detected_encoding(b'\\xff\\xfea\\x00')[0]
+        'a'
+    """
+    bom_encoding = sniff_bom_encoding(data)
+    if bom_encoding is not None:
+        return data.decode(bom_encoding), DetectedEncoding(bom_encoding)
+
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    else:
+        # str.isascii() is a constant-time check of the internal string representation
+        return text, DetectedEncoding('ascii' if text.isascii() else 'utf-8')
+
+    detected = _detect_encoding_of_sample(sample_for_encoding_detection(data, sample_size))
+    if detected is not None:
+        try:
+            return data.decode(detected.encoding), detected
+        except UnicodeDecodeError:
+            if len(data) <= 3 * sample_size:
+                raise
+
+    detected = _run_chardet(data)
+    if detected is None:
+        detected = DetectedEncoding('ascii', confidence=0.0)
+    return data.decode(detected.encoding), detected
@@ -1,7 +1,14 @@
-"""Default retry configuration values for remote component helpers."""
+"""Default retry, download and listing configuration values for remote component helpers."""
 
 from omnipy.shared.enums.data import BackoffStrategy
 
 DEFAULT_RETRIES = 5
 DEFAULT_BACKOFF_STRATEGY = BackoffStrategy.EXPONENTIAL
 DEFAULT_RETRY_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024**2
+DEFAULT_DOWNLOAD_ATTEMPTS = 5
+
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_RAW_URL = 'https://raw.githubusercontent.com'
+DEFAULT_MAX_CONCURRENT_LISTINGS = 10
@@ -2,7 +2,7 @@
 
 from omnipy.data.dataset import Dataset
 
-from .models import AutoResponseContentModel, HttpUrlModel
+from .models import AutoResponseContentModel, DownloadedFileModel, HttpUrlModel
 
 
 class HttpUrlDataset(Dataset[HttpUrlModel]):
@@ -47,3 +47,17 @@ class AutoResponseContentDataset(Dataset[AutoResponseContentModel]):
         True
     """
     ...
+
+
+class DownloadedFileDataset(Dataset[DownloadedFileModel]):
+    """Store named references to HTTP response bodies downloaded to local files.
+
+    Args:
+        *args: Positional data forwarded to :class:`~omnipy.data.dataset.Dataset`.
+        **kwargs: Keyword arguments forwarded to
+            :class:`~omnipy.data.dataset.Dataset`.
+
+    Returns:
+        DownloadedFileDataset: Dataset containing ``DownloadedFileModel`` entries.
+    """
+    ...
@@ -0,0 +1,289 @@
+"""Streamed, resumable downloads of HTTP response bodies to local files.
+
+Response bodies are written chunk by chunk to a ``.part`` file next to the destination file,
+so that memory use is independent of the file size. If the transfer is interrupted, the
+download is resumed from the end of the ``.part`` file with an HTTP ``Range`` request, also
+across separate calls. An ``If-Range`` header with the validator of the original response
+makes sure that the server restarts the transfer if the remote file has changed in between.
+
+Concurrent downloads to the same destination file within a process are serialized by a lock per
+destination file, as they would otherwise write to the same ``.part`` file.
+"""
+
+import asyncio
+import base64
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+import re
+from typing import Mapping
+import weakref
+
+from omnipy.shared.typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .lazy_import import ClientSession
+
+_CONTENT_RANGE_REGEX = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)')
+_UNSATISFIED_CONTENT_RANGE_REGEX = re.compile(r'bytes\s+\*/(\d+)')
+_DIGEST_SHA256_REGEX = re.compile(r'sha-256\s*=\s*:?([A-Za-z0-9+/=]+):?', re.IGNORECASE)
+
+_PART_FILE_SUFFIX = '.part'
+_PART_METADATA_FILE_SUFFIX = '.part.json'
+_HASH_BLOCK_SIZE = 1024**2
+
+# asyncio locks are bound to an event loop, hence one lock per event loop and destination file
+_download_locks: weakref.WeakValueDictionary[tuple[asyncio.AbstractEventLoop, Path],
+                                             asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+class IncompleteDownloadError(ConnectionError):
+    """Raised when a download could not be completed within the allowed number of attempts."""
+
+
+class ChecksumMismatchError(ValueError):
+    """Raised when the checksum of a downloaded file does not match the expected checksum."""
+
+
+@dataclass
+class _PartialDownload:
+    url: str
+    validator: str | None = None
+    total_size: int | None = None
+    content_type: str | None = None
+    sha256: str | None = None
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a completed download.
+
+    Args:
+        path: Path of the downloaded file.
+        size: Size of the downloaded file in bytes.
+        sha256: Hex digest of the SHA-256 checksum of the file content.
+        content_type: Content type of the response, if provided by the server.
+        num_requests: Number of requests needed to complete the download.
+    """
+
+    path: Path
+    size: int
+    sha256: str
+    content_type: str | None
+    num_requests: int
+
+
+def get_sha256_from_digest_headers(headers: Mapping[str, str]) -> str | None:
+    """Return the SHA-256 checksum announced in ``Repr-Digest`` or ``Digest`` headers, if any.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        str | None: Hex digest of the SHA-256 checksum, or ``None`` if not announced.
+
+    Examples:
+        >>> get_sha256_from_digest_headers(
+        ...     {'Repr-Digest': 'sha-256=:47DEQpj8HBSa+/TImW+5JCeuQeRkm5NMpJWZG3hSuFU=:'})
+        'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+    """
+    for header_name in ('Repr-Digest', 'Digest'):
+        header_value = headers.get(header_name)
+        if header_value and (match := _DIGEST_SHA256_REGEX.search(header_value)):
+            try:
+                return base64.b64decode(match.group(1), validate=True).hex()
+            except ValueError:
+                return None
+    return None
+
+
+async def download_to_file(
+    url: str,
+    session: 'ClientSession',
+    file_path: Path,
+    expected_sha256: str | None = None,
+    chunk_size: int = 1024**2,
+    max_attempts: int = 5,
+) -> DownloadResult:
+    """Stream an HTTP response body to a file, resuming interrupted transfers.
+
+    The checksum of the completed file is verified against ``expected_sha256`` or else against
+    a SHA-256 checksum announced by the server in ``Repr-Digest`` or ``Digest`` headers.
+
+    Args:
+        url: URL to download.
+        session: Active aiohttp-compatible session used to execute the requests.
+        file_path: Destination path of the downloaded file.
+        expected_sha256: Optional hex digest of the expected SHA-256 checksum.
+        chunk_size: Maximum number of bytes kept in memory at a time.
+        max_attempts: Maximum number of requests made for the download. Each interrupted
+            transfer uses one attempt.
+
+    Returns:
+        DownloadResult: Path, size and checksum of the downloaded file.
+
+    Raises:
+        ConnectionError: If a response has an unexpected HTTP status code.
+        IncompleteDownloadError: If the download is still incomplete after ``max_attempts``.
+        ChecksumMismatchError: If the checksum of the downloaded file does not match.
+    """
+    async with _get_download_lock(file_path):
+        return await _download_to_file(url,
+                                       session,
+                                       file_path,
+                                       expected_sha256,
+                                       chunk_size,
+                                       max_attempts)
+
+
+def _get_download_lock(file_path: Path) -> asyncio.Lock:
+    key = (asyncio.get_running_loop(), file_path.resolve())
+    lock = _download_locks.get(key)
+    if lock is None:
+        lock = _download_locks[key] = asyncio.Lock()
+    return lock
+
+
+async def _download_to_file(
+    url: str,
+    session: 'ClientSession',
+    file_path: Path,
+    expected_sha256: str | None,
+    chunk_size: int,
+    max_attempts: int,
+) -> DownloadResult:
+    from .lazy_import import ClientConnectionError, ClientPayloadError
+
+    file_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    part_path = file_path.with_name(file_path.name + _PART_FILE_SUFFIX)
+    partial = _read_partial_download_metadata(file_path, url)
+    if partial is None:
+        # Leftovers from an unknown transfer cannot be safely resumed
+        part_path.unlink(missing_ok=True)
+        partial = _PartialDownload(url=url)
+
+    last_exc: BaseException | None = None
+    for attempt in range(1, max_attempts + 1):
+        try:
+            if await _request_and_append_to_part_file(session, partial, part_path, chunk_size):
+                return _complete_download(
+                    partial, part_path, file_path, expected_sha256, num_requests=attempt)
+        except (ClientPayloadError, ClientConnectionError, asyncio.TimeoutError) as exc:
+            last_exc = exc
+        finally:
+            _write_partial_download_metadata(file_path, partial)
+
+    raise IncompleteDownloadError(f'Failed to complete download after {max_attempts} attempts. '
+                                  f'URL: {url}') from last_exc
+
+
+async def _request_and_append_to_part_file(
+    session: 'ClientSession',
+    partial: _PartialDownload,
+    part_path: Path,
+    chunk_size: int,
+) -> bool:
+    offset = part_path.stat().st_size if part_path.exists() else 0
+
+    # Byte offsets of Range requests refer to the encoded content, so transfer encodings like
+    # gzip, which are transparently decoded by aiohttp, would break resumption
+    headers = {'Accept-Encoding': 'identity'}
+    if offset > 0:
+        headers['Range'] = f'bytes={offset}-'
+        if partial.validator is not None:
+            headers['If-Range'] = partial.validator
+
+    async with session.get(partial.url, headers=headers) as response:
+        match response.status:
+            case 206:
+                content_range = _CONTENT_RANGE_REGEX.match(
+                    response.headers.get('Content-Range', ''))
+                if content_range is None or int(content_range.group(1)) != offset:
+                    raise ConnectionError(f'Failed to resume download. Unexpected '
+                                          f'Content-Range: '
+                                          f'{response.headers.get("Content-Range")}. '
+                                          f'URL: {partial.url}')
+                if content_range.group(3) != '*':
+                    partial.total_size = int(content_range.group(3))
+            case 200:
+                offset = 0
+                partial.validator = response.headers.get('ETag') \
+                    or response.headers.get('Last-Modified')
+                partial.total_size = response.content_length
+                partial.content_type = response.headers.get('Content-Type')
+                partial.sha256 = get_sha256_from_digest_headers(response.headers)
+            case 416 if offset > 0:
+                # The part file might already be complete
+                unsatisfied_range = _UNSATISFIED_CONTENT_RANGE_REGEX.match(
+                    response.headers.get('Content-Range', ''))
+                if unsatisfied_range is not None and int(unsatisfied_range.group(1)) == offset:
+                    partial.total_size = offset
+                    return True
+                part_path.unlink()
+                return False
+            case _:
+                raise ConnectionError(f'Failed to get data. '
+                                      f'HTTP status: {response.status}. '
+                                      f'URL: {response.url}')
+
+        with open(part_path, 'r+b' if offset > 0 else 'wb') as part_file:
+            part_file.seek(offset)
+            part_file.truncate()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                part_file.write(chunk)
+
+    size = part_path.stat().st_size
+    return partial.total_size is None or size >= partial.total_size
+
+
+def _complete_download(
+    partial: _PartialDownload,
+    part_path: Path,
+    file_path: Path,
+    expected_sha256: str | None,
+    num_requests: int,
+) -> DownloadResult:
+    hasher = sha256()
+    with open(part_path, 'rb') as part_file:
+        while block := part_file.read(_HASH_BLOCK_SIZE):
+            hasher.update(block)
+    checksum = hasher.hexdigest()
+
+    expected_sha256 = expected_sha256 or partial.sha256
+    if expected_sha256 is not None and checksum != expected_sha256.lower():
+        part_path.unlink()
+        raise ChecksumMismatchError(f'Checksum mismatch for downloaded file. '
+                                    f'Expected SHA-256: {expected_sha256}. '
+                                    f'Actual SHA-256: {checksum}. URL: {partial.url}')
+
+    os.replace(part_path, file_path)
+    _get_partial_download_metadata_path(file_path).unlink(missing_ok=True)
+    return DownloadResult(
+        path=file_path,
+        size=file_path.stat().st_size,
+        sha256=checksum,
+        content_type=partial.content_type,
+        num_requests=num_requests,
+    )
+
+
+def _get_partial_download_metadata_path(file_path: Path) -> Path:
+    return file_path.with_name(file_path.name + _PART_METADATA_FILE_SUFFIX)
+
+
+def _read_partial_download_metadata(file_path: Path, url: str) -> _PartialDownload | None:
+    try:
+        metadata_path = _get_partial_download_metadata_path(file_path)
+        partial = _PartialDownload(**json.loads(metadata_path.read_text(encoding='utf-8')))
+    except (OSError, ValueError, TypeError):
+        return None
+    return partial if partial.url == url else None
+
+
+def _write_partial_download_metadata(file_path: Path, partial: _PartialDownload) -> None:
+    part_path = file_path.with_name(file_path.name + _PART_FILE_SUFFIX)
+    if part_path.exists():
+        metadata_path = _get_partial_download_metadata_path(file_path)
+        metadata_path.write_text(json.dumps(asdict(partial)), encoding='utf-8')
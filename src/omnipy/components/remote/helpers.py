@@ -2,10 +2,14 @@
 
 import asyncio
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+import re
+import time
 from types import TracebackType
-from typing import cast
+from typing import cast, Mapping
 
 from omnipy.shared.enums.data import BackoffStrategy
+from omnipy.shared.typing import TYPE_CHECKING
 
 from .lazy_import import (ClientSession,
                           ExponentialRetry,
@@ -14,20 +18,325 @@ from .lazy_import import (ClientSession,
                           RandomRetry,
                           TraceConfig)
 
+if TYPE_CHECKING:
+    from .lazy_import import URL
+
+THROTTLING_HTTP_STATUSES = (429, 503)
+
+_RATELIMIT_FIELD_REGEX = re.compile(r'\b(remaining|reset)\s*=\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# Reset values above this are interpreted as Unix timestamps, e.g. in 'X-RateLimit-Reset'
+_MIN_EPOCH_RESET_SECS = 10**9
+
+_LATENCY_SMOOTHING_FACTOR = 0.2
+_MIN_BASELINE_LATENCY_SECS = 0.01
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a ``Retry-After`` header into a number of seconds to wait.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        float | None: Non-negative number of seconds, or ``None`` if missing or malformed.
+
+    Examples:
+        >>> parse_retry_after('120')
+        120.0
+        >>> parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT')
+        0.0
+        >>> parse_retry_after('soon') is None
+        True
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> tuple[int, float] | None:
+    """Parse the remaining request quota announced by a server.
+
+    Supports the ``RateLimit`` header of the IETF draft on rate limit headers, as well as the
+    separate ``RateLimit-Remaining``/``RateLimit-Reset`` headers and their widespread
+    ``X-RateLimit-*`` variants, where the reset time may also be a Unix timestamp.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        tuple[int, float] | None: Number of remaining requests and seconds until the quota is
+            reset, or ``None`` if the server does not announce a quota.
+
+    Examples:
+        >>> parse_rate_limit_headers({'RateLimit': 'limit=100, remaining=50, reset=5'})
+        (50, 5.0)
+        >>> parse_rate_limit_headers({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '30'})
+        (0, 30.0)
+        >>> parse_rate_limit_headers({}) is None
+        True
+    """
+    fields = {}
+    if 'RateLimit' in headers:
+        fields = {
+            name.lower(): value
+            for name, value in _RATELIMIT_FIELD_REGEX.findall(headers['RateLimit'])
+        }
+    for prefix in ('RateLimit-', 'X-RateLimit-'):
+        for field in ('remaining', 'reset'):
+            header_value = headers.get(prefix + field.capitalize())
+            if header_value is not None:
+                fields.setdefault(field, header_value)
+
+    try:
+        remaining = int(float(fields['remaining']))
+        reset_secs = float(fields['reset'])
+    except (KeyError, ValueError):
+        return None
+
+    if reset_secs > _MIN_EPOCH_RESET_SECS:
+        reset_secs = reset_secs - time.time()
+    return max(remaining, 0), max(reset_secs, 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Rate limiter for a single host that adapts its request rate to feedback from the server.
+
+    Requests are scheduled by a token bucket that allows a burst of `burst_size` requests. The
+    rate starts at `requests_per_second` and is then adjusted by additive increase and
+    multiplicative decrease (AIMD), similar to TCP congestion control. Until the server first
+    signals throttling, each successful response increases the rate by one request per second
+    ("slow start"), which grows the rate exponentially. After that, successful responses
+    increase the rate by `additive_increase` requests per second for each second of requests.
+    A throttling response (429 or 503) cuts the rate by `decrease_factor`. The rate is not
+    increased while response latencies are growing, which is an early sign of server overload.
+
+    Requests are paused until the time given by a `Retry-After` header, or until an exhausted
+    quota announced by `RateLimit` headers is reset. While a non-exhausted quota is announced,
+    the rate instead follows the quota, spreading the remaining requests evenly until the reset.
+
+    The limiter does not depend on an event loop, so that it can be shared by sessions across
+    event loops. Use `get_host_rate_limiter()` to get the shared limiter for a host.
+    """
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst_size: float = 1,
+        min_requests_per_second: float | None = None,
+        max_requests_per_second: float | None = None,
+        additive_increase: float | None = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance_factor: float = 2.0,
+    ) -> None:
+        self._initial_requests_per_second = requests_per_second
+        self._requests_per_second = requests_per_second
+        self._burst_size = max(burst_size, 1)
+        self._min_requests_per_second = min_requests_per_second \
+            if min_requests_per_second is not None else requests_per_second / 100
+        self._max_requests_per_second = max_requests_per_second \
+            if max_requests_per_second is not None else requests_per_second * 100
+        self._additive_increase = additive_increase \
+            if additive_increase is not None else requests_per_second / 2
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance_factor = latency_tolerance_factor
+
+        self._num_tokens = self._burst_size
+        self._last_refill_time = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease_time = 0.0
+        self._slow_start = True
+        self._quota_requests_per_second: float | None = None
+        self._quota_reset_time = 0.0
+        self._baseline_latency: float | None = None
+        self._smoothed_latency: float | None = None
+
+    @property
+    def initial_requests_per_second(self) -> float:
+        """Return the request rate that the limiter started out with."""
+
+        return self._initial_requests_per_second
+
+    @property
+    def requests_per_second(self) -> float:
+        """Return the current request rate, which follows an announced quota if there is one."""
+
+        if self._quota_requests_per_second is not None \
+                and time.monotonic() < self._quota_reset_time:
+            return min(
+                max(self._quota_requests_per_second, self._min_requests_per_second),
+                self._max_requests_per_second)
+        return self._requests_per_second
+
+    @property
+    def paused_until(self) -> float:
+        """Return the ``time.monotonic()`` time until which requests are paused."""
+
+        return self._paused_until
+
+    async def acquire(self) -> None:
+        """Wait until a new request is allowed according to the current rate."""
+
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            requests_per_second = self.requests_per_second
+            self._num_tokens = min(
+                self._num_tokens + (now - self._last_refill_time) * requests_per_second,
+                self._burst_size,
+            )
+            self._last_refill_time = now
+
+            if self._num_tokens >= 1:
+                self._num_tokens -= 1
+                return
+
+            # The rate might change while waiting, so the token bucket is checked again
+            await asyncio.sleep((1 - self._num_tokens) / requests_per_second)
+
+    def register_response(self,
+                          status: int,
+                          headers: Mapping[str, str],
+                          latency_secs: float | None = None) -> None:
+        """Adjust the request rate according to a response from the host.
+
+        Args:
+            status: HTTP status code of the response.
+            headers: Response headers.
+            latency_secs: Time from sending the request until the response headers arrived.
+        """
+        now = time.monotonic()
+
+        if status in THROTTLING_HTTP_STATUSES:
+            self._decrease_rate(now)
+            retry_after_secs = parse_retry_after(headers.get('Retry-After'))
+            if retry_after_secs is not None:
+                self._pause(now + retry_after_secs)
+        else:
+            latency_is_growing = False
+            if latency_secs is not None:
+                latency_is_growing = self._register_latency(latency_secs)
+            if latency_is_growing:
+                self._slow_start = False
+            elif status < 400:
+                self._increase_rate()
+
+        self._register_quota(now, headers)
+
+    def _increase_rate(self) -> None:
+        # Increasing the rate by `additive_increase / rate` for each response adds up to an
+        # increase of `additive_increase` for each second of requests at the current rate
+        increase = 1.0 if self._slow_start \
+            else self._additive_increase / self._requests_per_second
+        self._requests_per_second = min(self._requests_per_second + increase,
+                                        self._max_requests_per_second)
+
+    def _decrease_rate(self, now: float) -> None:
+        # Responses to requests sent before the previous decrease took effect are ignored, so
+        # that a burst of throttling responses only decreases the rate once
+        if now - self._last_decrease_time < max(1 / self._requests_per_second,
+                                                self._smoothed_latency or 0.0):
+            return
+        self._last_decrease_time = now
+        self._slow_start = False
+        self._requests_per_second = max(self._requests_per_second * self._decrease_factor,
+                                        self._min_requests_per_second)
+
+    def _pause(self, until: float) -> None:
+        # No burst of requests is allowed directly after the pause
+        self._paused_until = max(self._paused_until, until)
+        self._num_tokens = 0
+        self._last_refill_time = self._paused_until
+
+    def _register_latency(self, latency_secs: float) -> bool:
+        if self._smoothed_latency is None or self._baseline_latency is None:
+            self._smoothed_latency = self._baseline_latency = latency_secs
+            return False
+
+        self._baseline_latency = min(self._baseline_latency, latency_secs)
+        self._smoothed_latency += _LATENCY_SMOOTHING_FACTOR * (
+            latency_secs - self._smoothed_latency)
+
+        max_latency = self._latency_tolerance_factor \
+            * max(self._baseline_latency, _MIN_BASELINE_LATENCY_SECS)
+        return self._smoothed_latency > max_latency
+
+    def _register_quota(self, now: float, headers: Mapping[str, str]) -> None:
+        quota = parse_rate_limit_headers(headers)
+        if quota is None:
+            return
+
+        remaining, reset_secs = quota
+        if remaining == 0:
+            self._pause(now + reset_secs)
+        elif reset_secs > 0:
+            self._quota_requests_per_second = remaining / reset_secs
+            self._quota_reset_time = now + reset_secs
+
+
+_host_rate_limiters: dict[tuple[str | None, int | None], AdaptiveRateLimiter] = {}
+
+
+def get_host_rate_limiter(url: 'URL',
+                          requests_per_second: float,
+                          burst_size: float = 1) -> AdaptiveRateLimiter:
+    """Return the adaptive rate limiter shared by all sessions sending requests to a host.
+
+    A new limiter is created if there is none for the host, or if the configured initial rate
+    for the host has changed.
+
+    Args:
+        url: URL of a request to the host.
+        requests_per_second: Initial request rate for the host.
+        burst_size: Number of requests allowed to be sent in a burst.
+
+    Returns:
+        AdaptiveRateLimiter: Rate limiter for the host and port of the URL.
+    """
+    key = (url.host, url.port)
+    rate_limiter = _host_rate_limiters.get(key)
+    if rate_limiter is None or rate_limiter.initial_requests_per_second != requests_per_second:
+        rate_limiter = AdaptiveRateLimiter(requests_per_second, burst_size=burst_size)
+        _host_rate_limiters[key] = rate_limiter
+    return rate_limiter
+
 
 class RateLimitingClientSession(ClientSession):
     """
     A ClientSession that limits the number of requests made per time period, allowing an initial
     burst of requests to go through before rate limiting kicks in for the rest.
+
+    If `adaptive` is True, the configured rate is instead used as the starting point of an
+    `AdaptiveRateLimiter` per host, which adapts the rate to responses from the server and is
+    shared with all other adaptive sessions.
     """
-    def __init__(self, requests_per_time_period: float, time_period_in_secs: float, *args,
+    def __init__(self,
+                 requests_per_time_period: float,
+                 time_period_in_secs: float,
+                 *args,
+                 adaptive: bool = False,
                  **kwargs) -> None:
         from .lazy_import import AsyncLimiter
 
         trace_config = TraceConfig()
-        trace_config.on_request_start.append(self._limit_request)
+        if adaptive:
+            trace_config.on_request_start.append(self._limit_request_adaptively)
+            trace_config.on_request_end.append(self._register_response)
+        else:
+            trace_config.on_request_start.append(self._limit_request)
         super().__init__(*args, trace_configs=[trace_config], **kwargs)
 
+        self._adaptive = adaptive
         self._requests_per_time_period = requests_per_time_period
         self._time_period_in_secs = time_period_in_secs
 
@@ -71,6 +380,25 @@ class RateLimitingClientSession(ClientSession):
 
         # print(f'Request number: {request_num}, Actual request time: {datetime.now()}')
 
+    async def _limit_request_adaptively(self, session, trace_config_ctx, params) -> None:
+        rate_limiter = get_host_rate_limiter(params.url, self.requests_per_second, self._burst_size)
+        await rate_limiter.acquire()
+
+        trace_config_ctx.rate_limiter = rate_limiter
+        trace_config_ctx.request_start_time = time.monotonic()
+
+    async def _register_response(self, session, trace_config_ctx, params) -> None:
+        latency_secs = time.monotonic() - trace_config_ctx.request_start_time
+        trace_config_ctx.rate_limiter.register_response(params.response.status,
+                                                        params.response.headers,
+                                                        latency_secs)
+
+    @property
+    def adaptive(self) -> bool:
+        """Return whether the request rate adapts to responses from the server."""
+
+        return self._adaptive
+
     @property
     def requests_per_second(self) -> float:
         """Return the configured steady-state request rate."""
@@ -0,0 +1,417 @@
+"""On-disk cache of HTTP responses with support for conditional requests.
+
+Responses are stored per URL as a JSON metadata file and a body file. Freshness is determined
+from the ``Cache-Control`` and ``Expires`` response headers, while the ``ETag`` and
+``Last-Modified`` validators of stale responses are sent as ``If-None-Match`` and
+``If-Modified-Since`` headers, so that unchanged content is answered with a body-less
+``304 Not Modified`` response.
+"""
+
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any, Callable, Mapping
+
+from omnipy.shared.enums.data import HttpCacheMode
+from omnipy.shared.protocols.config import IsHttpCacheConfig
+
+_CACHE_CONTROL_DIRECTIVE_REGEX = re.compile(r'\s*([\w-]+)\s*(?:=\s*"?([^",]*)"?)?\s*(?:,|$)')
+_CHARSET_REGEX = re.compile(r'charset\s*=\s*"?([\w.:-]+)"?', re.IGNORECASE)
+
+_METADATA_FILE_SUFFIX = '.json'
+_BODY_FILE_SUFFIX = '.body'
+
+
+def parse_cache_control(header_value: str | None) -> dict[str, str | None]:
+    """Parse a ``Cache-Control`` header into a dict of lower-cased directives.
+
+    Args:
+        header_value: Value of the ``Cache-Control`` header, if any.
+
+    Returns:
+        dict[str, str | None]: Directive values, or ``None`` for directives without value.
+
+    Examples:
+        >>> parse_cache_control('public, max-age=300, no-cache')
+        {'public': None, 'max-age': '300', 'no-cache': None}
+    """
+    if not header_value:
+        return {}
+    return {
+        match.group(1).lower(): match.group(2)
+        for match in _CACHE_CONTROL_DIRECTIVE_REGEX.finditer(header_value)
+        if match.group(1)
+    }
+
+
+def _parse_http_date(header_value: str | None) -> float | None:
+    if not header_value:
+        return None
+    try:
+        return parsedate_to_datetime(header_value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_non_negative_int(value: str | None) -> int | None:
+    try:
+        return max(int(value), 0) if value is not None else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class HttpCacheEntry:
+    """Metadata of a cached HTTP response.
+
+    Args:
+        url: Requested URL.
+        status: HTTP status code of the cached response.
+        headers: Response headers as a list of name-value pairs.
+        stored_at: Time of storing or last revalidation, in seconds since the epoch.
+        body_size: Size of the cached body in bytes.
+    """
+
+    url: str
+    status: int
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    stored_at: float = 0.0
+    body_size: int = 0
+
+    def get_header(self, name: str) -> str | None:
+        """Return the value of the first header with a given case-insensitive name, if any."""
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def etag(self) -> str | None:
+        return self.get_header('ETag')
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.get_header('Last-Modified')
+
+    @property
+    def freshness_lifetime_secs(self) -> float:
+        """Return for how long the response is fresh after being stored or revalidated.
+
+        Calculated from ``Cache-Control: max-age``, or else from ``Expires`` relative to
+        ``Date``, minus the ``Age`` of the response when received. Responses with
+        ``no-cache`` or without explicit freshness information are always stale.
+        """
+        cache_control = parse_cache_control(self.get_header('Cache-Control'))
+        if 'no-cache' in cache_control:
+            return 0.0
+
+        max_age = _parse_non_negative_int(cache_control.get('max-age'))
+        if max_age is not None:
+            lifetime: float = max_age
+        else:
+            expires = _parse_http_date(self.get_header('Expires'))
+            if expires is None:
+                return 0.0
+            date = _parse_http_date(self.get_header('Date'))
+            lifetime = expires - (date if date is not None else self.stored_at)
+
+        age = _parse_non_negative_int(self.get_header('Age')) or 0
+        return max(lifetime - age, 0.0)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Return whether the response can be served without revalidation."""
+        now = time.time() if now is None else now
+        return now - self.stored_at < self.freshness_lifetime_secs
+
+    def get_conditional_request_headers(self) -> dict[str, str]:
+        """Return the headers needed to revalidate the response with the server."""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class CachedResponse:
+    """Response served from the HTTP cache.
+
+    Provides the subset of the ``aiohttp.ClientResponse`` interface used by the remote tasks.
+
+    Args:
+        entry: Metadata of the cached response.
+        body: Cached response body.
+    """
+    def __init__(self, entry: HttpCacheEntry, body: bytes) -> None:
+        from .lazy_import import CIMultiDict, CIMultiDictProxy, URL
+
+        self._body = body
+        self.status = entry.status
+        self.url = URL(entry.url)
+        self.headers = CIMultiDictProxy(CIMultiDict(entry.headers))
+
+    @property
+    def content_type(self) -> str:
+        from .lazy_import import CONTENT_TYPE, parse_mimetype
+
+        mimetype = parse_mimetype(self.headers.get(CONTENT_TYPE, 'application/octet-stream'))
+        return f'{mimetype.type}/{mimetype.subtype}'
+
+    @property
+    def charset(self) -> str | None:
+        from .lazy_import import CONTENT_TYPE
+
+        match = _CHARSET_REGEX.search(self.headers.get(CONTENT_TYPE, ''))
+        return match.group(1) if match else None
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str | None = None, errors: str = 'strict') -> str:
+        return self._body.decode(encoding or self.charset or 'utf-8', errors=errors)
+
+    async def json(
+        self,
+        *,
+        encoding: str | None = None,
+        loads: Callable[[str], Any] = json.loads,
+        content_type: str | None = 'application/json',
+    ) -> Any:
+        if content_type is not None and content_type not in self.content_type:
+            raise ValueError(f'Attempt to decode JSON with unexpected mimetype: '
+                             f'{self.content_type}. URL: {self.url}')
+        return loads(await self.text(encoding=encoding))
+
+
+class HttpCache:
+    """On-disk cache of HTTP responses, keyed by URL.
+
+    Only ``200 OK`` responses are stored, unless forbidden by ``Cache-Control: no-store`` or
+    ``Vary: *``. Bodies larger than ``max_entry_size_in_bytes`` are not stored, and the least
+    recently used responses are evicted when the total size of the stored bodies exceeds
+    ``max_size_in_bytes``.
+
+    Cache files are read and written synchronously. Async code should call ``get()``,
+    ``store()`` and ``refresh()`` in a worker thread, e.g. with ``asyncio.to_thread()``, to
+    avoid blocking the event loop. The methods can be called from several threads at once.
+
+    Args:
+        cache_dir_path: Directory where cached responses are stored.
+        mode: Whether and how cached responses are used, see ``HttpCacheMode``.
+        max_size_in_bytes: Maximum total size of cached response bodies.
+        max_entry_size_in_bytes: Maximum size of a single cached response body.
+    """
+    def __init__(
+        self,
+        cache_dir_path: str | Path,
+        mode: HttpCacheMode.Literals = HttpCacheMode.DEFAULT,
+        max_size_in_bytes: int = 1024**3,
+        max_entry_size_in_bytes: int = 128 * 1024**2,
+    ) -> None:
+        self.cache_dir_path = Path(cache_dir_path)
+        self.mode = mode
+        self.max_size_in_bytes = max_size_in_bytes
+        self.max_entry_size_in_bytes = max_entry_size_in_bytes
+        self._total_size_in_bytes: int | None = None
+        self._size_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: IsHttpCacheConfig,
+                    default_cache_dir_path: str | Path) -> 'HttpCache | None':
+        """Create an HTTP cache from configuration.
+
+        Args:
+            config: HTTP cache configuration.
+            default_cache_dir_path: Directory where cached responses are stored if not set in
+                the configuration.
+
+        Returns:
+            HttpCache | None: The HTTP cache, or ``None`` if caching is turned off.
+        """
+        if config.mode == HttpCacheMode.OFF:
+            return None
+        return cls(
+            config.cache_dir_path or default_cache_dir_path,
+            mode=config.mode,
+            max_size_in_bytes=config.max_size_in_bytes,
+            max_entry_size_in_bytes=config.max_entry_size_in_bytes,
+        )
+
+    @property
+    def makes_requests(self) -> bool:
+        return self.mode != HttpCacheMode.OFFLINE
+
+    def get(self, url: str) -> tuple[HttpCacheEntry, bytes] | None:
+        """Return the cached response for a URL, regardless of freshness.
+
+        Args:
+            url: Requested URL.
+
+        Returns:
+            tuple[HttpCacheEntry, bytes] | None: Metadata and body of the cached response, or
+                ``None`` if the URL is not cached.
+        """
+        metadata_path, body_path = self._get_file_paths(url)
+        try:
+            entry = HttpCacheEntry(**json.loads(metadata_path.read_text(encoding='utf-8')))
+            body = body_path.read_bytes()
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if entry.url != url or len(body) != entry.body_size:
+            return None
+
+        # Marks the entry as recently used, for eviction
+        os.utime(body_path)
+        entry.headers = [(key, value) for key, value in entry.headers]
+        return entry, body
+
+    def can_serve_without_request(self, entry: HttpCacheEntry) -> bool:
+        """Return whether a cached response can be served without contacting the server."""
+        return self.mode != HttpCacheMode.DEFAULT or entry.is_fresh()
+
+    def is_storable(self, status: int, headers: Mapping[str, str]) -> bool:
+        """Return whether a response may be stored in the cache.
+
+        Args:
+            status: HTTP status code of the response.
+            headers: Response headers.
+
+        Returns:
+            bool: ``True`` if the response may be stored.
+        """
+        if status != 200:
+            return False
+        if 'no-store' in parse_cache_control(headers.get('Cache-Control')):
+            return False
+        if headers.get('Vary', '').strip() == '*':
+            return False
+        content_length = _parse_non_negative_int(headers.get('Content-Length'))
+        return content_length is None or content_length <= self.max_entry_size_in_bytes
+
+    def store(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str] | list[tuple[str, str]],
+        body: bytes,
+    ) -> HttpCacheEntry:
+        """Store a response in the cache, if not larger than ``max_entry_size_in_bytes``.
+
+        Args:
+            url: Requested URL.
+            status: HTTP status code of the response.
+            headers: Response headers, as a mapping or a list of name-value pairs.
+            body: Response body.
+
+        Returns:
+            HttpCacheEntry: Metadata of the response, whether stored or not.
+        """
+        header_items = headers.items() if isinstance(headers, Mapping) else headers
+        entry = HttpCacheEntry(
+            url=url,
+            status=status,
+            headers=[(str(key), str(value)) for key, value in header_items],
+            stored_at=time.time(),
+            body_size=len(body),
+        )
+        if entry.body_size > min(self.max_entry_size_in_bytes, self.max_size_in_bytes):
+            return entry
+
+        metadata_path, body_path = self._get_file_paths(url)
+        prev_body_size = body_path.stat().st_size if body_path.exists() else 0
+
+        self.cache_dir_path.mkdir(parents=True, exist_ok=True)
+        _write_file_atomically(body_path, body)
+        _write_file_atomically(metadata_path, json.dumps(asdict(entry)).encode('utf-8'))
+
+        with self._size_lock:
+            self._total_size_in_bytes = \
+                self._get_total_size_in_bytes() - prev_body_size + entry.body_size
+            self._evict_least_recently_used(keep=body_path)
+        return entry
+
+    def refresh(self, entry: HttpCacheEntry, headers: Mapping[str, str]) -> HttpCacheEntry:
+        """Update a cached response after revalidation with a ``304 Not Modified`` response.
+
+        Headers of the ``304`` response replace the stored headers with the same names, and
+        the freshness of the cached response is restarted.
+
+        Args:
+            entry: Metadata of the cached response.
+            headers: Headers of the ``304 Not Modified`` response.
+
+        Returns:
+            HttpCacheEntry: Updated metadata of the cached response.
+        """
+        updated_names = {key.lower() for key in headers.keys()}
+        entry.headers = [
+            (key, value) for key, value in entry.headers if key.lower() not in updated_names
+        ]
+        entry.headers += [(str(key), str(value))
+                          for key, value in headers.items()
+                          if key.lower() != 'content-length']
+        entry.stored_at = time.time()
+
+        metadata_path, _ = self._get_file_paths(entry.url)
+        if metadata_path.exists():
+            _write_file_atomically(metadata_path, json.dumps(asdict(entry)).encode('utf-8'))
+        return entry
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._size_lock:
+            for path in self._iter_cache_files():
+                path.unlink(missing_ok=True)
+            self._total_size_in_bytes = 0
+
+    def _get_file_paths(self, url: str) -> tuple[Path, Path]:
+        key = sha256(url.encode('utf-8')).hexdigest()
+        return (self.cache_dir_path / f'{key}{_METADATA_FILE_SUFFIX}',
+                self.cache_dir_path / f'{key}{_BODY_FILE_SUFFIX}')
+
+    def _iter_cache_files(self):
+        if self.cache_dir_path.is_dir():
+            for path in self.cache_dir_path.iterdir():
+                if path.suffix in (_METADATA_FILE_SUFFIX, _BODY_FILE_SUFFIX):
+                    yield path
+
+    def _get_total_size_in_bytes(self) -> int:
+        if self._total_size_in_bytes is None:
+            self._total_size_in_bytes = sum(path.stat().st_size
+                                            for path in self._iter_cache_files()
+                                            if path.suffix == _BODY_FILE_SUFFIX)
+        return self._total_size_in_bytes
+
+    def _evict_least_recently_used(self, keep: Path) -> None:
+        if self._get_total_size_in_bytes() <= self.max_size_in_bytes:
+            return
+
+        body_paths = sorted(
+            (path for path in self._iter_cache_files() if path.suffix == _BODY_FILE_SUFFIX),
+            key=lambda path: path.stat().st_mtime,
+        )
+        total_size = sum(path.stat().st_size for path in body_paths)
+        for body_path in body_paths:
+            if total_size <= self.max_size_in_bytes:
+                break
+            if body_path == keep:
+                continue
+            total_size -= body_path.stat().st_size
+            body_path.with_suffix(_METADATA_FILE_SUFFIX).unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+        self._total_size_in_bytes = total_size
+
+
+def _write_file_atomically(path: Path, content: bytes) -> None:
+    # Unique per process and thread, as the same URL might be stored concurrently
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
@@ -1,6 +1,11 @@
 """Lazy imports for async HTTP client dependencies used by remote components."""
 
-from aiohttp import ClientResponse, ClientSession, TraceConfig  # noqa
+from aiohttp import ClientConnectionError  # noqa
+from aiohttp import ClientPayloadError  # noqa
+from aiohttp import ClientResponse  # noqa
+from aiohttp import ClientSession  # noqa
+from aiohttp import TCPConnector  # noqa
+from aiohttp import TraceConfig  # noqa
 from aiohttp.hdrs import CONTENT_TYPE  # noqa
 from aiohttp.helpers import MimeType, parse_mimetype  # noqa
 from aiohttp_retry import ExponentialRetry  # noqa
@@ -9,3 +14,5 @@ from aiohttp_retry import JitterRetry  # noqa
 from aiohttp_retry import RandomRetry  # noqa
 from aiohttp_retry import RetryClient  # noqa
 from aiolimiter import AsyncLimiter  # noqa
+from multidict import CIMultiDict, CIMultiDictProxy  # noqa
+from yarl import URL  # noqa
@@ -1,6 +1,7 @@
 """Models for HTTP URLs, URL parts, query strings, and automatic response decoding."""
 
-from pathlib import PurePosixPath
+import mmap
+from pathlib import Path, PurePosixPath
 from typing import Any, cast, TypeGuard
 from urllib.parse import quote, unquote
 
@@ -20,6 +21,7 @@ __all__ = [
     'UrlPathModel',
     'UrlDataclassModel',
     'HttpUrlModel',
+    'DownloadedFileModel',
 ]
 
 QueryParamsSplitterModel = NestedSplitToItemsModel.adjust(
@@ -502,3 +504,60 @@ class AutoResponseContentModel(Model[ResponseContentPydModel | StrictBytesModel
                     return StrictBytesModel(data.response)
         else:
             return data
+
+
+class DownloadedFilePydModel(pyd.BaseModel):
+    """Describe an HTTP response body that has been downloaded to a local file.
+
+    Args:
+        path: Path of the downloaded file.
+        size: Size of the downloaded file in bytes.
+        sha256: Hex digest of the SHA-256 checksum of the file content.
+        content_type: Content type of the response, if provided by the server.
+    """
+    path: str
+    size: pyd.NonNegativeInt
+    sha256: str
+    content_type: str | None = None
+
+
+class DownloadedFileModel(Model[DownloadedFilePydModel]):
+    """Reference an HTTP response body downloaded to a local file.
+
+    The content is kept on disk and is only read into memory on request. Use
+    ``memory_map()`` to access the content as a read-only bytes-like object without loading
+    it all into memory.
+
+    Examples:
+        >>> # downloaded = DownloadedFileModel(
+        >>> #     DownloadedFilePydModel(path='data.bin', size=3, sha256='...'))
+        >>> # with downloaded.memory_map() as content:
+        >>> #     content[:2]
+        >>> pass
+    """
+    @property
+    def path(self) -> Path:
+        return Path(self.content.path)
+
+    def read_bytes(self) -> bytes:
+        """Read the full content of the downloaded file into memory.
+
+        Returns:
+            bytes: File content.
+        """
+        return self.path.read_bytes()
+
+    def memory_map(self) -> mmap.mmap:
+        """Memory-map the downloaded file for read-only access.
+
+        The returned object supports slicing and the buffer protocol, and can be used as a
+        context manager to close the memory map after use.
+
+        Returns:
+            mmap.mmap: Read-only memory map of the file content.
+
+        Raises:
+            ValueError: If the file is empty, which cannot be memory-mapped.
+        """
+        with open(self.path, 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,224 @@
+"""Runtime-managed pool of HTTP client sessions shared by remote tasks and dataset loading.
+
+The pool is the process-global ``http_session_pool`` object, which is exposed as
+``runtime.objects.http_session_pool`` and configured through ``runtime.config.data.http``.
+
+Each event loop gets a single connector, which keeps connections alive for reuse and caches DNS
+lookups, so that many requests to the same host share a handful of sockets and TLS handshakes.
+On top of the connector, a rate-limiting retry client is created per host according to the
+per-host request policy. As aiohttp sessions are bound to an event loop, all sessions of a loop
+are closed and removed from the pool when the loop shuts down, e.g. at the end of
+``asyncio.run()`` for an outermost async flow run, or explicitly with ``close()``.
+
+``retry_client_for_host()`` provides the retry client to use for requests to a host, falling
+back to a temporary client following the same per-host request policy if the pool is disabled.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, cast
+import weakref
+
+from omnipy.config.data import HttpConfig
+from omnipy.shared.protocols.config import IsHttpConfig, IsHttpRequestsConfig
+from omnipy.shared.typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .helpers import RateLimitingClientSession
+    from .lazy_import import RetryClient, TCPConnector
+
+__all__ = [
+    'HttpSessionPool',
+    'http_session_pool',
+    'retry_client_for_host',
+]
+
+
+class _LoopSessions:
+    """Connector and per-host clients of the pool for a single event loop."""
+    def __init__(self, connector: 'TCPConnector') -> None:
+        self.connector = connector
+        self.clients: dict[str, tuple[IsHttpRequestsConfig, 'RetryClient']] = {}
+        self.sessions: list['RateLimitingClientSession'] = []
+        self.closer: AsyncGenerator[None, None] | None = None
+
+    async def close(self) -> None:
+        self.clients.clear()
+        sessions, self.sessions = self.sessions, []
+        for session in sessions:
+            await session.close()
+        await self.connector.close()
+
+
+class HttpSessionPool:
+    """Pool of HTTP client sessions with shared connections per event loop.
+
+    Sessions are handed out by ``get_retry_client()``, which must be called from within a
+    running event loop. Pooled clients must not be closed by the caller.
+    """
+    def __init__(self) -> None:
+        self._config: IsHttpConfig = cast(IsHttpConfig, HttpConfig())
+        self._loop_sessions: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSessions] \
+            = weakref.WeakKeyDictionary()
+
+    @property
+    def config(self) -> IsHttpConfig:
+        """Return the HTTP configuration."""
+
+        return self._config
+
+    def set_config(self, config: IsHttpConfig) -> None:
+        """Replace the HTTP configuration. Sessions created after the change use the new config.
+
+        Args:
+            config: New HTTP configuration.
+        """
+
+        self._config = config
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether remote tasks and dataset loading use pooled sessions by default."""
+
+        return self._config.pool.enabled
+
+    async def get_retry_client(self,
+                               host: str,
+                               http_config: IsHttpConfig | None = None) -> 'RetryClient':
+        """Return a pooled, rate-limiting retry client for a host in the running event loop.
+
+        The client follows the request policy for the host in ``http_config.for_host``. If the
+        policy has changed since the client was created, a new client is created.
+
+        Args:
+            host: Host name that requests will be made to.
+            http_config: HTTP configuration with the request policy for the host. Defaults to
+                ``config``. Connection limits of the pool always follow ``config``.
+
+        Returns:
+            RetryClient: Retry client wrapping a pooled session for the host.
+        """
+        from .helpers import RateLimitingClientSession
+        from .tasks import get_retry_client
+
+        loop_sessions = await self._get_loop_sessions()
+        host_config = (http_config or self._config).for_host[host]
+
+        if host in loop_sessions.clients:
+            prev_host_config, retry_client = loop_sessions.clients[host]
+            if prev_host_config == host_config:
+                return retry_client
+
+        session = RateLimitingClientSession(
+            host_config.requests_per_time_period,
+            host_config.time_period_in_secs,
+            adaptive=host_config.adaptive_rate_limiting,
+            connector=loop_sessions.connector,
+            connector_owner=False,
+        )
+        loop_sessions.sessions.append(session)
+
+        retry_client = get_retry_client(
+            client_session=session,
+            retry_http_statuses=host_config.retry_http_statuses,
+            retry_attempts=host_config.retry_attempts,
+            retry_backoff_strategy=host_config.retry_backoff_strategy,
+        )
+        loop_sessions.clients[host] = (host_config.deepcopy(), retry_client)
+        return retry_client
+
+    async def close(self) -> None:
+        """Close all pooled sessions and connections of the running event loop."""
+
+        loop_sessions = self._loop_sessions.pop(asyncio.get_running_loop(), None)
+        if loop_sessions is not None and loop_sessions.closer is not None:
+            await loop_sessions.closer.aclose()
+
+    async def _get_loop_sessions(self) -> _LoopSessions:
+        from .lazy_import import TCPConnector
+
+        loop = asyncio.get_running_loop()
+        loop_sessions = self._loop_sessions.get(loop)
+        if loop_sessions is None:
+            pool_config = self._config.pool
+            loop_sessions = _LoopSessions(
+                TCPConnector(
+                    limit=pool_config.max_connections,
+                    limit_per_host=pool_config.max_connections_per_host,
+                    keepalive_timeout=pool_config.keepalive_timeout_secs,
+                    use_dns_cache=True,
+                    ttl_dns_cache=pool_config.dns_cache_ttl_secs,
+                ))
+
+            # Event loops close all open async generators when shutting down (see
+            # `asyncio.loop.shutdown_asyncgens()`), which is used here as a hook to close the
+            # sessions of the loop while it is still running
+            loop_sessions.closer = self._close_on_loop_shutdown(loop, loop_sessions)
+            await loop_sessions.closer.__anext__()
+
+            self._loop_sessions[loop] = loop_sessions
+        return loop_sessions
+
+    async def _close_on_loop_shutdown(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_sessions: _LoopSessions,
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            # The connector and sessions refer back to the loop, which would otherwise keep the
+            # entry of the loop alive in the weak key dictionary
+            if self._loop_sessions.get(loop) is loop_sessions:
+                del self._loop_sessions[loop]
+            await loop_sessions.close()
+
+
+http_session_pool = HttpSessionPool()
+
+
+@asynccontextmanager
+async def retry_client_for_host(
+    host: str,
+    retry_client: 'RetryClient | None' = None,
+    http_config: IsHttpConfig | None = None,
+) -> AsyncIterator['RetryClient']:
+    """Provide a retry client for requests to a host.
+
+    Args:
+        host: Host name that requests will be made to.
+        retry_client: Retry client provided by the caller, which is used as is if given.
+        http_config: HTTP configuration with the request policy for the host, which also
+            determines whether the pool is used. Defaults to the configuration of
+            ``http_session_pool``.
+
+    Returns:
+        The given retry client, else a pooled retry client if the pool is enabled, or else a
+        temporary rate-limiting retry client that is closed on exit.
+    """
+    from .helpers import RateLimitingClientSession
+    from .tasks import get_retry_client
+
+    if retry_client is not None:
+        yield retry_client
+        return
+
+    if http_config is None:
+        http_config = http_session_pool.config
+
+    if http_config.pool.enabled:
+        yield await http_session_pool.get_retry_client(host, http_config)
+        return
+
+    host_config = http_config.for_host[host]
+    async with RateLimitingClientSession(
+            host_config.requests_per_time_period,
+            host_config.time_period_in_secs,
+            adaptive=host_config.adaptive_rate_limiting) as client_session:
+        async with get_retry_client(
+                client_session=client_session,
+                retry_http_statuses=host_config.retry_http_statuses,
+                retry_attempts=host_config.retry_attempts,
+                retry_backoff_strategy=host_config.retry_backoff_strategy,
+        ) as new_retry_client:
+            yield new_retry_client
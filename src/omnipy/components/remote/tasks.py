@@ -2,56 +2,146 @@
 
 import asyncio
 from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from hashlib import sha256
+import os
 from pathlib import Path
+import re
 from typing import AsyncGenerator, cast
 
 from typing_extensions import TypeVar
 
 from omnipy.compute.task import TaskTemplate
 from omnipy.data.dataset import Dataset
-from omnipy.data.model import Model
+from omnipy.hub.tracing import Span, tracer
 from omnipy.shared.enums.data import BackoffStrategy
 from omnipy.shared.exceptions import ShouldNotOccurException
 from omnipy.shared.typing import TYPE_CHECKING
+from omnipy.util.helpers import get_event_loop_and_check_if_loop_is_running
 
-from ..json.datasets import JsonDataset, JsonListOfDictsDataset
+from ..json.datasets import JsonDataset, JsonDictDataset, JsonListOfDictsDataset
 from ..json.models import JsonModel
 from ..raw.datasets import BytesDataset, StrDataset
 from ..raw.models import BytesModel, StrModel
-from .constants import DEFAULT_BACKOFF_STRATEGY, DEFAULT_RETRIES, DEFAULT_RETRY_STATUSES
-from .datasets import AutoResponseContentDataset, HttpUrlDataset
-from .models import AutoResponseContentModel, HttpUrlModel, ResponseContentPydModel
+from .constants import (DEFAULT_BACKOFF_STRATEGY,
+                        DEFAULT_DOWNLOAD_ATTEMPTS,
+                        DEFAULT_DOWNLOAD_CHUNK_SIZE,
+                        DEFAULT_MAX_CONCURRENT_LISTINGS,
+                        DEFAULT_RETRIES,
+                        DEFAULT_RETRY_STATUSES,
+                        GITHUB_API_URL,
+                        GITHUB_RAW_URL)
+from .datasets import AutoResponseContentDataset, DownloadedFileDataset, HttpUrlDataset
+from .models import (AutoResponseContentModel,
+                     DownloadedFileModel,
+                     DownloadedFilePydModel,
+                     HttpUrlModel,
+                     ResponseContentPydModel)
+from .session_pool import retry_client_for_host
 
 if TYPE_CHECKING:
+    from .http_cache import CachedResponse, HttpCache
     from .lazy_import import ClientResponse, ClientSession, RetryClient
 
 _JsonDatasetT = TypeVar('_JsonDatasetT', bound=Dataset)
 
 
-async def _call_get(url: HttpUrlModel,
-                    session: 'ClientSession') -> 'AsyncGenerator[ClientResponse, None]':
-    """Perform a GET request and yield the validated successful response.
+async def _call_get(
+    url: HttpUrlModel,
+    session: 'ClientSession',
+    http_cache: 'HttpCache | None' = None,
+) -> 'AsyncGenerator[ClientResponse | CachedResponse, None]':
+    """Perform a GET request and yield the response, making use of an HTTP cache if provided.
+
+    With an HTTP cache, fresh cached responses are yielded without making a request, while
+    stale cached responses are revalidated with a conditional request. If the server replies
+    with ``304 Not Modified``, the cached response is yielded. Successful responses are stored
+    in the cache.
 
     Args:
         url: URL to request.
         session: Active aiohttp-compatible session used to execute the request.
+        http_cache: Optional on-disk cache of HTTP responses.
 
     Returns:
-        AsyncGenerator[ClientResponse, None]: Async generator yielding one successful response.
+        AsyncGenerator[ClientResponse | CachedResponse, None]: Async generator yielding one
+            response.
 
     Raises:
-        ConnectionError: If the response status code is not ``200``.
+        ConnectionError: If the HTTP cache is offline and the URL is not cached.
 
     Examples:
         >>> # async for response in _call_get(HttpUrlModel('https://example.com'), session):
         >>> #     data = await response.read()
         >>> pass
     """
-    async with session.get(str(url)) as response:
-        yield response
-
-
-def _check_response_status(response: 'ClientResponse') -> None:
+    span = tracer.start_span(f'GET {url}', 'http', url=str(url), method='GET')
+    try:
+        if http_cache is None:
+            async with session.get(str(url)) as response:
+                if span is not None:
+                    span.set_attribute('status', response.status)
+                yield response
+        else:
+            async for response in _call_get_with_http_cache(url, session, http_cache, span):
+                yield response
+    except BaseException as exc:
+        if span is not None:
+            span.record_exception(exc)
+        raise
+    finally:
+        tracer.end_span(span)
+
+
+async def _call_get_with_http_cache(
+    url: HttpUrlModel,
+    session: 'ClientSession',
+    http_cache: 'HttpCache',
+    span: 'Span | None',
+) -> 'AsyncGenerator[ClientResponse | CachedResponse, None]':
+    from .http_cache import CachedResponse
+
+    def _set_span_attributes(status: int, cache: str | None = None) -> None:
+        if span is not None:
+            span.set_attribute('status', status)
+            if cache is not None:
+                span.set_attribute('cache', cache)
+
+    # Cache files of up to max_entry_size_in_bytes are read and written in a worker thread, to
+    # avoid blocking the event loop
+    cached = await asyncio.to_thread(http_cache.get, str(url))
+
+    if cached is not None and http_cache.can_serve_without_request(cached[0]):
+        _set_span_attributes(cached[0].status, 'hit')
+        yield CachedResponse(*cached)
+        return
+
+    if not http_cache.makes_requests:
+        raise ConnectionError(f'Failed to get data. URL is not cached and the HTTP cache '
+                              f'is offline. URL: {url}')
+
+    headers = cached[0].get_conditional_request_headers() if cached else {}
+    async with session.get(str(url), headers=headers) as response:
+        if response.status == 304 and cached is not None:
+            _set_span_attributes(response.status, 'revalidated')
+            entry, body = cached
+            entry = await asyncio.to_thread(http_cache.refresh, entry, response.headers)
+            yield CachedResponse(entry, body)
+        elif http_cache.is_storable(response.status, response.headers):
+            _set_span_attributes(response.status, 'miss')
+            body = await response.read()
+            entry = await asyncio.to_thread(http_cache.store,
+                                            str(url),
+                                            response.status,
+                                            response.headers,
+                                            body)
+            yield CachedResponse(entry, body)
+        else:
+            _set_span_attributes(response.status)
+            yield response
+
+
+def _check_response_status(response: 'ClientResponse | CachedResponse') -> None:
     if response.status != 200:
         raise ConnectionError(f'Failed to get data. '
                               f'HTTP status: {response.status}. '
@@ -98,21 +188,11 @@ def get_retry_client(
     )
 
 
-async def _ensure_retry_session(
-        retry_client: 'RetryClient | None') -> 'AsyncGenerator[RetryClient, None]':
-    from .lazy_import import ClientSession
-
-    if retry_client:
-        yield retry_client
-    else:
-        async with ClientSession() as tmp_session:
-            yield get_retry_client(tmp_session,)
-
-
 @TaskTemplate(iterate_over_data_files=True, output_dataset_cls=JsonDataset)
 async def get_json_from_api_endpoint(
     url: HttpUrlModel,
     retry_client: 'RetryClient | None' = None,
+    http_cache: 'HttpCache | None' = None,
 ) -> JsonModel:
     """Fetch a JSON API endpoint and decode the response body as JSON.
 
@@ -122,6 +202,7 @@ async def get_json_from_api_endpoint(
         retry_http_statuses: HTTP status codes that trigger retries.
         retry_attempts: Maximum number of retry attempts.
         retry_backoff_strategy: Backoff policy used between retries.
+        http_cache: Optional on-disk cache of HTTP responses.
 
     Returns:
         The decoded JSON response for the requested URL.
@@ -137,8 +218,8 @@ async def get_json_from_api_endpoint(
     """
     from .lazy_import import ClientSession
 
-    async for retry_session in _ensure_retry_session(retry_client,):
-        async for response in _call_get(url, cast(ClientSession, retry_session)):
+    async with retry_client_for_host(url.host, retry_client) as retry_session:
+        async for response in _call_get(url, cast(ClientSession, retry_session), http_cache):
             _check_response_status(response)
             return JsonModel(await response.json(content_type=None))
 
@@ -149,6 +230,7 @@ async def get_json_from_api_endpoint(
 async def get_str_from_api_endpoint(
     url: HttpUrlModel,
     retry_client: 'RetryClient | None' = None,
+    http_cache: 'HttpCache | None' = None,
 ) -> StrModel:
     """Fetch an API endpoint and decode the response body as text.
 
@@ -158,6 +240,7 @@ async def get_str_from_api_endpoint(
         retry_http_statuses: HTTP status codes that trigger retries.
         retry_attempts: Maximum number of retry attempts.
         retry_backoff_strategy: Backoff policy used between retries.
+        http_cache: Optional on-disk cache of HTTP responses.
 
     Returns:
         The response body as plain text.
@@ -172,8 +255,8 @@ async def get_str_from_api_endpoint(
     """
     from .lazy_import import ClientSession
 
-    async for retry_session in _ensure_retry_session(retry_client,):
-        async for response in _call_get(url, cast(ClientSession, retry_session)):
+    async with retry_client_for_host(url.host, retry_client) as retry_session:
+        async for response in _call_get(url, cast(ClientSession, retry_session), http_cache):
             _check_response_status(response)
             return StrModel(await response.text())
 
@@ -184,6 +267,7 @@ async def get_str_from_api_endpoint(
 async def get_bytes_from_api_endpoint(
     url: HttpUrlModel,
     retry_client: 'RetryClient | None' = None,
+    http_cache: 'HttpCache | None' = None,
 ) -> BytesModel:
     """Fetch an API endpoint and decode the response body as raw bytes.
 
@@ -193,6 +277,7 @@ async def get_bytes_from_api_endpoint(
         retry_http_statuses: HTTP status codes that trigger retries.
         retry_attempts: Maximum number of retry attempts.
         retry_backoff_strategy: Backoff policy used between retries.
+        http_cache: Optional on-disk cache of HTTP responses.
 
     Returns:
         The response body as bytes.
@@ -207,8 +292,8 @@ async def get_bytes_from_api_endpoint(
     """
     from .lazy_import import ClientSession
 
-    async for retry_session in _ensure_retry_session(retry_client,):
-        async for response in _call_get(url, cast(ClientSession, retry_session)):
+    async with retry_client_for_host(url.host, retry_client) as retry_session:
+        async for response in _call_get(url, cast(ClientSession, retry_session), http_cache):
             _check_response_status(response)
             return BytesModel(await response.read())
 
@@ -220,6 +305,7 @@ async def get_auto_from_api_endpoint(
     url: HttpUrlModel,
     retry_client: 'RetryClient | None' = None,
     as_mime_type: str | None = None,
+    http_cache: 'HttpCache | None' = None,
 ) -> AutoResponseContentModel:
     """Fetch an API endpoint and decode the response from its MIME type.
 
@@ -230,6 +316,7 @@ async def get_auto_from_api_endpoint(
         retry_attempts: Maximum number of retry attempts.
         retry_backoff_strategy: Backoff policy used between retries.
         as_mime_type: Optional MIME type override for response decoding.
+        http_cache: Optional on-disk cache of HTTP responses.
 
     Returns:
         The response content wrapped together with its effective content type.
@@ -245,8 +332,8 @@ async def get_auto_from_api_endpoint(
     """
     from .lazy_import import ClientSession, CONTENT_TYPE
 
-    async for retry_session in _ensure_retry_session(retry_client):
-        async for response in _call_get(url, cast(ClientSession, retry_session)):
+    async with retry_client_for_host(url.host, retry_client) as retry_session:
+        async for response in _call_get(url, cast(ClientSession, retry_session), http_cache):
             _check_response_status(response)
             if as_mime_type:
                 content_type = content_type_header = as_mime_type
@@ -269,6 +356,82 @@ async def get_auto_from_api_endpoint(
     raise ShouldNotOccurException('Other exception should have been raised before this point.')
 
 
+@TaskTemplate(iterate_over_data_files=True, output_dataset_cls=DownloadedFileDataset)
+async def download_file_from_api_endpoint(
+    url: HttpUrlModel,
+    retry_client: 'RetryClient | None' = None,
+    download_dir_path: str | Path | None = None,
+    expected_sha256: str | None = None,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    max_attempts: int = DEFAULT_DOWNLOAD_ATTEMPTS,
+) -> DownloadedFileModel:
+    """Stream an API endpoint response to a local file, resuming interrupted transfers.
+
+    In contrast to ``get_bytes_from_api_endpoint``, the response body is never kept in memory
+    as a whole, making this suitable for large files. Interrupted transfers are resumed with
+    HTTP ``Range`` requests, also across calls, and the checksum of the downloaded file is
+    verified if known.
+
+    Args:
+        url: HTTP URL to request.
+        retry_client: Optional retry-enabled client used to execute the requests.
+        download_dir_path: Directory where the file is downloaded. The file name is derived
+            from the URL. Defaults to ``download_dir_path`` in the HTTP configuration.
+        expected_sha256: Optional hex digest of the expected SHA-256 checksum. If not given,
+            a checksum announced by the server in ``Repr-Digest`` or ``Digest`` headers is
+            verified instead.
+        chunk_size: Maximum number of bytes kept in memory at a time.
+        max_attempts: Maximum number of requests made for the download.
+
+    Returns:
+        A reference to the downloaded file, which can be memory-mapped.
+
+    Raises:
+        ConnectionError: If a response status code is not ``200`` or ``206``, or the download
+            is still incomplete after ``max_attempts``.
+        ValueError: If the checksum of the downloaded file does not match.
+
+    Examples:
+        >>> # downloaded = await download_file_from_api_endpoint(
+        >>> #     HttpUrlModel('https://example.com/big.bin'))
+        >>> # isinstance(downloaded, DownloadedFileModel)
+        >>> True
+    """
+    from .download import download_to_file
+    from .lazy_import import ClientSession
+
+    async with retry_client_for_host(url.host, retry_client) as retry_session:
+        result = await download_to_file(
+            str(url),
+            cast(ClientSession, retry_session),
+            Path(download_dir_path or _get_download_dir_path()) / _get_download_file_name(url),
+            expected_sha256=expected_sha256,
+            chunk_size=chunk_size,
+            max_attempts=max_attempts,
+        )
+        return DownloadedFileModel(
+            DownloadedFilePydModel(
+                path=str(result.path),
+                size=result.size,
+                sha256=result.sha256,
+                content_type=result.content_type,
+            ))
+
+    raise ShouldNotOccurException('Other exception should have been raised before this point.')
+
+
+def _get_download_dir_path() -> str:
+    data_config = Dataset.data_class_creator.config
+    return data_config.http.download_dir_path \
+        or os.path.join(data_config.ui.cache_dir_path, 'downloads')
+
+
+def _get_download_file_name(url: HttpUrlModel) -> str:
+    url_hash = sha256(str(url).encode('utf-8')).hexdigest()[:16]
+    url_file_name = re.sub(r'[^\w.-]', '_', url.path.name)
+    return f'{url_hash}_{url_file_name}' if url_file_name else url_hash
+
+
 @TaskTemplate()
 def load_urls_into_new_dataset(
     urls: HttpUrlDataset,
@@ -334,6 +497,8 @@ class GithubRepoContext:
         repo: Repository name.
         branch: Branch or reference to read from.
         path: File or directory path inside the repository.
+        api_url: Base URL of the GitHub REST API.
+        raw_url: Base URL for downloading raw file contents.
 
     Returns:
         GithubRepoContext: Repository context container.
@@ -351,6 +516,8 @@ class GithubRepoContext:
     repo: str
     branch: str
     path: str | Path
+    api_url: str = GITHUB_API_URL
+    raw_url: str = GITHUB_RAW_URL
 
 
 @TaskTemplate()
@@ -360,6 +527,11 @@ def get_github_repo_urls(
     branch: str,
     path: str | Path,
     file_suffix: str | None = None,
+    file_pattern: str | None = None,
+    recursive: bool = False,
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_LISTINGS,
+    github_api_url: str = GITHUB_API_URL,
+    github_raw_url: str = GITHUB_RAW_URL,
 ) -> HttpUrlDataset:
     """Create raw GitHub content URLs for one file or matching files in a repository path.
 
@@ -369,9 +541,18 @@ def get_github_repo_urls(
         branch: Branch or ref to read from.
         path: File or directory path inside the repository.
         file_suffix: Optional suffix filter when ``path`` points to a directory.
+        file_pattern: Optional glob pattern filter when ``path`` points to a directory,
+            matched against file paths relative to ``path``.
+        recursive: Whether to include files in all subdirectories of ``path``.
+        max_concurrent_requests: Maximum number of directory listings requested concurrently
+            when a recursive listing needs to be fetched directory by directory.
+        github_api_url: Base URL of the GitHub REST API, e.g. for GitHub Enterprise.
+        github_raw_url: Base URL for downloading raw file contents.
 
     Returns:
-        A dataset of raw-content URLs keyed by file name.
+        A dataset of raw-content URLs keyed by file paths relative to ``path``. As for
+        ``Dataset.load()``, directory listings are returned as an ``asyncio.Task`` producing
+        the dataset when called inside a running event loop.
 
     Raises:
         TypeError: If any input cannot be converted to expected model types.
@@ -382,35 +563,33 @@ def get_github_repo_urls(
         >>> True
     """
 
-    repo_context = GithubRepoContext(owner=owner, repo=repo, branch=branch, path=path)
+    repo_context = GithubRepoContext(
+        owner=owner,
+        repo=repo,
+        branch=branch,
+        path=path,
+        api_url=github_api_url,
+        raw_url=github_raw_url,
+    )
 
-    if file_suffix:
-        return _get_urls_for_files_in_dir_with_suffix(repo_context, file_suffix)
+    if recursive:
+        listing = _async_get_urls_for_files_in_tree(repo_context,
+                                                    max_concurrent_requests,
+                                                    file_suffix,
+                                                    file_pattern)
+    elif file_suffix or file_pattern:
+        listing = _async_get_urls_for_files_in_dir_with_suffix(repo_context,
+                                                               file_suffix,
+                                                               file_pattern)
     else:
         return _get_url_for_single_file(repo_context)
 
+    loop, loop_is_running = get_event_loop_and_check_if_loop_is_running()
 
-def _get_urls_for_files_in_dir_with_suffix(ctx: GithubRepoContext, file_suffix: str):
-    """Build raw-content URLs for files in a repository directory filtered by suffix.
-
-    Args:
-        ctx: Repository context describing owner, repo, branch, and path.
-        file_suffix: Filename suffix used to filter listed files.
-
-    Returns:
-        HttpUrlDataset: URL dataset containing matching files.
-
-    Raises:
-        TypeError: If fetched GitHub API listing cannot be parsed as JSON list data.
-
-    Examples:
-        >>> # dataset = _get_urls_for_files_in_dir_with_suffix(ctx, '.py')
-        >>> # isinstance(dataset, HttpUrlDataset)
-        >>> True
-    """
-    api_url = _create_api_url_for_file_list(ctx)
-    file_list = cast(JsonListOfDictsDataset, JsonListOfDictsDataset.load(api_url))
-    return _create_url_dataset_for_files_with_suffix(file_list, file_suffix, ctx)
+    if loop and loop_is_running:
+        return cast(HttpUrlDataset, loop.create_task(listing))
+    else:
+        return asyncio.run(listing)
 
 
 @TaskTemplate()
@@ -420,18 +599,35 @@ async def async_get_github_repo_urls(
     branch: str,
     path: str | Path,
     file_suffix: str | None = None,
+    file_pattern: str | None = None,
+    recursive: bool = False,
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_LISTINGS,
+    github_api_url: str = GITHUB_API_URL,
+    github_raw_url: str = GITHUB_RAW_URL,
 ) -> HttpUrlDataset:
     """Asynchronously create raw GitHub content URLs for repository files.
 
+    With ``recursive=True``, all files below ``path`` are listed with a single request to the
+    git trees API. If the listing is truncated by GitHub because the tree is too large, the
+    subdirectories are instead listed level by level, with up to ``max_concurrent_requests``
+    concurrent requests.
+
     Args:
         owner: GitHub repository owner or organization.
         repo: Repository name.
         branch: Branch or ref to read from.
         path: File or directory path inside the repository.
         file_suffix: Optional suffix filter when ``path`` points to a directory.
+        file_pattern: Optional glob pattern filter when ``path`` points to a directory,
+            matched against file paths relative to ``path``.
+        recursive: Whether to include files in all subdirectories of ``path``.
+        max_concurrent_requests: Maximum number of directory listings requested concurrently
+            when a recursive listing needs to be fetched directory by directory.
+        github_api_url: Base URL of the GitHub REST API, e.g. for GitHub Enterprise.
+        github_raw_url: Base URL for downloading raw file contents.
 
     Returns:
-        A dataset of raw-content URLs keyed by file name.
+        A dataset of raw-content URLs keyed by file paths relative to ``path``.
 
     Raises:
         TypeError: If any input cannot be converted to expected model types.
@@ -442,20 +638,39 @@ async def async_get_github_repo_urls(
         >>> True
     """
 
-    repo_context = GithubRepoContext(owner=owner, repo=repo, branch=branch, path=path)
+    repo_context = GithubRepoContext(
+        owner=owner,
+        repo=repo,
+        branch=branch,
+        path=path,
+        api_url=github_api_url,
+        raw_url=github_raw_url,
+    )
 
-    if file_suffix:
-        return await _async_get_urls_for_files_in_dir_with_suffix(repo_context, file_suffix)
+    if recursive:
+        return await _async_get_urls_for_files_in_tree(repo_context,
+                                                       max_concurrent_requests,
+                                                       file_suffix,
+                                                       file_pattern)
+    elif file_suffix or file_pattern:
+        return await _async_get_urls_for_files_in_dir_with_suffix(repo_context,
+                                                                  file_suffix,
+                                                                  file_pattern)
     else:
         return _get_url_for_single_file(repo_context)
 
 
-async def _async_get_urls_for_files_in_dir_with_suffix(ctx: GithubRepoContext, file_suffix: str):
+async def _async_get_urls_for_files_in_dir_with_suffix(
+    ctx: GithubRepoContext,
+    file_suffix: str | None,
+    file_pattern: str | None = None,
+):
     """Asynchronously build filtered raw-content URLs for a repository directory.
 
     Args:
         ctx: Repository context describing owner, repo, branch, and path.
-        file_suffix: Filename suffix used to filter listed files.
+        file_suffix: Optional filename suffix used to filter listed files.
+        file_pattern: Optional glob pattern used to filter listed files.
 
     Returns:
         HttpUrlDataset: URL dataset containing matching files.
@@ -471,7 +686,182 @@ async def _async_get_urls_for_files_in_dir_with_suffix(ctx: GithubRepoContext, f
     api_url = _create_api_url_for_file_list(ctx)
     file_list = await cast(asyncio.Task[JsonListOfDictsDataset],
                            JsonListOfDictsDataset.load(api_url))
-    return _create_url_dataset_for_files_with_suffix(file_list, file_suffix, ctx)
+    return _create_url_dataset_for_files_with_suffix(file_list, file_suffix, ctx, file_pattern)
+
+
+async def _async_get_urls_for_files_in_tree(
+    ctx: GithubRepoContext,
+    max_concurrent_requests: int,
+    file_suffix: str | None,
+    file_pattern: str | None = None,
+) -> HttpUrlDataset:
+    """Asynchronously build filtered raw-content URLs for all files below a repository path.
+
+    Args:
+        ctx: Repository context describing owner, repo, branch, and path.
+        max_concurrent_requests: Maximum number of concurrent requests if the recursive
+            listing is truncated and subdirectories need to be listed separately.
+        file_suffix: Optional filename suffix used to filter listed files.
+        file_pattern: Optional glob pattern used to filter listed files.
+
+    Returns:
+        HttpUrlDataset: URL dataset containing matching files.
+
+    Raises:
+        FailedDataError: If a listing could not be fetched.
+
+    Examples:
+        >>> # dataset = await _async_get_urls_for_files_in_tree(ctx, 10, '.py')
+        >>> # isinstance(dataset, HttpUrlDataset)
+        >>> True
+    """
+    file_paths = await _async_list_files_in_tree(ctx, max_concurrent_requests)
+    return _create_url_dataset_for_matching_files(file_paths, ctx, file_suffix, file_pattern)
+
+
+async def _async_list_files_in_tree(
+    ctx: GithubRepoContext,
+    max_concurrent_requests: int,
+) -> list[str]:
+    """List all files below ``ctx.path`` using the git trees API.
+
+    Args:
+        ctx: Repository context describing owner, repo, branch, and path.
+        max_concurrent_requests: Maximum number of concurrent requests if the recursive
+            listing is truncated and subdirectories need to be listed separately.
+
+    Returns:
+        list[str]: Sorted file paths relative to ``ctx.path``.
+
+    Raises:
+        FailedDataError: If a listing could not be fetched.
+
+    Examples:
+        >>> # file_paths = await _async_list_files_in_tree(ctx, 10)
+        >>> # isinstance(file_paths, list)
+        >>> True
+    """
+    tree_ish = _get_tree_ish(ctx)
+    trees = await _async_load_trees([_create_api_url_for_tree(ctx, tree_ish, recursive=True)])
+
+    if not trees[0].get('truncated'):
+        return sorted(entry['path'] for entry in trees[0]['tree'] if entry['type'] == 'blob')
+
+    return await _async_walk_tree(ctx, tree_ish, max_concurrent_requests)
+
+
+async def _async_walk_tree(
+    ctx: GithubRepoContext,
+    tree_ish: str,
+    max_concurrent_requests: int,
+) -> list[str]:
+    """List all files below a tree by listing its subtrees level by level.
+
+    Args:
+        ctx: Repository context describing owner and repo.
+        tree_ish: Git tree reference for the top-level tree.
+        max_concurrent_requests: Maximum number of subtrees listed concurrently.
+
+    Returns:
+        list[str]: Sorted file paths relative to the top-level tree.
+
+    Raises:
+        FailedDataError: If a listing could not be fetched.
+
+    Examples:
+        >>> # file_paths = await _async_walk_tree(ctx, 'main:docs', 10)
+        >>> # isinstance(file_paths, list)
+        >>> True
+    """
+    file_paths: list[str] = []
+    subtrees: list[tuple[str, str]] = [('', tree_ish)]
+
+    while subtrees:
+        next_subtrees: list[tuple[str, str]] = []
+
+        for i in range(0, len(subtrees), max_concurrent_requests):
+            batch = subtrees[i:i + max_concurrent_requests]
+            trees = await _async_load_trees(
+                [_create_api_url_for_tree(ctx, subtree_sha) for _, subtree_sha in batch])
+
+            for (dir_path, _), tree in zip(batch, trees):
+                for entry in tree['tree']:
+                    entry_path = f"{dir_path}/{entry['path']}" if dir_path else entry['path']
+                    match entry['type']:
+                        case 'blob':
+                            file_paths.append(entry_path)
+                        case 'tree':
+                            next_subtrees.append((entry_path, entry['sha']))
+
+        subtrees = next_subtrees
+
+    return sorted(file_paths)
+
+
+async def _async_load_trees(api_urls: list[HttpUrlModel]) -> list[dict]:
+    """Concurrently fetch git tree listings.
+
+    Args:
+        api_urls: URLs of git trees API endpoints.
+
+    Returns:
+        list[dict]: Tree listings as plain JSON data, in the order of ``api_urls``.
+
+    Raises:
+        FailedDataError: If a listing could not be fetched.
+
+    Examples:
+        >>> # trees = await _async_load_trees([api_url])
+        >>> # 'tree' in trees[0]
+        >>> True
+    """
+    urls = HttpUrlDataset({str(i): api_url for i, api_url in enumerate(api_urls)})
+    trees = await cast(asyncio.Task[JsonDictDataset], JsonDictDataset.load(urls))
+    return [trees[str(i)].to_data() for i in range(len(api_urls))]
+
+
+def _get_tree_ish(ctx: GithubRepoContext) -> str:
+    """Create a git tree reference for ``ctx.path`` at ``ctx.branch``.
+
+    Args:
+        ctx: Repository context with path and branch details.
+
+    Returns:
+        str: Tree reference of the form ``<branch>:<path>``, or the branch for the root.
+
+    Examples:
+        >>> _get_tree_ish(GithubRepoContext('octocat', 'hello-world', 'main', '/docs/'))
+        'main:docs'
+        >>> _get_tree_ish(GithubRepoContext('octocat', 'hello-world', 'main', ''))
+        'main'
+    """
+    path = str(ctx.path).strip('/')
+    return f'{ctx.branch}:{path}' if path and path != '.' else ctx.branch
+
+
+def _create_api_url_for_tree(ctx: GithubRepoContext,
+                             tree_ish: str,
+                             recursive: bool = False) -> HttpUrlModel:
+    """Create git trees API URL for listing a tree.
+
+    Args:
+        ctx: Repository context with owner and repo details.
+        tree_ish: SHA or other git reference of the tree.
+        recursive: Whether to list the tree recursively.
+
+    Returns:
+        HttpUrlModel: URL pointing to the git trees API endpoint.
+
+    Examples:
+        >>> # api_url = _create_api_url_for_tree(ctx, 'main:docs', recursive=True)
+        >>> # 'git/trees' in str(api_url)
+        >>> True
+    """
+    api_url = HttpUrlModel(ctx.api_url)
+    api_url.path // 'repos' // ctx.owner // ctx.repo // 'git' // 'trees' // tree_ish
+    if recursive:
+        api_url.query['recursive'] = '1'
+    return api_url
 
 
 def _create_api_url_for_file_list(ctx: GithubRepoContext) -> HttpUrlModel:
@@ -491,7 +881,7 @@ def _create_api_url_for_file_list(ctx: GithubRepoContext) -> HttpUrlModel:
         >>> # 'api.github.com' in str(api_url)
         >>> True
     """
-    api_url = HttpUrlModel('https://api.github.com')
+    api_url = HttpUrlModel(ctx.api_url)
     api_url.path // 'repos' // ctx.owner // ctx.repo // 'contents' // ctx.path
     api_url.query['ref'] = ctx.branch
     return api_url
@@ -499,15 +889,17 @@ def _create_api_url_for_file_list(ctx: GithubRepoContext) -> HttpUrlModel:
 
 def _create_url_dataset_for_files_with_suffix(
     file_list: JsonListOfDictsDataset,
-    file_suffix: str,
+    file_suffix: str | None,
     ctx: GithubRepoContext,
+    file_pattern: str | None = None,
 ):
     """Convert GitHub file metadata to raw-content URLs filtered by suffix.
 
     Args:
         file_list: JSON dataset from GitHub Contents API response.
-        file_suffix: Filename suffix used to filter entries.
+        file_suffix: Optional filename suffix used to filter entries.
         ctx: Repository context used to build the raw-content URL prefix.
+        file_pattern: Optional glob pattern used to filter entries.
 
     Returns:
         HttpUrlDataset: Dataset mapping matching file names to raw-content URLs.
@@ -520,9 +912,42 @@ def _create_url_dataset_for_files_with_suffix(
         >>> # isinstance(urls, HttpUrlDataset)
         >>> True
     """
+    names = [str(f['name']) for f in file_list[0]]
+    return _create_url_dataset_for_matching_files(names, ctx, file_suffix, file_pattern)
+
+
+def _create_url_dataset_for_matching_files(
+    file_paths: list[str],
+    ctx: GithubRepoContext,
+    file_suffix: str | None = None,
+    file_pattern: str | None = None,
+) -> HttpUrlDataset:
+    """Create raw-content URLs for the file paths matching a suffix and a glob pattern.
+
+    Args:
+        file_paths: File paths relative to ``ctx.path``.
+        ctx: Repository context used to build the raw-content URL prefix.
+        file_suffix: Optional filename suffix used to filter file paths.
+        file_pattern: Optional glob pattern used to filter file paths. As with ``fnmatch``,
+            ``*`` also matches ``/``, so that e.g. ``*.json`` matches files at any depth.
+
+    Returns:
+        HttpUrlDataset: Dataset mapping matching file paths to raw-content URLs.
+
+    Examples:
+        >>> ctx = GithubRepoContext('octocat', 'hello-world', 'main', 'docs')
+        >>> urls = _create_url_dataset_for_matching_files(
+        ...     ['a.json', 'b.txt', 'sub/c.json'], ctx, file_pattern='sub/*.json')
+        >>> list(urls.keys())
+        ['sub/c.json']
+    """
     url_prefix = _get_url_prefix_for_download(ctx)
-    names = Model[list[str]]([f['name'] for f in file_list[0] if f['name'].endswith(file_suffix)])
-    return HttpUrlDataset({name: f'{url_prefix}/{name}' for name in names})
+    return HttpUrlDataset({
+        file_path: f'{url_prefix}/{file_path}'
+        for file_path in file_paths
+        if (not file_suffix or file_path.endswith(file_suffix)) and (
+            not file_pattern or fnmatchcase(file_path, file_pattern))
+    })
 
 
 def _get_url_prefix_for_download(ctx: GithubRepoContext):
@@ -542,7 +967,7 @@ def _get_url_prefix_for_download(ctx: GithubRepoContext):
         >>> # 'raw.githubusercontent.com' in str(prefix)
         >>> True
     """
-    url_pre = HttpUrlModel('https://raw.githubusercontent.com')
+    url_pre = HttpUrlModel(ctx.raw_url)
     url_pre.path // ctx.owner // ctx.repo // ctx.branch // ctx.path
     return url_pre
 
@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import cast
 
 from omnipy.config.job import JobConfig
+from omnipy.hub._runtime_setup import ensure_runtime_is_set_up
 from omnipy.shared.protocols.compute.job_creator import IsJobCreator
 from omnipy.shared.protocols.config import IsJobConfig
 from omnipy.shared.protocols.engine.base import IsEngine
@@ -126,6 +127,7 @@ class JobBaseMeta(ABCMeta):
     @property
     def job_creator(self) -> IsJobCreator:
         """Return the shared creator object used by the job class hierarchy."""
+        ensure_runtime_is_set_up()
         return self._job_creator_obj
 
     @property
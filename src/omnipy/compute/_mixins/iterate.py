@@ -16,6 +16,7 @@ from omnipy.compute._mixins.typedefs import (_InputDatasetT,
 from omnipy.data.dataset import Dataset
 from omnipy.data.helpers import FailedData, PendingData
 from omnipy.data.model import is_model_subclass, Model
+from omnipy.hub.tracing import tracer
 from omnipy.shared.protocols.compute.job import IsJobBase, IsPlainFuncArgJobBase
 from omnipy.shared.protocols.data import IsDataset
 from omnipy.util.helpers import is_package_editable
@@ -113,9 +114,11 @@ class IterateFuncJobBaseMixin:
                         output_dataset, args, kwargs = \
                             self._extract_output_dataset(dataset, *args, **kwargs)
 
+                        job_unique_name = cast(IsJobBase, self).unique_name
                         for title, data_file in dataset.items():
                             data_arg = self._prepare_data_arg(data_file)
-                            output_dataset[title] = inner_func(data_arg, *args, **kwargs)
+                            with tracer.span(title, 'iterate_item', job=job_unique_name):
+                                output_dataset[title] = inner_func(data_arg, *args, **kwargs)
 
                         return output_dataset
 
@@ -133,11 +136,17 @@ class IterateFuncJobBaseMixin:
                         output_dataset, args, kwargs = \
                             self._extract_output_dataset(dataset, *args, **kwargs)
 
+                        job_unique_name = cast(IsJobBase, self).unique_name
                         tasks = []
                         for title, data_file in dataset.items():
                             output_dataset[title] = self._create_pending_data()
                             data_arg = self._prepare_data_arg(data_file)
-                            coro = cast(Coroutine, inner_func(data_arg, *args, **kwargs))
+                            coro = tracer.wrap_awaitable(
+                                cast(Coroutine, inner_func(data_arg, *args, **kwargs)),
+                                title,
+                                'iterate_item',
+                                job=job_unique_name,
+                            )
 
                             task = self._create_task(coro, output_dataset, title)
                             tasks.append(task)
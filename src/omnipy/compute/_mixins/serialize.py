@@ -25,6 +25,7 @@ from omnipy.components import get_serializer_registry
 from omnipy.compute._mixins.func_signature import SignatureFuncJobBaseMixin
 from omnipy.compute._mixins.name import NameJobBaseMixin
 from omnipy.data.dataset import Dataset
+from omnipy.hub.tracing import tracer
 from omnipy.shared.enums.job import ConfigPersistOutputsOptions as ConfigPersistOpts
 from omnipy.shared.enums.job import (OutputStorageProtocolOptions,
                                      PersistOutputsOptions,
@@ -253,19 +254,27 @@ class SerializerFuncJobBaseMixin:
 
         file_path = output_path.joinpath(f'{num_cur_files:02}_{job_name}.tar.gz')
 
-        parsed_dataset, serializer = \
-            self._serializer_registry.auto_detect_tar_file_serializer(results)
-
-        if serializer is None:
-            self._log('Unable to find a serializer for results of job '
-                      f'"{self_as_name_job_base_mixin.name}", with data type "{type(results)}". '
-                      f'Will abort persisting results...')
-        else:
-            assert parsed_dataset is not None
-            self._log(f'Writing dataset as a gzipped tarpack to "{os.path.abspath(file_path)}"')
+        with tracer.span(
+                'persist_outputs',
+                'serialization',
+                job=self_as_name_job_base_mixin.unique_name,
+                file_path=str(file_path)):
+            preferred_file_suffix = \
+                'parquet' if self._job_config.output_storage.prefer_parquet else None
+            parsed_dataset, serializer = \
+                self._serializer_registry.auto_detect_tar_file_serializer(
+                    results, preferred_file_suffix=preferred_file_suffix)
+
+            if serializer is None:
+                self._log('Unable to find a serializer for results of job '
+                          f'"{self_as_name_job_base_mixin.name}", with data type '
+                          f'"{type(results)}". Will abort persisting results...')
+            else:
+                assert parsed_dataset is not None
+                self._log(f'Writing dataset as a gzipped tarpack to "{os.path.abspath(file_path)}"')
 
-            with open(file_path, 'wb') as tarfile:
-                tarfile.write(serializer.serialize(parsed_dataset))
+                with open(file_path, 'wb') as tarfile:
+                    tarfile.write(serializer.serialize(parsed_dataset))
 
     def _job_name(self):
         self_as_name_job_base_mixin = cast(NameJobBaseMixin, self)
@@ -317,8 +326,13 @@ class SerializerFuncJobBaseMixin:
             for tar_file_path in self._all_job_output_file_paths_in_reverse_order_for_last_run(
                     persist_data_dir_path, self._job_name()):
                 to_dataset = cast(Type[Dataset], self._return_type)
-                return self._serializer_registry.load_from_tar_file_path_based_on_file_suffix(
-                    self_as_job_base, str(tar_file_path), to_dataset())
+                with tracer.span(
+                        'restore_outputs',
+                        'serialization',
+                        job=self_as_job_base.unique_name,
+                        file_path=str(tar_file_path)):
+                    return self._serializer_registry.load_from_tar_file_path_based_on_file_suffix(
+                        self_as_job_base, str(tar_file_path), to_dataset())
 
         raise RuntimeError('No persisted output')
 
@@ -22,7 +22,7 @@ from omnipy.shared.constants import (BROWSER_DEFAULT_HEIGHT,
                                      TERMINAL_DEFAULT_HEIGHT,
                                      TERMINAL_DEFAULT_WIDTH)
 from omnipy.shared.enums.colorstyles import AllColorStyles, RecommendedColorStyles
-from omnipy.shared.enums.data import BackoffStrategy
+from omnipy.shared.enums.data import BackoffStrategy, HttpCacheMode
 from omnipy.shared.enums.display import (DisplayColorSystem,
                                          DisplayDimensionsUpdateMode,
                                          HorizontalOverflowMode,
@@ -35,10 +35,13 @@ from omnipy.shared.enums.ui import SpecifiedUserInterfaceType, UserInterfaceType
 from omnipy.shared.protocols.config import (IsBrowserUserInterfaceConfig,
                                             IsColorConfig,
                                             IsFontConfig,
+                                            IsHttpCacheConfig,
                                             IsHttpConfig,
+                                            IsHttpPoolConfig,
                                             IsHttpRequestsConfig,
                                             IsJupyterUserInterfaceConfig,
                                             IsLayoutConfig,
+                                            IsMetricsConfig,
                                             IsModelConfig,
                                             IsOverflowConfig,
                                             IsTerminalUserInterfaceConfig,
@@ -317,6 +320,9 @@ class HtmlUserInterfaceConfig(UserInterfaceTypeConfig):
 
 class JupyterUserInterfaceConfig(HtmlUserInterfaceConfig, DimsModeConfig):
     """Jupyter-specific UI configuration with notebook defaults."""
+
+    reactive_update_delay_secs: pyd.NonNegativeFloat = 0.05
+
     @classmethod
     @override
     def _get_available_display_dims(
@@ -363,6 +369,10 @@ class BrowserUserInterfaceConfig(HtmlUserInterfaceConfig):
     """
     Configuration for browser user interface type.
     """
+    windowed_browse_min_items: pyd.NonNegativeInt | None = 1000
+    windowed_browse_page_size: pyd.PositiveInt = 100
+    windowed_browse_max_servers: pyd.PositiveInt = 4
+
     def __init__(self, **data: Any) -> None:
         """Initialize browser defaults for dimensions and color settings.
 
@@ -483,6 +493,14 @@ class ModelConfig(ConfigBase):
     dynamically_convert_elements_to_models: bool = False
 
 
+class MetricsConfig(ConfigBase):
+    """
+    Configuration for collection of data-layer performance metrics.
+    """
+    enabled: bool = False
+    measure_snapshot_bytes: bool = True
+
+
 class HttpRequestsConfig(ConfigBase):
     """
     Configuration for HTTP requests.
@@ -490,6 +508,7 @@ class HttpRequestsConfig(ConfigBase):
     # For RateLimitingClientSession helper class
     requests_per_time_period: float = 60
     time_period_in_secs: float = 60
+    adaptive_rate_limiting: bool = False
 
     # For get_*_from_api_endpoint tasks
     retry_http_statuses: tuple[int, ...] = (408, 425, 429, 500, 502, 503, 504)
@@ -497,12 +516,44 @@ class HttpRequestsConfig(ConfigBase):
     retry_backoff_strategy: BackoffStrategy.Literals = BackoffStrategy.EXPONENTIAL
 
 
+class HttpCacheConfig(ConfigBase):
+    """
+    Configuration for the on-disk cache of HTTP responses used when loading
+    datasets from URLs. Caching is turned off by default. If `cache_dir_path`
+    is `None`, responses are stored in the `http` subdirectory of the
+    configured UI cache directory.
+    """
+    mode: HttpCacheMode.Literals = HttpCacheMode.OFF
+    cache_dir_path: str | None = None
+    max_size_in_bytes: pyd.NonNegativeInt = 1024**3
+    max_entry_size_in_bytes: pyd.NonNegativeInt = 128 * 1024**2
+
+
+class HttpPoolConfig(ConfigBase):
+    """
+    Configuration for the runtime-managed pool of HTTP client sessions, which
+    keeps connections alive for reuse across remote tasks and dataset loading.
+    """
+    enabled: bool = True
+    max_connections: pyd.NonNegativeInt = 100
+    max_connections_per_host: pyd.NonNegativeInt = 10
+    keepalive_timeout_secs: pyd.NonNegativeFloat = 30.0
+    dns_cache_ttl_secs: pyd.NonNegativeInt = 300
+
+
 class HttpConfig(ConfigBase):
-    """HTTP request defaults together with per-host overrides."""
+    """
+    HTTP request defaults together with per-host overrides. If
+    `download_dir_path` is `None`, files are downloaded to the `downloads`
+    subdirectory of the configured UI cache directory.
+    """
 
     defaults: IsHttpRequestsConfig = pyd.Field(default_factory=HttpRequestsConfig)
     for_host: defaultdict[str, IsHttpRequestsConfig] = pyd.Field(
         default_factory=lambda: defaultdict(HttpRequestsConfig))
+    cache: IsHttpCacheConfig = pyd.Field(default_factory=HttpCacheConfig)
+    pool: IsHttpPoolConfig = pyd.Field(default_factory=HttpPoolConfig)
+    download_dir_path: str | None = None
 
     @pyd.validator('for_host', always=True)
     def update_http_defaults(cls,
@@ -538,3 +589,4 @@ class DataConfig(ConfigBase):
     ui: IsUserInterfaceConfig = pyd.Field(default_factory=lambda: UserInterfaceConfig())
     model: IsModelConfig = pyd.Field(default_factory=lambda: ModelConfig())
     http: IsHttpConfig = pyd.Field(default_factory=HttpConfig)
+    metrics: IsMetricsConfig = pyd.Field(default_factory=MetricsConfig)
@@ -41,6 +41,7 @@ class OutputStorageConfig(ConfigBase):
     restore_outputs: ConfigRestoreOutputsOptions.Literals = \
         ConfigRestoreOutputsOptions.DISABLED
     protocol: ConfigOutputStorageProtocolOptions.Literals = ConfigOutputStorageProtocolOptions.LOCAL
+    prefer_parquet: bool = False
     local: IsLocalOutputStorageConfig = pyd.Field(default_factory=LocalOutputStorageConfig)
     s3: IsS3OutputStorageConfig = pyd.Field(default_factory=S3OutputStorageConfig)
 
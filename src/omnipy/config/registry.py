@@ -0,0 +1,17 @@
+"""Configuration for retention and logging in the job run-state registry."""
+
+from omnipy.config import ConfigBase
+import omnipy.util.pydantic as pyd
+
+
+class RunStateRegistryConfig(ConfigBase):
+    """Retention and logging settings for the run-state registry.
+
+    Retention only applies to finished jobs, which are evicted oldest first. Aggregated
+    per-job-name statistics are kept for evicted jobs.
+    """
+
+    max_jobs: pyd.NonNegativeInt | None = None
+    max_age_secs: pyd.NonNegativeFloat | None = None
+    keep_failed_only: bool = False
+    log_state_changes: bool = True
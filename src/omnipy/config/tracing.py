@@ -0,0 +1,25 @@
+"""Configuration for span-based tracing of jobs and their exporting to trace files."""
+
+from pathlib import Path
+
+from omnipy.config import ConfigBase
+from omnipy.shared.enums.job import TraceFileFormat
+import omnipy.util.pydantic as pyd
+
+
+def _get_trace_file_path() -> str:
+    return str(Path.cwd() / 'traces' / 'omnipy_trace.json')
+
+
+class TracingConfig(ConfigBase):
+    """Tracing settings for jobs, iterated data items, serialization and HTTP requests.
+
+    Chrome trace-event files can be opened in Perfetto (https://ui.perfetto.dev) or in
+    ``chrome://tracing``.
+    """
+
+    enabled: bool = False
+    trace_file_path: str = pyd.Field(default_factory=_get_trace_file_path)
+    trace_file_format: TraceFileFormat.Literals = TraceFileFormat.CHROME
+    export_at_exit: bool = True
+    max_spans: int | None = 100_000
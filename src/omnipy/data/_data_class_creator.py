@@ -5,10 +5,12 @@ from contextlib import contextmanager
 from typing import Callable, cast, ContextManager, Generic, Iterator
 
 from omnipy.config.data import DataConfig
-from omnipy.data.snapshot import SnapshotHolder
+from omnipy.data.snapshot import ContentVersions, SnapshotHolder
+from omnipy.hub._runtime_setup import ensure_runtime_is_set_up
 from omnipy.shared.protocols.config import IsDataConfig
 from omnipy.shared.protocols.data import (ContentT,
                                           HasContent,
+                                          IsContentVersions,
                                           IsDataClassCreator,
                                           IsReactiveObjects,
                                           IsSnapshotHolder)
@@ -28,6 +30,7 @@ class DataClassCreator:
         self._config: IsDataConfig = cast(IsDataConfig, DataConfig())
         self._reactive_objects: IsReactiveObjects | None = None
         self._snapshot_holder = SnapshotHolder[HasContent, object]()
+        self._content_versions = ContentVersions[HasContent]()
         self._deepcopy_context_level = 0
 
     @property
@@ -74,6 +77,12 @@ class DataClassCreator:
 
         return self._snapshot_holder
 
+    @property
+    def content_versions(self) -> IsContentVersions[HasContent]:
+        """Return the content-version registry shared across related model and dataset instances."""
+
+        return self._content_versions
+
     def deepcopy_context(
         self,
         top_level_entry_func: Callable[[], None],
@@ -114,7 +123,7 @@ class DataClassBaseMeta(ABCMeta):
     @property
     def data_class_creator(self) -> IsDataClassCreator:
         """Return the creator object shared by classes using this metaclass."""
-
+        ensure_runtime_is_set_up()
         return self._data_class_creator_obj
 
 
@@ -180,6 +189,27 @@ class DataClassBase(Generic[ContentT], metaclass=DataClassBaseMeta):
 
         return self.__class__.data_class_creator.snapshot_holder
 
+    @property
+    def content_version(self) -> int:
+        """Return a process-wide unique version number of the current content.
+
+        The version changes whenever the content is changed through a validated mutation, and
+        can be used as a cache key for values derived from the content.
+        """
+
+        return self.__class__.data_class_creator.content_versions.get_version(self)
+
+    def _bump_content_version(self) -> None:
+        self.__class__.data_class_creator.content_versions.bump(self)
+
+    def _restore_content_version(self, version: int) -> None:
+        self.__class__.data_class_creator.content_versions[self] = version
+
+    def _content_unchanged_since_validation(self) -> bool:
+        # Whether the content is known to be unchanged since it was last validated, so that the
+        # content version identifies it. Overridden by subclasses able to detect in-place changes
+        return False
+
     def deepcopy_context(
         self,
         top_level_entry_func: Callable[[], None],
@@ -1,3 +1,4 @@
+import threading
 from typing import cast
 
 from rich._unicode_data import load as load_cell_table
@@ -5,6 +6,11 @@ from rich.cells import _is_single_cell_widths
 
 from omnipy.util.range_lookup import RangeLookup
 
+# Held while rendering panels, including access to the module-level render caches. Rendering is
+# thus serialized between the main thread and background threads, such as the servers of
+# windowed dataset browsers.
+render_lock = threading.RLock()
+
 
 class UnicodeCharWidthMap:
     """Map Unicode characters to display cell widths used by panel layout."""
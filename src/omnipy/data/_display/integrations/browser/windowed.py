@@ -0,0 +1,261 @@
+"""Windowed browsing of large datasets served page by page from a local HTTP server.
+
+Instead of rendering every item of a dataset to HTML files up front, the server renders the
+listing of one page of items at a time, and the page of each item only when it is requested.
+The time to first paint is thus independent of the size of the dataset.
+
+Pages are rendered in the server thread while holding the render lock, which is shared with all
+other rendering and with the render caches. Index and item pages look up items by position through
+the cached positional key index of the dataset.
+
+Running servers are tracked in a module-level registry. Starting a server stops the least
+recently started servers beyond a given limit, and all servers are stopped at interpreter exit.
+Stopping a server releases the reference to the dataset it serves.
+"""
+
+import atexit
+from collections import deque
+from html import escape
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import re
+import threading
+from typing import Any, cast
+
+from omnipy.data._display.helpers import render_lock
+from omnipy.data.helpers import FailedData, PendingData
+from omnipy.shared.enums.ui import UserInterfaceType
+from omnipy.shared.typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from omnipy.data.dataset import Dataset
+
+_PAGE_PATH_REGEX = re.compile(r'^/(?:page/(\d+))?$')
+_ITEM_PATH_REGEX = re.compile(r'^/item/(\d+)$')
+
+_running_browsers: deque['WindowedDatasetBrowser'] = deque()
+_running_browsers_lock = threading.Lock()
+
+
+class WindowedDatasetBrowser:
+    """Serve HTML pages of a dataset on demand from a local HTTP server.
+
+    Index pages list ``page_size`` items each, with links to the neighbouring index pages and
+    to the pages of the listed items. Pages are rendered when requested, and reflect the
+    dataset content at that time.
+
+    Args:
+        dataset: Dataset to browse.
+        page_size: Number of items listed per index page.
+        **kwargs: Display configuration overrides, as for ``browse()``.
+    """
+    def __init__(self, dataset: 'Dataset', page_size: int, **kwargs: object) -> None:
+        self._dataset = dataset
+        self._page_size = page_size
+        self._kwargs = kwargs
+        self._server: HTTPServer | None = None
+        self._server_thread: threading.Thread | None = None
+
+    @property
+    def num_pages(self) -> int:
+        """Return the number of index pages, which is at least one."""
+        return max((len(self._dataset) + self._page_size - 1) // self._page_size, 1)
+
+    @property
+    def url(self) -> str | None:
+        """Return the URL of the first index page, or ``None`` if the server is not running."""
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def start(self, max_running_servers: int | None = None) -> str:
+        """Start serving pages from a local HTTP server in a background thread.
+
+        Args:
+            max_running_servers: Maximum number of windowed browser servers kept running,
+                including this one. The least recently started servers beyond the limit are
+                stopped. If ``None``, no servers are stopped.
+
+        Returns:
+            str: URL of the first index page.
+        """
+        if self._server is None:
+            browser = self
+
+            class _Handler(_WindowedDatasetRequestHandler):
+                windowed_browser = browser
+
+            # Requests are handled one at a time, each rendering pages while holding the render
+            # lock
+            self._server = HTTPServer(('127.0.0.1', 0), _Handler)
+            self._server_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._server_thread.start()
+
+            with _running_browsers_lock:
+                _running_browsers.append(self)
+                num_to_stop = 0 if max_running_servers is None \
+                    else max(len(_running_browsers) - max_running_servers, 0)
+                browsers_to_stop = [_running_browsers[i] for i in range(num_to_stop)]
+
+            for browser_to_stop in browsers_to_stop:
+                browser_to_stop.stop()
+
+        return cast(str, self.url)
+
+    def stop(self) -> None:
+        """Stop the HTTP server, if running, and wait for the server thread to finish."""
+        with _running_browsers_lock:
+            server, self._server = self._server, None
+            server_thread, self._server_thread = self._server_thread, None
+            if self in _running_browsers:
+                _running_browsers.remove(self)
+
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if server_thread is not None:
+            server_thread.join()
+
+    def render_index_page(self, page: int) -> str:
+        """Render the HTML index page listing the items of a page.
+
+        Args:
+            page: Zero-based page number.
+
+        Returns:
+            str: Complete HTML document.
+
+        Raises:
+            IndexError: If the page number is out of range.
+        """
+        with render_lock:
+            if not 0 <= page < self.num_pages:
+                raise IndexError(f'Page {page} is out of range')
+
+            start = page * self._page_size
+            stop = min(start + self._page_size, len(self._dataset))
+            keys = self._dataset._select_keys(slice(start, stop)).keys
+
+            html_page = self._dataset._display_according_to_ui_type(
+                UserInterfaceType.BROWSER_PAGE,
+                True,
+                self._dataset._list_window,
+                start,
+                stop,
+                **self._list_kwargs(),
+            )
+
+        nav_links = []
+        if page > 0:
+            nav_links.append(f'<a href="/page/{page - 1}">&larr; Previous</a>')
+        nav_links.append(f'Items {start}&ndash;{max(stop - 1, start)} of {len(self._dataset)} '
+                         f'(page {page + 1} of {self.num_pages})')
+        if page < self.num_pages - 1:
+            nav_links.append(f'<a href="/page/{page + 1}">Next &rarr;</a>')
+
+        item_links = ''.join(f'<li><a href="/item/{index}">{index}. {escape(key)}</a></li>'
+                             for index, key in enumerate(keys, start=start))
+
+        return _insert_after_body_tag(
+            html_page,
+            f'<nav>{" | ".join(nav_links)}</nav>\n<ol start="{start}">{item_links}</ol>\n',
+        )
+
+    def render_item_page(self, index: int) -> str:
+        """Render the HTML page of a single item of the dataset.
+
+        Args:
+            index: Position of the item in the dataset.
+
+        Returns:
+            str: Complete HTML document.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        with render_lock:
+            return self._render_item_page_unlocked(index)
+
+    def _render_item_page_unlocked(self, index: int) -> str:
+        from omnipy.data.dataset import Dataset
+
+        if not 0 <= index < len(self._dataset):
+            raise IndexError(f'Item {index} is out of range')
+
+        key = self._dataset._select_keys(index).keys[0]
+        item = self._dataset.data[key]
+
+        if isinstance(item, (PendingData, FailedData)):
+            html_page = (f'<!DOCTYPE html>\n<html>\n<head><title>{escape(key)}</title></head>\n'
+                         f'<body>\n<h1>{escape(key)}</h1>\n'
+                         f'<pre>{escape(self._dataset._type_str(item))}</pre>\n</body>\n</html>\n')
+        elif isinstance(item, Dataset):
+            html_page = item._display_according_to_ui_type(
+                UserInterfaceType.BROWSER_PAGE,
+                True,
+                item._list,
+                **self._list_kwargs(),
+            )
+        else:
+            html_page = item._display_according_to_ui_type(
+                UserInterfaceType.BROWSER_PAGE,
+                True,
+                item._browse_model,
+                **self._kwargs,
+            )
+
+        page = index // self._page_size
+        return _insert_after_body_tag(
+            html_page, f'<nav><a href="/page/{page}">&uarr; Back to list</a></nav>\n')
+
+    def _list_kwargs(self) -> dict[str, Any]:
+        return self._kwargs | {'ui': UserInterfaceType.BROWSER_PAGE}
+
+
+class _WindowedDatasetRequestHandler(BaseHTTPRequestHandler):
+    windowed_browser: WindowedDatasetBrowser
+
+    def do_GET(self) -> None:  # noqa: N802
+        try:
+            if match := _PAGE_PATH_REGEX.match(self.path):
+                html = self.windowed_browser.render_index_page(int(match.group(1) or 0))
+            elif match := _ITEM_PATH_REGEX.match(self.path):
+                html = self.windowed_browser.render_item_page(int(match.group(1)))
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+        except IndexError as exc:
+            self.send_error(HTTPStatus.NOT_FOUND, str(exc))
+            return
+        except Exception as exc:
+            # Rendering errors are reported to the browser instead of breaking the connection
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f'{type(exc).__name__}: {exc}')
+            return
+
+        content = html.encode('utf-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _insert_after_body_tag(html_page: str, html_content: str) -> str:
+    return html_page.replace('<body>', f'<body>\n{html_content}', 1)
+
+
+def running_windowed_browsers() -> tuple[WindowedDatasetBrowser, ...]:
+    """Return the windowed dataset browsers with running servers, least recently started first."""
+    with _running_browsers_lock:
+        return tuple(_running_browsers)
+
+
+@atexit.register
+def stop_all_windowed_browsers() -> None:
+    """Stop the servers of all running windowed dataset browsers."""
+    for browser in running_windowed_browsers():
+        browser.stop()
@@ -104,9 +104,25 @@ def ShowHtml(
     render_output_method: Callable[[FullyRenderedPanel], str],
     **kwargs: Any,
 ):
-    if (update_flag is not None or jupyter_ui_config != orig_jupyter_ui_config
-            or text_config != orig_text_config or layout_config != orig_layout_config):
-        rendered_panel = render_panel_method(**kwargs)
+    def _rerender_panel_if_changed() -> FullyRenderedPanel:
+        if (update_flag is not None or jupyter_ui_config != orig_jupyter_ui_config
+                or text_config != orig_text_config or layout_config != orig_layout_config):
+            return render_panel_method(**kwargs)
+        return rendered_panel
+
+    # Only re-render the panel if the update flag of this view or the configs have changed, and
+    # not on every re-rendering of the component triggered by updates of other views
+    rendered_panel = solara.use_memo(
+        _rerender_panel_if_changed,
+        dependencies=[
+            update_flag,
+            jupyter_ui_config,
+            text_config,
+            layout_config,
+            rendered_panel,
+            kwargs,
+        ],
+    )
 
     solara.HTML(
         tag='div',
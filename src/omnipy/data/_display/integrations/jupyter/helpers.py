@@ -1,6 +1,7 @@
 """Reactive helper objects used by Jupyter display integrations."""
 
-from typing import Generic
+import asyncio
+from typing import Callable, Generic
 
 import solara
 from solara.toestand import ValueBase
@@ -12,12 +13,56 @@ from omnipy.shared.protocols.config import (IsConfigBase,
                                             IsLayoutConfig,
                                             IsTextConfig)
 from omnipy.shared.protocols.data import AvailableDisplayDims, IsReactive
+from omnipy.util.helpers import get_event_loop_and_check_if_loop_is_running
 from omnipy.util.publisher import DataPublisher
 import omnipy.util.pydantic as pyd
 
 ConfigBaseT = TypeVar('ConfigBaseT', bound=IsConfigBase)
 
 
+class CoalescingCaller:
+    """
+    Coalesce bursts of calls into a single delayed call of a callback.
+
+    The first call after a flush schedules the callback on the running asyncio
+    event loop, `update_delay_secs` seconds later. Further calls before that
+    are absorbed. In Jupyter, the event loop is blocked while a cell executes,
+    so all updates made by a cell are coalesced. Without a running event loop,
+    or with a delay of zero, the callback is called immediately.
+
+    If the event loop stops, closes or is replaced before the scheduled call,
+    the scheduled call is dropped at the next call, which is then handled as
+    the first call of a new burst.
+    """
+    def __init__(self, callback: Callable[[], None], update_delay_secs: float = 0.0) -> None:
+        self.update_delay_secs = update_delay_secs
+        self._callback = callback
+        self._scheduled: asyncio.TimerHandle | None = None
+        self._scheduled_loop: asyncio.AbstractEventLoop | None = None
+
+    def __call__(self) -> None:
+        loop, loop_is_running = get_event_loop_and_check_if_loop_is_running()
+
+        if self._scheduled is not None:
+            if not self._scheduled.cancelled() and loop_is_running \
+                    and loop is self._scheduled_loop:
+                return
+            self._scheduled = None
+
+        if self.update_delay_secs > 0 and loop is not None and loop_is_running:
+            self._scheduled = loop.call_later(self.update_delay_secs, self.flush)
+            self._scheduled_loop = loop
+        else:
+            self._callback()
+
+    def flush(self) -> None:
+        """Call the callback now if a call is scheduled, cancelling the scheduled call."""
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+            self._callback()
+
+
 class ReactiveConfigCopy(solara.Reactive[ConfigBaseT], Generic[ConfigBaseT]):
     """
     A `solara.Reactive` wrapper for a `ConfigBase` object that ensures deep
@@ -26,15 +71,35 @@ class ReactiveConfigCopy(solara.Reactive[ConfigBaseT], Generic[ConfigBaseT]):
     detecting changes in nested mutable objects (see "Mutation pitfalls" in
     the Solara documentation:
     https://solara.dev/documentation/getting_started/fundamentals/state-management).
+
+    As every change of a nested config attribute calls `set()`, the deep copy
+    and the resulting re-rendering of reactive views are coalesced into a
+    single update per burst of changes, see `CoalescingCaller`.
     """
-    def __init__(self, default_value: ConfigBaseT | ValueBase[ConfigBaseT], key=None, equals=None):
+    def __init__(self,
+                 default_value: ConfigBaseT | ValueBase[ConfigBaseT],
+                 key=None,
+                 equals=None,
+                 update_delay_secs: float = 0.0):
         if not isinstance(default_value, ValueBase):
             super().__init__(default_value.deepcopy(), key=key, equals=equals)
         else:
             super().__init__(default_value, key=key, equals=equals)
 
+        self._pending_value: ConfigBaseT | None = None
+        self._coalesced_set = CoalescingCaller(self._set_pending_value, update_delay_secs)
+
     def set(self, value: ConfigBaseT) -> None:
-        super().set(value.deepcopy())
+        self._pending_value = value
+        self._coalesced_set()
+
+    def set_update_delay_secs(self, update_delay_secs: float) -> None:
+        self._coalesced_set.update_delay_secs = update_delay_secs
+
+    def _set_pending_value(self) -> None:
+        value, self._pending_value = self._pending_value, None
+        if value is not None:
+            super().set(value.deepcopy())
 
 
 class ReactiveObjects(DataPublisher):
@@ -60,6 +125,13 @@ class ReactiveObjects(DataPublisher):
     reactive components that read from `jupyter_ui_config`. Similarly, we
     wrap the TextConfig and LayoutConfig in ReactiveConfigCopy instances to
     ensure that changes to those configs are also detected.
+
+    To avoid a deep copy and a re-rendering of all reactive views for each
+    single change, config updates are coalesced into a single update per
+    burst of changes, delayed by `reactive_update_delay_secs` from the
+    Jupyter config. Similarly, `request_view_update()` marks the views of
+    single objects as dirty, and only the update flags of the dirty views
+    in `obj_id_update_flags` are toggled, once per burst.
     """
     jupyter_ui_config: IsReactive[IsJupyterUserInterfaceConfig] = pyd.Field(
         default_factory=lambda: ReactiveConfigCopy(JupyterUserInterfaceConfig()))
@@ -72,6 +144,45 @@ class ReactiveObjects(DataPublisher):
     obj_id_update_flags: IsReactive[dict[int, bool]] = pyd.Field(
         default_factory=lambda: solara.Reactive(dict()))
 
+    _dirty_obj_ids: set[int] = pyd.PrivateAttr(default_factory=set)
+    _update_views: CoalescingCaller = pyd.PrivateAttr()
+
+    def __init__(self, **data) -> None:
+        super().__init__(**data)
+        self._update_views = CoalescingCaller(self._toggle_update_flags_of_dirty_views)
+
+    def set_update_delay_from_config(self, jupyter_ui_config: IsJupyterUserInterfaceConfig) -> None:
+        """Set the delay for coalescing updates, as configured in the Jupyter UI config.
+
+        Args:
+            jupyter_ui_config: Jupyter UI config with the `reactive_update_delay_secs` setting.
+        """
+        update_delay_secs = jupyter_ui_config.reactive_update_delay_secs
+        for reactive_config in (self.jupyter_ui_config, self.text_config, self.layout_config):
+            if isinstance(reactive_config, ReactiveConfigCopy):
+                reactive_config.set_update_delay_secs(update_delay_secs)
+        self._update_views.update_delay_secs = update_delay_secs
+
+    def request_view_update(self, obj_id: int) -> None:
+        """Mark the reactive views of an object as dirty, to be re-rendered with the next update.
+
+        Only views of objects marked as dirty are re-rendered. Requests for several objects
+        within the update delay are coalesced into a single update.
+
+        Args:
+            obj_id: `id()` of the object whose views should be re-rendered.
+        """
+        self._dirty_obj_ids.add(obj_id)
+        self._update_views()
+
+    def _toggle_update_flags_of_dirty_views(self) -> None:
+        if self._dirty_obj_ids:
+            obj_id_update_flags = self.obj_id_update_flags.value.copy()
+            for obj_id in self._dirty_obj_ids:
+                obj_id_update_flags[obj_id] = not obj_id_update_flags.get(obj_id, False)
+            self._dirty_obj_ids.clear()
+            self.obj_id_update_flags.set(obj_id_update_flags)
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, ReactiveObjects):
             return False
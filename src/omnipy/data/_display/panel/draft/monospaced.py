@@ -11,6 +11,7 @@ from omnipy.data._display.dimensions import Dimensions
 from omnipy.data._display.helpers import UnicodeCharWidthMap
 from omnipy.data._display.panel.draft.base import DimensionsAwareDraftPanel, DraftPanel
 from omnipy.data._display.panel.typedefs import ContentT, FrameT
+from omnipy.data.metrics import data_metrics
 from omnipy.shared.enums.display import MaxTitleHeight
 import omnipy.util.pydantic as pyd
 
@@ -109,3 +110,6 @@ def _calc_line_stats(
             stats.register_char(char_width)
 
         return stats
+
+
+data_metrics.register_cache('calc_line_stats', _calc_line_stats.cache_info)
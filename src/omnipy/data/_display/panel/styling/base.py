@@ -17,6 +17,7 @@ from omnipy.data._display.panel.base import FullyRenderedPanel, OutputVariant
 from omnipy.data._display.panel.cropping import rich_overflow_method
 from omnipy.data._display.panel.draft.monospaced import MonospacedDraftPanel
 from omnipy.data._display.panel.typedefs import ContentT, FrameT
+from omnipy.data.metrics import data_metrics
 from omnipy.shared.enums.display import DisplayColorSystem
 import omnipy.util.pydantic as pyd
 
@@ -199,3 +200,7 @@ class StylizedMonospacedPanel(
     @abstractmethod
     def colorized(self) -> OutputVariant:
         ...
+
+
+data_metrics.register_cache('stylized_panel_console',
+                            StylizedMonospacedPanel._get_console_common.cache_info)
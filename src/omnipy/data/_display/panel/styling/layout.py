@@ -28,6 +28,7 @@ from omnipy.data._display.panel.helpers import (calculate_bg_color_from_color_st
 from omnipy.data._display.panel.styling.base import StylizedMonospacedPanel, StylizedRichTypes
 from omnipy.data._display.panel.styling.output import OutputMode, TableCroppingOutputVariant
 from omnipy.data._display.panel.typedefs import FrameInvT
+from omnipy.data.metrics import data_metrics
 from omnipy.shared.constants import (INFO_BASE_16_TOKEN,
                                      INFO_GENERAL_TOKEN,
                                      PANEL_TITLE_BASE_16_TOKEN,
@@ -444,3 +445,7 @@ class OuterLayoutPanelStyler:
                 self._styles,
             )
             yield inner_panel_layout_props.style_inner_panel()
+
+
+data_metrics.register_cache('stylized_layout',
+                            StylizedLayoutPanel._get_stylized_layout_common.cache_info)
@@ -13,6 +13,7 @@ from omnipy.data._display.panel.styling.base import StylizedMonospacedPanel, Sty
 from omnipy.data._display.panel.styling.output import OutputMode, TextCroppingOutputVariant
 from omnipy.data._display.panel.typedefs import FrameT
 from omnipy.data._display.styles.dynamic_styles import clean_style_name
+from omnipy.data.metrics import data_metrics
 from omnipy.shared.enums.colorstyles import AllColorStyles
 from omnipy.shared.enums.display import (DisplayColorSystem,
                                          HorizontalOverflowMode,
@@ -139,3 +140,7 @@ class SyntaxStylizedTextPanel(
     @override
     def colorized(self) -> OutputVariant:
         return TextCroppingOutputVariant(self, OutputMode.COLORIZED)
+
+
+data_metrics.register_cache('stylized_text_content',
+                            SyntaxStylizedTextPanel._get_stylized_content_common.cache_info)
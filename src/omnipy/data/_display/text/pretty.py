@@ -1,12 +1,14 @@
 """Draft-to-text formatting pipeline for non-layout display content."""
 
+from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+import sys
 from typing import cast
 
-from cachebox import cached, FIFOCache
-
+from omnipy.data._data_class_creator import DataClassBase
 from omnipy.data._display.dimensions import Proportionally
 from omnipy.data._display.frame import frame_has_width, FrameWithWidth
+from omnipy.data._display.helpers import render_lock
 from omnipy.data._display.panel.draft.base import DraftPanel
 from omnipy.data._display.panel.draft.text import ReflowedTextDraftPanel
 from omnipy.data._display.panel.typedefs import FrameT, OtherFrameT
@@ -16,6 +18,9 @@ from omnipy.data._display.text.preview_pruning import (_is_probe_render_active,
                                                        _maybe_prune_draft_panel,
                                                        _PreviewPruningMemo,
                                                        _set_probe_render_active)
+from omnipy.data.metrics import data_metrics
+from omnipy.shared.constants import FORMAT_DRAFT_PANEL_CACHE_MAX_BYTES
+from omnipy.util.budget_cache import MemoryBudgetCache
 
 _preview_pruning_memo_ctx_var: ContextVar[_PreviewPruningMemo | None] = ContextVar(
     '_preview_pruning_memo_ctx_var',
@@ -35,6 +40,10 @@ def pretty_repr_of_draft_output(
     memo_token = _preview_pruning_memo_ctx_var.set(memo)
 
     try:
+        # Pruning is determined by the content, frame and config of the panel, all part of the
+        # cache keys, so the original content identifies the pruned content as well
+        orig_draft_content_key = content_cache_key(in_draft_panel.content)
+
         if _is_probe_render_active():
             draft_panel = in_draft_panel
         else:
@@ -45,7 +54,6 @@ def pretty_repr_of_draft_output(
             )
 
         pretty_printer = PrettyPrinter.get_pretty_printer_for_draft_panel(draft_panel)
-        orig_draft_content_id = id(draft_panel.content)
         draft_panel = pretty_printer.prepare_draft_panel(draft_panel)
         formatted_draft_panel = pretty_printer.format_prepared_draft(draft_panel)
         if frame_has_width(formatted_draft_panel.frame):
@@ -53,11 +61,16 @@ def pretty_repr_of_draft_output(
                                        formatted_draft_panel)
             if (isinstance(pretty_printer, StatsTighteningPrettyPrinter)
                     and _should_reduce_width(reflowed_text_panel)):
-                return _iteratively_reduce_width(
+                if pretty_printer.get_searchable_stat_req(draft_panel) is not None:
+                    reduce_width_func = _search_width_reducing_stat_req
+                else:
+                    reduce_width_func = _iteratively_reduce_width
+
+                return reduce_width_func(
                     pretty_printer=pretty_printer,
                     draft_panel=draft_panel,
                     cur_reflowed_text_panel=reflowed_text_panel,
-                    orig_draft_content_id=orig_draft_content_id,
+                    orig_draft_content_key=orig_draft_content_key,
                     should_follow_proportionality=_should_follow_proportionality(
                         reflowed_text_panel),
                 )
@@ -98,7 +111,7 @@ def _iteratively_reduce_width(
     pretty_printer: StatsTighteningPrettyPrinter[object],
     draft_panel: DraftPanel[object, FrameT],
     cur_reflowed_text_panel: ReflowedTextDraftPanel[FrameWithWidth],
-    orig_draft_content_id: int,
+    orig_draft_content_key: Hashable | None,
     should_follow_proportionality: bool,
 ) -> ReflowedTextDraftPanel[FrameT]:
     prev_reflowed_text_panel = None
@@ -132,7 +145,7 @@ def _iteratively_reduce_width(
         prev_reflowed_text_panel = cur_reflowed_text_panel
 
         cur_reflowed_text_panel = _format_draft_panel(
-            orig_draft_content_id=orig_draft_content_id,
+            orig_draft_content_key=orig_draft_content_key,
             pretty_printer=pretty_printer,
             draft_for_format=draft_for_format,
             cur_reflowed_text_panel=cur_reflowed_text_panel)
@@ -141,28 +154,173 @@ def _iteratively_reduce_width(
     return cast(ReflowedTextDraftPanel[FrameT], cur_reflowed_text_panel)
 
 
-def _unique_format_params_key_maker(*_args, **kwargs):
-    """A key maker for unique format parameters."""
-    return hash((
-        kwargs['pretty_printer'],
-        kwargs['orig_draft_content_id'],
-        kwargs['draft_for_format'].title,
-        kwargs['draft_for_format'].frame,
-        kwargs['draft_for_format'].constraints,
-        kwargs['draft_for_format'].config,
-        kwargs['cur_reflowed_text_panel'],
-    ))
+def _search_width_reducing_stat_req(  # noqa: C901
+    pretty_printer: StatsTighteningPrettyPrinter[object],
+    draft_panel: DraftPanel[object, FrameT],
+    cur_reflowed_text_panel: ReflowedTextDraftPanel[FrameWithWidth],
+    orig_draft_content_key: Hashable | None,
+    should_follow_proportionality: bool,
+) -> ReflowedTextDraftPanel[FrameT]:
+    # Alternative to _iteratively_reduce_width() for printers where the output depends on a
+    # single requirement. Instead of tightening the requirement one print at a time, gallops
+    # down with doubling steps until the output fits, then bisects for the least tightened
+    # requirement that fits. This assumes that tightening the requirement never widens the
+    # output. As for iterative tightening, the search gives up when the calculated statistic
+    # stops improving.
+    init_stat_req = pretty_printer.get_searchable_stat_req(draft_panel)
+    assert init_stat_req is not None
+
+    printed = {init_stat_req: cur_reflowed_text_panel}
+
+    def _print(stat_req: int) -> ReflowedTextDraftPanel[FrameWithWidth]:
+        if stat_req not in printed:
+            printed[stat_req] = _format_draft_panel(
+                orig_draft_content_key=orig_draft_content_key,
+                pretty_printer=pretty_printer,
+                draft_for_format=pretty_printer.prepare_draft_for_print_with_stat_req(
+                    draft_panel, stat_req),
+                cur_reflowed_text_panel=printed[init_stat_req],
+            )
+        return printed[stat_req]
+
+    def _next_stat_req(stat_req: int) -> int:
+        next_stat_req = pretty_printer.calc_next_searchable_stat_req(_print(stat_req))
+        return min(next_stat_req, stat_req - 1)
+
+    def _fits(stat_req: int) -> bool:
+        fit = _print(stat_req).within_frame
+        if should_follow_proportionality:
+            return bool(fit.width and fit.proportionality
+                        and fit.proportionality <= Proportionally.WIDER)
+        return bool(fit.width)
+
+    def _calculated_stat(stat_req: int) -> int:
+        return pretty_printer.get_calculated_searchable_stat(_print(stat_req))
+
+    # As for iterative tightening, give up if the initial output does not allow tightening
+    if pretty_printer.calc_next_searchable_stat_req(cur_reflowed_text_panel) >= init_stat_req:
+        return cast(ReflowedTextDraftPanel[FrameT], cur_reflowed_text_panel)
+
+    max_stat_req = _next_stat_req(init_stat_req)
+    prev_stat_req = prev_high = init_stat_req
+    high = max_stat_req
+    step = 1
+
+    while True:
+        stat_req = max(high - step + 1, 0)
+
+        if _fits(stat_req):
+            stat_req = _bisect_max_stat_req(_fits, _next_stat_req, low=stat_req, high=high)
+
+            # If narrowing to follow proportionality made the output too high, fall back to
+            # the previous, wider output if that fits the frame in both dimensions
+            if should_follow_proportionality and not _print(stat_req).within_frame.height:
+                wider_stat_req = stat_req + 1 if stat_req < max_stat_req else init_stat_req
+                if _print(wider_stat_req).within_frame.both:
+                    stat_req = wider_stat_req
+            break
+
+        calculated_stat = _calculated_stat(stat_req)
+        if calculated_stat >= _calculated_stat(prev_stat_req):
+            # Plateau reached. Settle for the second output on the plateau, where iterative
+            # tightening would have given up.
+            plateau_stat_req = _bisect_max_stat_req(
+                lambda other_stat_req: _calculated_stat(other_stat_req) <= calculated_stat,
+                _next_stat_req,
+                low=prev_stat_req,
+                high=prev_high,
+            )
+            stat_req = max(_next_stat_req(plateau_stat_req), 0)
+            break
+
+        if stat_req == 0:
+            break
+
+        prev_stat_req, prev_high = stat_req, high
+        high = _next_stat_req(stat_req)
+        step *= 2
+
+    # Even though FrameT is FrameWithWidth at this point, static type checkers don't know that
+    return cast(ReflowedTextDraftPanel[FrameT], _print(stat_req))
+
+
+def _bisect_max_stat_req(
+    predicate: Callable[[int], bool],
+    next_stat_req_func: Callable[[int], int],
+    low: int,
+    high: int,
+) -> int:
+    # Returns the highest requirement in [low, high] satisfying the predicate, which must be
+    # satisfied for low. Unsatisfying requirements also rule out all higher requirements that
+    # reproduce the same output.
+    while low < high:
+        stat_req = (low + high + 1) // 2
+        if predicate(stat_req):
+            low = stat_req
+        else:
+            high = max(next_stat_req_func(stat_req), low)
+    return low
+
+
+def content_cache_key(content: object) -> Hashable | None:
+    """Return a key identifying the current state of display content, for use in render caches.
+
+    Models and datasets are identified by their content version, which changes on every
+    validated mutation. As nested content may also be changed in place without changing the
+    version, the version is only used if the content is verified to be equal to the snapshot
+    taken when it was last validated. Other hashable content is identified by value.
+
+    Returns ``None`` if the content cannot be identified, in which case it should not be cached.
+    """
+    if isinstance(content, DataClassBase):
+        if content._content_unchanged_since_validation():
+            return 'version', content.content_version
+        return None
+    try:
+        hash(content)
+    except TypeError:
+        return None
+    return 'value', type(content), content
+
+
+def _reflowed_text_panel_num_bytes(panel: ReflowedTextDraftPanel) -> int:
+    return sys.getsizeof(panel.content)
+
+
+_format_draft_panel_cache = MemoryBudgetCache[Hashable, ReflowedTextDraftPanel](
+    FORMAT_DRAFT_PANEL_CACHE_MAX_BYTES, _reflowed_text_panel_num_bytes, lock=render_lock)
 
 
-@cached(FIFOCache(maxsize=512), key_maker=_unique_format_params_key_maker)
 def _format_draft_panel(
     *,
     pretty_printer: StatsTighteningPrettyPrinter,
-    orig_draft_content_id: int,  # Only used for generating unique cache keys
+    orig_draft_content_key: Hashable | None,  # Only used for generating unique cache keys
     draft_for_format: DraftPanel[object, FrameT],
     cur_reflowed_text_panel: ReflowedTextDraftPanel[OtherFrameT],
 ) -> ReflowedTextDraftPanel[OtherFrameT]:
-    return ReflowedTextDraftPanel.create_from_draft_panel(
+    if orig_draft_content_key is None:
+        return ReflowedTextDraftPanel.create_from_draft_panel(
+            cur_reflowed_text_panel,
+            other_content=pretty_printer.print_draft_to_str(draft_for_format),
+        )
+
+    cache_key = (
+        pretty_printer,
+        orig_draft_content_key,
+        draft_for_format.title,
+        draft_for_format.frame,
+        draft_for_format.constraints,
+        draft_for_format.config,
         cur_reflowed_text_panel,
-        other_content=pretty_printer.print_draft_to_str(draft_for_format),
     )
+    reflowed_text_panel = _format_draft_panel_cache.get(cache_key)
+    if reflowed_text_panel is None:
+        reflowed_text_panel = ReflowedTextDraftPanel.create_from_draft_panel(
+            cur_reflowed_text_panel,
+            other_content=pretty_printer.print_draft_to_str(draft_for_format),
+        )
+        _format_draft_panel_cache[cache_key] = reflowed_text_panel
+    return reflowed_text_panel
+
+
+data_metrics.register_cache('format_draft_panel', _format_draft_panel_cache.cache_info)
@@ -222,6 +222,75 @@ class StatsTighteningPrettyPrinter(
         """
         return False
 
+    def get_searchable_stat_req(
+        self,
+        draft_panel: DraftPanel[ContentT, FrameT],
+    ) -> pyd.NonNegativeInt | None:
+        """Return the value of the single requirement tightened to fit the frame, if any.
+
+        If the output depends on a single requirement that is tightened by lowering its value,
+        the lowest fitting value can be searched for directly instead of tightened one print at
+        a time. Printers that tighten several requirements together return ``None`` and are
+        fitted iteratively.
+
+        Args:
+            draft_panel: Prepared draft panel to read the requirement from.
+
+        Returns:
+            Current value of the searchable requirement, or ``None`` if not searchable.
+        """
+        return None
+
+    @abstractmethod
+    def prepare_draft_for_print_with_stat_req(
+        self,
+        draft_panel: DraftPanel[ContentT, FrameT],
+        stat_req: pyd.NonNegativeInt,
+    ) -> DraftPanel[ContentT, FrameT | FrameWithWidth]:
+        """Return a copy of the draft panel with the searchable requirement set to a value.
+
+        Args:
+            draft_panel: Prepared draft panel to modify.
+            stat_req: New value of the searchable requirement.
+
+        Returns:
+            Draft panel copy for printing with the requirement.
+        """
+        ...
+
+    @abstractmethod
+    def get_calculated_searchable_stat(
+        self,
+        reflowed_text_panel: ReflowedTextDraftPanel[AnyFrame],
+    ) -> pyd.NonNegativeInt:
+        """Return the statistic of printed output that the searchable requirement limits.
+
+        Args:
+            reflowed_text_panel: Printed output panel.
+
+        Returns:
+            Value of the statistic calculated from the output.
+        """
+        ...
+
+    @abstractmethod
+    def calc_next_searchable_stat_req(
+        self,
+        reflowed_text_panel: ReflowedTextDraftPanel[AnyFrame],
+    ) -> pyd.NonNegativeInt:
+        """Return the highest requirement value that could change the printed output.
+
+        Printing with any value between this and the requirement that produced the output is
+        assumed to reproduce the same output, allowing such values to be skipped.
+
+        Args:
+            reflowed_text_panel: Printed output panel.
+
+        Returns:
+            Next value of the searchable requirement to consider.
+        """
+        ...
+
     @staticmethod
     def _stat_tightened_since_last_print_common(
         prev_vals_dict: dict[str, pyd.NonNegativeInt | None],
@@ -343,6 +412,39 @@ class WidthReducingPrettyPrinter(StatsTighteningPrettyPrinter[ContentT], Generic
         new_frame_width = max(0, self._calc_reduced_frame_width(cur_reflowed_text_panel.orig_dims))
         return cur_reflowed_text_panel.frame.modified_copy(width=new_frame_width)
 
+    @override
+    def get_searchable_stat_req(
+        self,
+        draft_panel: DraftPanel[ContentT, FrameT],
+    ) -> pyd.NonNegativeInt | None:
+        return draft_panel.frame.dims.width
+
+    @override
+    def prepare_draft_for_print_with_stat_req(
+        self,
+        draft_panel: DraftPanel[ContentT, FrameT],
+        stat_req: pyd.NonNegativeInt,
+    ) -> DraftPanel[ContentT, FrameT | FrameWithWidth]:
+        return draft_panel.create_modified_copy(
+            draft_panel.content,
+            frame=draft_panel.frame.modified_copy(width=stat_req),
+            constraints=draft_panel.constraints,
+        )
+
+    @override
+    def get_calculated_searchable_stat(
+        self,
+        reflowed_text_panel: ReflowedTextDraftPanel[AnyFrame],
+    ) -> pyd.NonNegativeInt:
+        return reflowed_text_panel.orig_dims.width
+
+    @override
+    def calc_next_searchable_stat_req(
+        self,
+        reflowed_text_panel: ReflowedTextDraftPanel[AnyFrame],
+    ) -> pyd.NonNegativeInt:
+        return max(0, self._calc_reduced_frame_width(reflowed_text_panel.orig_dims))
+
     @classmethod
     @abstractmethod
     def _calc_reduced_frame_width(
@@ -437,6 +539,42 @@ class ConstraintTighteningPrettyPrinter(
         else:
             return reflowed_text_panel.constraints
 
+    @override
+    def get_searchable_stat_req(
+        self,
+        draft_panel: DraftPanel[ContentT, FrameT],
+    ) -> pyd.NonNegativeInt | None:
+        return getattr(draft_panel.constraints, self.CONSTRAINT_STAT_NAME)
+
+    @override
+    def prepare_draft_for_print_with_stat_req(
+        self,
+        draft_panel: DraftPanel[ContentT, FrameT],
+        stat_req: pyd.NonNegativeInt,
+    ) -> DraftPanel[ContentT, FrameT | FrameWithWidth]:
+        return draft_panel.create_modified_copy(
+            draft_panel.content,
+            constraints=dataclasses.replace(
+                draft_panel.constraints,
+                **{self.CONSTRAINT_STAT_NAME: stat_req},
+            ),
+        )
+
+    @override
+    def get_calculated_searchable_stat(
+        self,
+        reflowed_text_panel: ReflowedTextDraftPanel[AnyFrame],
+    ) -> pyd.NonNegativeInt:
+        return getattr(reflowed_text_panel, self.CONSTRAINT_STAT_NAME)
+
+    @override
+    def calc_next_searchable_stat_req(
+        self,
+        reflowed_text_panel: ReflowedTextDraftPanel[AnyFrame],
+    ) -> pyd.NonNegativeInt:
+        calculated_stat = self.get_calculated_searchable_stat(reflowed_text_panel)
+        return max(0, type(self).CONSTRAINT_TIGHTEN_FUNC(calculated_stat))
+
     @override
     def stats_tightened_since_last_print(
         self,
@@ -51,6 +51,14 @@ class DevtoolsPrettyPrinter(
         return Constraints(
             max_inline_container_width_incl=(draft_panel.frame.dims.width or MAX_TERMINAL_SIZE))
 
+    @override
+    def get_searchable_stat_req(
+        self,
+        draft_panel: DraftPanel[object, FrameT],
+    ) -> pyd.NonNegativeInt | None:
+        # Constraint and width are tightened together, see below
+        return None
+
     @override
     def prepare_draft_for_print_with_tightened_stat_reqs(
         self,
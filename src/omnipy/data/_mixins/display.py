@@ -15,6 +15,7 @@ dataset-specific panel construction.
 """
 
 from abc import ABCMeta, abstractmethod
+from collections.abc import Hashable
 import dataclasses
 import functools
 from inspect import signature
@@ -33,6 +34,7 @@ from omnipy.data._data_class_creator import DataClassBase
 from omnipy.data._display.config import OutputConfig
 from omnipy.data._display.dimensions import Dimensions, has_height, has_width
 from omnipy.data._display.frame import empty_frame, Frame
+from omnipy.data._display.helpers import render_lock
 from omnipy.data._display.integrations.browser.macosx import (OmnipyMacOSXOSAScript,
                                                               setup_macosx_browser_integration)
 from omnipy.data._display.layout.base import Layout, PanelDesignDims
@@ -40,17 +42,22 @@ from omnipy.data._display.layout.flow.helpers import create_ellipsis_panel
 from omnipy.data._display.panel.base import FullyRenderedPanel
 from omnipy.data._display.panel.draft.base import DraftPanel
 from omnipy.data._display.styles.dynamic_styles import resolve_and_fetch_style
+from omnipy.data._display.text.pretty import content_cache_key
 from omnipy.data.helpers import FailedData, PendingData
+from omnipy.data.metrics import data_metrics
+from omnipy.data.size import deep_size_accountant
 from omnipy.hub.ui import (detect_dark_background,
                            detect_display_color_system,
                            get_terminal_prompt_height,
-                           note_mime_bundle)
+                           note_mime_bundle,
+                           running_in_interactive_session)
 from omnipy.shared.constants import (MAX_MODEL_ARG_REPR_LEN,
                                      MAX_PANEL_NESTING_DEPTH,
                                      MAX_PANELS_HORIZONTALLY,
                                      MAX_PANELS_HORIZONTALLY_DEEPLY_NESTED,
                                      MIN_CROP_WIDTH,
                                      MIN_PANEL_WIDTH,
+                                     RENDERED_PANEL_CACHE_MAX_BYTES,
                                      TITLE_BLANK_LINES)
 from omnipy.shared.enums.colorstyles import AllColorStyles, RecommendedColorStyles
 from omnipy.shared.enums.display import (DarkBackground,
@@ -73,6 +80,7 @@ from omnipy.shared.enums.ui import (BrowserPageUserInterfaceType,
 from omnipy.shared.protocols.config import IsHtmlUserInterfaceConfig, IsUserInterfaceTypeConfig
 from omnipy.shared.typedefs import Method
 from omnipy.shared.typing import TYPE_CHECKER, TYPE_CHECKING
+from omnipy.util.budget_cache import MemoryBudgetCache
 from omnipy.util.helpers import is_package_editable, min_or_none, takes_input_params_from
 import omnipy.util.pydantic as pyd
 
@@ -90,6 +98,58 @@ if sys.platform == 'darwin':
 P = ParamSpec('P')
 _RetT = TypeVar('_RetT')
 
+# Rough estimate of the memory used per character cell by the plain, stylized and colorized
+# terminal and HTML output variants of a fully rendered panel
+_RENDERED_PANEL_EST_BYTES_PER_CELL = 32
+
+
+def _rendered_panel_est_num_bytes(panel: FullyRenderedPanel) -> int:
+    return panel.dims.width * panel.dims.height * _RENDERED_PANEL_EST_BYTES_PER_CELL
+
+
+_rendered_panel_cache: MemoryBudgetCache[Hashable, FullyRenderedPanel] = MemoryBudgetCache(
+    RENDERED_PANEL_CACHE_MAX_BYTES, _rendered_panel_est_num_bytes, lock=render_lock)
+data_metrics.register_cache('rendered_panel', _rendered_panel_cache.cache_info)
+
+
+def _rendered_panel_cache_key(
+    output_method: Method[P, DraftPanel],
+    panel: DraftPanel,
+    ui_type: SpecifiedUserInterfaceType.Literals,
+    kwargs: dict[str, object],
+) -> Hashable | None:
+    """Return a cache key for the fully rendered output of a draft panel, if cacheable.
+
+    The content of the draft panel is identified by the content version of the model or
+    dataset producing it, while the frame dimensions and output config are taken from the draft
+    panel itself. Returns ``None`` if the output is not produced by a model or dataset, if the
+    content cannot be verified to be unchanged since it was last validated (see
+    ``content_cache_key()``), or if the display arguments are not hashable.
+    """
+    data_obj = getattr(output_method, '__self__', None)
+    if not isinstance(data_obj, DataClassBase):
+        return None
+
+    content_key = content_cache_key(data_obj)
+    if content_key is None:
+        return None
+
+    key = (
+        output_method.__func__,  # type: ignore[attr-defined]
+        content_key,
+        ui_type,
+        tuple(sorted(kwargs.items())),
+        panel.title,
+        panel.frame,
+        panel.constraints,
+        panel.config,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 @pyd.dataclass(
     kw_only=True,
@@ -2578,18 +2638,33 @@ class BaseDisplayMixin(metaclass=ABCMeta):
             *args: P.args,
             **kwargs: P.kwargs,
         ) -> FullyRenderedPanel:
-            panel = output_method(*args, **kwargs)
-            resized_panel = panel.render_next_stage()
-            if ui_type in BrowserPageUserInterfaceType:
-                # If the output is a browser page, we allow expanding the
-                # frame to fit the content
-                if not resized_panel.within_frame.width:
-                    new_frame = resized_panel.frame.modified_copy(width=resized_panel.dims.width)
-                    resized_panel = dataclasses.replace(
-                        resized_panel,
-                        frame=new_frame,
-                    )
-            return resized_panel.render_next_stage()
+            # Rendering makes use of module-level caches, and is thus serialized across threads
+            with render_lock:
+                panel = output_method(*args, **kwargs)
+
+                cache_key = None if args else _rendered_panel_cache_key(
+                    output_method, panel, ui_type, kwargs)
+                if cache_key is not None:
+                    cached_panel = _rendered_panel_cache.get(cache_key)
+                    if cached_panel is not None:
+                        return cached_panel
+
+                resized_panel = panel.render_next_stage()
+                if ui_type in BrowserPageUserInterfaceType:
+                    # If the output is a browser page, we allow expanding the
+                    # frame to fit the content
+                    if not resized_panel.within_frame.width:
+                        new_frame = resized_panel.frame.modified_copy(
+                            width=resized_panel.dims.width)
+                        resized_panel = dataclasses.replace(
+                            resized_panel,
+                            frame=new_frame,
+                        )
+                rendered_panel = resized_panel.render_next_stage()
+
+                if cache_key is not None:
+                    _rendered_panel_cache[cache_key] = rendered_panel
+                return rendered_panel
 
         def _render_output(
             rendered_panel: FullyRenderedPanel,
@@ -3226,10 +3301,7 @@ class BaseDisplayMixin(metaclass=ABCMeta):
     def update_reactive_views(self):
         from omnipy.hub.runtime import runtime
         assert runtime.objects.reactive is not None
-        obj_id_update_flags = runtime.objects.reactive.obj_id_update_flags.value.copy()
-        flag = obj_id_update_flags.get(id(self), False)
-        obj_id_update_flags[id(self)] = not flag
-        runtime.objects.reactive.obj_id_update_flags.set(obj_id_update_flags)
+        runtime.objects.reactive.request_view_update(id(self))
 
 
 def _call_dataset_method_if_applicable(model_method: Callable[..., _RetT]):
@@ -3809,6 +3881,13 @@ class DatasetDisplayMixin(BaseDisplayMixin):
 
     def _list(self, **kwargs) -> DraftPanel:
         """Build the tabular summary view used by ``Dataset.list()``."""
+        return self._list_window(0, None, **kwargs)
+
+    def _list_window(self, start: int, stop: int | None, /, **kwargs) -> DraftPanel:
+        """Build the tabular summary view for the dataset items from ``start`` to ``stop``.
+
+        Rows are numbered by their position in the full dataset.
+        """
         from omnipy.data.dataset import Dataset
         from omnipy.data.model import Model
 
@@ -3830,19 +3909,22 @@ class DatasetDisplayMixin(BaseDisplayMixin):
 
         layout: Layout[DraftPanel] = Layout()
 
-        rows_to_materialize = self._dataset_list_rows_to_materialize(self_dataset, frame, config)
-        row_items = list(islice(self_data_as_dict.items(), rows_to_materialize))
+        stop = len(self_dataset) if stop is None else min(stop, len(self_dataset))
+        num_rows = max(stop - start, 0)
+        rows_to_materialize = self._dataset_list_rows_to_materialize(num_rows, frame, config)
+        row_items = list(islice(self_data_as_dict.items(), start, start + rows_to_materialize))
         row_keys = [key for key, _ in row_items]
         row_models = [model for _, model in row_items]
 
         max_digits_for_dataset_list_index_numbers = self._max_digits_for_dataset_list_index_numbers(
-            self_dataset,
+            num_rows,
             frame,
             config,
+            start,
         )
 
         layout['#'] = DraftPanel(
-            '\n'.join(str(i) for i in range(len(row_items))),
+            '\n'.join(str(i) for i in range(start, start + len(row_items))),
             title='#',
             frame=Frame(
                 Dimensions(max_digits_for_dataset_list_index_numbers, None), fixed_width=True),
@@ -3864,29 +3946,30 @@ class DatasetDisplayMixin(BaseDisplayMixin):
 
     def _max_digits_for_dataset_list_index_numbers(
         self,
-        dataset: 'Dataset',
+        num_rows: int,
         frame: Frame,
         config: OutputConfig,
+        start: int = 0,
     ) -> int:
-        """Calculate the width needed for dataset list row indices."""
+        """Calculate the width needed for dataset list row indices starting at ``start``."""
         panels_design_dims = PanelDesignDims.create(config.panel)
 
         if has_height(frame.dims):
             inner_frame_height = (
                 frame.dims.height - panels_design_dims.num_extra_vertical_chars(1)
                 - config.max_title_height - TITLE_BLANK_LINES)
-            num_panels_listed_in_view = min(len(dataset), inner_frame_height)
+            num_panels_listed_in_view = min(num_rows, inner_frame_height)
         else:
-            num_panels_listed_in_view = len(dataset)
+            num_panels_listed_in_view = num_rows
 
         # -1 is due to indices starting at 0
-        max_digits_for_dataset_list_index_numbers = len(str(num_panels_listed_in_view - 1))
+        max_digits_for_dataset_list_index_numbers = len(str(start + num_panels_listed_in_view - 1))
 
         return max_digits_for_dataset_list_index_numbers
 
     def _dataset_list_rows_to_materialize(
         self,
-        dataset: 'Dataset',
+        num_rows: int,
         frame: Frame,
         config: OutputConfig,
     ) -> int:
@@ -3897,15 +3980,15 @@ class DatasetDisplayMixin(BaseDisplayMixin):
         avoiding eager materialization of all rows.
 
         Args:
-            dataset: Dataset being rendered.
+            num_rows: Number of dataset rows to be rendered.
             frame: Output frame constraints.
             config: Display output configuration.
 
         Returns:
-            Number of rows to materialize from the front of the dataset.
+            Number of rows to materialize from the front of the rendered rows.
         """
         if not has_height(frame.dims):
-            return len(dataset)
+            return num_rows
 
         panels_design_dims = PanelDesignDims.create(config.panel)
         inner_frame_height = (
@@ -3917,7 +4000,7 @@ class DatasetDisplayMixin(BaseDisplayMixin):
 
         visible_rows = max(0, inner_frame_height - 1)
         safety_margin = 2
-        return min(len(dataset), visible_rows + safety_margin)
+        return min(num_rows, visible_rows + safety_margin)
 
     def _browse(self, **kwargs) -> None:
         self._browse_dataset(**kwargs)
@@ -3933,7 +4016,20 @@ class DatasetDisplayMixin(BaseDisplayMixin):
         else:
             nested_call = True
 
-        self_data_as_dict = cast(dict[str, Model], cast(Dataset, self).data)
+        self_as_dataset = cast(Dataset, self)
+        self_data_as_dict = cast(dict[str, Model], self_as_dataset.data)
+
+        # Pages are served by a thread of the current process, which is only kept running in
+        # interactive sessions. Otherwise, all items are rendered to files up front.
+        browser_config = self_as_dataset.config.ui.browser
+        min_items = browser_config.windowed_browse_min_items
+        if (not nested_call and min_items is not None and len(self_as_dataset) >= min_items
+                and not UserInterfaceType.is_jupyter_in_browser(self._extract_ui_type(**kwargs))
+                and running_in_interactive_session()):
+            self._browse_dataset_windowed(browser_config.windowed_browse_page_size,
+                                          browser_config.windowed_browse_max_servers,
+                                          **kwargs)
+            return
 
         filename = f'{self.__class__.__name__}_{id(self)}.html'
 
@@ -3955,6 +4051,14 @@ class DatasetDisplayMixin(BaseDisplayMixin):
             nested_call,
             **kwargs)
 
+    def _browse_dataset_windowed(self, page_size: int, max_servers: int, **kwargs) -> None:
+        """Open the dataset in a browser, served page by page from a local HTTP server."""
+        from omnipy.data._display.integrations.browser.windowed import WindowedDatasetBrowser
+        from omnipy.data.dataset import Dataset
+
+        windowed_browser = WindowedDatasetBrowser(cast(Dataset, self), page_size, **kwargs)
+        webbrowser.open(windowed_browser.start(max_running_servers=max_servers), new=1)
+
     @classmethod
     def _type_str(cls, obj: Any) -> str:
         """Return a human-readable type label for dataset list output."""
@@ -3979,19 +4083,16 @@ class DatasetDisplayMixin(BaseDisplayMixin):
         if isinstance(obj, PendingData):
             return '-'
         else:
-            try:
-                cached_obj_size_func = functools.cache(cls._obj_size)
-                return cached_obj_size_func(obj)
-            except TypeError:
-                return cls._obj_size(obj)
+            return cls._obj_size(obj)
 
     @staticmethod
     def _obj_size(obj: Any) -> str:
-        """Return a human-readable deep size estimate for an object."""
+        """Return a human-readable deep size for an object, prefixed by ``~`` if estimated."""
         import humanize
-        import objsize
 
-        return humanize.naturalsize(objsize.get_deep_size(obj))
+        deep_size = deep_size_accountant.get_deep_size(obj)
+        prefix = '~' if deep_size.estimated else ''
+        return prefix + humanize.naturalsize(deep_size.num_bytes)
 
 
 if TYPE_CHECKING and TYPE_CHECKER != 'mypy':
@@ -2,12 +2,13 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterable, Mapping, MutableMapping, TypeAlias
+from typing import Any, Iterable, Mapping, MutableMapping, NamedTuple, TypeAlias
 
 from typing_extensions import TypeVar
 
 from omnipy.shared.constants import UNTITLED_KEY
 from omnipy.util.helpers import is_iterable
+from omnipy.util.weak import WeakKeyRefContainer
 
 _ValT = TypeVar('_ValT')
 
@@ -27,18 +28,94 @@ class SelectedKeys:
     last_index: int = -1
 
 
+class KeyIndex:
+    """Positional index of the keys of a mapping, for constant-time lookups in both directions.
+
+    Attributes:
+        keys: Keys of the mapping in order, for lookups of keys by position.
+    """
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys: tuple[str, ...] = tuple(keys)
+        self._positions: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def position(self, key: str) -> int:
+        """Return the position of a key, building the reverse lookup table on first use.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self.keys)}
+        return self._positions[key]
+
+
+class _CachedKeyIndex(NamedTuple):
+    content_version: int
+    key_index: KeyIndex
+
+
+_key_index_cache = WeakKeyRefContainer[object, _CachedKeyIndex]()
+
+
+def get_cached_key_index(
+    owner: object,
+    content_version: int,
+    mapping: dict[str, Any],
+) -> KeyIndex:
+    """Return a positional index of the keys of a mapping, cached per owner and content version.
+
+    The index is rebuilt only when the content version of the owner has changed since the index
+    was built, i.e. after a validated mutation. The number of keys and the first and last keys
+    are also compared, which detects keys added, removed or replaced by most in-place changes
+    that bypass validation, at constant cost.
+
+    Args:
+        owner: Object holding the mapping, typically a dataset. Referenced weakly.
+        content_version: Current content version of the owner.
+        mapping: Mapping to index.
+
+    Returns:
+        A positional index of the current keys of the mapping.
+    """
+
+    cached = _key_index_cache.get(owner)
+    if cached is not None and cached.content_version == content_version \
+            and _has_same_number_and_end_keys(cached.key_index, mapping):
+        return cached.key_index
+
+    key_index = KeyIndex(mapping.keys())
+    _key_index_cache[owner] = _CachedKeyIndex(content_version, key_index)
+    return key_index
+
+
+def _has_same_number_and_end_keys(key_index: KeyIndex, mapping: dict[str, Any]) -> bool:
+    if len(key_index) != len(mapping):
+        return False
+    if len(mapping) == 0:
+        return True
+    first_key, last_key = next(iter(mapping)), next(reversed(mapping))
+    return key_index.keys[0] == first_key and key_index.keys[-1] == last_key
+
+
 Key2DataItemType: TypeAlias = dict[str, tuple[str, _ValT] | None]
 Index2DataItemsType: TypeAlias = defaultdict[int, list[tuple[str, _ValT]]]
 MappingType: TypeAlias = MutableMapping[str, _ValT]
 
 
 def select_keys(selector: str | int | slice | Iterable[str | int],
-                mapping: MappingType[_ValT]) -> SelectedKeys:
+                mapping: MappingType[_ValT],
+                key_index: KeyIndex | None = None) -> SelectedKeys:
     """Resolve a dataset selector into normalized string keys.
 
     Args:
         selector: Key, positional index, slice, or iterable of keys and indices.
         mapping: Source mapping whose key order defines positional selection.
+        key_index: Positional index of the keys of ``mapping``, e.g. from
+            :func:`get_cached_key_index`. Built from ``mapping`` if not provided.
 
     Returns:
         A normalized selection describing the resolved keys and insertion position.
@@ -50,7 +127,9 @@ def select_keys(selector: str | int | slice | Iterable[str | int],
     if isinstance(selector, str):
         return SelectedKeys(singular=True, keys=(selector,))
     else:
-        data_keys = tuple(mapping.keys())
+        if key_index is None:
+            key_index = KeyIndex(mapping.keys())
+        data_keys = key_index.keys
 
         if isinstance(selector, int):
             return SelectedKeys(singular=True, keys=(data_keys[selector],))
@@ -61,8 +140,8 @@ def select_keys(selector: str | int | slice | Iterable[str | int],
 
         elif is_iterable(selector):
             keys = tuple(data_keys[_] if isinstance(_, int) else _ for _ in selector)
-            if keys and keys[-1] in data_keys:
-                last_index = data_keys.index(keys[-1])
+            if keys and keys[-1] in mapping:
+                last_index = key_index.position(keys[-1])
             else:
                 last_index = len(data_keys) - 1
             return SelectedKeys(singular=False, keys=keys, last_index=last_index)
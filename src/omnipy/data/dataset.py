@@ -23,13 +23,19 @@ from omnipy.data._data_class_creator import DataClassBase, DataClassBaseMeta
 from omnipy.data._mixins.display import DatasetDisplayMixin
 from omnipy.data._mixins.task import TaskDatasetMixin
 from omnipy.data._selector import (create_updated_mapping,
+                                   get_cached_key_index,
                                    Index2DataItemsType,
                                    Key2DataItemType,
                                    prepare_selected_items_with_iterable_data,
                                    prepare_selected_items_with_mapping_data,
-                                   select_keys)
+                                   select_keys,
+                                   SelectedKeys)
 from omnipy.data.helpers import (build_own_module_and_global_namespace_for_forward_refs,
-                                 cleanup_name_qualname_and_module)
+                                 cleanup_name_qualname_and_module,
+                                 FailedData,
+                                 PendingData,
+                                 specialization_cache,
+                                 specialization_cache_key)
 from omnipy.shared.constants import ASYNC_LOAD_SLEEP_TIME, DATA_KEY
 from omnipy.shared.protocols.data import (IsHttpUrlDataset,
                                           IsMultiModelDataset,
@@ -194,6 +200,10 @@ class Dataset(
         # TODO: change model type to params: Type[Any] | tuple[Type[Any], ...]
         #       as in GenericModel.
 
+        cache_key = specialization_cache_key(cls, params)
+        if cache_key is not None and cache_key in specialization_cache:
+            return cast(Self, specialization_cache[cache_key])
+
         _params = cls._prepare_params(params)
         orig_params = cls._clean_type(_params)
 
@@ -213,6 +223,9 @@ class Dataset(
         cls._recursively_set_allow_none(created_dataset._get_data_field())
         cleanup_name_qualname_and_module(cls, created_dataset, orig_params)
 
+        if cache_key is not None:
+            specialization_cache[cache_key] = created_dataset
+
         return cast(Self, created_dataset)
 
     @call_super_if_available(call_super_before_method=True)
@@ -822,15 +835,41 @@ class Dataset(
             The selected validated item for singular selection, or a new dataset containing the
             selected items for plural selection.
         """
-        selected_keys = select_keys(selector, self.data)
+        selected_keys = self._select_keys(selector)
 
         if selected_keys.singular:
             value: _ModelOrDatasetT | Self = self.data[selected_keys.keys[0]]
         else:
-            value = self.__class__({key: self.data[key] for key in selected_keys.keys})
+            value = self._create_subset(selected_keys.keys)
 
         return self._check_value(value)
 
+    def _create_subset(self, keys: Iterable[str]) -> Self:
+        """Create a dataset of the same class with selected items, skipping re-validation.
+
+        The items of this dataset are already validated for the dataset type, and are referenced
+        by the subset as they are. Creating a subset is thus linear in the number of selected
+        keys, regardless of the size of the items. The subset has its own mapping of keys to
+        items, so that adding, replacing or deleting items in either dataset does not affect the
+        other, while in-place changes of the content of a shared item are seen by both.
+
+        Args:
+            keys: Keys of the items to include, in order.
+
+        Returns:
+            A new dataset with the selected items.
+
+        Raises:
+            KeyError: If a key is not in the dataset.
+        """
+        subset = self.__class__()
+
+        # Bypassing assignment validation, as all items have been validated by this dataset
+        object.__setattr__(subset, DATA_KEY, {key: self.data[key] for key in keys})
+        subset.__fields_set__.add(DATA_KEY)
+        subset._bump_content_version()
+        return subset
+
     @call_super_if_available(call_super_before_method=True)
     def _check_value(self, value: Any) -> Any:
         """Post-process a selected value before returning it.
@@ -846,6 +885,25 @@ class Dataset(
         """
         return value
 
+    def _select_keys(self, selector: str | int | slice | Iterable[str | int]) -> SelectedKeys:
+        """Resolve a selector into keys, using a positional key index cached per content version.
+
+        Args:
+            selector: A data-file key, positional index, slice, or iterable of keys and/or
+                indices.
+
+        Returns:
+            The normalized selection.
+        """
+        if isinstance(selector, str):
+            return select_keys(selector, self.data)
+
+        # The content version of the dataset itself is used, as changes of the items do not
+        # affect the keys. Looking up the content versions of all items would also make
+        # positional access linear in the number of items.
+        key_index = get_cached_key_index(self, super().content_version, self.data)
+        return select_keys(selector, self.data, key_index)
+
     def __delitem__(self, selector: str | int | slice | Iterable[str | int]) -> None:
         """Delete one or more items selected from the dataset.
 
@@ -853,7 +911,7 @@ class Dataset(
             selector: A data-file key, positional index, slice, or iterable of keys and/or
                 indices.
         """
-        selected_keys = select_keys(selector, self.data)
+        selected_keys = self._select_keys(selector)
 
         if selected_keys.singular:
             del self.data[selected_keys.keys[0]]
@@ -867,6 +925,8 @@ class Dataset(
                 self.data = prev_data
                 raise
 
+        self._bump_content_version()
+
     @overload
     def __setitem__(self, selector: str | int, data_obj: object) -> None:
         """Describe singular assignment for static type checkers.
@@ -909,7 +969,7 @@ class Dataset(
                 iterable.
             ValidationError: If any assigned item fails dataset validation.
         """
-        selected_keys = select_keys(selector, self.data)
+        selected_keys = self._select_keys(selector)
 
         if selected_keys.singular:
             self._set_data_file_and_validate(selected_keys.keys[0],
@@ -937,6 +997,8 @@ class Dataset(
 
             self._update_selected_items_with_data_items(key_2_data_item, index_2_data_items)
 
+        self._bump_content_version()
+
     def _update_selected_items_with_data_items(
         self,
         key_2_data_item: Key2DataItemType[object],
@@ -1159,13 +1221,12 @@ class Dataset(
         Raises:
             ValidationError: If the stored item does not validate for this dataset type.
         """
-        from omnipy.data.model import is_model_instance
-
         val = self.data[data_file]
-        if is_model_instance(val):
-            self.data[data_file] = self._validate_value_for_data_file(data_file, val)
-        else:
+        if val is None or isinstance(val, (PendingData, FailedData)):
             self._force_full_validation()
+        else:
+            # Only the new item is validated, so that the other items are kept as they are
+            self.data[data_file] = self._validate_value_for_data_file(data_file, val)
 
     @staticmethod
     def _basic_validation_func(type_variant: 'type[Model | Dataset]',
@@ -1229,6 +1290,32 @@ class Dataset(
         """
         self.data = self.data  # Triggers pydantic validation, as validate_assignment=True
 
+    @property
+    def content_version(self) -> int:
+        """Return a process-wide unique version number of the current dataset content.
+
+        As content versions are drawn from a single increasing counter, a mutation of an item
+        made directly on the item is detected by the item having a higher version than the
+        dataset, in which case the dataset version is bumped.
+
+        Returns:
+            Version number usable as a cache key for values derived from the dataset.
+        """
+        version = super().content_version
+        max_item_version = max(
+            (val.content_version for val in self.data.values() if isinstance(val, DataClassBase)),
+            default=0,
+        )
+        if max_item_version > version:
+            self._bump_content_version()
+            version = super().content_version
+        return version
+
+    def _content_unchanged_since_validation(self) -> bool:
+        return all(val._content_unchanged_since_validation()
+                   for val in self.data.values()
+                   if isinstance(val, DataClassBase))
+
     @override
     def __iter__(self) -> Iterator[str]:  # type: ignore[override]
         """Iterate over dataset keys.
@@ -1250,6 +1337,8 @@ class Dataset(
         """
         if attr in self.__dict__ or attr == DATA_KEY or attr.startswith('__'):
             super().__setattr__(attr, value)
+            if attr == DATA_KEY:
+                self._bump_content_version()
         elif attr == 'repr_state':
             prop = getattr(self.__class__, attr)
             prop.__set__(self, value)
@@ -1686,8 +1775,12 @@ class Dataset(
         Returns:
             This dataset instance after loading, or an ``asyncio.Task`` in an active event loop.
         """
-        from omnipy.components.remote.helpers import RateLimitingClientSession
-        from omnipy.components.remote.tasks import get_auto_from_api_endpoint, get_retry_client
+        from omnipy.components.remote.http_cache import HttpCache
+        from omnipy.components.remote.session_pool import retry_client_for_host
+        from omnipy.components.remote.tasks import get_auto_from_api_endpoint
+
+        http_cache = HttpCache.from_config(self.config.http.cache,
+                                           os.path.join(self.config.ui.cache_dir_path, 'http'))
 
         hosts: defaultdict[str, list[int]] = defaultdict(list)
         for i, url in enumerate(http_url_dataset.values()):
@@ -1706,44 +1799,37 @@ class Dataset(
 
             # TODO: Manage ClientConnectionResetError in Dataset._load_http_urls
             for host in hosts:
-                host_config = self.config.http.for_host[host]
-                async with RateLimitingClientSession(
-                        host_config.requests_per_time_period,
-                        host_config.time_period_in_secs) as client_session:
-                    async with get_retry_client(
-                            client_session=client_session,
-                            retry_http_statuses=host_config.retry_http_statuses,
-                            retry_attempts=host_config.retry_attempts,
-                            retry_backoff_strategy=host_config.retry_backoff_strategy
-                    ) as retry_client:
-                        indices = hosts[host]
-                        # fetch_task = get_auto_from_api_endpoint
-                        # if as_mime_type:
-                        #     match as_mime_type:
-                        #         case 'application/json':
-                        #             fetch_task = get_json_from_api_endpoint
-                        #         case 'text/plain':
-                        #             fetch_task = get_str_from_api_endpoint
-                        #         case 'application/octet-stream' | _:
-                        #             fetch_task = get_bytes_from_api_endpoint
-
-                        ret = get_auto_from_api_endpoint.refine(
-                            output_dataset_param='output_dataset').run(
-                                http_url_dataset[indices],
-                                retry_client=retry_client,
-                                output_dataset=self,
-                                as_mime_type=as_mime_type)
-
-                        if not isinstance(ret, asyncio.Task):
-                            assert inspect.iscoroutine(ret)
-                            task = asyncio.create_task(ret)
-                        else:
-                            task = ret
-
-                        tasks.append(task)
-
-                        while not task.done():
-                            await asyncio.sleep(ASYNC_LOAD_SLEEP_TIME)
+                http_config = self.config.http
+                async with retry_client_for_host(host, http_config=http_config) as retry_client:
+                    indices = hosts[host]
+                    # fetch_task = get_auto_from_api_endpoint
+                    # if as_mime_type:
+                    #     match as_mime_type:
+                    #         case 'application/json':
+                    #             fetch_task = get_json_from_api_endpoint
+                    #         case 'text/plain':
+                    #             fetch_task = get_str_from_api_endpoint
+                    #         case 'application/octet-stream' | _:
+                    #             fetch_task = get_bytes_from_api_endpoint
+
+                    ret = get_auto_from_api_endpoint.refine(
+                        output_dataset_param='output_dataset').run(
+                            http_url_dataset[indices],
+                            retry_client=retry_client,
+                            output_dataset=self,
+                            as_mime_type=as_mime_type,
+                            http_cache=http_cache)
+
+                    if not isinstance(ret, asyncio.Task):
+                        assert inspect.iscoroutine(ret)
+                        task = asyncio.create_task(ret)
+                    else:
+                        task = ret
+
+                    tasks.append(task)
+
+                    while not task.done():
+                        await asyncio.sleep(ASYNC_LOAD_SLEEP_TIME)
 
             await asyncio.gather(*tasks)
             return self
@@ -1,13 +1,22 @@
 """Helper types and utilities shared across Omnipy's data layer internals."""
 
 from collections import defaultdict
+from collections.abc import Hashable
 from contextlib import suppress
 from dataclasses import dataclass
 from enum import IntEnum
 import os
 import sys
 from textwrap import dedent
-from typing import Any, ContextManager, ForwardRef, Generic, get_args, get_origin, NamedTuple
+from typing import (Annotated,
+                    Any,
+                    ContextManager,
+                    ForwardRef,
+                    Generic,
+                    get_args,
+                    get_origin,
+                    Literal,
+                    NamedTuple)
 
 from typing_extensions import TypeIs, TypeVar
 
@@ -27,6 +36,8 @@ __all__ = [
     'SPECIAL_METHODS_INFO_DICT',
     'ResetSolutionTuple',
     'cleanup_name_qualname_and_module',
+    'specialization_cache',
+    'specialization_cache_key',
     'build_own_module_and_global_namespace_for_forward_refs',
     'PendingData',
     'FailedData',
@@ -284,6 +295,77 @@ def cleanup_name_qualname_and_module(
     model_or_dataset.__module__ = cls.__module__
 
 
+specialization_cache: dict[Hashable, type] = {}
+
+
+def specialization_cache_key(  # noqa: C901
+        cls: type[DataClassBase],
+        params: object,
+) -> Hashable | None:
+    """Return a canonical key for caching the specialization of a generic data class.
+
+    Specializing a model or dataset class, e.g. ``Model[list[int]]``, is costly, as Omnipy
+    post-processes the class created by pydantic. The key allows ``__class_getitem__`` to return
+    the previously prepared class for repeated specializations. Type arguments are normalized
+    into nested tuples of origins and arguments, so that e.g. ``list[int]`` and ``(list[int],)``
+    share a key, while keys still differ for e.g. ``int | str`` and ``str | int`` or for
+    ``Literal[1]`` and ``Literal[True]``, which are considered equal by ``typing``.
+
+    Args:
+        cls: The generic data class being specialized, which also provides the pydantic config.
+        params: The type arguments passed to ``__class_getitem__``.
+
+    Returns:
+        A hashable key, or ``None`` if the specialization should not be cached. This is the case
+        for type arguments with forward references or type variables, as the specialized class
+        is later updated when these are resolved, as well as for unhashable type arguments.
+    """
+    def _value_key(value: object) -> Hashable:
+        return value if isinstance(value, type) else (type(value), value)
+
+    def _type_key(type_: object) -> Hashable | None:
+        if isinstance(type_, (str, ForwardRef, TypeVar)):
+            return None
+
+        if isinstance(type_, (tuple, list)):
+            arg_keys = tuple(_type_key(arg) for arg in type_)
+            return None if None in arg_keys else (type(type_), arg_keys)
+
+        origin = get_origin(type_)
+        if origin is None:
+            return _value_key(type_)
+
+        # Including the alias type distinguishes e.g. `list[int]` from `typing.List[int]`
+        alias_key = (type(type_), origin)
+        args = get_args(type_)
+        if origin is Literal:
+            return alias_key, tuple(_value_key(arg) for arg in args)
+
+        arg_keys = tuple(_type_key(arg) for arg in (args[:1] if origin is Annotated else args))
+        if None in arg_keys:
+            return None
+
+        if origin is Annotated:
+            arg_keys += tuple(_value_key(metadata) for metadata in args[1:])
+
+        return alias_key, arg_keys
+
+    # Pydantic passes single type arguments as len(1) tuples, see DataClassBase._prepare_params()
+    if isinstance(params, tuple) and len(params) == 1:
+        params = params[0]
+
+    params_key = _type_key(params)
+    if params_key is None:
+        return None
+
+    key = (cls, params_key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 # def orjson_dumps(v, *, default):
 #     # orjson.dumps returns bytes, to match standard json.dumps we need to decode
 #     return orjson.dumps(v, default=default).decode()
@@ -0,0 +1,245 @@
+"""Opt-in performance metrics for the data layer.
+
+Metrics are collected in the process-global ``data_metrics`` object, which is exposed as
+``runtime.objects.metrics`` and enabled through ``runtime.config.data.metrics.enabled``. When
+disabled, instrumented code paths only pay for a single attribute check.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any, Callable, cast, Iterator
+
+from omnipy.config.data import MetricsConfig
+from omnipy.shared.protocols.config import IsMetricsConfig
+
+__all__ = [
+    'SERIALIZE',
+    'DESERIALIZE',
+    'TimingStats',
+    'ThroughputStats',
+    'CacheStats',
+    'ByteCountHolder',
+    'DataMetrics',
+    'data_metrics',
+]
+
+SERIALIZE = 'serialize'
+DESERIALIZE = 'deserialize'
+
+
+@dataclass
+class TimingStats:
+    """Number of calls and their cumulative wall-clock time in seconds."""
+
+    count: int = 0
+    total_secs: float = 0.0
+
+    @property
+    def mean_secs(self) -> float | None:
+        return self.total_secs / self.count if self.count else None
+
+    def add(self, secs: float) -> None:
+        self.count += 1
+        self.total_secs += secs
+
+    def export(self) -> dict[str, Any]:
+        return asdict(self) | {'mean_secs': self.mean_secs}
+
+
+@dataclass
+class ThroughputStats:
+    """Number of calls, bytes processed and cumulative wall-clock time in seconds."""
+
+    count: int = 0
+    total_bytes: int = 0
+    total_secs: float = 0.0
+
+    @property
+    def bytes_per_sec(self) -> float | None:
+        return self.total_bytes / self.total_secs if self.total_secs > 0 else None
+
+    def add(self, num_bytes: int, secs: float) -> None:
+        self.count += 1
+        self.total_bytes += num_bytes
+        self.total_secs += secs
+
+    def export(self) -> dict[str, Any]:
+        return asdict(self) | {'bytes_per_sec': self.bytes_per_sec}
+
+
+@dataclass
+class CacheStats:
+    """Hits and misses of a cache since the last reset of the metrics."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def export(self) -> dict[str, Any]:
+        return asdict(self) | {'hit_ratio': self.hit_ratio}
+
+
+@dataclass
+class ByteCountHolder:
+    """Mutable holder for the number of bytes processed within a measured block."""
+
+    num_bytes: int = 0
+
+
+class DataMetrics:
+    """Collect validation, snapshot, serializer and display cache metrics for the data layer.
+
+    Validation metrics are recorded per model class name and include the time spent validating
+    nested models. Display caches are registered by name with a function returning an object
+    with ``hits`` and ``misses`` attributes, such as the ``cache_info()`` method of
+    ``functools.lru_cache`` and ``cachebox`` caches. Cache statistics are read from the caches
+    when requested, and are thus collected even when metrics are disabled.
+    """
+    def __init__(self) -> None:
+        self._config: IsMetricsConfig = cast(IsMetricsConfig, MetricsConfig())
+        self.enabled: bool = False
+        self.measure_snapshot_bytes: bool = True
+        self._cache_info_funcs: dict[str, Callable[[], Any]] = {}
+        self._cache_baselines: dict[str, tuple[int, int]] = {}
+        self.reset()
+
+    @property
+    def config(self) -> IsMetricsConfig:
+        """Return the metrics configuration."""
+
+        return self._config
+
+    def set_config(self, config: IsMetricsConfig) -> None:
+        """Replace the metrics configuration, enabling or disabling collection accordingly.
+
+        Args:
+            config: New metrics configuration.
+        """
+
+        self._config = config
+        self.enabled = config.enabled
+        self.measure_snapshot_bytes = config.measure_snapshot_bytes
+
+    def reset(self) -> None:
+        """Clear all collected metrics and restart counting of cache hits and misses."""
+
+        self.validation: defaultdict[str, TimingStats] = defaultdict(TimingStats)
+        self.snapshot = ThroughputStats()
+        self.serialization: defaultdict[str, defaultdict[str, ThroughputStats]] = \
+            defaultdict(lambda: defaultdict(ThroughputStats))
+        self._cache_baselines = {
+            name: self._get_cache_hits_and_misses(name) for name in self._cache_info_funcs
+        }
+
+    def register_cache(self, name: str, cache_info_func: Callable[[], Any]) -> None:
+        """Register a cache for hit ratio statistics.
+
+        Args:
+            name: Name of the cache in the exported metrics.
+            cache_info_func: Function returning an object with ``hits`` and ``misses``
+                attributes.
+        """
+
+        self._cache_info_funcs[name] = cache_info_func
+        self._cache_baselines[name] = self._get_cache_hits_and_misses(name)
+
+    def _get_cache_hits_and_misses(self, name: str) -> tuple[int, int]:
+        cache_info = self._cache_info_funcs[name]()
+        return cache_info.hits, cache_info.misses
+
+    @property
+    def caches(self) -> dict[str, CacheStats]:
+        """Return hit and miss counts of the registered caches since the last reset."""
+
+        cache_stats = {}
+        for name in self._cache_info_funcs:
+            hits, misses = self._get_cache_hits_and_misses(name)
+            base_hits, base_misses = self._cache_baselines[name]
+            # Counts decrease if the cache itself has been cleared since the last reset
+            cache_stats[name] = CacheStats(
+                hits=hits - base_hits if hits >= base_hits else hits,
+                misses=misses - base_misses if misses >= base_misses else misses,
+            )
+        return cache_stats
+
+    def record_validation(self, cls_name: str, secs: float) -> None:
+        """Record one validation of a model class."""
+
+        self.validation[cls_name].add(secs)
+
+    def record_snapshot(self, num_bytes: int, secs: float) -> None:
+        """Record one snapshot deepcopy of ``num_bytes`` bytes."""
+
+        self.snapshot.add(num_bytes, secs)
+
+    def record_serialization(self,
+                             serializer_name: str,
+                             direction: str,
+                             num_bytes: int,
+                             secs: float) -> None:
+        """Record one serialization or deserialization of ``num_bytes`` serialized bytes."""
+
+        self.serialization[serializer_name][direction].add(num_bytes, secs)
+
+    @contextmanager
+    def measure_serialization(self, serializer_name: str,
+                              direction: str) -> Iterator[ByteCountHolder]:
+        """Measure the time of the enclosed block as a serialization, if metrics are enabled.
+
+        The number of serialized bytes should be set on the yielded holder within the block.
+
+        Args:
+            serializer_name: Name of the serializer, typically its class name.
+            direction: Either ``SERIALIZE`` or ``DESERIALIZE``.
+        """
+
+        byte_count = ByteCountHolder()
+        if not self.enabled:
+            yield byte_count
+            return
+
+        start = perf_counter()
+        yield byte_count
+        self.record_serialization(serializer_name,
+                                  direction,
+                                  byte_count.num_bytes,
+                                  perf_counter() - start)
+
+    def get_sorted_validation_stats(self) -> dict[str, TimingStats]:
+        """Return validation statistics sorted by cumulative time, from highest to lowest."""
+
+        return dict(
+            sorted(self.validation.items(), key=lambda item: item[1].total_secs, reverse=True))
+
+    def export(self) -> dict[str, Any]:
+        """Export all metrics as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with ``validation``, ``snapshot``, ``serialization`` and ``caches``
+            sections.
+        """
+
+        return {
+            'validation': {
+                cls_name: stats.export()
+                for cls_name, stats in self.get_sorted_validation_stats().items()
+            },
+            'snapshot': self.snapshot.export(),
+            'serialization': {
+                serializer_name: {
+                    direction: stats.export() for direction, stats in directions.items()
+                } for serializer_name, directions in self.serialization.items()
+            },
+            'caches': {
+                name: stats.export() for name, stats in self.caches.items()
+            },
+        }
+
+
+data_metrics = DataMetrics()
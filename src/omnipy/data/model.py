@@ -12,6 +12,7 @@ import functools
 import inspect
 from itertools import chain
 import json
+from time import perf_counter
 from types import GenericAlias, NoneType, UnionType
 from typing import (Annotated,
                     Any,
@@ -39,8 +40,11 @@ from omnipy.data.helpers import (build_own_module_and_global_namespace_for_forwa
                                  MethodInfo,
                                  ResetSolutionTuple,
                                  SPECIAL_METHODS_INFO_DICT,
+                                 specialization_cache,
+                                 specialization_cache_key,
                                  validate_cls_counts,
                                  YesNoMaybe)
+from omnipy.data.metrics import data_metrics
 from omnipy.shared.constants import ROOT_KEY
 from omnipy.shared.exceptions import OmnipyNoneIsNotAllowedError
 from omnipy.shared.protocols.data import IsModel, IsSnapshotWrapper
@@ -367,6 +371,10 @@ class Model(  # type: ignore[misc]
             A concrete :class:`Model` subclass bound to ``params``.
         """
 
+        cache_key = specialization_cache_key(cls, params)
+        if cache_key is not None and cache_key in specialization_cache:
+            return cast(type[Model], specialization_cache[cache_key])
+
         model = cls._prepare_params(params)
 
         orig_model: type[_RootT] | TypeVar = model
@@ -401,6 +409,9 @@ class Model(  # type: ignore[misc]
 
         cls._prepare_cls_members_to_mimic_model(created_model)
 
+        if cache_key is not None:
+            specialization_cache[cache_key] = created_model
+
         return created_model
 
     @classmethod
@@ -828,7 +839,14 @@ class Model(  # type: ignore[misc]
         """
         # Pydantic validation of super_kwargs
         validate_cls_counts[self.__class__.__name__] += 1
-        super().__init__(**super_kwargs)
+        if data_metrics.enabled:
+            start = perf_counter()
+            try:
+                super().__init__(**super_kwargs)
+            finally:
+                data_metrics.record_validation(self.__class__.__name__, perf_counter() - start)
+        else:
+            super().__init__(**super_kwargs)
 
     def _secondary_validation_from_data(self, super_kwargs):
         """Retry validation by reparsing prepared raw data.
@@ -1228,8 +1246,10 @@ class Model(  # type: ignore[misc]
             ValidationError: If ``new_content`` fails validation.
         """
         keep_alive_old_content = self.content  # To ensure old content ids are not reused
+        prev_content_version = self.content_version
 
         inner_reset_solution: ContextManager[None]
+        content_unchanged = False
         if outer_reset_solution:
             inner_reset_solution = nothing()
         else:
@@ -1239,6 +1259,15 @@ class Model(  # type: ignore[misc]
                 return
             inner_reset_solution = reset_solution_tuple.reset_solution
 
+            # In interactive mode, no snapshot is taken above if the content is equal to the
+            # snapshot of the previously validated content, i.e. if the content is unchanged
+            content_unchanged = validating_self and self.config.model.interactive
+
+        if not content_unchanged:
+            # Content may already have been mutated in place, whether or not validation
+            # succeeds. Replaced content bumps the version again in __setattr__().
+            self._bump_content_version()
+
         with (inner_reset_solution):
             validated_content = self._validate_content_from_value(new_content)
 
@@ -1253,6 +1282,11 @@ class Model(  # type: ignore[misc]
         if self.has_snapshot() or not lazy_snapshot_if_possible:
             self._take_snapshot_of_validated_content()
 
+        if content_unchanged:
+            # The validated copy of unchanged content keeps the version, so that values cached
+            # per content version are still valid
+            self._restore_content_version(prev_content_version)
+
         del keep_alive_old_content
 
     def _validate_content_from_value(
@@ -1261,7 +1295,13 @@ class Model(  # type: ignore[misc]
     ) -> _RootT:
         _, value = convert_value_to_raw_data_if_model_or_dataset(value)
 
-        values, _, validation_error = pyd.validate_model(self.__class__, {ROOT_KEY: value})
+        if data_metrics.enabled:
+            start = perf_counter()
+            values, _, validation_error = pyd.validate_model(self.__class__, {ROOT_KEY: value})
+            data_metrics.record_validation(self.__class__.__name__, perf_counter() - start)
+        else:
+            values, _, validation_error = pyd.validate_model(self.__class__, {ROOT_KEY: value})
+
         if validation_error:
             raise validation_error
 
@@ -1338,6 +1378,13 @@ class Model(  # type: ignore[misc]
             or not self.snapshot_taken_of_same_model(self)
         return not needs_validation
 
+    def _content_unchanged_since_validation(self) -> bool:
+        # Nested content may be changed in place without changing the content version. In
+        # interactive mode, such changes are detected by comparing the content with the
+        # snapshot taken when the content was last validated.
+        return self.config.model.interactive and self.has_snapshot() \
+            and self.content_validated_according_to_snapshot()
+
     def _take_snapshot_of_validated_content(self) -> None:
         """Store a validated snapshot when interactive mode is enabled.
         """
@@ -1711,6 +1758,7 @@ class Model(  # type: ignore[misc]
 
                     if is_new_content:
                         content_prop.__set__(self, value)
+                        self._bump_content_version()
 
                         if self.config.model.interactive and self.has_snapshot():
                             self.snapshot_holder.schedule_deepcopy_content_ids_for_deletion(
@@ -10,6 +10,8 @@ from typing import Any, Callable, cast, Generic, IO, Type
 
 from typing_extensions import TypeVar
 
+from omnipy.data.metrics import data_metrics, DESERIALIZE, SERIALIZE
+from omnipy.hub.tracing import tracer
 from omnipy.shared.protocols.data import HasData, IsDataset, IsSerializer, IsTarFileSerializer
 from omnipy.shared.protocols.hub.log import CanLog
 from omnipy.util.contexts import hold_and_reset_prev_attrib_value
@@ -75,26 +77,35 @@ class TarFileSerializer(Serializer[_DatasetT], Generic[_DatasetT]):
     @classmethod
     def create_tarfile_from_dataset(cls,
                                     dataset: _DatasetT,
-                                    data_encode_func: Callable[..., bytes | memoryview]) -> bytes:
+                                    data_encode_func: Callable[..., bytes | memoryview],
+                                    compresslevel: int = 9) -> bytes:
         """Build a gzipped tar archive by serializing each dataset item into one member file.
 
         Args:
             dataset: Dataset whose items should be written into the archive.
             data_encode_func: Function converting each dataset item into raw bytes.
+            compresslevel: Gzip compression level, from 1 (fastest) to 9 (smallest).
 
         Returns:
             The complete gzipped tar archive as bytes.
         """
 
-        bytes_io = BytesIO()
-        with tarfile.open(fileobj=bytes_io, mode='w:gz') as tarfile_stream:
-            for data_file, data in dataset.items():  # type: ignore[attr-defined]
-                json_data_bytestream = BytesIO(data_encode_func(data))
-                json_data_bytestream.seek(0)
-                tarinfo = TarInfo(name=f'{data_file}.{cls.get_output_file_suffix()}')
-                tarinfo.size = len(json_data_bytestream.getbuffer())
-                tarfile_stream.addfile(tarinfo, json_data_bytestream)
-        return bytes_io.getbuffer().tobytes()
+        with tracer.span(cls.__name__, 'serialization', direction=SERIALIZE) as span, \
+                data_metrics.measure_serialization(cls.__name__, SERIALIZE) as byte_count:
+            bytes_io = BytesIO()
+            with tarfile.open(
+                    fileobj=bytes_io, mode='w:gz', compresslevel=compresslevel) as tarfile_stream:
+                for data_file, data in dataset.items():  # type: ignore[attr-defined]
+                    json_data_bytestream = BytesIO(data_encode_func(data))
+                    json_data_bytestream.seek(0)
+                    tarinfo = TarInfo(name=f'{data_file}.{cls.get_output_file_suffix()}')
+                    tarinfo.size = len(json_data_bytestream.getbuffer())
+                    tarfile_stream.addfile(tarinfo, json_data_bytestream)
+            tarfile_bytes = bytes_io.getbuffer().tobytes()
+            byte_count.num_bytes = len(tarfile_bytes)
+            if span is not None:
+                span.set_attribute('num_bytes', len(tarfile_bytes))
+        return tarfile_bytes
 
     @classmethod
     def create_dataset_from_tarfile(cls,
@@ -115,15 +126,21 @@ class TarFileSerializer(Serializer[_DatasetT], Generic[_DatasetT]):
             any_file_suffix: Whether to skip file-suffix validation inside the archive.
         """
 
-        with tarfile.open(fileobj=BytesIO(tarfile_bytes), mode='r:gz') as tarfile_stream:
-            for filename in tarfile_stream.getnames():
-                data_file = tarfile_stream.extractfile(filename)
-                assert data_file is not None
-                if not any_file_suffix:
-                    assert filename.endswith(f'.{cls.get_output_file_suffix()}')
-                data_file_name = os.path.basename('.'.join(filename.split('.')[:-1]))
-                getattr(dataset, import_method)(
-                    dictify_object_func(data_file_name, data_decode_func(data_file)))
+        with tracer.span(cls.__name__,
+                         'serialization',
+                         direction=DESERIALIZE,
+                         num_bytes=len(tarfile_bytes)), \
+                data_metrics.measure_serialization(cls.__name__, DESERIALIZE) as byte_count:
+            byte_count.num_bytes = len(tarfile_bytes)
+            with tarfile.open(fileobj=BytesIO(tarfile_bytes), mode='r:gz') as tarfile_stream:
+                for filename in tarfile_stream.getnames():
+                    data_file = tarfile_stream.extractfile(filename)
+                    assert data_file is not None
+                    if not any_file_suffix:
+                        assert filename.endswith(f'.{cls.get_output_file_suffix()}')
+                    data_file_name = os.path.basename('.'.join(filename.split('.')[:-1]))
+                    getattr(dataset, import_method)(
+                        dictify_object_func(data_file_name, data_decode_func(data_file)))
 
 
 class SerializerRegistry:
@@ -154,10 +171,22 @@ class SerializerRegistry:
         return self._autodetect_serializer(dataset, self.serializers)
 
     def auto_detect_tar_file_serializer(
-            self, dataset: IsDataset) -> tuple[IsDataset, IsSerializer] | tuple[None, None]:
-        """Try only tar-file serializers and return the first compatible pair."""
+        self,
+        dataset: IsDataset,
+        preferred_file_suffix: str | None = None,
+    ) -> tuple[IsDataset, IsSerializer] | tuple[None, None]:
+        """Try only tar-file serializers and return the first compatible pair.
 
-        return self._autodetect_serializer(dataset, self.tar_file_serializers)
+        Serializers with ``preferred_file_suffix`` as output file suffix, if given, are tried
+        before the other serializers.
+        """
+
+        serializers = self.tar_file_serializers
+        if preferred_file_suffix is not None:
+            serializers = tuple(
+                sorted(
+                    serializers, key=lambda s: s.get_output_file_suffix() != preferred_file_suffix))
+        return self._autodetect_serializer(dataset, serializers)
 
     @classmethod
     def _autodetect_serializer(
@@ -250,6 +279,16 @@ class SerializerRegistry:
         return tuple(serializer_cls for serializer_cls in self.tar_file_serializers
                      if serializer_cls.get_output_file_suffix() == file_suffix)
 
+    @staticmethod
+    def _read_tar_file_bytes(tar_file_path: str) -> bytes:
+        with open(tar_file_path, 'rb') as tarfile_binary:
+            return tarfile_binary.read()
+
+    @staticmethod
+    def _get_file_suffixes_in_tar_file(tarfile_bytes: bytes) -> set[str]:
+        with tarfile.open(fileobj=BytesIO(tarfile_bytes), mode='r:gz') as tarfile_obj:
+            return set(fn.split('.')[-1] for fn in tarfile_obj.getnames())
+
     def load_from_tar_file_path_based_on_file_suffix(
         self,
         log_obj: CanLog,
@@ -274,8 +313,8 @@ class SerializerRegistry:
         else:
             log = print
 
-        with tarfile.open(tar_file_path, 'r:gz') as tarfile_obj:
-            file_suffixes = set(fn.split('.')[-1] for fn in tarfile_obj.getnames())
+        tarfile_bytes = self._read_tar_file_bytes(tar_file_path)
+        file_suffixes = self._get_file_suffixes_in_tar_file(tarfile_bytes)
         if len(file_suffixes) != 1:
             log(f'Tar archive contains files with different or '
                 f'no file suffixes: {file_suffixes}. Serializer '
@@ -292,8 +331,7 @@ class SerializerRegistry:
                     f' "{os.path.abspath(tar_file_path)}"')
 
                 serializer = serializers[0]
-                with open(tar_file_path, 'rb') as tarfile_binary:
-                    auto_dataset = serializer.deserialize(tarfile_binary.read())
+                auto_dataset = serializer.deserialize(tarfile_bytes)
 
                 if to_dataset.get_type() is auto_dataset.get_type():
                     cast(HasData, to_dataset).data = cast(HasData, auto_dataset).data
@@ -338,15 +376,24 @@ class SerializerRegistry:
             log(f'No serializer for Dataset with type "{type(to_dataset)}" can be '
                 f'determined.')
         else:
-            for serializer in serializers:
+            tarfile_bytes = self._read_tar_file_bytes(tar_file_path)
+            file_suffixes = self._get_file_suffixes_in_tar_file(tarfile_bytes)
+
+            # Serializers matching the file suffixes of the archive are tried first. Other
+            # serializers are only tried if the previous ones fail.
+            serializers = tuple(
+                sorted(serializers, key=lambda s: s.get_output_file_suffix() not in file_suffixes))
+
+            for i, serializer in enumerate(serializers):
                 log(f'Reading dataset from a gzipped tarpack at'
                     f' "{os.path.abspath(tar_file_path)}" with serializer type: '
                     f'"{serializer.__name__}"')
 
-                with open(tar_file_path, 'rb') as tarfile_binary:
-                    out_dataset = serializer.deserialize(
-                        tarfile_binary.read(),
-                        any_file_suffix=any_file_suffix,
-                    )
-
-                return out_dataset
+                try:
+                    return serializer.deserialize(tarfile_bytes, any_file_suffix=any_file_suffix)
+                except (TypeError, ValueError, ValidationError, AssertionError,
+                        tarfile.TarError) as exc:
+                    if i == len(serializers) - 1:
+                        raise
+                    log(f'Unable to read dataset with serializer type '
+                        f'"{serializer.__name__}": {exc}')
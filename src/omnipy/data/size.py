@@ -0,0 +1,135 @@
+"""Cached accounting of the deep in-memory size of Omnipy data objects.
+
+Computing the deep size of an object requires traversing everything it references, which is
+slow for large models and datasets. The process-global ``deep_size_accountant`` caches the deep
+sizes of models and datasets per content version, so that sizes are only recomputed after a
+validated mutation. Containers with more elements than ``sampling_threshold`` are estimated from
+an evenly spaced sample of their elements instead of being traversed in full.
+"""
+
+from itertools import islice
+import sys
+from typing import Collection, NamedTuple
+
+from omnipy.data._data_class_creator import DataClassBase
+from omnipy.data.metrics import CacheStats, data_metrics
+from omnipy.shared.constants import DATA_KEY, ROOT_KEY
+from omnipy.util.weak import WeakKeyRefContainer
+
+__all__ = [
+    'DeepSize',
+    'DeepSizeAccountant',
+    'deep_size_accountant',
+]
+
+_SAMPLED_CONTAINER_TYPES = (list, tuple, set, frozenset, dict)
+
+
+class DeepSize(NamedTuple):
+    """Deep in-memory size of an object, in bytes.
+
+    Attributes:
+        num_bytes: Deep size of the object, in bytes.
+        estimated: Whether the size was estimated from a sample of the elements.
+    """
+
+    num_bytes: int
+    estimated: bool = False
+
+
+class _CachedDeepSize(NamedTuple):
+    content_version: int
+    deep_size: DeepSize
+
+
+class DeepSizeAccountant:
+    """Compute deep sizes of objects, caching them per content version for models and datasets.
+
+    Cached sizes are stored weakly per object and are invalidated when the content version of
+    the object changes, i.e. after validated mutations. In-place changes of the content that
+    bypass validation are not detected.
+
+    Attributes:
+        sampling_threshold: Minimum number of elements of a container for its deep size to be
+            estimated by sampling.
+        num_samples: Number of evenly spaced elements sampled for the estimate.
+    """
+    def __init__(self, sampling_threshold: int = 10_000, num_samples: int = 1_000) -> None:
+        self.sampling_threshold = sampling_threshold
+        self.num_samples = num_samples
+        self._cache = WeakKeyRefContainer[object, _CachedDeepSize]()
+        self._hits = 0
+        self._misses = 0
+
+    def get_deep_size(self, obj: object) -> DeepSize:
+        """Return the deep size of an object, from the cache if its content is unchanged.
+
+        Args:
+            obj: Object to measure. Only models and datasets are cached.
+
+        Returns:
+            DeepSize: Deep size of the object, possibly estimated by sampling.
+        """
+        if not isinstance(obj, DataClassBase):
+            return self._compute_deep_size(obj)
+
+        content_version = obj.content_version
+        cached = self._cache.get(obj)
+        if cached is not None and cached.content_version == content_version:
+            self._hits += 1
+            return cached.deep_size
+
+        self._misses += 1
+        deep_size = self._compute_deep_size(obj)
+        self._cache[obj] = _CachedDeepSize(content_version, deep_size)
+        return deep_size
+
+    def clear(self) -> None:
+        """Discard all cached deep sizes."""
+
+        self._cache.clear()
+
+    def cache_info(self) -> CacheStats:
+        """Return the total number of cache hits and misses.
+
+        Returns:
+            CacheStats: Cache hits and misses since the accountant was created.
+        """
+
+        return CacheStats(hits=self._hits, misses=self._misses)
+
+    def _compute_deep_size(self, obj: object) -> DeepSize:
+        import objsize
+
+        container = self._get_container(obj)
+        if isinstance(container, _SAMPLED_CONTAINER_TYPES) \
+                and len(container) > self.sampling_threshold:
+            return self._estimate_deep_size(obj, container)
+
+        return DeepSize(objsize.get_deep_size(obj))
+
+    @staticmethod
+    def _get_container(obj: object) -> object:
+        if isinstance(obj, DataClassBase):
+            return obj.__dict__.get(ROOT_KEY, obj.__dict__.get(DATA_KEY))
+        return obj
+
+    def _estimate_deep_size(self, obj: object, container: Collection) -> DeepSize:
+        import objsize
+
+        step = max(len(container) // self.num_samples, 1)
+        sample: list | dict
+        if isinstance(container, dict):
+            sample = dict(islice(container.items(), 0, None, step))
+        else:
+            sample = list(islice(container, 0, None, step))
+
+        # Measured through a container to follow the same referents as for the full container
+        sample_size = objsize.get_deep_size(sample) - sys.getsizeof(sample)
+        outer_size = objsize.get_deep_size(obj, exclude=[container]) + sys.getsizeof(container)
+        return DeepSize(
+            outer_size + round(sample_size * len(container) / len(sample)), estimated=True)
+
+
+deep_size_accountant = DeepSizeAccountant()
+data_metrics.register_cache('deep_size', deep_size_accountant.cache_info)
@@ -3,8 +3,11 @@
 from copy import copy, deepcopy
 from dataclasses import dataclass
 import gc
+from itertools import count
+from time import perf_counter
 from typing import Generic
 
+from omnipy.data.metrics import data_metrics
 from omnipy.shared.protocols.data import ContentT, HasContentT, IsSnapshotWrapper, ObjContraT
 from omnipy.util.contexts import setup_and_teardown_callback_context
 from omnipy.util.helpers import all_equals
@@ -37,6 +40,33 @@ class SnapshotWrapper(Generic[ObjContraT, ContentT]):
         return not all_equals(self.snapshot, obj)
 
 
+class ContentVersions(WeakKeyRefContainer[HasContentT, int], Generic[HasContentT]):
+    """Track a version number for the content of Omnipy models and datasets.
+
+    Versions are drawn from a single process-wide counter, so a version number identifies one
+    state of one object even if the ``id()`` of a deleted object is later reused. Versions are
+    bumped on every validated mutation, allowing derived values such as deep sizes or rendered
+    output to be cached per content version.
+    """
+
+    _counter = count(1)
+
+    def get_version(self, obj: HasContentT) -> int:
+        """Return the current content version of ``obj``, assigning one if needed."""
+
+        version = self.get(obj)
+        if version is None:
+            version = self.bump(obj)
+        return version
+
+    def bump(self, obj: HasContentT) -> int:
+        """Assign a new content version to ``obj`` and return it."""
+
+        version = next(self._counter)
+        self[obj] = version
+        return version
+
+
 obj_getattr = object.__getattribute__
 obj_setattr = object.__setattr__
 
@@ -151,6 +181,8 @@ class SnapshotHolder(WeakKeyRefContainer[HasContentT, IsSnapshotWrapper[HasConte
             obj: Object whose ``content`` attribute should be snapshotted.
         """
 
+        start = perf_counter() if data_metrics.enabled else 0.0
+
         try:
             # Delete scheduled content in the deepcopy memo if the new object is reusing an old id.
             # This deletion might not succeed, e.g. if the current snapshot holds a reference to the
@@ -182,9 +214,36 @@ class SnapshotHolder(WeakKeyRefContainer[HasContentT, IsSnapshotWrapper[HasConte
                       f'Attempting simple copy.')
                 obj_copy = copy(obj.content)
 
+        if data_metrics.enabled:
+            self._record_snapshot_metrics(obj_copy, perf_counter() - start)
+
         # Eventual old snapshot object is being kept alive until this point, but is scheduled for
         # deletion after the next line. In many cases (but not all), this happens before
         # take_snapshot_teardown() is called, which triggers deletion of any unreferenced
         # fragments still kept alive in the memo dict.
 
         super().__setitem__(obj, SnapshotWrapper(id(obj), obj_copy))
+
+    @staticmethod
+    def _record_snapshot_metrics(obj_copy: object, secs: float) -> None:
+        num_bytes = 0
+        if data_metrics.measure_snapshot_bytes:
+            import objsize
+            num_bytes = objsize.get_deep_size(obj_copy)
+        data_metrics.record_snapshot(num_bytes, secs)
+
+    def store_snapshot(self,
+                       obj: HasContentT,
+                       snapshot_wrapper: IsSnapshotWrapper[HasContentT, ContentT]) -> None:
+        """Store a snapshot of ``obj`` that was captured outside the holder.
+
+        Allows content types with cheaper copy and comparison semantics than ``deepcopy`` and
+        ``==``, e.g. pandas DataFrames, to bypass the memo-aware deepcopy machinery.
+
+        Args:
+            obj: Object the snapshot was taken from.
+            snapshot_wrapper: Snapshot record to register for ``obj``.
+        """
+
+        assert snapshot_wrapper.taken_of_same_obj(obj)
+        super().__setitem__(obj, snapshot_wrapper)
@@ -3,6 +3,7 @@ from typing import Any, Callable, ClassVar, Literal, NamedTuple
 
 from omnipy.engine._base import Engine
 from omnipy.engine.run_spec import DagFlowRunSpec, FuncFlowRunSpec, LinearFlowRunSpec, TaskRunSpec
+from omnipy.hub.tracing import tracer
 from omnipy.shared.enums.job import JobType, RunState
 from omnipy.shared.protocols.compute.job import IsFuncArgJob
 from omnipy.shared.protocols.engine.run_spec import (IsFlowRunSpec,
@@ -140,7 +141,14 @@ class JobRunnerEngine(Engine, ABC):
 
             def _job_runner_call_func(*args: object, **kwargs: object) -> Any:
                 self._register_job_state(job, RunState.RUNNING)
-                job_result = run_job(state, job_run_spec, *args, **kwargs)
+                traced_run_job = tracer.wrap_call(
+                    run_job,
+                    job.unique_name,
+                    'job',
+                    job_name=job.name,
+                    engine=self.__class__.__name__,
+                )
+                job_result = traced_run_job(state, job_run_spec, *args, **kwargs)
                 return self._decorate_result_with_job_finalization_detector(job, job_result)
 
             return _job_runner_call_func
@@ -5,28 +5,120 @@ the timestamp for each observed transition. Registration follows a strict patter
 new jobs must first enter the `INITIALIZED` state, existing jobs may only advance one
 state at a time, and unique-name collisions are resolved by asking the incoming job to
 regenerate its unique name before registering it as a distinct job.
+
+Per-state job indexes are insertion-ordered dicts used as ordered sets, so that each
+transition is O(1). Finished jobs are evicted according to the retention policy of the
+registry config, while aggregated statistics per job name (see `JobStats`) are kept for the
+lifetime of the registry.
 """
 
+from bisect import bisect_left
 from collections import defaultdict
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from logging import INFO
 from typing import DefaultDict
 
+from omnipy.config.registry import RunStateRegistryConfig
 from omnipy.hub.log.mixin import LogMixin
 from omnipy.shared.enums.job import RunState, RunStateLogMessages
 from omnipy.shared.protocols.compute.job import IsUniquelyNamedJob
+from omnipy.shared.protocols.config import IsRunStateRegistryConfig
+
+RUN_SECS_HISTOGRAM_BOUNDS: tuple[float, ...] = (0.001, 0.01, 0.1, 1.0, 10.0, 60.0, 600.0, 3600.0)
+
+
+def _zero_state_counts() -> dict[RunState.Literals, int]:
+    return dict.fromkeys(RunState, 0)
+
+
+def _zero_run_secs_histogram() -> list[int]:
+    return [0] * (len(RUN_SECS_HISTOGRAM_BOUNDS) + 1)
+
+
+@dataclass
+class JobStats:
+    """Aggregated run statistics for all jobs sharing a job name.
+
+    Attributes:
+        state_counts: Number of transitions into each run state.
+        num_evicted: Number of finished jobs evicted from the registry.
+        total_run_secs: Sum of the run durations of all finished jobs.
+        min_run_secs: Shortest run duration, or `None` if no jobs have finished.
+        max_run_secs: Longest run duration, or `None` if no jobs have finished.
+        run_secs_histogram: Number of finished jobs per run-duration bucket. The upper bounds of
+            the buckets are given by `RUN_SECS_HISTOGRAM_BOUNDS`, with an extra last bucket for
+            longer runs.
+    """
+
+    state_counts: dict[RunState.Literals, int] = field(default_factory=_zero_state_counts)
+    num_evicted: int = 0
+    total_run_secs: float = 0.0
+    min_run_secs: float | None = None
+    max_run_secs: float | None = None
+    run_secs_histogram: list[int] = field(default_factory=_zero_run_secs_histogram)
+
+    @property
+    def num_finished(self) -> int:
+        return self.state_counts[RunState.FINISHED]
+
+    @property
+    def num_unfinished(self) -> int:
+        return self.state_counts[RunState.RUNNING] - self.state_counts[RunState.FINISHED]
+
+    @property
+    def mean_run_secs(self) -> float | None:
+        return self.total_run_secs / self.num_finished if self.num_finished else None
+
+    def add_run_secs(self, run_secs: float) -> None:
+        self.total_run_secs += run_secs
+        if self.min_run_secs is None or run_secs < self.min_run_secs:
+            self.min_run_secs = run_secs
+        if self.max_run_secs is None or run_secs > self.max_run_secs:
+            self.max_run_secs = run_secs
+        self.run_secs_histogram[bisect_left(RUN_SECS_HISTOGRAM_BOUNDS, run_secs)] += 1
 
 
 class RunStateRegistry(LogMixin):
     """Track uniquely named jobs and their state-transition history."""
     def __init__(self) -> None:
 
+        self._config: IsRunStateRegistryConfig = RunStateRegistryConfig()
         self._jobs: dict[str, IsUniquelyNamedJob] = {}
         self._job_states: dict[str, RunState.Literals] = {}
-        self._state_jobs: DefaultDict[RunState.Literals, list[str]] = defaultdict(list)
+        self._state_jobs: DefaultDict[RunState.Literals, dict[str, None]] = defaultdict(dict)
         self._job_state_datetime: dict[tuple[str, RunState.Literals], datetime] = {}
+        self._job_stats: dict[str, JobStats] = {}
 
         super().__init__()
 
+    def set_config(self, config: IsRunStateRegistryConfig) -> None:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_SET_CONFIG_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_SET_CONFIG_DETAILS}}
+        """Replace the registry configuration and apply its retention policy.
+
+        Args:
+            config: New registry configuration to apply.
+        """
+        self._config = config
+        self._evict_finished_jobs(datetime.now())
+
+    @property
+    def config(self) -> IsRunStateRegistryConfig:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_CONFIG_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_CONFIG_DETAILS}}
+        """Return the active registry configuration.
+
+        Returns:
+            IsRunStateRegistryConfig: Configuration controlling retention and logging.
+        """
+        return self._config
+
     def get_job_state(self, job: IsUniquelyNamedJob) -> RunState.Literals:
         # %% Original docstring (managed by expand_docstr_macros.py) %%
         # {{ISRUNSTATEREGISTRY_GET_JOB_STATE_SUMMARY}}
@@ -96,7 +188,41 @@ class RunStateRegistry(LogMixin):
             self._register_new_job(job, state)
 
         self._update_job_stats(job, state, cur_datetime)
-        self._log_state_change(job, state)
+        self._log_state_change(job, state, cur_datetime)
+
+        if state == RunState.FINISHED:
+            self._evict_finished_jobs(cur_datetime)
+
+    def get_job_stats(self, name: str) -> JobStats:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_GET_JOB_STATS_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_GET_JOB_STATS_DETAILS}}
+        """Return aggregated statistics for all jobs registered with the given job name.
+
+        Statistics are kept per job name, not per unique name, and are retained when jobs are
+        evicted from the registry.
+
+        Args:
+            name: Job name to look up.
+
+        Returns:
+            IsJobStats: Aggregated statistics for the job name.
+        """
+        return self._job_stats[name]
+
+    def all_job_stats(self) -> dict[str, JobStats]:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_ALL_JOB_STATS_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_ALL_JOB_STATS_DETAILS}}
+        """Return aggregated statistics for all job names seen by the registry.
+
+        Returns:
+            dict[str, IsJobStats]: Aggregated statistics by job name, in order of first
+                registration.
+        """
+        return self._job_stats.copy()
 
     def _other_job_registered_with_same_unique_name(self, job: IsUniquelyNamedJob) -> bool:
         other_job_same_unique_name = self._jobs.get(job.unique_name)
@@ -111,7 +237,7 @@ class RunStateRegistry(LogMixin):
         else:
             prev_state = self._job_states[job.unique_name]
             if state == prev_state + 1:
-                self._state_jobs[prev_state].remove(job.unique_name)
+                del self._state_jobs[prev_state][job.unique_name]
             else:
                 self._raise_job_error(
                     job,
@@ -134,14 +260,67 @@ class RunStateRegistry(LogMixin):
         cur_datetime: datetime,
     ) -> None:
         self._job_states[job.unique_name] = state
-        self._state_jobs[state].append(job.unique_name)
+        self._state_jobs[state][job.unique_name] = None
         self._job_state_datetime[(job.unique_name, state)] = cur_datetime
 
-    def _log_state_change(self, job: IsUniquelyNamedJob, state: RunState.Literals) -> None:
+        job_stats = self._job_stats.get(job.name)
+        if job_stats is None:
+            job_stats = self._job_stats[job.name] = JobStats()
+        job_stats.state_counts[state] += 1
+
+        if state == RunState.FINISHED:
+            run_time = cur_datetime - self._job_state_datetime[(job.unique_name, RunState.RUNNING)]
+            job_stats.add_run_secs(run_time.total_seconds())
+
+    def _evict_finished_jobs(self, cur_datetime: datetime) -> None:
+        num_to_evict = self._num_finished_jobs_to_evict(cur_datetime)
+        if num_to_evict > 0:
+            finished_jobs = self._state_jobs[RunState.FINISHED]
+            for unique_name in list(islice(finished_jobs, num_to_evict)):
+                self._evict_job(unique_name)
+
+    def _num_finished_jobs_to_evict(self, cur_datetime: datetime) -> int:
+        # Finished jobs are indexed in order of finishing, so the oldest are evicted first
+        finished_jobs = self._state_jobs[RunState.FINISHED]
+        if self._config.keep_failed_only:
+            return len(finished_jobs)
+
+        num_to_evict = 0
+        if self._config.max_jobs is not None:
+            num_to_evict = len(self._jobs) - self._config.max_jobs
+
+        if self._config.max_age_secs is not None:
+            min_finish_datetime = cur_datetime - timedelta(seconds=self._config.max_age_secs)
+            num_too_old = 0
+            for unique_name in finished_jobs:
+                finish_datetime = self._job_state_datetime[(unique_name, RunState.FINISHED)]
+                if finish_datetime >= min_finish_datetime:
+                    break
+                num_too_old += 1
+            num_to_evict = max(num_to_evict, num_too_old)
+
+        return min(num_to_evict, len(finished_jobs))
+
+    def _evict_job(self, unique_name: str) -> None:
+        job = self._jobs.pop(unique_name)
+        state = self._job_states.pop(unique_name)
+        del self._state_jobs[state][unique_name]
+        for prev_state in RunState:
+            self._job_state_datetime.pop((unique_name, prev_state), None)
+        self._job_stats[job.name].num_evicted += 1
+
+    def _log_state_change(
+        self,
+        job: IsUniquelyNamedJob,
+        state: RunState.Literals,
+        cur_datetime: datetime,
+    ) -> None:
+        if not self._config.log_state_changes or not self._logger.isEnabledFor(INFO):
+            return
+
         log_template = getattr(RunStateLogMessages, RunState.name_for_value(state))
         log_msg = log_template.format(job.unique_name)
-        datetime_obj = self.get_job_state_datetime(job, state)
-        self.log(log_msg, datetime_obj=datetime_obj)
+        self.log(log_msg, datetime_obj=cur_datetime)
 
     def _raise_job_error(self, job: IsUniquelyNamedJob, msg: str) -> None:
         raise ValueError(f'Error in job "{job.unique_name}": {msg}')
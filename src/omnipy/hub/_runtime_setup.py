@@ -0,0 +1,18 @@
+"""Lazy set-up of the global Omnipy runtime."""
+
+_runtime_set_up = False
+
+
+def ensure_runtime_is_set_up() -> None:
+    """Create the Omnipy runtime, if not already done, by importing ``omnipy.hub.runtime``.
+
+    The runtime configures the shared job and data class creators, sets up root logging and
+    detects the user interface. As the top-level ``omnipy`` package imports lazily, the runtime
+    is instead created when the job machinery, data classes or public API are first used.
+    """
+    global _runtime_set_up
+
+    if not _runtime_set_up:
+        # Set before importing, as the import itself makes use of the job and data machinery
+        _runtime_set_up = True
+        import omnipy.hub.runtime  # noqa: F401
@@ -19,12 +19,16 @@ from omnipy.config import ConfigBase
 from omnipy.config.data import DataConfig
 from omnipy.config.engine import EngineConfig
 from omnipy.config.job import JobConfig
+from omnipy.config.registry import RunStateRegistryConfig
 from omnipy.config.root_log import RootLogConfig
+from omnipy.config.tracing import TracingConfig
 from omnipy.data._data_class_creator import DataClassBase
+from omnipy.data.metrics import data_metrics
 from omnipy.data.serializer import SerializerRegistry
 from omnipy.engine.local import LocalRunner
 from omnipy.hub._registry import RunStateRegistry
 from omnipy.hub.log._root_log import RootLogObjects
+from omnipy.hub.tracing import tracer
 from omnipy.hub.ui import detect_and_setup_user_interface
 from omnipy.shared.enums.job import EngineChoice
 from omnipy.shared.enums.ui import UserInterfaceType
@@ -33,14 +37,21 @@ from omnipy.shared.protocols.config import (IsDataConfig,
                                             IsEngineConfig,
                                             IsJobConfig,
                                             IsJobRunnerConfig,
-                                            IsRootLogConfig)
-from omnipy.shared.protocols.data import IsDataClassCreator, IsReactiveObjects, IsSerializerRegistry
+                                            IsRootLogConfig,
+                                            IsRunStateRegistryConfig,
+                                            IsTracingConfig)
+from omnipy.shared.protocols.data import (IsDataClassCreator,
+                                          IsDataMetrics,
+                                          IsHttpSessionPool,
+                                          IsReactiveObjects,
+                                          IsSerializerRegistry)
 from omnipy.shared.protocols.engine.base import IsEngine
 from omnipy.shared.protocols.hub.registry import IsRunStateRegistry
 from omnipy.shared.protocols.hub.runtime import (IsRootLogObjects,
                                                  IsRuntime,
                                                  IsRuntimeConfig,
                                                  IsRuntimeObjects)
+from omnipy.shared.protocols.hub.tracing import IsTracer
 from omnipy.shared.typing import TYPE_CHECKING
 from omnipy.util.helpers import called_from_omnipy_tests
 from omnipy.util.publisher import DataPublisher, RuntimeEntryPublisher
@@ -78,6 +89,38 @@ def _data_class_creator_factory() -> IsDataClassCreator:
     return DataClassBase.data_class_creator
 
 
+def _data_metrics_factory() -> IsDataMetrics:
+    """Return the process-global data-layer metrics collector used by runtimes.
+
+    Returns:
+        IsDataMetrics: Shared metrics collector for the data layer.
+    """
+
+    return data_metrics
+
+
+def _http_session_pool_factory() -> IsHttpSessionPool:
+    """Return the process-global pool of HTTP client sessions used by runtimes.
+
+    Returns:
+        IsHttpSessionPool: Shared pool of HTTP client sessions for remote tasks and dataset
+            loading.
+    """
+    from omnipy.components.remote.session_pool import http_session_pool
+
+    return http_session_pool
+
+
+def _tracer_factory() -> IsTracer:
+    """Return the process-global tracer used by runtimes.
+
+    Returns:
+        IsTracer: Shared tracer for jobs, serialization and HTTP requests.
+    """
+
+    return tracer
+
+
 def _data_config_factory() -> IsDataConfig:
     """Return the active data configuration from the shared data creator.
 
@@ -95,6 +138,8 @@ class RuntimeConfig(RuntimeEntryPublisher, ConfigBase):
         data: Data-related runtime settings.
         engine: Engine selection and per-engine configuration.
         job: Job creation and execution settings.
+        registry: Retention and logging settings for the run-state registry.
+        tracing: Span-based tracing and trace file export settings.
         root_log: Root logger integration settings.
 
     """
@@ -102,6 +147,8 @@ class RuntimeConfig(RuntimeEntryPublisher, ConfigBase):
     data: IsDataConfig = pyd.Field(default_factory=_data_config_factory)
     engine: IsEngineConfig = pyd.Field(default_factory=EngineConfig)
     job: IsJobConfig = pyd.Field(default_factory=_job_config_factory)
+    registry: IsRunStateRegistryConfig = pyd.Field(default_factory=RunStateRegistryConfig)
+    tracing: IsTracingConfig = pyd.Field(default_factory=TracingConfig)
     root_log: IsRootLogConfig = pyd.Field(default_factory=RootLogConfig)
 
     def reset_to_defaults(self) -> None:
@@ -111,8 +158,8 @@ class RuntimeConfig(RuntimeEntryPublisher, ConfigBase):
         # {{ISRUNTIMECONFIG_RESET_TO_DEFAULTS_DETAILS}}
         """Reset all runtime configuration sections to their default values.
 
-        Rebuilds the data, engine, job, and root-log config sections and then refreshes runtime
-        subscriptions when the config is attached to a runtime object.
+        Rebuilds the data, engine, job, registry, tracing, and root-log config sections and then
+        refreshes runtime subscriptions when the config is attached to a runtime object.
         """
 
         prev_back = self._back
@@ -121,6 +168,8 @@ class RuntimeConfig(RuntimeEntryPublisher, ConfigBase):
         self.data = cast(IsDataConfig, DataConfig())
         self.engine = cast(IsEngineConfig, EngineConfig())
         self.job = cast(IsJobConfig, JobConfig())
+        self.registry = cast(IsRunStateRegistryConfig, RunStateRegistryConfig())
+        self.tracing = cast(IsTracingConfig, TracingConfig())
         self.root_log = cast(IsRootLogConfig, RootLogConfig())
 
         self._back = prev_back
@@ -140,6 +189,10 @@ class RuntimeObjects(RuntimeEntryPublisher, DataPublisher):
         prefect: Prefect execution engine.
         registry: Runtime run-state registry.
         serializers: Dataset serializer registry.
+        metrics: Data-layer performance metrics collector.
+        http_session_pool: Pool of HTTP client sessions shared by remote tasks and dataset
+            loading.
+        tracer: Span recorder for jobs, serialization and HTTP requests.
         root_log: Root logging integration objects.
 
     """
@@ -151,6 +204,9 @@ class RuntimeObjects(RuntimeEntryPublisher, DataPublisher):
     prefect: IsEngine = pyd.Field(default_factory=PrefectEngine)
     registry: IsRunStateRegistry = pyd.Field(default_factory=RunStateRegistry)
     serializers: IsSerializerRegistry = pyd.Field(default_factory=SerializerRegistry)
+    metrics: IsDataMetrics = pyd.Field(default_factory=_data_metrics_factory)
+    http_session_pool: IsHttpSessionPool = pyd.Field(default_factory=_http_session_pool_factory)
+    tracer: IsTracer = pyd.Field(default_factory=_tracer_factory)
     root_log: IsRootLogObjects = pyd.Field(default_factory=RootLogObjects)
 
     def setup_reactive(self, ui_type: UserInterfaceType.Literals) -> None:
@@ -235,12 +291,18 @@ class Runtime(DataPublisher):
 
         self.config.subscribe_attr('data', self.objects.data_class_creator.set_config)
         self.config.subscribe_attr('job', self.objects.job_creator.set_config)
+        self.config.subscribe_attr('registry', self.objects.registry.set_config)
+        self.config.subscribe_attr('tracing', self.objects.tracer.set_config)
         self.config.subscribe_attr('root_log', self.objects.root_log.set_config)
 
+        self.config.data.subscribe_attr('metrics', self.objects.metrics.set_config)
+        self.config.data.subscribe_attr('http', self.objects.http_session_pool.set_config)
         self.config.data.ui.subscribe_attr('detected_type', self.objects.setup_reactive)
 
         if UserInterfaceType.is_jupyter_in_browser(self.config.data.ui.detected_type):
             assert self.objects.reactive is not None
+            self.config.data.ui.subscribe_attr('jupyter',
+                                               self.objects.reactive.set_update_delay_from_config)
             self.config.data.ui.subscribe_attr('jupyter',
                                                self.objects.reactive.jupyter_ui_config.set)
             self.config.data.ui.subscribe_attr('text', self.objects.reactive.text_config.set)
@@ -0,0 +1,529 @@
+"""Span-based tracing of jobs, iterated data items, serialization and HTTP requests.
+
+Spans are recorded in the process-global ``tracer`` object, which is exposed as
+``runtime.objects.tracer`` and enabled through ``runtime.config.tracing.enabled``. The current
+span is tracked in a context variable, so that spans started within asyncio tasks are linked to
+the span that was current when the task was created. Recorded spans can be exported to a Chrome
+trace-event file, which can be opened in Perfetto, or to an OpenTelemetry OTLP/JSON file.
+
+In Chrome trace files, each thread and each asyncio task is shown as a separate track, making
+concurrently running coroutines visible as overlapping spans on parallel tracks.
+"""
+
+import asyncio
+import atexit
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import functools
+import inspect
+from itertools import count
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from types import AsyncGeneratorType, GeneratorType
+from typing import (Any,
+                    AsyncGenerator,
+                    Awaitable,
+                    Callable,
+                    cast,
+                    Coroutine,
+                    Generator,
+                    Iterator,
+                    TypeVar)
+
+from omnipy.config.tracing import TracingConfig
+from omnipy.shared.enums.job import TraceFileFormat
+from omnipy.shared.protocols.config import IsTracingConfig
+from omnipy.shared.protocols.hub.tracing import IsSpan
+
+__all__ = [
+    'Span',
+    'Tracer',
+    'tracer',
+]
+
+_CallableT = TypeVar('_CallableT', bound=Callable)
+_AwaitableT = TypeVar('_AwaitableT', bound=Awaitable)
+
+_current_span: ContextVar['Span | None'] = ContextVar('omnipy_current_span', default=None)
+
+_OTLP_SPAN_KIND_INTERNAL = 1
+_OTLP_SPAN_KIND_CLIENT = 3
+_OTLP_STATUS_CODE_ERROR = 2
+
+
+def _current_track() -> tuple[int, str]:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+
+    if task is not None:
+        return id(task), task.get_name()
+
+    thread = threading.current_thread()
+    return cast(int, thread.ident), thread.name
+
+
+@dataclass
+class Span:
+    """A timed operation with a parent link and attributes.
+
+    Times are measured with a monotonic clock and converted to nanoseconds since the epoch.
+    """
+
+    name: str
+    category: str
+    span_id: int
+    parent_id: int | None
+    trace_id: str
+    start_ns: int
+    track_id: int
+    track_name: str
+    end_ns: int | None = None
+    attributes: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def duration_secs(self) -> float | None:
+        return (self.end_ns - self.start_ns) / 1e9 if self.end_ns is not None else None
+
+    @property
+    def failed(self) -> bool:
+        return 'error' in self.attributes
+
+    def set_attribute(self, key: str, value: object) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.attributes['error'] = f'{type(exc).__name__}: {exc}'
+
+
+class Tracer:
+    """Record spans for jobs, iterated data items, serialization and HTTP requests.
+
+    Spans are only recorded when they end. Spans that have not ended, e.g. for generator jobs
+    that are neither fully consumed nor closed, are thus not exported. At most
+    ``config.max_spans`` ended spans are kept, after which the oldest spans are dropped. When
+    tracing is disabled, all methods return immediately, and ``wrap_call()`` and
+    ``wrap_awaitable()`` return their arguments unchanged.
+    """
+    def __init__(self) -> None:
+        self._config: IsTracingConfig = cast(IsTracingConfig, TracingConfig())
+        self.enabled: bool = False
+        self._spans: deque[Span] = deque(maxlen=self._config.max_spans)
+        self._num_dropped_spans = 0
+        self._span_ids = count(1)
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._exit_handler_registered = False
+
+    @property
+    def config(self) -> IsTracingConfig:
+        """Return the tracing configuration."""
+
+        return self._config
+
+    def set_config(self, config: IsTracingConfig) -> None:
+        """Replace the tracing configuration, enabling or disabling tracing accordingly.
+
+        Args:
+            config: New tracing configuration.
+        """
+
+        self._config = config
+        self.enabled = config.enabled
+
+        if config.max_spans != self._spans.maxlen:
+            prev_spans = self._spans
+            self._spans = deque(prev_spans, maxlen=config.max_spans)
+            self._num_dropped_spans += len(prev_spans) - len(self._spans)
+
+        if self.enabled and config.export_at_exit and not self._exit_handler_registered:
+            atexit.register(self._export_at_exit)
+            self._exit_handler_registered = True
+
+    def _export_at_exit(self) -> None:
+        if self._config.enabled and self._config.export_at_exit and self._spans:
+            self.export()
+
+    @property
+    def spans(self) -> tuple[Span, ...]:
+        """Return all ended spans, in the order they ended."""
+
+        return tuple(self._spans)
+
+    @property
+    def num_dropped_spans(self) -> int:
+        """Return the number of ended spans dropped due to ``config.max_spans``."""
+
+        return self._num_dropped_spans
+
+    def reset(self) -> None:
+        """Discard all recorded spans."""
+
+        self._spans.clear()
+        self._num_dropped_spans = 0
+
+    def _now_ns(self) -> int:
+        return self._epoch_offset_ns + time.perf_counter_ns()
+
+    def start_span(self, name: str, category: str, **attributes: object) -> Span | None:
+        """Start a span as a child of the current span, without making it current.
+
+        Use this for spans that do not enclose other spans, or that cannot be expressed as a
+        ``with`` block.
+
+        Args:
+            name: Name of the span.
+            category: Category of the span, e.g. ``'job'`` or ``'http'``.
+            **attributes: Initial attributes of the span.
+
+        Returns:
+            The started span, or ``None`` if tracing is disabled.
+        """
+
+        if not self.enabled:
+            return None
+
+        parent = _current_span.get()
+        track_id, track_name = _current_track()
+        return Span(
+            name=name,
+            category=category,
+            span_id=next(self._span_ids),
+            parent_id=parent.span_id if parent is not None else None,
+            trace_id=parent.trace_id if parent is not None else os.urandom(16).hex(),
+            start_ns=self._now_ns(),
+            track_id=track_id,
+            track_name=track_name,
+            attributes=attributes,
+        )
+
+    def end_span(self, span: IsSpan | None) -> None:
+        """End a span started with ``start_span()`` and record it.
+
+        Args:
+            span: Span to end. ``None`` is ignored.
+        """
+
+        if span is not None and span.end_ns is None:
+            span.end_ns = self._now_ns()
+            if len(self._spans) == self._spans.maxlen:
+                self._num_dropped_spans += 1
+            self._spans.append(cast(Span, span))
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes: object) -> Iterator[Span | None]:
+        """Record the enclosed block as a span, which is the current span within the block.
+
+        Exceptions raised within the block are recorded in the ``error`` attribute of the span.
+
+        Args:
+            name: Name of the span.
+            category: Category of the span, e.g. ``'job'`` or ``'http'``.
+            **attributes: Initial attributes of the span.
+        """
+
+        span = self.start_span(name, category, **attributes)
+        if span is None:
+            yield None
+            return
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def wrap_call(self, func: _CallableT, name: str, category: str,
+                  **attributes: object) -> _CallableT:
+        """Wrap a callable so that each call, including consumption of its result, is a span.
+
+        The span is current while the callable runs. If the callable returns a generator or async
+        generator, the span is also current while the generator runs, i.e. during each step of
+        the iteration. The span then ends when the generator is exhausted, fails or is closed.
+        Likewise, if the callable returns a coroutine, the span is also current while the
+        coroutine is awaited, and ends when it completes. If the callable returns an asyncio task
+        or future, which is already scheduled, it is returned as it is, and the span ends when it
+        is done.
+
+        Args:
+            func: Callable to wrap.
+            name: Name of the spans.
+            category: Category of the spans.
+            **attributes: Initial attributes of the spans.
+
+        Returns:
+            The wrapped callable, or ``func`` itself if tracing is disabled.
+        """
+
+        if not self.enabled:
+            return func
+
+        @functools.wraps(func)
+        def _traced_call(*args: object, **kwargs: object) -> object:
+            span = self.start_span(name, category, **attributes)
+            assert span is not None
+
+            token = _current_span.set(span)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                span.record_exception(exc)
+                self.end_span(span)
+                raise
+            finally:
+                _current_span.reset(token)
+
+            if isinstance(result, GeneratorType):
+                return self._trace_generator(result, span)
+            elif isinstance(result, AsyncGeneratorType):
+                return self._trace_async_generator(result, span)
+            elif inspect.iscoroutine(result):
+                return self._trace_coroutine(result, span)
+            elif asyncio.isfuture(result):
+                # The exception of a failed future is not recorded, as retrieving it would
+                # silence the warning for futures with exceptions that are never retrieved
+                result.add_done_callback(lambda _future: self.end_span(span))
+                return result
+            else:
+                self.end_span(span)
+                return result
+
+        return cast(_CallableT, _traced_call)
+
+    async def _trace_coroutine(self, coroutine: Coroutine[object, object, object],
+                               span: Span) -> object:
+        # The coroutine only runs when awaited, possibly in another asyncio task, where the
+        # span is then made current
+        token = _current_span.set(span)
+        try:
+            return await coroutine
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def _trace_generator(self, generator: Generator[object, object, object],
+                         span: Span) -> Generator[object, object, object]:
+        # Each step of the generator is run with the span as the current span. Values and
+        # exceptions sent or thrown into the wrapper are passed on to the generator.
+        try:
+            to_send: object = None
+            to_throw: BaseException | None = None
+            while True:
+                token = _current_span.set(span)
+                try:
+                    item = generator.send(to_send) if to_throw is None \
+                        else generator.throw(to_throw)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    _current_span.reset(token)
+
+                to_send, to_throw = None, None
+                try:
+                    to_send = yield item
+                except Exception as exc:
+                    to_throw = exc
+        except BaseException as exc:
+            if not isinstance(exc, GeneratorExit):
+                span.record_exception(exc)
+            raise
+        finally:
+            generator.close()
+            self.end_span(span)
+
+    async def _trace_async_generator(self, generator: AsyncGenerator[object, object],
+                                     span: Span) -> AsyncGenerator[object, object]:
+        try:
+            to_send: object = None
+            to_throw: BaseException | None = None
+            while True:
+                token = _current_span.set(span)
+                try:
+                    item = await (generator.asend(to_send)
+                                  if to_throw is None else generator.athrow(to_throw))
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_span.reset(token)
+
+                to_send, to_throw = None, None
+                try:
+                    to_send = yield item
+                except Exception as exc:
+                    to_throw = exc
+        except BaseException as exc:
+            if not isinstance(exc, GeneratorExit):
+                span.record_exception(exc)
+            raise
+        finally:
+            await generator.aclose()
+            self.end_span(span)
+
+    def wrap_awaitable(self, awaitable: _AwaitableT, name: str, category: str,
+                       **attributes: object) -> _AwaitableT:
+        """Wrap an awaitable so that awaiting it is recorded as a span.
+
+        Args:
+            awaitable: Awaitable to wrap.
+            name: Name of the span.
+            category: Category of the span.
+            **attributes: Initial attributes of the span.
+
+        Returns:
+            A coroutine awaiting ``awaitable`` within a span, or ``awaitable`` itself if tracing
+            is disabled.
+        """
+
+        if not self.enabled:
+            return awaitable
+
+        async def _traced_awaitable() -> object:
+            with self.span(name, category, **attributes):
+                return await awaitable
+
+        return cast(_AwaitableT, _traced_awaitable())
+
+    def export(self,
+               file_path: str | None = None,
+               file_format: TraceFileFormat.Literals | None = None) -> str:
+        """Export all recorded spans to a trace file.
+
+        Args:
+            file_path: Path of the trace file. Defaults to ``config.trace_file_path``.
+            file_format: Format of the trace file. Defaults to ``config.trace_file_format``.
+
+        Returns:
+            Path of the written trace file.
+        """
+
+        path = Path(file_path if file_path is not None else self._config.trace_file_path)
+        if file_format is None:
+            file_format = self._config.trace_file_format
+
+        if file_format == TraceFileFormat.OTLP_JSON:
+            trace = self.to_otlp_json()
+        else:
+            trace = self.to_chrome_trace()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as trace_file:
+            json.dump(trace, trace_file, default=str)
+        return str(path)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the recorded spans as a Chrome trace-event JSON object.
+
+        Each span is a complete (``'X'``) event with the span and parent ids among its args.
+        Parent links across tracks, e.g. from a flow to the asyncio tasks it spawns, are
+        additionally exported as flow events, which are drawn as arrows in Perfetto.
+        """
+
+        pid = os.getpid()
+        track_to_tid: dict[int, int] = {}
+        events: list[dict[str, Any]] = []
+        spans_by_id = {span.span_id: span for span in self._spans}
+
+        for span in sorted(self._spans, key=lambda span: span.start_ns):
+            if span.track_id not in track_to_tid:
+                tid = track_to_tid[span.track_id] = len(track_to_tid) + 1
+                events.append({
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': tid,
+                    'args': {
+                        'name': span.track_name
+                    },
+                })
+            tid = track_to_tid[span.track_id]
+            ts = span.start_ns / 1000
+
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': ts,
+                'dur': (cast(int, span.end_ns) - span.start_ns) / 1000,
+                'pid': pid,
+                'tid': tid,
+                'args': {
+                    'span_id': span.span_id, 'parent_id': span.parent_id
+                } | span.attributes,
+            })
+
+            parent = spans_by_id.get(span.parent_id) if span.parent_id is not None else None
+            if parent is not None and parent.track_id != span.track_id:
+                flow_event = {'name': 'parent', 'cat': 'parent', 'id': span.span_id, 'pid': pid}
+                events.append(flow_event | {
+                    'ph': 's', 'tid': track_to_tid[parent.track_id], 'ts': ts
+                })
+                events.append(flow_event | {'ph': 'f', 'bp': 'e', 'tid': tid, 'ts': ts})
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def to_otlp_json(self) -> dict[str, Any]:
+        """Return the recorded spans as an OpenTelemetry OTLP/JSON traces object."""
+
+        otlp_spans = []
+        for span in self._spans:
+            parent_span_id = f'{span.parent_id:016x}' if span.parent_id is not None else ''
+            kind = _OTLP_SPAN_KIND_CLIENT if span.category == 'http' else _OTLP_SPAN_KIND_INTERNAL
+            attributes = [_otlp_attribute('omnipy.category', span.category)]
+            attributes += [_otlp_attribute(key, value) for key, value in span.attributes.items()]
+
+            otlp_span: dict[str, Any] = {
+                'traceId': span.trace_id,
+                'spanId': f'{span.span_id:016x}',
+                'parentSpanId': parent_span_id,
+                'name': span.name,
+                'kind': kind,
+                'startTimeUnixNano': str(span.start_ns),
+                'endTimeUnixNano': str(span.end_ns),
+                'attributes': attributes,
+            }
+            if span.failed:
+                otlp_span['status'] = {
+                    'code': _OTLP_STATUS_CODE_ERROR,
+                    'message': str(span.attributes['error']),
+                }
+            otlp_spans.append(otlp_span)
+
+        return {
+            'resourceSpans': [{
+                'resource': {
+                    'attributes': [_otlp_attribute('service.name', 'omnipy')]
+                },
+                'scopeSpans': [{
+                    'scope': {
+                        'name': 'omnipy'
+                    }, 'spans': otlp_spans
+                }],
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: object) -> dict[str, Any]:
+    if isinstance(value, bool):
+        otlp_value: dict[str, object] = {'boolValue': value}
+    elif isinstance(value, int):
+        otlp_value = {'intValue': str(value)}
+    elif isinstance(value, float):
+        otlp_value = {'doubleValue': value}
+    else:
+        otlp_value = {'stringValue': str(value)}
+    return {'key': key, 'value': otlp_value}
+
+
+tracer = Tracer()
@@ -144,6 +144,22 @@ def running_in_atty_terminal() -> bool:
     return sys.stdout.isatty()
 
 
+def running_in_interactive_session() -> bool:
+    """Return whether the current process runs an interactive session that outlives commands.
+
+    Interactive sessions include the Python REPL (also with ``python -i``), IPython terminals and
+    consoles, and Jupyter kernels. Scripts, including test runs, are not interactive.
+
+    Returns:
+        ``True`` when running an interactive session, else ``False``.
+
+    Notes:
+        Depends on the active Python execution environment.
+    """
+    return (hasattr(sys, 'ps1') or bool(sys.flags.interactive) or running_in_ipython_terminal()
+            or running_in_ipython_pycharm() or running_in_any_jupyter())
+
+
 def detect_ui_type() -> AutoDetectableUserInterfaceType.Literals:
     """Detect the current Omnipy user-interface type from the execution environment.
 
@@ -28,6 +28,12 @@ MAX_PANEL_NESTING_DEPTH: pyd.NonNegativeInt | None = 3
 # Data - Display - Pruning
 VERBOSE_PRUNE = False
 
+# Data - Display - Caching
+
+# Memory budgets for caches of formatted text and fully rendered panels, in bytes
+FORMAT_DRAFT_PANEL_CACHE_MAX_BYTES: pyd.NonNegativeInt = 32 * 1024**2
+RENDERED_PANEL_CACHE_MAX_BYTES: pyd.NonNegativeInt = 64 * 1024**2
+
 DEFAULT_DARK_BACKGROUND = False
 
 TERMINAL_DEFAULT_WIDTH: pyd.NonNegativeInt | None = 80
@@ -1,4 +1,4 @@
-"""Data-related literal enums for retry and backoff behavior."""
+"""Data-related literal enums for retry, backoff and HTTP caching behavior."""
 
 from typing import Literal
 
@@ -14,3 +14,33 @@ class BackoffStrategy(LiteralEnum[str]):
     JITTER: Literal['jitter'] = 'jitter'
     FIBONACCI: Literal['fibonacci'] = 'fibonacci'
     RANDOM: Literal['random'] = 'random'
+
+
+class HttpCacheMode(LiteralEnum[str]):
+    """Modes of the on-disk cache of HTTP responses."""
+
+    Literals = Literal['off', 'default', 'force_cache', 'offline']
+
+    OFF: Literal['off'] = 'off'
+    """Responses are neither stored in nor served from the cache."""
+
+    DEFAULT: Literal['default'] = 'default'
+    """Follow HTTP caching semantics.
+
+    Fresh responses are served from the cache according to the `Cache-Control`
+    and `Expires` headers. Stale responses with `ETag` or `Last-Modified`
+    validators are revalidated with conditional requests, so that unchanged
+    content is not transferred again.
+    """
+
+    FORCE_CACHE: Literal['force_cache'] = 'force_cache'
+    """Serve any stored response from the cache, regardless of freshness.
+
+    Only URLs missing from the cache are requested.
+    """
+
+    OFFLINE: Literal['offline'] = 'offline'
+    """Serve any stored response from the cache and never make requests.
+
+    URLs missing from the cache fail with a `ConnectionError`.
+    """
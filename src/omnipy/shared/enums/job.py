@@ -64,6 +64,15 @@ class ConfigOutputStorageProtocolOptions(LiteralEnum[str]):
     S3: Literal['s3'] = 's3'
 
 
+class TraceFileFormat(LiteralEnum[str]):
+    """File formats for exporting job traces."""
+
+    Literals = Literal['chrome', 'otlp_json']
+
+    CHROME: Literal['chrome'] = 'chrome'
+    OTLP_JSON: Literal['otlp_json'] = 'otlp_json'
+
+
 class EngineChoice(LiteralEnum[str]):
     """Execution engine enum values for running jobs."""
 
@@ -5,7 +5,7 @@ from io import TextIOBase
 from typing import Any, Protocol, runtime_checkable, TYPE_CHECKING
 
 from omnipy.shared.enums.colorstyles import AllColorStyles
-from omnipy.shared.enums.data import BackoffStrategy
+from omnipy.shared.enums.data import BackoffStrategy, HttpCacheMode
 from omnipy.shared.enums.display import (DisplayColorSystem,
                                          DisplayDimensionsUpdateMode,
                                          HorizontalOverflowMode,
@@ -17,7 +17,8 @@ from omnipy.shared.enums.display import (DisplayColorSystem,
 from omnipy.shared.enums.job import (ConfigOutputStorageProtocolOptions,
                                      ConfigPersistOutputsOptions,
                                      ConfigRestoreOutputsOptions,
-                                     EngineChoice)
+                                     EngineChoice,
+                                     TraceFileFormat)
 from omnipy.shared.enums.ui import SpecifiedUserInterfaceType, TerminalOutputUserInterfaceType
 from omnipy.shared.protocols.util import IsDataPublisher
 from omnipy.shared.typedefs import LocaleType
@@ -158,16 +159,33 @@ class IsHtmlUserInterfaceConfig(IsUserInterfaceTypeConfig, Protocol):
 
 @runtime_checkable
 class IsJupyterUserInterfaceConfig(IsHtmlUserInterfaceConfig, IsDimsModeConfig, Protocol):
-    """HTML UI configuration specialized for Jupyter environments."""
+    """HTML UI configuration specialized for Jupyter environments.
 
-    ...
+    Attributes:
+        reactive_update_delay_secs: Delay for coalescing bursts of config changes and view
+            update requests into single updates of reactive notebook output. ``0`` updates
+            immediately on every change.
+    """
+
+    reactive_update_delay_secs: pyd.NonNegativeFloat
 
 
 @runtime_checkable
 class IsBrowserUserInterfaceConfig(IsHtmlUserInterfaceConfig, Protocol):
-    """HTML UI configuration specialized for browser rendering."""
+    """HTML UI configuration specialized for browser rendering.
 
-    ...
+    Attributes:
+        windowed_browse_min_items: Minimum number of items for ``browse()`` of a dataset to
+            serve pages of items on demand from a local HTTP server, instead of rendering all
+            items to files up front. ``None`` disables windowed browsing.
+        windowed_browse_page_size: Number of items listed per page in windowed browsing.
+        windowed_browse_max_servers: Maximum number of local HTTP servers kept running for
+            windowed browsing. Starting another server stops the least recently started one.
+    """
+
+    windowed_browse_min_items: pyd.NonNegativeInt | None
+    windowed_browse_page_size: pyd.PositiveInt
+    windowed_browse_max_servers: pyd.PositiveInt
 
 
 @runtime_checkable
@@ -281,6 +299,20 @@ class IsModelConfig(IsConfigBase, Protocol):
     dynamically_convert_elements_to_models: bool
 
 
+@runtime_checkable
+class IsMetricsConfig(IsConfigBase, Protocol):
+    """Configuration controlling collection of data-layer performance metrics.
+
+    Attributes:
+        enabled: Whether metrics are collected.
+        measure_snapshot_bytes: Whether the deep size of snapshots is measured, which adds a
+            traversal of each snapshot.
+    """
+
+    enabled: bool
+    measure_snapshot_bytes: bool
+
+
 @runtime_checkable
 class IsHttpRequestsConfig(IsConfigBase, Protocol):
     """HTTP retry and throttling policy for one request profile.
@@ -288,6 +320,8 @@ class IsHttpRequestsConfig(IsConfigBase, Protocol):
     Attributes:
         requests_per_time_period: Maximum requests allowed per time window.
         time_period_in_secs: Length of the throttling window in seconds.
+        adaptive_rate_limiting: Whether to start out at the configured rate and then adapt it to
+            throttling responses, latencies and rate limit headers from the server.
         retry_http_statuses: HTTP status codes that should trigger retries.
         retry_attempts: Maximum number of retry attempts.
         retry_backoff_strategy: Backoff strategy used between retries.
@@ -295,11 +329,52 @@ class IsHttpRequestsConfig(IsConfigBase, Protocol):
 
     requests_per_time_period: float
     time_period_in_secs: float
+    adaptive_rate_limiting: bool
     retry_http_statuses: tuple[int, ...]
     retry_attempts: int
     retry_backoff_strategy: BackoffStrategy.Literals
 
 
+@runtime_checkable
+class IsHttpCacheConfig(IsConfigBase, Protocol):
+    """Configuration of the on-disk cache of HTTP responses.
+
+    Attributes:
+        mode: Whether and how cached responses are used, see `HttpCacheMode`.
+        cache_dir_path: Directory where cached responses are stored. If `None`, the `http`
+            subdirectory of the UI cache directory is used.
+        max_size_in_bytes: Maximum total size of cached response bodies. Least recently used
+            responses are evicted when exceeded.
+        max_entry_size_in_bytes: Maximum size of a single cached response body. Larger
+            responses are not cached.
+    """
+
+    mode: HttpCacheMode.Literals
+    cache_dir_path: str | None
+    max_size_in_bytes: int
+    max_entry_size_in_bytes: int
+
+
+@runtime_checkable
+class IsHttpPoolConfig(IsConfigBase, Protocol):
+    """Configuration of the runtime-managed pool of HTTP client sessions.
+
+    Attributes:
+        enabled: Whether remote tasks and dataset loading share pooled sessions by default.
+        max_connections: Maximum number of simultaneous connections in total, 0 for no limit.
+        max_connections_per_host: Maximum number of simultaneous connections per host, 0 for
+            no limit.
+        keepalive_timeout_secs: How long idle connections are kept open for reuse.
+        dns_cache_ttl_secs: How long resolved host addresses are cached.
+    """
+
+    enabled: bool
+    max_connections: int
+    max_connections_per_host: int
+    keepalive_timeout_secs: float
+    dns_cache_ttl_secs: int
+
+
 @runtime_checkable
 class IsHttpConfig(IsConfigBase, Protocol):
     """HTTP configuration with default and per-host request policies.
@@ -307,10 +382,17 @@ class IsHttpConfig(IsConfigBase, Protocol):
     Attributes:
         defaults: Fallback request policy used when no host-specific override exists.
         for_host: Request-policy overrides keyed by host name.
+        cache: On-disk cache of HTTP responses, shared by all hosts.
+        pool: Pool of HTTP client sessions, shared by all hosts.
+        download_dir_path: Directory where files are downloaded to by default. If `None`, the
+            `downloads` subdirectory of the UI cache directory is used.
     """
 
     defaults: IsHttpRequestsConfig
     for_host: defaultdict[str, IsHttpRequestsConfig]
+    cache: IsHttpCacheConfig
+    pool: IsHttpPoolConfig
+    download_dir_path: str | None
 
 
 @runtime_checkable
@@ -321,11 +403,13 @@ class IsDataConfig(IsConfigBase, Protocol):
         ui: User-interface and rendering settings.
         model: Model conversion and interaction settings.
         http: HTTP retry and throttling settings.
+        metrics: Data-layer performance metrics settings.
     """
 
     ui: IsUserInterfaceConfig
     model: IsModelConfig
     http: IsHttpConfig
+    metrics: IsMetricsConfig
 
 
 # engine
@@ -416,6 +500,8 @@ class IsOutputStorageConfig(IsConfigBase, Protocol):
         persist_outputs: Default policy for persisting job outputs.
         restore_outputs: Default policy for restoring persisted outputs.
         protocol: Storage backend selected for persisted outputs.
+        prefer_parquet: Whether to persist pandas datasets as Parquet instead of CSV, if the
+            optional `pyarrow` package is installed.
         local: Local-backend settings.
         s3: S3-backend settings.
     """
@@ -423,6 +509,7 @@ class IsOutputStorageConfig(IsConfigBase, Protocol):
     persist_outputs: ConfigPersistOutputsOptions.Literals
     restore_outputs: ConfigRestoreOutputsOptions.Literals
     protocol: ConfigOutputStorageProtocolOptions.Literals
+    prefer_parquet: bool
     local: IsLocalOutputStorageConfig
     s3: IsS3OutputStorageConfig
 
@@ -438,6 +525,49 @@ class IsJobConfig(IsConfigBase, Protocol):
     output_storage: IsOutputStorageConfig
 
 
+# registry
+
+
+@runtime_checkable
+class IsRunStateRegistryConfig(IsConfigBase, Protocol):
+    """Retention and logging configuration for the job run-state registry.
+
+    Attributes:
+        max_jobs: Maximum number of jobs to retain, or `None` for no limit.
+        max_age_secs: Maximum time to retain finished jobs, or `None` for no limit.
+        keep_failed_only: Whether to evict jobs as soon as they finish successfully.
+        log_state_changes: Whether state transitions are logged.
+    """
+
+    max_jobs: int | None
+    max_age_secs: float | None
+    keep_failed_only: bool
+    log_state_changes: bool
+
+
+# tracing
+
+
+@runtime_checkable
+class IsTracingConfig(IsConfigBase, Protocol):
+    """Configuration of span-based tracing of jobs, serialization and HTTP requests.
+
+    Attributes:
+        enabled: Whether spans are recorded.
+        trace_file_path: Path of the file that traces are exported to.
+        trace_file_format: File format of exported traces.
+        export_at_exit: Whether recorded spans are exported when the Python process exits.
+        max_spans: Maximum number of recorded spans kept in memory, after which the oldest
+            spans are dropped. ``None`` means no limit.
+    """
+
+    enabled: bool
+    trace_file_path: str
+    trace_file_format: TraceFileFormat.Literals
+    export_at_exit: bool
+    max_spans: int | None
+
+
 # root_log
 
 
@@ -23,8 +23,10 @@ from typing_extensions import override, Self, TypeVar
 
 from omnipy.shared.protocols._util import IsWeakKeyRefContainer
 from omnipy.shared.protocols.config import (IsDataConfig,
+                                            IsHttpConfig,
                                             IsJupyterUserInterfaceConfig,
                                             IsLayoutConfig,
+                                            IsMetricsConfig,
                                             IsTextConfig)
 from omnipy.shared.protocols.hub.log import CanLog
 from omnipy.shared.protocols.typing import IsMutableMapping
@@ -435,12 +437,14 @@ class IsTarFileSerializer(IsSerializer[_DatasetT], Protocol[_DatasetT]):
     @classmethod
     def create_tarfile_from_dataset(cls,
                                     dataset: _DatasetT,
-                                    data_encode_func: Callable[..., bytes | memoryview]) -> bytes:
+                                    data_encode_func: Callable[..., bytes | memoryview],
+                                    compresslevel: int = 9) -> bytes:
         """Create a tar archive payload from a dataset.
 
         Args:
             dataset: Dataset to archive.
             data_encode_func: Encoder used for individual dataset-entry payloads.
+            compresslevel: Gzip compression level, from 1 (fastest) to 9 (smallest).
 
         Returns:
             bytes: Tar archive containing the serialized dataset entries.
@@ -469,6 +473,96 @@ class IsTarFileSerializer(IsSerializer[_DatasetT], Protocol[_DatasetT]):
         ...
 
 
+@runtime_checkable
+class IsDataMetrics(Protocol):
+    """Collector of opt-in performance metrics for the data layer."""
+
+    enabled: bool
+
+    @property
+    def config(self) -> IsMetricsConfig:
+        """Return the metrics configuration.
+
+        Returns:
+            IsMetricsConfig: Configuration controlling metrics collection.
+        """
+        ...
+
+    def set_config(self, config: IsMetricsConfig) -> None:
+        """Replace the metrics configuration, enabling or disabling collection accordingly.
+
+        Args:
+            config: New metrics configuration.
+        """
+        ...
+
+    def reset(self) -> None:
+        """Clear all collected metrics and restart counting of cache hits and misses."""
+        ...
+
+    def register_cache(self, name: str, cache_info_func: Callable[[], Any]) -> None:
+        """Register a cache for hit ratio statistics.
+
+        Args:
+            name: Name of the cache in the exported metrics.
+            cache_info_func: Function returning an object with ``hits`` and ``misses``
+                attributes.
+        """
+        ...
+
+    def export(self) -> dict[str, Any]:
+        """Export all metrics as a JSON-serializable dictionary.
+
+        Returns:
+            dict[str, Any]: Metrics with ``validation``, ``snapshot``, ``serialization`` and
+                ``caches`` sections.
+        """
+        ...
+
+
+@runtime_checkable
+class IsHttpSessionPool(Protocol):
+    """Pool of HTTP client sessions shared by remote tasks and dataset loading."""
+    @property
+    def enabled(self) -> bool:
+        """Return whether remote tasks and dataset loading use pooled sessions by default."""
+        ...
+
+    @property
+    def config(self) -> IsHttpConfig:
+        """Return the HTTP configuration.
+
+        Returns:
+            IsHttpConfig: Configuration with connection limits and per-host request policies.
+        """
+        ...
+
+    def set_config(self, config: IsHttpConfig) -> None:
+        """Replace the HTTP configuration. Sessions created after the change use the new config.
+
+        Args:
+            config: New HTTP configuration.
+        """
+        ...
+
+    async def get_retry_client(self, host: str, http_config: IsHttpConfig | None = None) -> Any:
+        """Return a pooled, rate-limiting retry client for a host in the running event loop.
+
+        Args:
+            host: Host name that requests will be made to.
+            http_config: HTTP configuration with the request policy for the host. Defaults to
+                `config`.
+
+        Returns:
+            RetryClient: Retry client wrapping a pooled session for the host.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close all pooled sessions and connections of the running event loop."""
+        ...
+
+
 @runtime_checkable
 class IsSerializerRegistry(Protocol):
     """Registry that tracks serializers and selects suitable ones for datasets."""
@@ -514,11 +608,15 @@ class IsSerializerRegistry(Protocol):
         ...
 
     def auto_detect_tar_file_serializer(
-            self, dataset: IsDataset) -> tuple[IsDataset, IsSerializer] | tuple[None, None]:
+        self,
+        dataset: IsDataset,
+        preferred_file_suffix: str | None = None,
+    ) -> tuple[IsDataset, IsSerializer] | tuple[None, None]:
         """Return the best tar-file serializer match for a dataset, if any.
 
         Args:
             dataset: Dataset to inspect.
+            preferred_file_suffix: Output file suffix of the serializers to try first, if any.
 
         Returns:
             tuple[IsDataset, IsSerializer] | tuple[None, None]: Parsed dataset and
@@ -681,6 +779,42 @@ class IsSnapshotHolder(IsWeakKeyRefContainer[HasContentT, IsSnapshotWrapper[HasC
         """
         ...
 
+    def store_snapshot(self,
+                       obj: HasContentT,
+                       snapshot_wrapper: IsSnapshotWrapper[HasContentT, ContentT]) -> None:
+        """Store a snapshot of the given object that was captured outside the holder.
+
+        Args:
+            obj: Object the snapshot was taken from.
+            snapshot_wrapper: Snapshot record to register for ``obj``.
+        """
+        ...
+
+
+class IsContentVersions(IsWeakKeyRefContainer[HasContentT, int], Protocol[HasContentT]):
+    """Container protocol tracking content versions used for cache invalidation."""
+    def get_version(self, obj: HasContentT) -> int:
+        """Return the current content version of an object, assigning one if needed.
+
+        Args:
+            obj: Object whose content version should be returned.
+
+        Returns:
+            int: Process-wide unique version of the current content of ``obj``.
+        """
+        ...
+
+    def bump(self, obj: HasContentT) -> int:
+        """Assign a new content version to an object.
+
+        Args:
+            obj: Object whose content has changed.
+
+        Returns:
+            int: The new content version of ``obj``.
+        """
+        ...
+
 
 class AvailableDisplayDims(TypedDict):
     """Display-space dimensions available for rendering, in pixels."""
@@ -720,6 +854,22 @@ class IsReactiveObjects(Protocol):
     available_display_dims_in_px: IsReactive[AvailableDisplayDims]
     obj_id_update_flags: IsReactive[dict[int, bool]]
 
+    def set_update_delay_from_config(self, jupyter_ui_config: IsJupyterUserInterfaceConfig) -> None:
+        """Set the delay for coalescing updates, as configured in the Jupyter UI config.
+
+        Args:
+            jupyter_ui_config: Jupyter UI config with the `reactive_update_delay_secs` setting.
+        """
+        ...
+
+    def request_view_update(self, obj_id: int) -> None:
+        """Mark the reactive views of an object as dirty, to be re-rendered with the next update.
+
+        Args:
+            obj_id: `id()` of the object whose views should be re-rendered.
+        """
+        ...
+
     def __eq__(self, other) -> bool:
         ...
 
@@ -778,6 +928,15 @@ class IsDataClassCreator(Protocol[HasContentT, ContentT]):
         """
         ...
 
+    @property
+    def content_versions(self) -> IsContentVersions[HasContentT]:
+        """Return the registry of content versions used for cache invalidation.
+
+        Returns:
+            IsContentVersions[HasContentT]: Content-version registry for related objects.
+        """
+        ...
+
     def deepcopy_context(
         self,
         top_level_entry_func: Callable[[], None],
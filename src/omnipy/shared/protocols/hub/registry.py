@@ -7,6 +7,7 @@ from typing import Protocol, runtime_checkable
 
 from omnipy.shared.enums.job import RunState
 from omnipy.shared.protocols.compute.mixins import IsUniquelyNamedJob
+from omnipy.shared.protocols.config import IsRunStateRegistryConfig
 from omnipy.util.helpers import is_package_editable
 
 if is_package_editable('omnipy'):
@@ -49,6 +50,91 @@ if is_package_editable('omnipy'):
             state: New run-state literal to register.
     """)
 
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_GET_JOB_STATS_SUMMARY'] = (
+        'Return aggregated statistics for all jobs registered with the given job name.')
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_GET_JOB_STATS_DETAILS'] = dedent("""\
+        Statistics are kept per job name, not per unique name, and are retained when jobs are
+        evicted from the registry.
+
+        Args:
+            name: Job name to look up.
+
+        Returns:
+            IsJobStats: Aggregated statistics for the job name.
+    """)
+
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_ALL_JOB_STATS_SUMMARY'] = (
+        'Return aggregated statistics for all job names seen by the registry.')
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_ALL_JOB_STATS_DETAILS'] = dedent("""\
+        Returns:
+            dict[str, IsJobStats]: Aggregated statistics by job name, in order of first
+                registration.
+    """)
+
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_SET_CONFIG_SUMMARY'] = (
+        'Replace the registry configuration and apply its retention policy.')
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_SET_CONFIG_DETAILS'] = dedent("""\
+        Args:
+            config: New registry configuration to apply.
+    """)
+
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_CONFIG_SUMMARY'] = (
+        'Return the active registry configuration.')
+    os.environ['OMNIPY_MACRO_ISRUNSTATEREGISTRY_CONFIG_DETAILS'] = dedent("""\
+        Returns:
+            IsRunStateRegistryConfig: Configuration controlling retention and logging.
+    """)
+
+
+@runtime_checkable
+class IsJobStats(Protocol):
+    """Protocol for aggregated run statistics of all jobs sharing a job name.
+
+    Attributes:
+        state_counts: Number of transitions into each run state.
+        num_evicted: Number of finished jobs evicted from the registry.
+        total_run_secs: Sum of the run durations of all finished jobs.
+        min_run_secs: Shortest run duration, or `None` if no jobs have finished.
+        max_run_secs: Longest run duration, or `None` if no jobs have finished.
+        run_secs_histogram: Number of finished jobs per run-duration bucket. The upper bounds of
+            the buckets are given by `RUN_SECS_HISTOGRAM_BOUNDS`, with an extra last bucket for
+            longer runs.
+    """
+
+    state_counts: dict[RunState.Literals, int]
+    num_evicted: int
+    total_run_secs: float
+    min_run_secs: float | None
+    max_run_secs: float | None
+    run_secs_histogram: list[int]
+
+    @property
+    def num_finished(self) -> int:
+        """Return the number of finished jobs.
+
+        Returns:
+            int: Number of jobs that have reached the `FINISHED` state.
+        """
+        ...
+
+    @property
+    def num_unfinished(self) -> int:
+        """Return the number of jobs that have started running, but not finished.
+
+        Returns:
+            int: Number of jobs that are still running or that failed while running.
+        """
+        ...
+
+    @property
+    def mean_run_secs(self) -> float | None:
+        """Return the mean run duration of all finished jobs.
+
+        Returns:
+            float | None: Mean run duration in seconds, or `None` if no jobs have finished.
+        """
+        ...
+
 
 @runtime_checkable
 class IsRunStateRegistry(Protocol):
@@ -115,3 +201,59 @@ class IsRunStateRegistry(Protocol):
             state: New run-state literal to register.
         """
         ...
+
+    def get_job_stats(self, name: str) -> IsJobStats:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_GET_JOB_STATS_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_GET_JOB_STATS_DETAILS}}
+        """Return aggregated statistics for all jobs registered with the given job name.
+
+        Statistics are kept per job name, not per unique name, and are retained when jobs are
+        evicted from the registry.
+
+        Args:
+            name: Job name to look up.
+
+        Returns:
+            IsJobStats: Aggregated statistics for the job name.
+        """
+        ...
+
+    def all_job_stats(self) -> dict[str, IsJobStats]:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_ALL_JOB_STATS_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_ALL_JOB_STATS_DETAILS}}
+        """Return aggregated statistics for all job names seen by the registry.
+
+        Returns:
+            dict[str, IsJobStats]: Aggregated statistics by job name, in order of first
+                registration.
+        """
+        ...
+
+    def set_config(self, config: IsRunStateRegistryConfig) -> None:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_SET_CONFIG_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_SET_CONFIG_DETAILS}}
+        """Replace the registry configuration and apply its retention policy.
+
+        Args:
+            config: New registry configuration to apply.
+        """
+        ...
+
+    @property
+    def config(self) -> IsRunStateRegistryConfig:
+        # %% Original docstring (managed by expand_docstr_macros.py) %%
+        # {{ISRUNSTATEREGISTRY_CONFIG_SUMMARY}}
+        #
+        # {{ISRUNSTATEREGISTRY_CONFIG_DETAILS}}
+        """Return the active registry configuration.
+
+        Returns:
+            IsRunStateRegistryConfig: Configuration controlling retention and logging.
+        """
+        ...
@@ -12,10 +12,17 @@ from omnipy.shared.protocols.config import (IsConfigBase,
                                             IsDataConfig,
                                             IsEngineConfig,
                                             IsJobConfig,
-                                            IsRootLogConfig)
-from omnipy.shared.protocols.data import IsDataClassCreator, IsReactiveObjects, IsSerializerRegistry
+                                            IsRootLogConfig,
+                                            IsRunStateRegistryConfig,
+                                            IsTracingConfig)
+from omnipy.shared.protocols.data import (IsDataClassCreator,
+                                          IsDataMetrics,
+                                          IsHttpSessionPool,
+                                          IsReactiveObjects,
+                                          IsSerializerRegistry)
 from omnipy.shared.protocols.engine.base import IsEngine
 from omnipy.shared.protocols.hub.registry import IsRunStateRegistry
+from omnipy.shared.protocols.hub.tracing import IsTracer
 from omnipy.shared.protocols.util import IsDataPublisher
 from omnipy.util.helpers import is_package_editable
 
@@ -37,8 +44,8 @@ if is_package_editable('omnipy'):
     os.environ['OMNIPY_MACRO_ISRUNTIMECONFIG_RESET_TO_DEFAULTS_SUMMARY'] = (
         'Reset all runtime configuration sections to their default values.')
     os.environ['OMNIPY_MACRO_ISRUNTIMECONFIG_RESET_TO_DEFAULTS_DETAILS'] = dedent("""\
-        Rebuilds the data, engine, job, and root-log config sections and then refreshes runtime
-        subscriptions when the config is attached to a runtime object.
+        Rebuilds the data, engine, job, registry, tracing, and root-log config sections and then
+        refreshes runtime subscriptions when the config is attached to a runtime object.
     """)
 
     os.environ['OMNIPY_MACRO_ISRUNTIMEOBJECTS_SETUP_REACTIVE_SUMMARY'] = (
@@ -103,6 +110,8 @@ class IsRuntimeConfig(IsConfigBase, Protocol):
     data: IsDataConfig
     engine: IsEngineConfig
     job: IsJobConfig
+    registry: IsRunStateRegistryConfig
+    tracing: IsTracingConfig
     root_log: IsRootLogConfig
 
     def reset_to_defaults(self) -> None:
@@ -112,8 +121,8 @@ class IsRuntimeConfig(IsConfigBase, Protocol):
         # {{ISRUNTIMECONFIG_RESET_TO_DEFAULTS_DETAILS}}
         """Reset all runtime configuration sections to their default values.
 
-        Rebuilds the data, engine, job, and root-log config sections and then refreshes runtime
-        subscriptions when the config is attached to a runtime object.
+        Rebuilds the data, engine, job, registry, tracing, and root-log config sections and then
+        refreshes runtime subscriptions when the config is attached to a runtime object.
         """
         ...
 
@@ -129,6 +138,9 @@ class IsRuntimeObjects(IsDataPublisher, Protocol):
     prefect: IsEngine
     registry: IsRunStateRegistry
     serializers: IsSerializerRegistry
+    metrics: IsDataMetrics
+    http_session_pool: IsHttpSessionPool
+    tracer: IsTracer
     root_log: IsRootLogObjects
 
     def setup_reactive(self, ui_type: UserInterfaceType.Literals) -> None:
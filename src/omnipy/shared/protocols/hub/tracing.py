@@ -0,0 +1,194 @@
+"""Protocols for span-based tracing of jobs, serialization and HTTP requests."""
+
+from contextlib import AbstractContextManager
+from typing import Any, Awaitable, Callable, Protocol, runtime_checkable, TypeVar
+
+from omnipy.shared.enums.job import TraceFileFormat
+from omnipy.shared.protocols.config import IsTracingConfig
+
+_CallableT = TypeVar('_CallableT', bound=Callable)
+_AwaitableT = TypeVar('_AwaitableT', bound=Awaitable)
+
+
+@runtime_checkable
+class IsSpan(Protocol):
+    """A timed operation with a parent link and attributes.
+
+    Attributes:
+        name: Name of the span, e.g. the unique name of a job.
+        category: Category of the span, e.g. ``'job'`` or ``'http'``.
+        span_id: Identifier of the span, unique within the process.
+        parent_id: Identifier of the parent span, or ``None`` for root spans.
+        trace_id: Identifier shared by all spans descending from the same root span.
+        start_ns: Start time in nanoseconds since the epoch.
+        end_ns: End time in nanoseconds since the epoch, or ``None`` if not ended.
+        attributes: Additional key-value information about the span.
+    """
+
+    name: str
+    category: str
+    span_id: int
+    parent_id: int | None
+    trace_id: str
+    start_ns: int
+    end_ns: int | None
+    attributes: dict[str, object]
+
+    def set_attribute(self, key: str, value: object) -> None:
+        """Set an attribute of the span.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+        ...
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span as failed with the given exception.
+
+        Args:
+            exc: Exception raised within the span.
+        """
+        ...
+
+
+@runtime_checkable
+class IsTracer(Protocol):
+    """Recorder of spans that can export them to trace files."""
+
+    enabled: bool
+
+    @property
+    def config(self) -> IsTracingConfig:
+        """Return the tracing configuration.
+
+        Returns:
+            IsTracingConfig: Configuration controlling tracing.
+        """
+        ...
+
+    def set_config(self, config: IsTracingConfig) -> None:
+        """Replace the tracing configuration, enabling or disabling tracing accordingly.
+
+        Args:
+            config: New tracing configuration.
+        """
+        ...
+
+    @property
+    def spans(self) -> tuple[IsSpan, ...]:
+        """Return all ended spans, in the order they ended.
+
+        Returns:
+            tuple[IsSpan, ...]: Ended spans recorded since the last reset.
+        """
+        ...
+
+    @property
+    def num_dropped_spans(self) -> int:
+        """Return the number of ended spans dropped due to ``config.max_spans``.
+
+        Returns:
+            int: Number of spans dropped since the last reset.
+        """
+        ...
+
+    def reset(self) -> None:
+        """Discard all recorded spans."""
+        ...
+
+    def start_span(self, name: str, category: str, **attributes: object) -> IsSpan | None:
+        """Start a span as a child of the current span, without making it current.
+
+        Args:
+            name: Name of the span.
+            category: Category of the span.
+            **attributes: Initial attributes of the span.
+
+        Returns:
+            IsSpan | None: The started span, or ``None`` if tracing is disabled.
+        """
+        ...
+
+    def end_span(self, span: IsSpan | None) -> None:
+        """End a span started with ``start_span()`` and record it.
+
+        Args:
+            span: Span to end. ``None`` is ignored.
+        """
+        ...
+
+    def span(self, name: str, category: str,
+             **attributes: object) -> AbstractContextManager[IsSpan | None]:
+        """Return a context manager that records the enclosed block as the current span.
+
+        Args:
+            name: Name of the span.
+            category: Category of the span.
+            **attributes: Initial attributes of the span.
+
+        Returns:
+            AbstractContextManager[IsSpan | None]: Context manager yielding the span, or
+                ``None`` if tracing is disabled.
+        """
+        ...
+
+    def wrap_call(self, func: _CallableT, name: str, category: str,
+                  **attributes: object) -> _CallableT:
+        """Wrap a callable so that each call, including consumption of its result, is a span.
+
+        Args:
+            func: Callable to wrap.
+            name: Name of the spans.
+            category: Category of the spans.
+            **attributes: Initial attributes of the spans.
+
+        Returns:
+            Callable: The wrapped callable, or ``func`` itself if tracing is disabled.
+        """
+        ...
+
+    def wrap_awaitable(self, awaitable: _AwaitableT, name: str, category: str,
+                       **attributes: object) -> _AwaitableT:
+        """Wrap an awaitable so that awaiting it is recorded as a span.
+
+        Args:
+            awaitable: Awaitable to wrap.
+            name: Name of the span.
+            category: Category of the span.
+            **attributes: Initial attributes of the span.
+
+        Returns:
+            Awaitable: The wrapped awaitable, or ``awaitable`` itself if tracing is disabled.
+        """
+        ...
+
+    def export(self,
+               file_path: str | None = None,
+               file_format: TraceFileFormat.Literals | None = None) -> str:
+        """Export all recorded spans to a trace file.
+
+        Args:
+            file_path: Path of the trace file. Defaults to the path in the config.
+            file_format: Format of the trace file. Defaults to the format in the config.
+
+        Returns:
+            str: Path of the written trace file.
+        """
+        ...
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the recorded spans as a Chrome trace-event JSON object.
+
+        Returns:
+            dict[str, Any]: JSON-serializable trace, loadable in Perfetto.
+        """
+        ...
+
+    def to_otlp_json(self) -> dict[str, Any]:
+        """Return the recorded spans as an OpenTelemetry OTLP/JSON traces object.
+
+        Returns:
+            dict[str, Any]: JSON-serializable trace in the OTLP/JSON encoding.
+        """
+        ...
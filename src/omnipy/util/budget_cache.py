@@ -0,0 +1,132 @@
+"""Least-recently-used cache bounded by an estimated memory budget.
+
+Unlike caches bounded by a fixed number of entries, the size of each entry is estimated by a
+caller-supplied function, and the least recently used entries are evicted whenever the total
+exceeds the budget. This keeps memory use predictable when cached values vary widely in size,
+e.g. rendered output of small and large data objects.
+
+The cache is thread-safe. A lock can be shared with other caches or code, e.g. to make a sequence
+of cache lookups and updates atomic.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from contextlib import AbstractContextManager
+import threading
+from typing import Generic, NamedTuple
+
+from typing_extensions import TypeVar
+
+_KeyT = TypeVar('_KeyT', bound=Hashable)
+_ValT = TypeVar('_ValT', bound=object)
+
+
+class MemoryBudgetCacheInfo(NamedTuple):
+    """Statistics of a ``MemoryBudgetCache``.
+
+    Attributes:
+        hits: Number of lookups that found a cached value.
+        misses: Number of lookups that did not find a cached value.
+        num_entries: Current number of cached values.
+        num_bytes: Current estimated size of all cached values, in bytes.
+        max_bytes: Memory budget of the cache, in bytes.
+    """
+
+    hits: int
+    misses: int
+    num_entries: int
+    num_bytes: int
+    max_bytes: int
+
+
+class MemoryBudgetCache(Generic[_KeyT, _ValT]):
+    """Map keys to values, evicting least recently used values to stay within a memory budget.
+
+    Values estimated to be larger than the full budget are not cached.
+
+    Args:
+        max_bytes: Memory budget of the cache, in bytes.
+        get_num_bytes: Function estimating the size of a value, in bytes.
+        lock: Reentrant lock held while accessing the cache. If ``None``, the cache has its own
+            lock.
+    """
+    def __init__(self,
+                 max_bytes: int,
+                 get_num_bytes: Callable[[_ValT], int],
+                 lock: AbstractContextManager | None = None) -> None:
+        self.max_bytes = max_bytes
+        self._get_num_bytes = get_num_bytes
+        self._lock = lock if lock is not None else threading.RLock()
+        self._entries: OrderedDict[_KeyT, tuple[_ValT, int]] = OrderedDict()
+        self._num_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: _KeyT) -> _ValT | None:
+        """Return the value cached for a key, marking it as recently used.
+
+        Args:
+            key: Key to look up.
+
+        Returns:
+            The cached value, or ``None`` if no value is cached for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __setitem__(self, key: _KeyT, value: _ValT) -> None:
+        num_bytes = self._get_num_bytes(value)
+
+        with self._lock:
+            self._remove(key)
+            if num_bytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, num_bytes)
+            self._num_bytes += num_bytes
+
+            while self._num_bytes > self.max_bytes:
+                _, (_, evicted_num_bytes) = self._entries.popitem(last=False)
+                self._num_bytes -= evicted_num_bytes
+
+    def __contains__(self, key: _KeyT) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: _KeyT) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._num_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    def cache_info(self) -> MemoryBudgetCacheInfo:
+        """Return statistics of the cache.
+
+        Returns:
+            MemoryBudgetCacheInfo: Hits and misses since the cache was created, together with
+                the current number of entries and their estimated size.
+        """
+        with self._lock:
+            return MemoryBudgetCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                num_entries=len(self._entries),
+                num_bytes=self._num_bytes,
+                max_bytes=self.max_bytes,
+            )
@@ -1,5 +1,6 @@
 """Helpers and literal enums for classifying and wrapping callable shapes."""
 
+import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Generator
 from contextlib import AbstractContextManager, nullcontext
 import functools
@@ -246,16 +247,13 @@ def _decorate_result_with_finished_callback(
         return _detect_finished_generator_decorator()
 
     elif isinstance(result, AsyncGeneratorType):
+        return _detect_finished_async_generator_decorator(result, register_finished)
 
-        async def _detect_finished_async_generator_decorator():
-            sent = None
-            try:
-                while True:
-                    sent = yield await result.asend(sent)
-            except StopAsyncIteration:
-                register_finished()
-
-        return _detect_finished_async_generator_decorator()
+    elif asyncio.isfuture(result):
+        # Tasks and futures are kept as is, as they are already scheduled and might be
+        # inspected by the caller with e.g. done() or result()
+        result.add_done_callback(lambda _future: register_finished())
+        return result
 
     elif inspect.isawaitable(result):
 
@@ -271,6 +269,18 @@ def _decorate_result_with_finished_callback(
         return result
 
 
+async def _detect_finished_async_generator_decorator(
+    result: AsyncGeneratorType,
+    register_finished: Callable[[], None],
+) -> AsyncGenerator:
+    sent = None
+    try:
+        while True:
+            sent = yield await result.asend(sent)
+    except StopAsyncIteration:
+        register_finished()
+
+
 def decorate_result_by_type(
     *,
     on_finished: Callable[[], None] | None = None,
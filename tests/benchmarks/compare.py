@@ -0,0 +1,64 @@
+"""Compare two recorded benchmark runs and flag slowdowns beyond a threshold.
+
+Usage: python -m tests.benchmarks.compare [--history PATH] [--threshold FRACTION] [BASE] [NEW]
+
+BASE and NEW select runs in the JSON history file by index (negative indices count from the most
+recent run), label or commit prefix. By default, the two most recent runs are compared. Exits with
+status 1 if any benchmark is slower than the base run by more than the threshold.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+from .helpers import compare_runs, DEFAULT_HISTORY_PATH, DEFAULT_THRESHOLD, load_history, select_run
+
+
+def _run_title(run: dict) -> str:
+    label = f' [{run["label"]}]' if run['label'] else ''
+    return f'{run["timestamp"]} ({run["commit"] or "unknown commit"}){label}'
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Compare two recorded benchmark runs.')
+    parser.add_argument('base', nargs='?', default='-2', help='Base run (default: -2)')
+    parser.add_argument('new', nargs='?', default='-1', help='New run (default: -1)')
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY_PATH)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Relative slowdown of the minimum round time that is flagged (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    runs = load_history(args.history)
+    try:
+        base_run = select_run(runs, args.base)
+        new_run = select_run(runs, args.new)
+    except ValueError as exp:
+        print(exp, file=sys.stderr)
+        return 2
+
+    print(f'Base: {_run_title(base_run)}')
+    print(f'New:  {_run_title(new_run)}')
+    print()
+
+    comparisons = compare_runs(base_run, new_run)
+    name_width = max((len(comparison.name) for comparison in comparisons), default=0)
+    num_slowdowns = 0
+    for comparison in comparisons:
+        flag = ''
+        if comparison.is_slowdown(args.threshold):
+            flag = '  SLOWER'
+            num_slowdowns += 1
+        print(f'{comparison.name:<{name_width}}  {comparison.base.min:10.6f}s '
+              f'-> {comparison.new.min:10.6f}s  x{comparison.ratio:.2f}{flag}')
+
+    print()
+    print(f'{num_slowdowns} of {len(comparisons)} benchmarks slower by more than '
+          f'{args.threshold:.0%}')
+    return 1 if num_slowdowns else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
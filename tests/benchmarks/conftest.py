@@ -0,0 +1,91 @@
+"""Fixtures and hooks for timing benchmarks and recording their results.
+
+By default, each benchmark runs a single round at the smallest scale, as a smoke test. Use e.g.
+``--omnipy-bench-scales=1k,100k,1M --omnipy-bench-rounds=5 --omnipy-bench-save`` to time the
+benchmarks and record the results in the JSON history file. Compare recorded runs with
+``python -m tests.benchmarks.compare``.
+
+The fixture, marker, options and default history directory are all prefixed with ``omnipy``, so
+that they do not clash with the ``pytest-benchmark`` plugin, if installed.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from .helpers import (append_run_to_history,
+                      BenchmarkFunc,
+                      BenchmarkResult,
+                      parse_scales,
+                      scale_id,
+                      time_rounds)
+
+_results_key = pytest.StashKey[dict[str, BenchmarkResult]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        'markers',
+        'omnipy_benchmark(max_scale): benchmark that is skipped for scales larger than max_scale')
+    config.stash[_results_key] = {}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if 'scale' not in metafunc.fixturenames:
+        return
+
+    scales = parse_scales(metafunc.config.getoption('--omnipy-bench-scales'))
+    marker = metafunc.definition.get_closest_marker('omnipy_benchmark')
+    max_scale = marker.kwargs.get('max_scale') if marker else None
+
+    params = []
+    for scale in scales:
+        marks = []
+        if max_scale is not None and scale > max_scale:
+            marks.append(pytest.mark.skip(reason=f'Scale is larger than {scale_id(max_scale)}'))
+        params.append(pytest.param(scale, id=scale_id(scale), marks=marks))
+    metafunc.parametrize('scale', params)
+
+
+@pytest.fixture(scope='function')
+def omnipy_benchmark(request: pytest.FixtureRequest) -> BenchmarkFunc:
+    """Time a callable over repeated rounds and register the result for the session.
+
+    The optional ``setup`` callable is run untimed before each round, and its return value is
+    passed on as positional arguments to the benchmarked callable.
+    """
+    config = request.config
+
+    def _benchmark(func: Callable[..., object],
+                   setup: Callable[[], tuple] | None = None) -> BenchmarkResult:
+        timings = time_rounds(
+            func,
+            setup,
+            rounds=config.getoption('--omnipy-bench-rounds'),
+            max_time=config.getoption('--omnipy-bench-max-time'),
+        )
+        result = BenchmarkResult.from_timings(timings)
+        name = request.node.nodeid.split('::', 1)[-1]
+        config.stash[_results_key][f'{request.node.module.__name__}::{name}'] = result
+        return result
+
+    return _benchmark
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter,
+                            config: pytest.Config) -> None:
+    results = config.stash[_results_key]
+    if not results:
+        return
+
+    terminalreporter.section('benchmark results')
+    for name, result in sorted(results.items()):
+        terminalreporter.write_line(f'{name}: min {result.min:.6f}s, '
+                                    f'median {result.median:.6f}s ({result.rounds} rounds)')
+
+    if config.getoption('--omnipy-bench-save'):
+        history_path = Path(config.getoption('--omnipy-bench-history'))
+        run = append_run_to_history(
+            history_path, results, label=config.getoption('--omnipy-bench-label'))
+        terminalreporter.write_line(f'Saved benchmark run {run["timestamp"]} to {history_path}')
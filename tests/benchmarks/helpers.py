@@ -0,0 +1,177 @@
+"""Timing, history and comparison helpers for the Omnipy benchmark suite."""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import time
+from typing import Any, Callable, Protocol
+
+SCALES: dict[str, int] = {'1k': 1_000, '100k': 100_000, '1M': 1_000_000}
+DEFAULT_HISTORY_PATH = Path('.omnipy-benchmarks') / 'history.json'
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings in seconds of repeated rounds of a single benchmark."""
+
+    rounds: int
+    min: float
+    median: float
+    mean: float
+
+    @classmethod
+    def from_timings(cls, timings: list[float]) -> 'BenchmarkResult':
+        return cls(
+            rounds=len(timings),
+            min=min(timings),
+            median=statistics.median(timings),
+            mean=statistics.fmean(timings),
+        )
+
+
+class BenchmarkFunc(Protocol):
+    """Signature of the ``omnipy_benchmark`` fixture."""
+    def __call__(self,
+                 func: Callable[..., object],
+                 setup: Callable[[], tuple] | None = None) -> BenchmarkResult:
+        ...
+
+
+@dataclass
+class BenchmarkComparison:
+    """Comparison of the timings of a benchmark between two recorded runs."""
+
+    name: str
+    base: BenchmarkResult
+    new: BenchmarkResult
+
+    @property
+    def ratio(self) -> float:
+        return self.new.min / self.base.min if self.base.min > 0 else float('inf')
+
+    def is_slowdown(self, threshold: float) -> bool:
+        return self.ratio > 1.0 + threshold
+
+
+def parse_scales(scales_option: str) -> list[int]:
+    """Parse a comma-separated list of scale names, e.g. ``'1k,100k'``, into item counts."""
+
+    scales = []
+    for scale_name in scales_option.split(','):
+        scale_name = scale_name.strip()
+        if scale_name not in SCALES:
+            raise ValueError(f'Unknown benchmark scale "{scale_name}". '
+                             f'Valid scales are: {", ".join(SCALES)}')
+        scales.append(SCALES[scale_name])
+    return scales
+
+
+def scale_id(scale: int) -> str:
+    for scale_name, count in SCALES.items():
+        if count == scale:
+            return scale_name
+    return str(scale)
+
+
+def time_rounds(func: Callable[..., object],
+                setup: Callable[[], tuple] | None,
+                rounds: int,
+                max_time: float) -> list[float]:
+    """Time ``rounds`` calls of ``func``, stopping early when ``max_time`` seconds are spent.
+
+    If ``setup`` is given, it is called untimed before each round and its return value is passed
+    on as positional arguments to ``func``. At least one round is always run.
+    """
+
+    timings: list[float] = []
+    total_start = time.perf_counter()
+    for _ in range(rounds):
+        args = setup() if setup is not None else ()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() - total_start > max_time:
+            break
+    return timings
+
+
+def _current_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True,
+                              check=True,
+                              text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(history_path: Path) -> list[dict[str, Any]]:
+    if not history_path.exists():
+        return []
+    with open(history_path) as history_file:
+        return json.load(history_file)['runs']
+
+
+def append_run_to_history(history_path: Path,
+                          results: dict[str, BenchmarkResult],
+                          label: str | None = None) -> dict[str, Any]:
+    """Append the results of a benchmark session as a new run in the JSON history file."""
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _current_commit(),
+        'label': label,
+        'machine': platform.node(),
+        'python': platform.python_version(),
+        'results': {
+            name: asdict(result) for name, result in sorted(results.items())
+        },
+    }
+    runs = load_history(history_path)
+    runs.append(run)
+
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = history_path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as tmp_file:
+        json.dump({'runs': runs}, tmp_file, indent=2)
+    os.replace(tmp_path, history_path)
+    return run
+
+
+def select_run(runs: list[dict[str, Any]], ref: str) -> dict[str, Any]:
+    """Select a recorded run by index (negative indices allowed), label or commit prefix."""
+
+    if not runs:
+        raise ValueError('No benchmark runs recorded')
+
+    try:
+        return runs[int(ref)]
+    except ValueError:
+        pass
+    except IndexError:
+        raise ValueError(f'No benchmark run with index {ref}')
+
+    for run in reversed(runs):
+        if run['label'] == ref or (run['commit'] or '').startswith(ref):
+            return run
+    raise ValueError(f'No benchmark run with label or commit "{ref}"')
+
+
+def compare_runs(base_run: dict[str, Any], new_run: dict[str, Any]) -> list[BenchmarkComparison]:
+    """Compare the benchmarks present in both runs, based on the minimum round timings."""
+
+    base_results = base_run['results']
+    new_results = new_run['results']
+    return [
+        BenchmarkComparison(
+            name=name,
+            base=BenchmarkResult(**base_results[name]),
+            new=BenchmarkResult(**new_results[name]),
+        ) for name in new_results if name in base_results
+    ]
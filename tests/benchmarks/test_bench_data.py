@@ -0,0 +1,75 @@
+"""Benchmarks of model validation, dataset updates and tar-file serialization."""
+
+from typing import Annotated
+
+import pytest
+
+from omnipy.components.json.datasets import JsonDataset
+from omnipy.components.json.serializers import JsonDatasetToTarFileSerializer
+from omnipy.components.raw.datasets import StrictStrDataset
+from omnipy.components.raw.serializers import RawStrDatasetToTarFileSerializer
+from omnipy.data.dataset import Dataset
+from omnipy.data.model import Model
+
+from .helpers import BenchmarkFunc
+
+NUM_FILES = 10
+
+
+def test_model_validation(omnipy_benchmark: Annotated[BenchmarkFunc, pytest.fixture],
+                          scale: int) -> None:
+    data = list(range(scale))
+
+    omnipy_benchmark(lambda: Model[list[int]](data))
+
+
+def test_model_validate_content(omnipy_benchmark: Annotated[BenchmarkFunc, pytest.fixture],
+                                scale: int) -> None:
+    model = Model[list[int]](list(range(scale)))
+
+    omnipy_benchmark(model.validate_content)
+
+
+@pytest.mark.omnipy_benchmark(max_scale=100_000)
+def test_dataset_setitem(omnipy_benchmark: Annotated[BenchmarkFunc, pytest.fixture],
+                         scale: int) -> None:
+    dataset = Dataset[Model[int]]({f'item_{i}': i for i in range(scale)})
+
+    def _setitem() -> None:
+        dataset['new_item'] = scale
+
+    omnipy_benchmark(_setitem)
+    assert len(dataset) == scale + 1
+
+
+@pytest.mark.omnipy_benchmark(max_scale=100_000)
+def test_json_tar_file_serializer_round_trip(omnipy_benchmark: Annotated[BenchmarkFunc,
+                                                                         pytest.fixture],
+                                             scale: int) -> None:
+    items_per_file = scale // NUM_FILES
+    dataset = JsonDataset({
+        f'file_{i}': [{
+            'id': j, 'value': j * 0.5
+        } for j in range(i * items_per_file, (i + 1) * items_per_file)] for i in range(NUM_FILES)
+    })
+
+    def _round_trip() -> None:
+        serialized = JsonDatasetToTarFileSerializer.serialize(dataset)
+        JsonDatasetToTarFileSerializer.deserialize(serialized)
+
+    omnipy_benchmark(_round_trip)
+
+
+def test_raw_str_tar_file_serializer_round_trip(omnipy_benchmark: Annotated[BenchmarkFunc,
+                                                                            pytest.fixture],
+                                                scale: int) -> None:
+    items_per_file = scale // NUM_FILES
+    dataset = StrictStrDataset({
+        f'file_{i}': '\n'.join(f'line {j}' for j in range(items_per_file)) for i in range(NUM_FILES)
+    })
+
+    def _round_trip() -> None:
+        serialized = RawStrDatasetToTarFileSerializer.serialize(dataset)
+        RawStrDatasetToTarFileSerializer.deserialize(serialized)
+
+    omnipy_benchmark(_round_trip)
@@ -0,0 +1,47 @@
+"""Benchmarks of pretty-printing data for display."""
+
+from typing import Annotated
+
+import pytest
+
+from omnipy.data._display.config import OutputConfig
+from omnipy.data._display.dimensions import Dimensions
+from omnipy.data._display.frame import Frame
+from omnipy.data._display.panel.draft.base import DraftPanel
+from omnipy.data._display.text.pretty import _format_draft_panel_cache, pretty_repr_of_draft_output
+from omnipy.shared.enums.display import PrettyPrinterLib
+
+from .helpers import BenchmarkFunc
+
+
+def _nested_data(scale: int) -> list[dict[str, object]]:
+    return [{
+        'id': i, 'attrs': {
+            'values': list(range(i, i + 10)), 'tags': ['a', 'b']
+        }
+    } for i in range(scale)]
+
+
+def _bench_format_draft_panel(omnipy_benchmark: BenchmarkFunc, data: object, frame: Frame) -> None:
+    # Width reduction of the compact-json printer formats the draft panel repeatedly through the
+    # cached _format_draft_panel(). The cache is cleared to time actual rendering.
+    config = OutputConfig(printer=PrettyPrinterLib.COMPACT_JSON)
+
+    def _setup() -> tuple[DraftPanel]:
+        _format_draft_panel_cache.clear()
+        return (DraftPanel(data, frame=frame, config=config),)
+
+    omnipy_benchmark(pretty_repr_of_draft_output, setup=_setup)
+
+
+def test_format_draft_panel_bounded_frame(omnipy_benchmark: Annotated[BenchmarkFunc,
+                                                                      pytest.fixture],
+                                          scale: int) -> None:
+    _bench_format_draft_panel(omnipy_benchmark, _nested_data(scale), Frame(Dimensions(40, 24)))
+
+
+@pytest.mark.omnipy_benchmark(max_scale=1_000)
+def test_format_draft_panel_unbounded_height(omnipy_benchmark: Annotated[BenchmarkFunc,
+                                                                         pytest.fixture],
+                                             scale: int) -> None:
+    _bench_format_draft_panel(omnipy_benchmark, _nested_data(scale), Frame(Dimensions(40, None)))
@@ -0,0 +1,29 @@
+"""Benchmarks of the per-task overhead of running jobs with the local engine."""
+
+from typing import Annotated
+
+import pytest
+
+from omnipy.compute.task import TaskTemplate
+from omnipy.shared.enums.job import ConfigPersistOutputsOptions, EngineChoice
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+from .helpers import BenchmarkFunc
+
+NUM_TASK_RUNS = 100
+
+
+def test_local_runner_task_overhead(omnipy_benchmark: Annotated[BenchmarkFunc, pytest.fixture],
+                                    runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    runtime.config.engine.choice = EngineChoice.LOCAL
+    runtime.config.job.output_storage.persist_outputs = ConfigPersistOutputsOptions.DISABLED
+
+    @TaskTemplate()
+    def plus_one(number: int) -> int:
+        return number + 1
+
+    def _run_tasks() -> None:
+        for i in range(NUM_TASK_RUNS):
+            plus_one.run(i)
+
+    omnipy_benchmark(_run_tasks)
@@ -0,0 +1,15 @@
+"""Benchmark of the cold start time of `import omnipy` in a fresh interpreter process."""
+
+import subprocess
+import sys
+from typing import Annotated
+
+import pytest
+
+from .helpers import BenchmarkFunc
+
+
+def test_cold_import_omnipy(omnipy_benchmark: Annotated[BenchmarkFunc, pytest.fixture]) -> None:
+    # Includes the startup time of the interpreter. See `scripts/cold_import_time.py` for the
+    # import time alone.
+    omnipy_benchmark(lambda: subprocess.run([sys.executable, '-c', 'import omnipy'], check=True))
@@ -0,0 +1,166 @@
+"""Tests for the paginated ENCODE and GDC importers."""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Annotated, Any, AsyncGenerator, cast
+
+from aiohttp import web
+import pytest
+import pytest_cases as pc
+
+from omnipy.components._fairtracks.tasks import import_dataset_from_encode, import_dataset_from_gdc
+from omnipy.components.json.datasets import JsonDataset
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+_NUM_RECORDS = {'Experiment': 45, 'Biosample': 7, 'projects': 23}
+
+
+@dataclass
+class ApiStandIn:
+    """Base URL of a stand-in for the ENCODE and GDC APIs, and statistics on the requests."""
+    url: str = ''
+    fail_from_offset: int | None = None
+    request_counts: Counter[str] = field(default_factory=Counter)
+    num_concurrent_requests: int = 0
+    max_concurrent_requests: int = 0
+
+
+def _get_records(endpoint: str, offset: int, size: int) -> list[dict[str, object]]:
+    return [
+        dict(accession=f'{endpoint}_{i}')
+        for i in range(offset, min(offset + size, _NUM_RECORDS[endpoint]))
+    ]
+
+
+@pc.fixture(scope='function')
+async def api_stand_in(runtime: Annotated[IsRuntime, pytest.fixture],
+                       aiohttp_server) -> AsyncGenerator[ApiStandIn, None]:
+    """Provide a local server mimicking paged search results of the ENCODE and GDC APIs."""
+    runtime.config.data.http.defaults.requests_per_time_period = 1000
+    runtime.config.data.http.defaults.retry_attempts = 1
+    stand_in = ApiStandIn()
+
+    async def _get_page(endpoint: str, request: web.Request) -> tuple[int, list[Any]]:
+        offset = int(request.query['from'])
+        stand_in.request_counts[endpoint] += 1
+
+        stand_in.num_concurrent_requests += 1
+        stand_in.max_concurrent_requests = max(stand_in.max_concurrent_requests,
+                                               stand_in.num_concurrent_requests)
+        await asyncio.sleep(0.05)
+        stand_in.num_concurrent_requests -= 1
+
+        if stand_in.fail_from_offset is not None and offset >= stand_in.fail_from_offset:
+            raise web.HTTPInternalServerError()
+        return offset, _get_records(endpoint, offset, int(request.query.get('limit', 0)))
+
+    async def _encode_search_endpoint(request: web.Request) -> web.Response:
+        assert request.headers['accept'] == 'application/json'
+        assert request.query['format'] == 'json'
+        endpoint = request.query['type']
+        _, records = await _get_page(endpoint, request)
+        content = {
+            '@graph': records,
+            'total': _NUM_RECORDS[endpoint],
+            'notification': 'Success' if records else 'No results found',
+        }
+        return web.json_response(content, status=200 if records else 404)
+
+    async def _gdc_endpoint(request: web.Request) -> web.Response:
+        endpoint = request.match_info['endpoint']
+        offset, _ = await _get_page(endpoint, request)
+        records = _get_records(endpoint, offset, int(request.query['size']))
+        return web.json_response({
+            'data': {
+                'hits': records,
+                'pagination': {
+                    'total': _NUM_RECORDS[endpoint], 'from': offset, 'count': len(records)
+                },
+            },
+            'warnings': {},
+        })
+
+    app = web.Application()
+    app.router.add_route('GET', '/encode/search', _encode_search_endpoint)
+    app.router.add_route('GET', '/gdc/{endpoint}', _gdc_endpoint)
+    server = await aiohttp_server(app)
+    stand_in.url = str(server.make_url('/'))
+    yield stand_in
+
+
+def _assert_records(dataset: JsonDataset, endpoint: str, num_records: int) -> None:
+    records = dataset[endpoint].to_data()
+    assert records == [dict(accession=f'{endpoint}_{i}') for i in range(num_records)]
+
+
+async def test_import_dataset_from_encode_concurrently(
+        api_stand_in: Annotated[ApiStandIn, pytest.fixture]) -> None:
+    dataset = await cast(Any, import_dataset_from_encode).run(
+        ['Experiment', 'Biosample'],
+        page_size=10,
+        base_url=api_stand_in.url + 'encode',
+    )
+
+    assert isinstance(dataset, JsonDataset)
+    assert list(dataset.keys()) == ['Experiment', 'Biosample']
+    _assert_records(dataset, 'Experiment', 45)
+    _assert_records(dataset, 'Biosample', 7)
+
+    assert api_stand_in.request_counts == {'Experiment': 5, 'Biosample': 1}
+    assert api_stand_in.max_concurrent_requests > 2
+
+
+async def test_import_dataset_with_max_concurrent_pages(
+        api_stand_in: Annotated[ApiStandIn, pytest.fixture]) -> None:
+    dataset = await cast(Any, import_dataset_from_gdc).run(
+        ['projects'],
+        page_size=3,
+        max_concurrent_pages=2,
+        base_url=api_stand_in.url + 'gdc',
+    )
+
+    _assert_records(dataset, 'projects', 23)
+    assert api_stand_in.request_counts == {'projects': 8}
+    assert api_stand_in.max_concurrent_requests == 2
+
+
+async def test_import_dataset_from_gdc_with_max_item_count(
+        api_stand_in: Annotated[ApiStandIn, pytest.fixture]) -> None:
+    dataset = await cast(Any, import_dataset_from_gdc).run(
+        ['projects'],
+        max_data_item_count=15,
+        page_size=10,
+        base_url=api_stand_in.url + 'gdc',
+    )
+
+    _assert_records(dataset, 'projects', 15)
+    assert api_stand_in.request_counts == {'projects': 2}
+
+
+async def test_import_dataset_resumes_from_progress(
+    api_stand_in: Annotated[ApiStandIn, pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    api_stand_in.fail_from_offset = 30
+    with pytest.raises(ConnectionError):
+        await cast(Any, import_dataset_from_encode).run(
+            ['Experiment'],
+            page_size=10,
+            progress_dir_path=tmp_path,
+            base_url=api_stand_in.url + 'encode',
+        )
+    assert api_stand_in.request_counts == {'Experiment': 5}
+
+    api_stand_in.fail_from_offset = None
+    api_stand_in.request_counts.clear()
+    dataset = await cast(Any, import_dataset_from_encode).run(
+        ['Experiment'],
+        page_size=10,
+        progress_dir_path=tmp_path,
+        base_url=api_stand_in.url + 'encode',
+    )
+
+    _assert_records(dataset, 'Experiment', 45)
+    assert api_stand_in.request_counts == {'Experiment': 2}
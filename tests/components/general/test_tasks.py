@@ -1,5 +1,6 @@
 """Tests for general-purpose dataset and model creation tasks."""
 
+from pathlib import Path
 from typing import Annotated, Generic
 
 import pytest
@@ -11,6 +12,8 @@ from omnipy.components.general.tasks import (concat_all_vals_in_datasets_as_args
                                              create_dataset_from_kwargs,
                                              create_model_from_args,
                                              create_model_from_kwargs,
+                                             import_directory,
+                                             split_dataset,
                                              union_all_datasets_as_args,
                                              union_all_datasets_as_kwargs,
                                              union_all_vals_in_datasets_as_args,
@@ -308,3 +311,95 @@ def test_union_all_datasets_as_kwargs_accepts_keyword_datasets(
             'c': 3
         },
     }
+
+
+def _create_files(dir_path: Path, contents: dict[str, str]) -> None:
+    for rel_path, content in contents.items():
+        file_path = dir_path / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding='utf-8')
+
+
+def test_split_dataset() -> None:
+    dataset = Dataset[Model[list[int]]](a=[1], b=[2], c=[3], d=[4])
+
+    dataset_a, dataset_b = split_dataset.run(dataset, datafile_names_for_b=['d', 'b', 'x'])
+    assert dataset_a.to_data() == dict(a=[1], c=[3])
+    assert dataset_b.to_data() == dict(b=[2], d=[4])
+    assert dataset_b['b'] is dataset['b']
+
+
+def test_import_directory(tmp_path: Path) -> None:
+    """Import files of one directory level, filtered by prefixes and suffixes."""
+    _create_files(
+        tmp_path,
+        {
+            'a.txt': 'A',
+            'b.data.txt': 'B',
+            'c.json': 'C',
+            'README': 'R',
+            '.hidden.txt': 'H',
+            '_private.txt': 'P',
+            'sub/d.txt': 'D',
+        },
+    )
+
+    dataset = import_directory.run(tmp_path)
+    assert isinstance(dataset, Dataset)
+    assert dataset.to_data() == {'README': 'R', 'a': 'A', 'b_data': 'B', 'c': 'C'}
+
+    dataset = import_directory.run(tmp_path, include_suffixes=('.txt',), exclude_prefixes=())
+    assert dataset.to_data() == {'_hidden': 'H', '_private': 'P', 'a': 'A', 'b_data': 'B'}
+
+
+def test_import_directory_recursively_with_globs(tmp_path: Path) -> None:
+    """Import files in subdirectories, filtered by glob patterns, with concurrent reads."""
+    many_files = {f'many/{i:03d}': str(i) for i in range(100)}
+    many_txt_files = {f'{name}.txt': content for name, content in many_files.items()}
+    _create_files(
+        tmp_path,
+        {
+            'a.txt': 'A',
+            'sub/b.txt': 'B',
+            'sub/c.json': 'C',
+            'sub/deeper/d.txt': 'D',
+            '_skipped/e.txt': 'E',
+        } | many_txt_files,
+    )
+
+    dataset = import_directory.run(
+        tmp_path, recursive=True, include_patterns=('*.txt',), max_workers=8)
+    assert dataset.to_data() == {'a': 'A', 'sub/b': 'B', 'sub/deeper/d': 'D'} | many_files
+
+    dataset = import_directory.run(tmp_path, recursive=True, include_patterns=('sub/*',))
+    assert list(dataset.keys()) == ['sub/b', 'sub/c', 'sub/deeper/d']
+
+
+def test_import_directory_with_memory_map(tmp_path: Path) -> None:
+    """Decode large files from memory maps and read small and empty files normally."""
+    _create_files(tmp_path, {'large.txt': 'æøå' * 1000, 'small.txt': 'small', 'empty.txt': ''})
+
+    dataset = import_directory.run(
+        tmp_path,
+        dataset_cls=Dataset[Model[str]],
+        memory_map_min_size=100,
+    )
+    assert dataset.to_data() == {'empty': '', 'large': 'æøå' * 1000, 'small': 'small'}
+
+
+def test_import_directory_with_memory_map_decodes_as_text_mode(tmp_path: Path) -> None:
+    """Decode memory-mapped files as open() in text mode, including newline translation."""
+    _create_files(tmp_path, {'lines.txt': 'æ\r\nø\rå\n' * 100})
+
+    mapped_dataset = import_directory.run(tmp_path, memory_map_min_size=1)
+    read_dataset = import_directory.run(tmp_path)
+    assert mapped_dataset.to_data() == read_dataset.to_data() == {'lines': 'æ\nø\nå\n' * 100}
+
+
+def test_import_directory_with_symlink_cycle(tmp_path: Path) -> None:
+    """Import files in symlinked directories once, without following symlink cycles."""
+    _create_files(tmp_path, {'sub/a.txt': 'A'})
+    (tmp_path / 'sub' / 'loop').symlink_to(tmp_path, target_is_directory=True)
+
+    dataset = import_directory.run(tmp_path, recursive=True)
+    assert dataset.to_data() == {'sub/a': 'A'}
@@ -4,12 +4,15 @@ from typing import Annotated
 
 import pytest
 
+from omnipy.components.json.constants import DEFAULT_KEY, ID_KEY, REF_KEY
 from omnipy.components.json.datasets import (JsonDictDataset,
                                              JsonDictOfDictsDataset,
                                              JsonDictOfListsOfDictsDataset,
                                              JsonListDataset,
-                                             JsonListOfDictsDataset)
-from omnipy.components.json.flows import (transpose_dict_of_dicts_2_list_of_dicts,
+                                             JsonListOfDictsDataset,
+                                             JsonListOfDictsOfScalarsDataset)
+from omnipy.components.json.flows import (flatten_nested_json,
+                                          transpose_dict_of_dicts_2_list_of_dicts,
                                           transpose_dicts_of_lists_of_dicts_2_lists_of_dicts)
 from omnipy.components.json.tasks import transpose_dicts_2_lists
 from omnipy.shared.protocols.hub.runtime import IsRuntime
@@ -227,3 +230,54 @@ def test_transpose_dicts_of_lists_of_dicts_2_lists_of_dicts(runtime: Annotated[I
             },
         ],
     }
+
+
+def test_flatten_nested_json(runtime: Annotated[IsRuntime, pytest.fixture]):
+    """Flatten nested records into related data files of scalar records, level by level."""
+
+    in_dataset = JsonListOfDictsDataset(
+        dict(
+            items=[
+                {
+                    'id': 'a',
+                    'meta': {
+                        'x': 1, 'tags': [{
+                            'k': 't'
+                        }, 'u']
+                    },
+                },
+                {
+                    ID_KEY: 'b', 'meta': {
+                        'x': 2, 'tags': []
+                    }
+                },
+            ],
+            empty=[],
+        ))
+    in_data = in_dataset.to_data()
+
+    out_dataset = flatten_nested_json.run(in_dataset)
+    assert type(out_dataset) is JsonListOfDictsOfScalarsDataset
+    assert in_dataset.to_data() == in_data
+
+    out_data = out_dataset.to_data()
+    assert list(out_data.keys()) == ['items', 'empty', 'items.meta', 'items.meta.tags']
+    assert out_data == {
+        'items': [{
+            ID_KEY: 'items.0', 'id': 'a'
+        }, {
+            ID_KEY: 'b'
+        }],
+        'empty': [],
+        'items.meta': [{
+            ID_KEY: 'items.meta.0', REF_KEY: 'items.0', 'x': 1
+        }, {
+            ID_KEY: 'items.meta.1', REF_KEY: 'b', 'x': 2
+        }],
+        'items.meta.tags': [{
+            ID_KEY: 'items.meta.tags.0', REF_KEY: 'items.meta.0', 'k': 't'
+        }, {
+            ID_KEY: 'items.meta.tags.1', REF_KEY: 'items.meta.0', DEFAULT_KEY: 'u'
+        }],
+    }
+    assert list(out_data['items.meta'][0].keys()) == [ID_KEY, REF_KEY, 'x']
@@ -132,3 +132,76 @@ def test_col_select_pandas():
     b = a[['x', 'y']]
 
     assert type(b) is PandasModel
+
+
+def test_pandas_model_to_data_keeps_numpy_nan_and_series_index() -> None:
+    from omnipy.components.pandas.lazy_import import pd
+
+    df = pd.DataFrame({
+        'float': [1.5, float('nan')],
+        'obj': ['x', None],
+        'date': pd.to_datetime(['2020-01-01', None]),
+    })
+    assert PandasModel(df).to_data() == {
+        'float': [1.5, pytest.approx(float('nan'), nan_ok=True)],
+        'obj': ['x', None],
+        'date': [pd.Timestamp('2020-01-01'), None],
+    }
+
+    series = pd.Series(['a', pd.NA], index=['x', 'y'], dtype='string')
+    assert PandasModel(series).to_data() == {'x': 'a', 'y': None}
+
+
+def test_pandas_model_to_columns() -> None:
+    from omnipy.components.pandas.lazy_import import pd
+
+    df = pd.DataFrame({'x': [1, 2, 3], 'y': [0.5, 1.5, 2.5]})
+    columns = PandasModel(df).to_columns()
+    assert list(columns) == ['x', 'y']
+    assert columns['x'].tolist() == [1, 2, 3]
+    assert columns['y'].tolist() == [0.5, 1.5, 2.5]
+
+    series_columns = PandasModel(pd.Series([1, 2], name='s')).to_columns()
+    assert series_columns['s'].tolist() == [1, 2]
+
+
+def test_pandas_model_eq_and_copy() -> None:
+    from omnipy.components.pandas.lazy_import import pd
+
+    a = PandasModel(pd.DataFrame({'x': [1.0, float('nan')]}))
+    b = PandasModel(pd.DataFrame({'x': [1.0, float('nan')]}))
+    assert a == b
+    assert a != PandasModel(pd.DataFrame({'y': [1.0, float('nan')]}))
+    assert a != PandasModel(pd.DataFrame({'x': [1.0, 2.0]}))
+    assert a != PandasModel(pd.DataFrame({'x': [1.0, float('nan'), 3.0]}))
+
+    for deep in (False, True):
+        a_copy = a.copy(deep=deep)
+        assert a_copy == a
+        assert a_copy.content is not a.content
+
+        a_copy.content.loc[0, 'x'] = 10.0
+        assert a.content.loc[0, 'x'] == 1.0
+
+
+def test_pandas_model_snapshot(
+        skip_test_if_not_interactive_mode: Annotated[None, pytest.fixture]) -> None:
+    from omnipy.components.pandas.lazy_import import pd
+    from omnipy.components.pandas.snapshot import PandasSnapshotWrapper
+
+    model = PandasModel(pd.DataFrame({'x': [1.0, float('nan')], 'y': ['a', 'b']}))
+    model.validate_content()
+
+    assert model.has_snapshot()
+    assert isinstance(model.snapshot_holder[model], PandasSnapshotWrapper)
+    assert model.snapshot is not model.content
+    assert model.content_validated_according_to_snapshot()
+    assert len(model.snapshot_holder.get_deepcopy_content_ids()) == 0
+
+    model.content.loc[0, 'x'] = 2.0
+    assert not model.content_validated_according_to_snapshot()
+    assert model.snapshot.loc[0, 'x'] == 1.0
+
+    model.validate_content()
+    assert model.content_validated_according_to_snapshot()
+    assert model.snapshot.loc[0, 'x'] == 2.0
@@ -2,11 +2,15 @@
 
 from textwrap import dedent
 
+import pytest
+
 from omnipy.components.pandas.datasets import PandasDataset
-from omnipy.components.pandas.serializers import PandasDatasetToTarFileSerializer
+from omnipy.components.pandas.serializers import (is_pyarrow_available,
+                                                  PandasDatasetToParquetTarFileSerializer,
+                                                  PandasDatasetToTarFileSerializer)
 
 from ...data.helpers.functions import assert_tar_file_content
-from .helpers.asserts import assert_pandas_dataset_equals
+from .helpers.asserts import assert_pandas_dataset_equals, assert_pandas_frame_dtypes
 
 
 def test_pandas_dataset_serializer_to_tar_file():
@@ -36,3 +40,88 @@ def test_pandas_dataset_serializer_to_tar_file():
     deserialized_pandas_data = serializer.deserialize(tarfile_bytes)
 
     assert_pandas_dataset_equals(deserialized_pandas_data, pandas_data)
+
+
+@pytest.mark.skipif(not is_pyarrow_available(), reason='Requires the optional pyarrow package')
+def test_pandas_dataset_serializer_to_parquet_tar_file():
+    from omnipy.components.pandas.lazy_import import pd
+
+    pandas_data = PandasDataset()
+    pandas_data['data_file_1'] = pd.DataFrame({
+        'a': pd.Series(['abc', 'bcd'], dtype='string'),
+        'b': pd.Series([12, None], dtype='Int64'),
+        'c': pd.Series([1.5, 2.5], dtype='float32'),
+        'd': pd.Series([True, None], dtype='boolean'),
+    })
+    pandas_data.from_data({'data_file_2': [{'a': 'abc', 'b': 12}, {'c': 'bcd'}]})
+
+    serializer = PandasDatasetToParquetTarFileSerializer()
+    tarfile_bytes = serializer.serialize(pandas_data)
+
+    deserialized_pandas_data = serializer.deserialize(tarfile_bytes)
+
+    assert_pandas_dataset_equals(deserialized_pandas_data, pandas_data)
+    assert_pandas_frame_dtypes(deserialized_pandas_data['data_file_1'].content,
+                               ('string', 'Int64', 'float32', 'boolean'))
+
+    projected_pandas_data = serializer.deserialize(tarfile_bytes, columns=['a', 'b'])
+
+    assert tuple(projected_pandas_data['data_file_1'].columns) == ('a', 'b')
+    assert tuple(projected_pandas_data['data_file_2'].columns) == ('a', 'b')
+    assert_pandas_frame_dtypes(projected_pandas_data['data_file_1'].content, ('string', 'Int64'))
+
+
+@pytest.mark.skipif(not is_pyarrow_available(), reason='Requires the optional pyarrow package')
+def test_pandas_dataset_persisted_as_csv_and_loaded_from_parquet(tmp_path):
+    from omnipy.components import register_serializers
+    from omnipy.data.serializer import SerializerRegistry
+
+    registry = SerializerRegistry()
+    register_serializers(registry)
+
+    pandas_data = PandasDataset()
+    pandas_data.from_data({'data_file_1': [{'a': 'abc', 'b': 12}, {'a': 'bcd', 'b': 23}]})
+
+    _, serializer = registry.auto_detect_tar_file_serializer(pandas_data)
+    assert serializer is PandasDatasetToTarFileSerializer
+
+    tar_file_path = tmp_path / 'pandas_data.tar.gz'
+    tar_file_path.write_bytes(PandasDatasetToParquetTarFileSerializer.serialize(pandas_data))
+
+    loaded_pandas_data = registry.load_from_tar_file_path_based_on_dataset_cls(
+        print, str(tar_file_path), PandasDataset())
+
+    assert_pandas_dataset_equals(loaded_pandas_data, pandas_data)
+
+
+@pytest.mark.skipif(not is_pyarrow_available(), reason='Requires the optional pyarrow package')
+def test_pandas_dataset_persisted_as_parquet_if_preferred():
+    from omnipy.components import register_serializers
+    from omnipy.components.pandas.lazy_import import pd
+    from omnipy.data.serializer import SerializerRegistry
+
+    registry = SerializerRegistry()
+    register_serializers(registry)
+
+    pandas_data = PandasDataset()
+    pandas_data.from_data({'data_file_1': [{'a': 'abc', 'b': 12}, {'a': 'bcd', 'b': 23}]})
+
+    _, serializer = registry.auto_detect_tar_file_serializer(
+        pandas_data, preferred_file_suffix='parquet')
+    assert serializer is PandasDatasetToParquetTarFileSerializer
+
+    # Series and DataFrames with non-string column names cannot be stored as Parquet, and are
+    # persisted as without the preference
+    for unsupported_data in (pd.Series([1, 2], name='a'), pd.DataFrame({0: [1, 2]})):
+        unsupported_pandas_data = PandasDataset()
+        unsupported_pandas_data['data_file_1'] = unsupported_data
+
+        assert not PandasDatasetToParquetTarFileSerializer.is_dataset_directly_supported(
+            unsupported_pandas_data)
+        with pytest.raises(TypeError, match='data_file_1'):
+            PandasDatasetToParquetTarFileSerializer.serialize(unsupported_pandas_data)
+
+        _, serializer = registry.auto_detect_tar_file_serializer(
+            unsupported_pandas_data, preferred_file_suffix='parquet')
+        _, default_serializer = registry.auto_detect_tar_file_serializer(unsupported_pandas_data)
+        assert serializer is default_serializer
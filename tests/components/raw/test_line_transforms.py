@@ -0,0 +1,66 @@
+"""Tests for declarative line transform pipelines."""
+
+import pickle
+import re
+
+import pytest
+
+from omnipy.components.raw.line_transforms import LineTransformPipeline
+
+_TEXT = '# header\nid\tname\tvalue\n\n1\tfoo\t0.5\n2\tbar\n3\tbaz\t1.5'
+
+
+def test_substitute_and_filter_lines() -> None:
+    pipeline = LineTransformPipeline().substitute(r'\t', ',').substitute(r'^(\d)', r'#\1')
+    assert pipeline.transform('a\tb\n1\t2\n') == 'a,b\n#1,2\n'
+
+    assert LineTransformPipeline().keep_lines(r'^\d').transform(_TEXT) == \
+        '1\tfoo\t0.5\n2\tbar\n3\tbaz\t1.5'
+    assert LineTransformPipeline().drop_lines(r'^#|^$').transform(_TEXT) == \
+        'id\tname\tvalue\n1\tfoo\t0.5\n2\tbar\n3\tbaz\t1.5'
+    assert LineTransformPipeline().drop_lines('ba').transform(_TEXT) == \
+        '# header\nid\tname\tvalue\n\n1\tfoo\t0.5\n'
+    assert LineTransformPipeline().keep_lines('FOO', flags=re.IGNORECASE).transform(_TEXT) == \
+        '1\tfoo\t0.5\n'
+
+
+def test_select_fields() -> None:
+    pipeline = LineTransformPipeline().drop_lines('^#').select_fields(2, 0)
+    assert pipeline.transform(_TEXT) == 'value\tid\n\n0.5\t1\n\t2\n1.5\t3'
+
+    pipeline = LineTransformPipeline().select_fields(1, delimiter='::', output_delimiter='\\')
+    assert pipeline.transform('a::b::c\nd::e\n') == 'b\ne\n'
+
+    for indices in ((), (-1,)):
+        with pytest.raises(ValueError):
+            LineTransformPipeline().select_fields(*indices)
+    with pytest.raises(ValueError):
+        LineTransformPipeline().select_fields(0, delimiter='')
+
+
+def test_add_prefix_and_suffix() -> None:
+    pipeline = LineTransformPipeline().add_prefix('> ').add_suffix(';')
+    assert pipeline.transform('a\n\nb\n') == '> a;\n> ;\n> b;\n'
+    assert pipeline.transform('a\nb') == '> a;\n> b;'
+    assert pipeline.transform('') == ''
+
+
+@pytest.mark.parametrize('chunk_size', [1, 10, 1000])
+def test_transform_in_chunks_equals_single_pass(chunk_size: int) -> None:
+    text = ''.join(f'{i}\tline {i}\t{"ERROR" if i % 3 == 0 else "OK"}\n' for i in range(200))
+    pipeline = (
+        LineTransformPipeline().keep_lines('ERROR$').select_fields(1).substitute(
+            r'line ', 'L').add_prefix('[').add_suffix(']'))
+
+    expected = ''.join(f'[L{i}]\n' for i in range(0, 200, 3))
+    assert pipeline.transform(text, chunk_size=chunk_size) == expected
+    assert pipeline.transform_chunk(text) == expected
+
+
+def test_transform_in_parallel_processes() -> None:
+    text = ''.join(f'line {i}\n' for i in range(10_000))
+    pipeline = LineTransformPipeline().substitute(r'^line (\d+)$', r'\1').keep_lines('7')
+
+    assert pickle.loads(pickle.dumps(pipeline)) == pipeline
+    assert pipeline.transform(text, chunk_size=1000, max_workers=2) == \
+        pipeline.transform(text)
@@ -1,10 +1,15 @@
 """Tests for raw component tasks."""
 
+import codecs
 from typing import Annotated, NamedTuple
 
 import pytest
 
-from omnipy.components.raw.tasks import decode_bytes
+from omnipy.components.raw.line_transforms import LineTransformPipeline
+from omnipy.components.raw.tasks import decode_bytes, transform_lines
+from omnipy.components.raw.utils import (decode_with_detected_encoding,
+                                         DetectedEncoding,
+                                         sample_for_encoding_detection)
 from omnipy.data.dataset import Dataset
 from omnipy.data.model import Model
 from omnipy.shared.protocols.hub.runtime import IsRuntime
@@ -39,3 +44,51 @@ def test_decode_bytes(runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
     assert decode_bytes.run(
         Dataset[Model[bytes]](dict([(case.encoding, case.bytes_data) for case in test_cases])),
         encoding=None).to_data() == dict([(case.encoding, case.target_str) for case in test_cases])
+
+
+def test_decode_bytes_detects_encoding_from_bom_and_samples(
+        runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    text = 'Ære være ølet vårt!\n' * 10
+    for encoding in ('utf-8-sig', 'utf-16', 'utf-16-be', 'utf-32'):
+        data = text.encode(encoding)
+        if encoding == 'utf-16-be':
+            data = codecs.BOM_UTF16_BE + data
+        assert decode_bytes.run(Dataset[Model[bytes]](a=data))['a'].content == text
+
+    large_text = 'ASCII line\n' * 50_000 + text + 'ASCII line\n' * 50_000
+    assert decode_bytes.run(
+        Dataset[Model[bytes]](a=large_text.encode('latin-1')))['a'].content == large_text
+
+
+def test_decode_with_detected_encoding() -> None:
+    assert decode_with_detected_encoding(b'') == ('', DetectedEncoding('ascii'))
+    assert decode_with_detected_encoding('æøå'.encode()) == ('æøå', DetectedEncoding('utf-8'))
+
+    # Non-ASCII content only in the middle of the data is found by sampling
+    text = 'ASCII line\n' * 1000 + 'Ære være ølet vårt!\n' * 10 + 'ASCII line\n' * 1000
+    decoded, detected = decode_with_detected_encoding(text.encode('latin-1'), sample_size=1024)
+    assert decoded == text
+    assert detected.confidence < 1.0
+
+    # Non-ASCII content outside the samples requires detection on the full data
+    text = 'ASCII line\n' * 1000 + 'Ære\n' + 'ASCII line\n' * 500 + 'være\n' + 'ASCII line\n' * 1000
+    decoded, detected = decode_with_detected_encoding(text.encode('latin-1'), sample_size=256)
+    assert decoded == text
+
+
+def test_sample_for_encoding_detection() -> None:
+    data = b'0123456789\n' * 100
+    assert sample_for_encoding_detection(data, sample_size=400) is data
+
+    sample = sample_for_encoding_detection(data, sample_size=100)
+    assert sample.startswith(data[:100])
+    assert sample.endswith(b'0123456789\n')
+    assert len(sample) < 300
+
+
+def test_transform_lines(runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    pipeline = LineTransformPipeline().drop_lines('^#').select_fields(1, 0, output_delimiter=',')
+    dataset = Dataset[Model[str]](a='# header\na\tb\nc\td\n', b='e\tf')
+
+    assert transform_lines.run(dataset, pipeline=pipeline).to_data() == \
+        dict(a='b,a\nd,c\n', b='f,e')
@@ -0,0 +1,203 @@
+"""Tests for streamed, resumable downloads to local files."""
+
+import asyncio
+import base64
+from collections import Counter
+from hashlib import sha256
+from pathlib import Path
+from typing import Annotated, Any, AsyncGenerator, cast
+
+import aiohttp
+from aiohttp import web
+import pytest
+import pytest_cases as pc
+
+from omnipy.components.remote.datasets import DownloadedFileDataset, HttpUrlDataset
+from omnipy.components.remote.download import download_to_file, IncompleteDownloadError
+from omnipy.components.remote.models import DownloadedFileModel, HttpUrlModel
+from omnipy.components.remote.tasks import download_file_from_api_endpoint
+from omnipy.shared.exceptions import FailedDataError
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+_DATA = bytes(range(256)) * 400
+_ETAG = '"v1"'
+_SHA256 = sha256(_DATA).hexdigest()
+
+
+@pc.fixture(scope='function')
+async def download_server(aiohttp_server) -> AsyncGenerator[tuple[str, Counter[str]], None]:
+    """Provide the base URL of a server supporting range requests, and counts of its responses.
+
+    The '/drops' endpoint drops the connection after 90% of the first transfer, while the
+    '/wrong_digest' endpoint announces a wrong checksum in a 'Repr-Digest' header.
+    """
+    response_counts: Counter[str] = Counter()
+
+    async def _range_response(request: web.Request, name: str,
+                              extra_headers: dict[str, str]) -> web.StreamResponse:
+        headers = {'ETag': _ETAG, 'Content-Type': 'application/octet-stream'} | extra_headers
+        range_header = request.headers.get('Range')
+        if range_header and request.headers.get('If-Range', _ETAG) == _ETAG:
+            start = int(range_header.removeprefix('bytes=').removesuffix('-'))
+            response_counts[f'{name}_206'] += 1
+            return web.Response(
+                status=206,
+                body=_DATA[start:],
+                headers=headers | {'Content-Range': f'bytes {start}-{len(_DATA) - 1}/{len(_DATA)}'},
+            )
+
+        response_counts[f'{name}_200'] += 1
+        if name == 'drops' and response_counts['drops_200'] == 1:
+            response = web.StreamResponse(headers=headers | {'Content-Length': str(len(_DATA))})
+            await response.prepare(request)
+            await response.write(_DATA[:len(_DATA) * 9 // 10])
+            assert request.transport is not None
+            request.transport.close()
+            return response
+        return web.Response(body=_DATA, headers=headers)
+
+    async def _drops_endpoint(request: web.Request) -> web.StreamResponse:
+        return await _range_response(request, 'drops', {})
+
+    async def _wrong_digest_endpoint(request: web.Request) -> web.StreamResponse:
+        wrong_digest = base64.b64encode(sha256(b'other').digest()).decode()
+        return await _range_response(request,
+                                     'wrong_digest', {'Repr-Digest': f'sha-256=:{wrong_digest}:'})
+
+    app = web.Application()
+    app.router.add_route('GET', '/drops/data.bin', _drops_endpoint)
+    app.router.add_route('GET', '/wrong_digest/data.bin', _wrong_digest_endpoint)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), response_counts
+
+
+async def test_download_resumes_interrupted_transfer(
+    download_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, response_counts = download_server
+
+    async with aiohttp.ClientSession() as session:
+        result = await download_to_file(
+            base_url + 'drops/data.bin',
+            session,
+            tmp_path / 'data.bin',
+            expected_sha256=_SHA256,
+            chunk_size=1024,
+        )
+
+    assert response_counts == {'drops_200': 1, 'drops_206': 1}
+    assert result.num_requests == 2
+    assert result.size == len(_DATA)
+    assert result.sha256 == _SHA256
+    assert (tmp_path / 'data.bin').read_bytes() == _DATA
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['data.bin']
+
+
+async def test_download_resumes_across_calls(
+    download_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, response_counts = download_server
+
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(IncompleteDownloadError):
+            await download_to_file(
+                base_url + 'drops/data.bin', session, tmp_path / 'data.bin', max_attempts=1)
+
+        assert (tmp_path / 'data.bin.part').stat().st_size == len(_DATA) * 9 // 10
+
+        result = await download_to_file(base_url + 'drops/data.bin', session, tmp_path / 'data.bin')
+
+    assert response_counts == {'drops_200': 1, 'drops_206': 1}
+    assert result.num_requests == 1
+    assert (tmp_path / 'data.bin').read_bytes() == _DATA
+
+
+async def test_concurrent_downloads_to_same_file(
+    download_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, response_counts = download_server
+
+    async with aiohttp.ClientSession() as session:
+        downloads = [
+            download_to_file(
+                base_url + 'drops/data.bin',
+                session,
+                tmp_path / 'data.bin',
+                expected_sha256=_SHA256,
+                chunk_size=1024) for _ in range(2)
+        ]
+        results = await asyncio.gather(*downloads)
+
+    # The second download waits for the first, and does not share its part file
+    assert response_counts == {'drops_200': 2, 'drops_206': 1}
+    assert [result.num_requests for result in results] == [2, 1]
+    assert (tmp_path / 'data.bin').read_bytes() == _DATA
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['data.bin']
+
+
+async def test_download_verifies_announced_checksum(
+    download_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, _ = download_server
+
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(ValueError, match='Checksum mismatch'):
+            await download_to_file(base_url + 'wrong_digest/data.bin',
+                                   session,
+                                   tmp_path / 'data.bin')
+
+    assert not any(tmp_path.iterdir())
+
+
+async def test_download_file_from_api_endpoint(
+    download_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, _ = download_server
+    query_urls = HttpUrlDataset({
+        'resumed': HttpUrlModel(base_url + 'drops/data.bin'),
+        'corrupt': HttpUrlModel(base_url + 'wrong_digest/data.bin'),
+    })
+
+    output = cast(
+        Any,
+        await download_file_from_api_endpoint.run(
+            cast(Any, query_urls),
+            download_dir_path=tmp_path,
+        ))
+    assert isinstance(output, DownloadedFileDataset)
+
+    downloaded = output['resumed']
+    assert isinstance(downloaded, DownloadedFileModel)
+    assert downloaded.path.parent == tmp_path
+    assert downloaded.path.name.endswith('_data.bin')
+    assert downloaded.content.size == len(_DATA)
+    assert downloaded.content.sha256 == _SHA256
+    assert downloaded.content.content_type == 'application/octet-stream'
+
+    with downloaded.memory_map() as content:
+        assert content[:256] == _DATA[:256]
+        assert len(content) == len(_DATA)
+
+    with pytest.raises(FailedDataError, match='Checksum mismatch'):
+        _ = output['corrupt']
+
+
+async def test_download_file_from_api_endpoint_to_configured_dir(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    download_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, _ = download_server
+    query_urls = HttpUrlDataset({'data': HttpUrlModel(base_url + 'drops/data.bin')})
+
+    output = cast(Any, await download_file_from_api_endpoint.run(cast(Any, query_urls)))
+    assert output['data'].path.parent == Path(runtime.config.data.ui.cache_dir_path) / 'downloads'
+
+    runtime.config.data.http.download_dir_path = str(tmp_path / 'downloads')
+    output = cast(Any, await download_file_from_api_endpoint.run(cast(Any, query_urls)))
+    assert output['data'].path.parent == tmp_path / 'downloads'
@@ -0,0 +1,182 @@
+"""Tests for building URL datasets from GitHub repository listings."""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Annotated, Any, AsyncGenerator, Awaitable, cast
+
+from aiohttp import web
+import pytest
+import pytest_cases as pc
+
+from omnipy.components.remote.datasets import HttpUrlDataset
+from omnipy.components.remote.tasks import async_get_github_repo_urls, get_github_repo_urls
+from omnipy.shared.enums.data import HttpCacheMode
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+_FILE_PATHS = [
+    'README.md',
+    'data/a.json',
+    'data/b.txt',
+    'data/sub/c.json',
+    'data/sub/deep/d.json',
+    *(f'data/wide_{i}/e.json' for i in range(12)),
+]
+
+
+@dataclass
+class GithubStandIn:
+    """Base URLs of a stand-in for the GitHub APIs, and statistics on the requests made."""
+    api_url: str
+    raw_url: str
+    truncate_recursive_listings: bool = False
+    request_counts: Counter[str] = field(default_factory=Counter)
+    num_concurrent_requests: int = 0
+    max_concurrent_requests: int = 0
+
+
+def _get_tree_entries(dir_path: str, recursive: bool) -> list[dict[str, str]]:
+    prefix = f'{dir_path}/' if dir_path else ''
+    entries: dict[str, dict[str, str]] = {}
+    for file_path in _FILE_PATHS:
+        if not file_path.startswith(prefix):
+            continue
+        parts = file_path.removeprefix(prefix).split('/')
+        num_parts = len(parts) if recursive else 1
+        for i in range(num_parts):
+            rel_path = '/'.join(parts[:i + 1])
+            if i == len(parts) - 1:
+                entries[rel_path] = dict(path=rel_path, type='blob', sha=f'blob:{prefix}{rel_path}')
+            else:
+                entries[rel_path] = dict(path=rel_path, type='tree', sha=f'tree:{prefix}{rel_path}')
+    return list(entries.values())
+
+
+@pc.fixture(scope='function')
+async def github_stand_in(runtime: Annotated[IsRuntime, pytest.fixture],
+                          aiohttp_server) -> AsyncGenerator[GithubStandIn, None]:
+    """Provide a local server mimicking the git trees and contents APIs of GitHub."""
+    runtime.config.data.http.cache.mode = HttpCacheMode.OFF
+    runtime.config.data.http.defaults.requests_per_time_period = 1000
+
+    stand_in = GithubStandIn(api_url='', raw_url='')
+
+    async def _trees_endpoint(request: web.Request) -> web.Response:
+        tree_ish = request.match_info['tree_ish']
+        recursive = request.query.get('recursive') == '1'
+        stand_in.request_counts['trees_recursive' if recursive else 'trees'] += 1
+
+        stand_in.num_concurrent_requests += 1
+        stand_in.max_concurrent_requests = max(stand_in.max_concurrent_requests,
+                                               stand_in.num_concurrent_requests)
+        await asyncio.sleep(0.02)
+        stand_in.num_concurrent_requests -= 1
+
+        if tree_ish.startswith('tree:'):
+            dir_path = tree_ish.removeprefix('tree:')
+        else:
+            _, _, dir_path = tree_ish.partition(':')
+
+        entries = _get_tree_entries(dir_path, recursive)
+        truncated = recursive and stand_in.truncate_recursive_listings
+        return web.json_response(
+            dict(sha=tree_ish, tree=entries[:3] if truncated else entries, truncated=truncated))
+
+    async def _contents_endpoint(request: web.Request) -> web.Response:
+        stand_in.request_counts['contents'] += 1
+        assert request.query['ref'] == 'main'
+        entries = _get_tree_entries(request.match_info['path'], recursive=False)
+        return web.json_response([
+            dict(name=entry['path'], type='file' if entry['type'] == 'blob' else 'dir')
+            for entry in entries
+        ])
+
+    app = web.Application()
+    app.router.add_route('GET', '/repos/owner/repo/git/trees/{tree_ish:.+}', _trees_endpoint)
+    app.router.add_route('GET', '/repos/owner/repo/contents/{path:.+}', _contents_endpoint)
+    server = await aiohttp_server(app)
+
+    stand_in.api_url = str(server.make_url(''))
+    stand_in.raw_url = str(server.make_url('/raw'))
+    yield stand_in
+
+
+async def _get_github_repo_urls(stand_in: GithubStandIn, **kwargs: object) -> HttpUrlDataset:
+    return cast(
+        HttpUrlDataset,
+        await cast(Any, async_get_github_repo_urls).run(
+            owner='owner',
+            repo='repo',
+            branch='main',
+            path='data',
+            github_api_url=stand_in.api_url,
+            github_raw_url=stand_in.raw_url,
+            **kwargs,
+        ))
+
+
+def _assert_urls(stand_in: GithubStandIn, urls: HttpUrlDataset, file_paths: list[str]) -> None:
+    assert isinstance(urls, HttpUrlDataset)
+    assert list(urls.keys()) == file_paths
+    for file_path in file_paths:
+        assert str(urls[file_path]) == f'{stand_in.raw_url}/owner/repo/main/data/{file_path}'
+
+
+async def test_github_repo_urls_in_dir_with_glob(
+        github_stand_in: Annotated[GithubStandIn, pytest.fixture]) -> None:
+    urls = await _get_github_repo_urls(github_stand_in, file_pattern='[ab].*')
+    _assert_urls(github_stand_in, urls, ['a.json', 'b.txt'])
+
+    urls = await _get_github_repo_urls(github_stand_in, file_suffix='.json')
+    _assert_urls(github_stand_in, urls, ['a.json'])
+
+    assert github_stand_in.request_counts == {'contents': 2}
+
+
+async def test_github_repo_urls_recursive_in_single_request(
+        github_stand_in: Annotated[GithubStandIn, pytest.fixture]) -> None:
+    urls = await _get_github_repo_urls(github_stand_in, recursive=True, file_pattern='sub/*.json')
+    _assert_urls(github_stand_in, urls, ['sub/c.json', 'sub/deep/d.json'])
+
+    assert github_stand_in.request_counts == {'trees_recursive': 1}
+
+
+async def test_github_repo_urls_recursive_falls_back_to_concurrent_walk(
+        github_stand_in: Annotated[GithubStandIn, pytest.fixture]) -> None:
+    github_stand_in.truncate_recursive_listings = True
+
+    urls = await _get_github_repo_urls(
+        github_stand_in, recursive=True, file_suffix='.json', max_concurrent_requests=4)
+    wide_file_paths = [f'wide_{i}/e.json' for i in range(12)]
+    _assert_urls(github_stand_in,
+                 urls,
+                 sorted(['a.json', 'sub/c.json', 'sub/deep/d.json', *wide_file_paths]))
+
+    # One request per directory: 'data', 'data/sub', 'data/sub/deep' and the 12 'data/wide_*'
+    assert github_stand_in.request_counts == {'trees_recursive': 1, 'trees': 15}
+    assert 1 < github_stand_in.max_concurrent_requests <= 4
+
+
+async def test_sync_github_repo_urls_in_running_loop(
+        github_stand_in: Annotated[GithubStandIn, pytest.fixture]) -> None:
+    def _get_urls_awaitable(**kwargs: object) -> Awaitable[HttpUrlDataset]:
+        urls_awaitable = cast(Any, get_github_repo_urls).run(
+            owner='owner',
+            repo='repo',
+            branch='main',
+            path='data',
+            github_api_url=github_stand_in.api_url,
+            github_raw_url=github_stand_in.raw_url,
+            **kwargs,
+        )
+        # As for Dataset.load(), listings are returned as tasks inside a running event loop
+        assert isinstance(urls_awaitable, asyncio.Task)
+        return urls_awaitable
+
+    urls = await _get_urls_awaitable(recursive=True, file_pattern='sub/*.json')
+    _assert_urls(github_stand_in, urls, ['sub/c.json', 'sub/deep/d.json'])
+
+    urls = await _get_urls_awaitable(file_suffix='.json')
+    _assert_urls(github_stand_in, urls, ['a.json'])
+
+    assert github_stand_in.request_counts == {'trees_recursive': 1, 'contents': 1}
@@ -1,14 +1,22 @@
 """Tests for remote helper utilities."""
 
 import asyncio
+from collections import Counter
 from datetime import datetime
-from typing import Annotated, AsyncGenerator
+import time
+from typing import Annotated, AsyncGenerator, cast
 
 from aiohttp import ClientSession, web
 import pytest
 import pytest_cases as pc
+from yarl import URL
 
-from omnipy.components.remote.helpers import RateLimitingClientSession
+from omnipy.components.remote.helpers import (AdaptiveRateLimiter,
+                                              get_host_rate_limiter,
+                                              parse_rate_limit_headers,
+                                              parse_retry_after,
+                                              RateLimitingClientSession)
+from omnipy.components.remote.tasks import get_retry_client
 
 
 async def my_endpoint(request: web.Request) -> web.Response:
@@ -79,3 +87,137 @@ async def test_rate_limiting_client_session(
             assert run_time_min < run_time < run_time_max
 
             await asyncio.sleep(0.1)
+
+
+@pc.fixture(scope='function')
+async def quota_server(aiohttp_server) -> AsyncGenerator[tuple[str, Counter[int]], None]:
+    """Provide the URL of an endpoint enforcing a quota of 10 requests per 0.25 seconds, and
+    counts of its response statuses.
+
+    Responses announce the quota in a 'RateLimit' header, while requests exceeding the quota
+    get a 429 response with a 'Retry-After' header.
+    """
+    quota, window_secs = 10, 0.25
+    status_counts: Counter[int] = Counter()
+    window_start = time.monotonic()
+    num_requests_in_window = 0
+
+    async def _quota_endpoint(request: web.Request) -> web.Response:
+        nonlocal window_start, num_requests_in_window
+        now = time.monotonic()
+        if now - window_start >= window_secs:
+            window_start, num_requests_in_window = now, 0
+        reset_secs = window_secs - (now - window_start)
+
+        num_requests_in_window += 1
+        if num_requests_in_window > quota:
+            status_counts[429] += 1
+            return web.Response(status=429, headers={'Retry-After': f'{reset_secs:.3f}'})
+
+        status_counts[200] += 1
+        remaining = quota - num_requests_in_window
+        return web.json_response(
+            'My response',
+            headers={'RateLimit': f'limit={quota}, remaining={remaining}, reset={reset_secs:.3f}'})
+
+    app = web.Application()
+    app.router.add_route('GET', '/quota', _quota_endpoint)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/quota')), status_counts
+
+
+async def test_adaptive_rate_limiting_speeds_up_when_server_allows(
+    skip_test_if_not_default_data_config_values: Annotated[None, pytest.fixture],
+    my_endpoint_url: Annotated[str, pytest.fixture],
+) -> None:
+    async with RateLimitingClientSession(2, 0.1, adaptive=True) as client_session:
+        assert client_session.adaptive
+
+        # At the fixed rate of 20 requests per second, 60 requests would take about 3 seconds
+        run_time = await _assert_requests_and_get_run_time_in_secs(
+            client_session,
+            my_endpoint_url,
+            60,
+        )
+        assert run_time < 2.0
+
+        rate_limiter = get_host_rate_limiter(URL(my_endpoint_url), 20)
+        assert rate_limiter.requests_per_second > 40
+
+
+async def test_adaptive_rate_limiting_honours_server_quota(
+    skip_test_if_not_default_data_config_values: Annotated[None, pytest.fixture],
+    quota_server: Annotated[tuple[str, Counter[int]], pytest.fixture],
+) -> None:
+    url, status_counts = quota_server
+
+    # Starting out at half the rate allowed by the quota
+    async with RateLimitingClientSession(20, 1, adaptive=True) as client_session, \
+            get_retry_client(client_session, retry_attempts=10) as retry_client:
+        start_time = time.monotonic()
+        responses = await asyncio.gather(*(retry_client.get(url) for _ in range(60)))
+        run_time = time.monotonic() - start_time
+
+    assert all(response.status == 200 for response in responses)
+    assert status_counts[200] == 60
+    assert status_counts[429] < 20
+
+    # The quota allows 60 requests in 1.5 seconds, while the fixed rate would take 2.5 seconds
+    assert 1.2 < run_time < 2.2
+
+
+def test_adaptive_rate_limiter_feedback() -> None:
+    rate_limiter = AdaptiveRateLimiter(10, additive_increase=5)
+
+    rate_limiter.register_response(200, {}, latency_secs=0.02)
+    assert rate_limiter.requests_per_second == 11
+
+    rate_limiter.register_response(429, {'Retry-After': '2'})
+    assert rate_limiter.requests_per_second == 5.5
+    assert 1.9 < rate_limiter.paused_until - time.monotonic() <= 2
+
+    # Throttling responses to requests sent before the decrease are ignored
+    rate_limiter.register_response(503, {})
+    assert rate_limiter.requests_per_second == 5.5
+
+    # After the first throttling response, the rate increases additively
+    rate_limiter.register_response(200, {}, latency_secs=0.02)
+    assert rate_limiter.requests_per_second == pytest.approx(5.5 + 5 / 5.5)
+
+    # No increase while latency is growing
+    rate_limiter.register_response(200, {}, latency_secs=1.0)
+    assert rate_limiter.requests_per_second == pytest.approx(5.5 + 5 / 5.5)
+
+    # An announced quota takes precedence
+    rate_limiter.register_response(200, {'RateLimit': 'limit=100, remaining=20, reset=1'})
+    assert rate_limiter.requests_per_second == 20
+
+    rate_limiter.register_response(200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '5'})
+    assert 4.9 < rate_limiter.paused_until - time.monotonic() <= 5
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [('3', 3.0), ('0.5', 0.5), ('-1', 0.0), ('Wed, 21 Oct 2015 07:28:00 GMT', 0.0), ('', None),
+     ('soon', None)],
+    ids=['secs', 'fractional_secs', 'negative_secs', 'past_http_date', 'empty', 'invalid'],
+)
+def test_parse_retry_after(value: str, expected: float | None) -> None:
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_rate_limit_headers() -> None:
+    assert parse_rate_limit_headers({'RateLimit': 'limit=10, remaining=3, reset=7'}) == (3, 7.0)
+    assert parse_rate_limit_headers({
+        'RateLimit-Remaining': '3', 'RateLimit-Reset': '7'
+    }) == (3, 7.0)
+
+    remaining, reset_secs = cast(
+        tuple[int, float],
+        parse_rate_limit_headers({
+            'X-RateLimit-Remaining': '3', 'X-RateLimit-Reset': str(int(time.time()) + 60)
+        }))
+    assert remaining == 3
+    assert 58 < reset_secs <= 60
+
+    assert parse_rate_limit_headers({'RateLimit-Remaining': '3'}) is None
@@ -0,0 +1,209 @@
+"""Tests for the on-disk HTTP response cache."""
+
+from collections import Counter
+from pathlib import Path
+import time
+from typing import Annotated, Any, AsyncGenerator, cast
+
+import aiohttp
+from aiohttp import web
+import pytest
+import pytest_cases as pc
+
+from omnipy.components.json.datasets import JsonDataset
+from omnipy.components.remote.datasets import HttpUrlDataset
+from omnipy.components.remote.http_cache import HttpCache, HttpCacheEntry, parse_cache_control
+from omnipy.components.remote.models import HttpUrlModel
+from omnipy.components.remote.tasks import get_json_from_api_endpoint, get_retry_client
+from omnipy.shared.enums.data import HttpCacheMode
+from omnipy.shared.exceptions import FailedDataError
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+from ...helpers.functions import assert_model_or_val
+
+_DATA = dict(author='deLillos', lyrics=['Og en fyr lå i senga mi'])
+
+
+@pc.fixture(scope='function')
+async def caching_server(aiohttp_server) -> AsyncGenerator[tuple[str, Counter[str]], None]:
+    """Provide the base URL of a server with caching headers, and counts of its responses."""
+    response_counts: Counter[str] = Counter()
+
+    async def _etag_endpoint(request: web.Request) -> web.Response:
+        if request.headers.get('If-None-Match') == '"v1"':
+            response_counts['etag_304'] += 1
+            return web.Response(status=304, headers={'ETag': '"v1"'})
+        response_counts['etag_200'] += 1
+        return web.json_response(_DATA, headers={'ETag': '"v1"', 'Cache-Control': 'no-cache'})
+
+    async def _last_modified_endpoint(request: web.Request) -> web.Response:
+        last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        if request.headers.get('If-Modified-Since') == last_modified:
+            response_counts['last_modified_304'] += 1
+            return web.Response(status=304)
+        response_counts['last_modified_200'] += 1
+        return web.json_response(_DATA, headers={'Last-Modified': last_modified})
+
+    async def _max_age_endpoint(request: web.Request) -> web.Response:
+        response_counts['max_age_200'] += 1
+        return web.json_response(_DATA, headers={'Cache-Control': 'max-age=3600'})
+
+    async def _no_store_endpoint(request: web.Request) -> web.Response:
+        response_counts['no_store_200'] += 1
+        return web.json_response(_DATA, headers={'ETag': '"v1"', 'Cache-Control': 'no-store'})
+
+    app = web.Application()
+    app.router.add_route('GET', '/etag', _etag_endpoint)
+    app.router.add_route('GET', '/last_modified', _last_modified_endpoint)
+    app.router.add_route('GET', '/max_age', _max_age_endpoint)
+    app.router.add_route('GET', '/no_store', _no_store_endpoint)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/')), response_counts
+
+
+async def _get_json(url: str, http_cache: HttpCache) -> Any:
+    query_urls = HttpUrlDataset({'song': HttpUrlModel(url)})
+
+    async with aiohttp.ClientSession() as client_session:
+        async with get_retry_client(client_session=client_session) as retry_client:
+            return cast(
+                Any,
+                await get_json_from_api_endpoint.run(
+                    cast(Any, query_urls),
+                    retry_client=retry_client,
+                    http_cache=http_cache,
+                ))
+
+
+def _assert_song(output: Any) -> None:
+    assert_model_or_val(output['song']['author'], str, 'deLillos')
+    assert_model_or_val(output['song']['lyrics'][0], str, 'Og en fyr lå i senga mi')
+
+
+@pytest.mark.parametrize(
+    'path, expected_response_counts',
+    [
+        ('etag', {
+            'etag_200': 1, 'etag_304': 2
+        }),
+        ('last_modified', {
+            'last_modified_200': 1, 'last_modified_304': 2
+        }),
+        ('max_age', {
+            'max_age_200': 1
+        }),
+        ('no_store', {
+            'no_store_200': 3
+        }),
+    ],
+    ids=['etag', 'last_modified', 'max_age', 'no_store'],
+)
+async def test_http_cache_default_mode(
+    caching_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+    path: str,
+    expected_response_counts: dict[str, int],
+) -> None:
+    base_url, response_counts = caching_server
+    http_cache = HttpCache(tmp_path / 'http')
+
+    for _ in range(3):
+        _assert_song(await _get_json(base_url + path, http_cache))
+
+    assert response_counts == expected_response_counts
+
+
+async def test_http_cache_force_cache_and_offline_modes(
+    caching_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+    tmp_path: Path,
+) -> None:
+    base_url, response_counts = caching_server
+
+    http_cache = HttpCache(tmp_path / 'http', mode=HttpCacheMode.FORCE_CACHE)
+    for _ in range(2):
+        _assert_song(await _get_json(base_url + 'etag', http_cache))
+    assert response_counts == {'etag_200': 1}
+
+    http_cache = HttpCache(tmp_path / 'http', mode=HttpCacheMode.OFFLINE)
+    _assert_song(await _get_json(base_url + 'etag', http_cache))
+    assert response_counts == {'etag_200': 1}
+
+    output = await _get_json(base_url + 'max_age', http_cache)
+    with pytest.raises(FailedDataError, match='HTTP cache is offline'):
+        _ = output['song']
+    assert response_counts == {'etag_200': 1}
+
+
+async def test_dataset_load_uses_http_cache_from_config(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    caching_server: Annotated[tuple[str, Counter[str]], pytest.fixture],
+) -> None:
+    base_url, response_counts = caching_server
+    http_cache_dir_path = Path(runtime.config.data.ui.cache_dir_path) / 'http'
+
+    await JsonDataset().load(base_url + 'etag')
+    assert response_counts == {'etag_200': 1}
+    assert not http_cache_dir_path.exists()
+
+    runtime.config.data.http.cache.mode = HttpCacheMode.DEFAULT
+    for _ in range(2):
+        dataset = await JsonDataset().load(base_url + 'etag')
+        assert_model_or_val(dataset[base_url + 'etag']['author'], str, 'deLillos')
+    assert response_counts == {'etag_200': 2, 'etag_304': 1}
+    assert any(http_cache_dir_path.iterdir())
+
+    runtime.config.data.ui.cache_dir_path = str(http_cache_dir_path.parent / 'other')
+    await JsonDataset().load(base_url + 'etag')
+    assert response_counts == {'etag_200': 3, 'etag_304': 1}
+    assert any((http_cache_dir_path.parent / 'other' / 'http').iterdir())
+
+    runtime.config.data.http.cache.cache_dir_path = str(http_cache_dir_path)
+    await JsonDataset().load(base_url + 'etag')
+    assert response_counts == {'etag_200': 3, 'etag_304': 2}
+
+    runtime.config.data.http.cache.mode = HttpCacheMode.OFF
+    await JsonDataset().load(base_url + 'etag')
+    assert response_counts == {'etag_200': 4, 'etag_304': 2}
+
+
+def test_http_cache_size_limits(tmp_path: Path) -> None:
+    http_cache = HttpCache(tmp_path, max_size_in_bytes=30, max_entry_size_in_bytes=10)
+
+    http_cache.store('http://a', 200, {}, b'a' * 11)
+    assert http_cache.get('http://a') is None
+
+    for url in ('http://a', 'http://b', 'http://c'):
+        http_cache.store(url, 200, {}, b'x' * 10)
+        time.sleep(0.01)
+
+    # Reading marks 'http://a' as recently used, so that 'http://b' is evicted instead
+    assert http_cache.get('http://a') is not None
+    http_cache.store('http://d', 200, {}, b'x' * 10)
+
+    assert http_cache.get('http://a') is not None
+    assert http_cache.get('http://b') is None
+    assert http_cache.get('http://c') is not None
+    assert http_cache.get('http://d') is not None
+
+
+def test_http_cache_entry_freshness() -> None:
+    assert parse_cache_control('Public, max-age="60", no-cache') \
+        == {'public': None, 'max-age': '60', 'no-cache': None}
+
+    now = time.time()
+    entry = HttpCacheEntry(
+        url='http://a', status=200, headers=[('Cache-Control', 'max-age=60')], stored_at=now)
+    assert entry.is_fresh(now + 59)
+    assert not entry.is_fresh(now + 61)
+
+    entry.headers.append(('Age', '30'))
+    assert not entry.is_fresh(now + 31)
+
+    entry.headers = [('Date', 'Wed, 21 Oct 2015 07:28:00 GMT'),
+                     ('Expires', 'Wed, 21 Oct 2015 07:29:00 GMT')]
+    assert entry.is_fresh(now + 59)
+    assert not entry.is_fresh(now + 61)
+
+    entry.headers = [('Cache-Control', 'max-age=60, no-cache'), ('ETag', '"v1"')]
+    assert not entry.is_fresh(now)
+    assert entry.get_conditional_request_headers() == {'If-None-Match': '"v1"'}
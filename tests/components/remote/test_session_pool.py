@@ -0,0 +1,147 @@
+"""Tests for the runtime-managed pool of HTTP client sessions."""
+
+import asyncio
+import gc
+from typing import Annotated, Any, AsyncGenerator, cast
+import weakref
+
+from aiohttp import web
+import pytest
+import pytest_cases as pc
+
+from omnipy.components.json.datasets import JsonDataset
+from omnipy.components.remote.datasets import HttpUrlDataset
+from omnipy.components.remote.models import HttpUrlModel
+from omnipy.components.remote.session_pool import retry_client_for_host
+from omnipy.components.remote.tasks import get_json_from_api_endpoint
+from omnipy.config.data import HttpConfig
+from omnipy.shared.enums.data import HttpCacheMode
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+from ...helpers.functions import assert_model_or_val
+
+
+@pc.fixture(scope='function')
+async def connection_counting_server(aiohttp_server) -> AsyncGenerator[tuple[str, set], None]:
+    """Provide the base URL of a slow JSON server, and the set of client sockets connected."""
+    peers: set = set()
+
+    async def _slow_endpoint(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        peers.add(request.transport.get_extra_info('peername'))
+        await asyncio.sleep(0.01)
+        return web.json_response(dict(number=int(request.query['number'])))
+
+    app = web.Application()
+    app.router.add_route('GET', '/number', _slow_endpoint)
+    server = await aiohttp_server(app)
+    yield str(server.make_url('/number')), peers
+
+
+def _get_query_urls(url: str, num_urls: int) -> HttpUrlDataset:
+    return HttpUrlDataset({str(i): HttpUrlModel(f'{url}?number={i}') for i in range(num_urls)})
+
+
+async def test_tasks_share_pooled_connections(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    connection_counting_server: Annotated[tuple[str, set], pytest.fixture],
+) -> None:
+    url, peers = connection_counting_server
+    runtime.config.data.http.cache.mode = HttpCacheMode.OFF
+    runtime.config.data.http.defaults.requests_per_time_period = 1000
+    runtime.config.data.http.pool.max_connections_per_host = 2
+    session_pool = runtime.objects.http_session_pool
+
+    for _ in range(2):
+        output = cast(
+            Any,
+            await get_json_from_api_endpoint.run(cast(Any, _get_query_urls(url, 10))),
+        )
+        for i in range(10):
+            assert_model_or_val(output[str(i)]['number'], int, i)
+
+    assert 0 < len(peers) <= 2
+
+    host = HttpUrlModel(url).host
+    retry_client = await session_pool.get_retry_client(host)
+    assert await session_pool.get_retry_client(host) is retry_client
+
+    await session_pool.close()
+    assert retry_client._client.closed
+    assert await session_pool.get_retry_client(host) is not retry_client
+    await session_pool.close()
+
+
+async def test_pooled_client_follows_host_config(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    connection_counting_server: Annotated[tuple[str, set], pytest.fixture],
+) -> None:
+    url, _ = connection_counting_server
+    session_pool = runtime.objects.http_session_pool
+    host = HttpUrlModel(url).host
+
+    retry_client = await session_pool.get_retry_client(host)
+    assert retry_client._client._requests_per_time_period == 60
+
+    runtime.config.data.http.for_host[host].requests_per_time_period = 120
+    new_retry_client = await session_pool.get_retry_client(host)
+    assert new_retry_client is not retry_client
+    assert new_retry_client._client._requests_per_time_period == 120
+    await session_pool.close()
+
+
+async def test_retry_client_for_host_follows_given_http_config(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    connection_counting_server: Annotated[tuple[str, set], pytest.fixture],
+) -> None:
+    url, _ = connection_counting_server
+    session_pool = runtime.objects.http_session_pool
+    host = HttpUrlModel(url).host
+
+    http_config = HttpConfig()
+    http_config.for_host[host].requests_per_time_period = 120
+    async with retry_client_for_host(host, http_config=http_config) as retry_client:
+        assert retry_client is await session_pool.get_retry_client(host, http_config)
+        assert retry_client._client._requests_per_time_period == 120
+
+    http_config.pool.enabled = False
+    async with retry_client_for_host(host, http_config=http_config) as retry_client:
+        assert retry_client is not await session_pool.get_retry_client(host, http_config)
+        assert retry_client._client._requests_per_time_period == 120
+    assert retry_client._client.closed
+
+    await session_pool.close()
+
+
+async def test_dataset_load_without_session_pool(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    connection_counting_server: Annotated[tuple[str, set], pytest.fixture],
+) -> None:
+    url, peers = connection_counting_server
+    runtime.config.data.http.cache.mode = HttpCacheMode.OFF
+    runtime.config.data.http.pool.enabled = False
+
+    dataset = await JsonDataset().load(f'{url}?number=1')
+    assert_model_or_val(dataset[f'{url}?number=1']['number'], int, 1)
+    assert len(peers) == 1
+
+    loop = asyncio.get_running_loop()
+    assert loop not in runtime.objects.http_session_pool._loop_sessions
+
+
+def test_loop_sessions_removed_at_loop_shutdown(
+        runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    session_pool = runtime.objects.http_session_pool
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def _get_retry_client() -> None:
+        loops.append(asyncio.get_running_loop())
+        await session_pool.get_retry_client('example.com')
+        assert loops[0] in session_pool._loop_sessions
+
+    asyncio.run(_get_retry_client())
+    assert loops[0] not in session_pool._loop_sessions
+
+    loop_ref = weakref.ref(loops.pop())
+    gc.collect()
+    assert loop_ref() is None
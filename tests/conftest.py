@@ -95,6 +95,7 @@ def runtime(
     runtime.config.data.ui.cache_dir_path = str(tmp_dir_path / '_cache')
     runtime.config.job.output_storage.local.persist_data_dir_path = str(tmp_dir_path / 'outputs')
     runtime.config.root_log.file_log_path = str(tmp_dir_path / 'logs' / 'omnipy.log')
+    runtime.config.tracing.trace_file_path = str(tmp_dir_path / 'traces' / 'omnipy_trace.json')
 
     yield runtime
 
@@ -238,6 +239,38 @@ def assert_model_if_dyn_conv_else_val(
     return _assert_model_if_dyn_convert_else_val
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options for the benchmark suite in ``tests/benchmarks``."""
+    group = parser.getgroup('omnipy_benchmarks', 'Omnipy benchmark suite')
+    group.addoption(
+        '--omnipy-bench-scales',
+        default='1k',
+        help='Comma-separated data scales to run benchmarks for, among "1k", "100k" and "1M" '
+        '(default: "1k")')
+    group.addoption(
+        '--omnipy-bench-rounds',
+        type=int,
+        default=1,
+        help='Maximum number of timed rounds per benchmark (default: 1)')
+    group.addoption(
+        '--omnipy-bench-max-time',
+        type=float,
+        default=10.0,
+        help='Stop repeating rounds of a benchmark after this many seconds (default: 10)')
+    group.addoption(
+        '--omnipy-bench-save',
+        action='store_true',
+        default=False,
+        help='Append benchmark results as a new run in the JSON history file')
+    group.addoption(
+        '--omnipy-bench-history',
+        default=os.path.join('.omnipy-benchmarks', 'history.json'),
+        help='Path of the JSON history file of benchmark runs '
+        '(default: .omnipy-benchmarks/history.json)')
+    group.addoption(
+        '--omnipy-bench-label', default=None, help='Label to store with the saved benchmark run')
+
+
 def pytest_collection_modifyitems(items):
     """Group ordinary, mypy, and integration tests in collection order."""
     integration_tests = []
@@ -0,0 +1 @@
+"""Test package for browser display integrations."""
@@ -0,0 +1,205 @@
+"""Tests for windowed browsing of large datasets."""
+
+import threading
+from typing import Annotated
+import urllib.error
+import urllib.request
+import webbrowser
+
+import pytest
+
+from omnipy.data._display.helpers import render_lock
+from omnipy.data._display.integrations.browser.windowed import (running_windowed_browsers,
+                                                                stop_all_windowed_browsers,
+                                                                WindowedDatasetBrowser)
+import omnipy.data._mixins.display as display_mixins
+from omnipy.data.dataset import Dataset
+from omnipy.data.helpers import FailedData, PendingData
+from omnipy.data.model import Model
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+
+def _get(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return response.read().decode('utf-8')
+
+
+def test_windowed_dataset_browser_pages() -> None:
+    dataset = Dataset[Model[list[int]]]({f'file_{i}': [i] for i in range(25)})
+    browser = WindowedDatasetBrowser(dataset, page_size=10)
+    assert browser.num_pages == 3
+    assert browser.url is None
+
+    first_page = browser.render_index_page(0)
+    assert '<a href="/item/0">0. file_0</a>' in first_page
+    assert '<a href="/item/9">9. file_9</a>' in first_page
+    assert 'file_10' not in first_page
+    assert 'Previous' not in first_page
+    assert '<a href="/page/1">' in first_page
+
+    last_page = browser.render_index_page(2)
+    assert '<a href="/item/24">24. file_24</a>' in last_page
+    assert 'file_19' not in last_page
+    assert '<a href="/page/1">' in last_page
+    assert 'Next' not in last_page
+    assert '>24<' in last_page  # Row numbers continue from previous pages
+
+    item_page = browser.render_item_page(12)
+    assert '12' in item_page
+    assert '<a href="/page/1">' in item_page
+
+    with pytest.raises(IndexError):
+        browser.render_index_page(3)
+
+    with pytest.raises(IndexError):
+        browser.render_item_page(25)
+
+
+def test_windowed_dataset_browser_server() -> None:
+    dataset = Dataset[Model[list[int]]]({f'file_{i}': [i] for i in range(25)})
+    browser = WindowedDatasetBrowser(dataset, page_size=10)
+
+    url = browser.start()
+    try:
+        assert url == browser.url
+        assert url.startswith('http://127.0.0.1:')
+        assert browser.start() == url
+
+        assert 'file_0' in _get(url)
+        assert 'file_24' in _get(f'{url}page/2')
+        assert '<a href="/page/2">' in _get(f'{url}item/24')
+
+        dataset['file_24'] = [1000]
+        assert '1000' in _get(f'{url}item/24')
+
+        for path in ('page/3', 'item/25', 'other'):
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                _get(f'{url}{path}')
+            assert exc_info.value.code == 404
+    finally:
+        browser.stop()
+
+    assert browser.url is None
+
+
+def test_windowed_dataset_browser_renders_while_holding_render_lock() -> None:
+    dataset = Dataset[Model[list[int]]]({f'file_{i}': [i] for i in range(25)})
+    browser = WindowedDatasetBrowser(dataset, page_size=10)
+    pages: list[str] = []
+
+    url = browser.start()
+    try:
+        with render_lock:
+            thread = threading.Thread(target=lambda: pages.append(_get(f'{url}item/20')))
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive()
+
+            # Positional lookup reflects changes to the dataset made while the lock is held
+            del dataset['file_0']
+            dataset['file_25'] = [25]
+
+        thread.join()
+        assert '21' in pages[0]
+        assert 'file_25' in _get(f'{url}page/2')
+    finally:
+        browser.stop()
+
+
+def test_windowed_dataset_browser_pending_and_failed_items() -> None:
+    dataset = Dataset[Model[list[int]]]({'file_0': [0]})
+    dataset['pending'] = PendingData(job_name='my_task')
+    dataset['failed'] = FailedData(job_name='my_other_task', exception=RuntimeError('Oops <3'))
+    browser = WindowedDatasetBrowser(dataset, page_size=10)
+
+    url = browser.start()
+    try:
+        assert '<a href="/item/1">1. pending</a>' in _get(url)
+
+        pending_page = _get(f'{url}item/1')
+        assert 'my_task -&gt; Data pending...' in pending_page
+        assert '<a href="/page/0">' in pending_page
+
+        failed_page = _get(f'{url}item/2')
+        assert 'my_other_task -&gt; RuntimeError: Oops &lt;3' in failed_page
+        assert '<a href="/page/0">' in failed_page
+    finally:
+        browser.stop()
+
+
+def test_windowed_dataset_browser_rendering_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    dataset = Dataset[Model[list[int]]]({'file_0': [0]})
+    browser = WindowedDatasetBrowser(dataset, page_size=10)
+
+    def _fail(index: int) -> str:
+        raise ValueError('Cannot render')
+
+    monkeypatch.setattr(browser, 'render_item_page', _fail)
+
+    url = browser.start()
+    try:
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            _get(f'{url}item/0')
+        assert exc_info.value.code == 500
+
+        assert 'file_0' in _get(url)
+    finally:
+        browser.stop()
+
+
+def test_windowed_dataset_browser_max_running_servers() -> None:
+    dataset = Dataset[Model[list[int]]]({'file_0': [0]})
+    browsers = [WindowedDatasetBrowser(dataset, page_size=10) for _ in range(3)]
+
+    try:
+        for browser in browsers:
+            browser.start(max_running_servers=2)
+
+        assert running_windowed_browsers()[-2:] == tuple(browsers[1:])
+        assert browsers[0] not in running_windowed_browsers()
+        assert browsers[0].url is None
+        assert all(browser.url is not None for browser in browsers[1:])
+    finally:
+        stop_all_windowed_browsers()
+
+    assert running_windowed_browsers() == ()
+    assert all(browser.url is None for browser in browsers)
+
+
+def test_browse_large_dataset_windowed(runtime: Annotated[IsRuntime, pytest.fixture],
+                                       monkeypatch: pytest.MonkeyPatch) -> None:
+    opened_urls: list[str] = []
+    monkeypatch.setattr(webbrowser, 'open', lambda url, *args, **kwargs: opened_urls.append(url))
+    monkeypatch.setattr(display_mixins, 'running_in_interactive_session', lambda: True)
+
+    runtime.config.data.ui.browser.windowed_browse_min_items = 20
+    runtime.config.data.ui.browser.windowed_browse_page_size = 5
+
+    dataset = Dataset[Model[list[int]]]({f'file_{i}': [i] for i in range(20)})
+    dataset.browse(ui='terminal')
+
+    assert len(opened_urls) == 1
+    assert opened_urls[0].startswith('http://127.0.0.1:')
+    page = _get(opened_urls[0])
+    assert 'file_4' in page
+    assert 'file_5' not in page
+    assert '<a href="/page/1">' in page
+
+    stop_all_windowed_browsers()
+
+
+def test_browse_large_dataset_not_windowed_if_not_interactive(
+        runtime: Annotated[IsRuntime, pytest.fixture], monkeypatch: pytest.MonkeyPatch) -> None:
+    opened_urls: list[str] = []
+    monkeypatch.setattr(webbrowser, 'open', lambda url, *args, **kwargs: opened_urls.append(url))
+    monkeypatch.setattr(webbrowser, 'get', lambda *args, **kwargs: None)
+    monkeypatch.setattr(display_mixins, 'running_in_interactive_session', lambda: False)
+
+    runtime.config.data.ui.browser.windowed_browse_min_items = 2
+
+    dataset = Dataset[Model[list[int]]]({f'file_{i}': [i] for i in range(2)})
+    dataset.browse(ui='terminal')
+
+    assert running_windowed_browsers() == ()
+    assert len(opened_urls) == 3
+    assert all(url.startswith('file://') for url in opened_urls)
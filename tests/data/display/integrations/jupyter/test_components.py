@@ -0,0 +1,47 @@
+"""Tests for components."""
+
+import reacton
+import solara
+
+from omnipy.config.data import JupyterUserInterfaceConfig, LayoutConfig, TextConfig
+from omnipy.data._display.integrations.jupyter.components import ShowHtml
+
+
+def test_show_html_rerenders_panel_only_on_changes() -> None:
+    update_flag = solara.reactive(None)
+    jupyter_ui_config = solara.reactive(JupyterUserInterfaceConfig())
+    render_kwargs = []
+
+    def _render_panel(**kwargs):
+        render_kwargs.append(kwargs)
+        return 'rerendered'
+
+    @solara.component
+    def _ShowHtmlWithReactiveProps():
+        ShowHtml(
+            update_flag=update_flag.value,
+            jupyter_ui_config=jupyter_ui_config.value,
+            orig_jupyter_ui_config=JupyterUserInterfaceConfig(),
+            text_config=TextConfig(),
+            orig_text_config=TextConfig(),
+            layout_config=LayoutConfig(),
+            orig_layout_config=LayoutConfig(),
+            rendered_panel='rendered',
+            render_panel_method=_render_panel,
+            render_output_method=lambda panel: f'<pre>{panel}</pre>',
+            indent=2,
+        )
+
+    _, rc = reacton.render(_ShowHtmlWithReactiveProps(), handle_error=False)
+    assert render_kwargs == []
+
+    update_flag.value = True
+    assert render_kwargs == [{'indent': 2}]
+
+    jupyter_ui_config.value = JupyterUserInterfaceConfig()
+    assert len(render_kwargs) == 1
+
+    update_flag.value = False
+    assert len(render_kwargs) == 2
+
+    rc.close()
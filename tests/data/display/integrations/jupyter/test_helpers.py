@@ -1,11 +1,15 @@
 """Tests for helpers."""
 
+import asyncio
 from typing import Annotated
 
 import pytest
 
 from omnipy.config import ConfigBase
-from omnipy.data._display.integrations.jupyter.helpers import ReactiveConfigCopy
+from omnipy.config.data import JupyterUserInterfaceConfig
+from omnipy.data._display.integrations.jupyter.helpers import (CoalescingCaller,
+                                                               ReactiveConfigCopy,
+                                                               ReactiveObjects)
 
 
 class MyChildConfig(ConfigBase):
@@ -83,3 +87,124 @@ def test_reactive_config_copy_subscribe_with_set(
 
     assert reactive_config_copy.value.param1 == 'new value'
     assert reactive_config_copy.value.child.param2 == 5
+
+
+def test_coalescing_caller_without_running_event_loop() -> None:
+    calls: list[int] = []
+    coalescing_caller = CoalescingCaller(lambda: calls.append(len(calls)), update_delay_secs=0.01)
+
+    coalescing_caller()
+    coalescing_caller()
+
+    assert calls == [0, 1]
+
+
+def test_coalescing_caller_with_running_event_loop() -> None:
+    calls: list[int] = []
+
+    async def _call_in_bursts() -> None:
+        coalescing_caller = CoalescingCaller(
+            lambda: calls.append(len(calls)), update_delay_secs=0.01)
+
+        for _ in range(3):
+            coalescing_caller()
+        assert calls == []
+
+        await asyncio.sleep(0.05)
+        assert calls == [0]
+
+        coalescing_caller()
+        coalescing_caller.flush()
+        assert calls == [0, 1]
+
+        await asyncio.sleep(0.05)
+        assert calls == [0, 1]
+
+        coalescing_caller.update_delay_secs = 0
+        coalescing_caller()
+        assert calls == [0, 1, 2]
+
+    asyncio.run(_call_in_bursts())
+
+
+def test_coalescing_caller_after_event_loop_stopped_before_scheduled_call() -> None:
+    calls: list[int] = []
+    coalescing_caller = CoalescingCaller(lambda: calls.append(len(calls)), update_delay_secs=10)
+
+    async def _call() -> None:
+        coalescing_caller()
+
+    asyncio.run(_call())
+    assert calls == []
+
+    coalescing_caller()
+    assert calls == [0]
+
+    async def _call_and_wait() -> None:
+        coalescing_caller()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(_call())
+    coalescing_caller.update_delay_secs = 0.01
+    asyncio.run(_call_and_wait())
+    assert calls == [0, 1]
+
+
+def test_reactive_config_copy_coalesces_set(
+        parent: Annotated[MyParentConfig, pytest.fixture]) -> None:
+    async def _set_in_burst() -> None:
+        reactive_config_copy = ReactiveConfigCopy[MyConfig](parent.config, update_delay_secs=0.01)
+        parent.subscribe_attr('config', reactive_config_copy.set)
+
+        num_deepcopies = 0
+        orig_deepcopy = MyConfig.deepcopy
+
+        def _count_deepcopies(self, *args, **kwargs):
+            nonlocal num_deepcopies
+            num_deepcopies += 1
+            return orig_deepcopy(self, *args, **kwargs)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(MyConfig, 'deepcopy', _count_deepcopies)
+
+            parent.config.param1 = 'new value'
+            parent.config.child.param2 = 5
+            parent.config.param1 = 'newer value'
+
+            assert reactive_config_copy.value.param1 == 'test'
+            assert num_deepcopies == 0
+
+            await asyncio.sleep(0.05)
+
+            assert reactive_config_copy.value.param1 == 'newer value'
+            assert reactive_config_copy.value.child.param2 == 5
+            assert num_deepcopies == 1
+
+    asyncio.run(_set_in_burst())
+
+
+def test_reactive_objects_request_view_update() -> None:
+    reactive_objects = ReactiveObjects()
+    jupyter_ui_config = JupyterUserInterfaceConfig(reactive_update_delay_secs=0.01)
+    reactive_objects.set_update_delay_from_config(jupyter_ui_config)
+
+    async def _request_in_burst() -> None:
+        reactive_objects.request_view_update(1)
+        reactive_objects.request_view_update(2)
+        reactive_objects.request_view_update(1)
+        assert reactive_objects.obj_id_update_flags.value == {}
+
+        await asyncio.sleep(0.05)
+        assert reactive_objects.obj_id_update_flags.value == {1: True, 2: True}
+
+        reactive_objects.request_view_update(2)
+        await asyncio.sleep(0.05)
+        assert reactive_objects.obj_id_update_flags.value == {1: True, 2: False}
+
+    asyncio.run(_request_in_burst())
+
+    jupyter_ui_config.reactive_update_delay_secs = 0
+    reactive_objects.set_update_delay_from_config(jupyter_ui_config)
+
+    reactive_objects.request_view_update(1)
+    assert reactive_objects.obj_id_update_flags.value == {1: False, 2: False}
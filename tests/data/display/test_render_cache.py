@@ -0,0 +1,73 @@
+"""Tests for caching of rendered display output per content version."""
+
+from typing import Annotated
+
+import pytest
+
+from omnipy.data._mixins.display import _rendered_panel_cache
+from omnipy.data.dataset import Dataset
+from omnipy.data.model import Model
+
+
+def test_rendered_panel_cache_per_content_version(
+        capsys: Annotated[pytest.CaptureFixture[str], pytest.fixture]) -> None:
+    def _output() -> str:
+        return capsys.readouterr().out
+
+    _rendered_panel_cache.clear()
+    model = Model[list[int]](list(range(10)))
+    model.validate_content()  # Takes a snapshot, needed to verify that the content is unchanged
+
+    model.peek()
+    output = _output()
+    model.peek()
+    assert _output() == output
+    model.peek(width=20)
+    assert _output() != output
+    assert _rendered_panel_cache.cache_info().num_entries == 2
+
+    hits = _rendered_panel_cache.cache_info().hits
+    model.peek()
+    assert _output() == output
+    assert _rendered_panel_cache.cache_info().hits == hits + 1
+
+    model.append(10)
+    model.peek()
+    new_output = _output()
+    assert new_output != output
+    assert '10' in new_output
+    assert _rendered_panel_cache.cache_info().hits == hits + 1
+
+    dataset = Dataset[Model[list[int]]](a=[1, 2])
+    dataset.list()
+    output = _output()
+    dataset.list()
+    assert _output() == output
+
+    dataset['a'].append(3)
+    dataset.list()
+    assert _output() != output
+
+    _rendered_panel_cache.clear()
+
+
+def test_rendered_panel_cache_detects_in_place_changes(
+        capsys: Annotated[pytest.CaptureFixture[str], pytest.fixture]) -> None:
+    def _output() -> str:
+        return capsys.readouterr().out
+
+    _rendered_panel_cache.clear()
+    for validate in (False, True):
+        model = Model[list[list[int]]]([[1, 2], [3]])
+        if validate:
+            model.validate_content()
+
+        model.peek()
+        output = _output()
+        model.content[0].append(99)
+        model.peek()
+        new_output = _output()
+        assert new_output != output
+        assert '99' in new_output
+
+    _rendered_panel_cache.clear()
@@ -4,6 +4,7 @@ import os
 import re
 from textwrap import dedent
 from typing import Annotated, Any
+from unittest.mock import patch
 
 from attr import dataclass
 import pytest
@@ -17,8 +18,11 @@ from omnipy.data._display.dimensions import Dimensions
 from omnipy.data._display.frame import Frame
 from omnipy.data._display.panel.draft.base import DraftPanel
 from omnipy.data._display.panel.draft.text import ReflowedTextDraftPanel
-from omnipy.data._display.text.pretty import pretty_repr_of_draft_output
+from omnipy.data._display.text.pretty import content_cache_key, pretty_repr_of_draft_output
 import omnipy.data._display.text.pretty as pretty_module
+from omnipy.data._display.text.pretty_printer.base import StatsTighteningPrettyPrinter
+from omnipy.data._display.text.pretty_printer.compact_json import CompactJsonPrettyPrinter
+from omnipy.data._display.text.pretty_printer.rich import RichPrettyPrinter
 import omnipy.data._display.text.preview_pruning as preview_pruning_module
 from omnipy.data.model import Model
 from omnipy.shared.enums.display import PrettyPrinterLib, SyntaxLanguageSpec
@@ -77,6 +81,15 @@ def _assert_pretty_repr_of_draft(
     out_draft_panel: ReflowedTextDraftPanel = pretty_repr_of_draft_output(in_draft_panel)
     output = out_draft_panel.content
 
+    # Searching for fitting stat requirements must give the same output as tightening the
+    # requirements one print at a time
+    with patch.object(pretty_module,
+                      '_search_width_reducing_stat_req',
+                      pretty_module._iteratively_reduce_width):
+        pretty_module._format_draft_panel_cache.clear()
+        iterated_draft_panel = pretty_repr_of_draft_output(in_draft_panel)
+    assert iterated_draft_panel.content == out_draft_panel.content
+
     if config:
         if config.printer is PrettyPrinterLib.DEVTOOLS:
             output = _remove_training_commas(output)
@@ -1148,3 +1161,69 @@ def test_pretty_repr_preview_pruning_prunes_growing_width_items(
 
     # Pruning should mean not all items are rendered
     assert max(_GrowingWidthItem.touched_indices) < len(content) - 1
+
+
+def test_content_cache_key() -> None:
+    model = Model[list[list[int]]]([[1, 2]])
+    assert content_cache_key(model) is None  # No snapshot to verify the content against
+
+    model.validate_content()
+    key = content_cache_key(model)
+    assert key is not None
+    assert content_cache_key(model) == key
+
+    model.append([3])
+    assert content_cache_key(model) not in (key, None)
+    other_model = Model[list[list[int]]]([[1, 2], [3]])
+    other_model.validate_content()
+    assert content_cache_key(other_model) != content_cache_key(model)
+
+    model.content[0].append(4)
+    assert content_cache_key(model) is None
+
+    assert content_cache_key('abc') == content_cache_key('abc')
+    assert content_cache_key(1) != content_cache_key(True)
+    assert content_cache_key([1, 2]) is None
+
+
+@pc.parametrize('pretty_printer_cls', [CompactJsonPrettyPrinter, RichPrettyPrinter])
+def test_pretty_repr_searches_for_fitting_stat_req(
+    monkeypatch: pytest.MonkeyPatch,
+    pretty_printer_cls: type[StatsTighteningPrettyPrinter],
+) -> None:
+    panel = DraftPanel(
+        [[{
+            f'key_{i}': list(range(i))
+        } for i in range(1, 30)]],
+        frame=Frame(Dimensions(30, 200), fixed_width=True, fixed_height=False),
+        config=OutputConfig(printer=pretty_printer_cls.get_pretty_printer_lib()),
+    )
+
+    num_prints = 0
+    original_print_draft_to_str = pretty_printer_cls.print_draft_to_str
+
+    def _count_prints(self, draft_panel):
+        nonlocal num_prints
+        num_prints += 1
+        return original_print_draft_to_str(self, draft_panel)
+
+    monkeypatch.setattr(pretty_printer_cls, 'print_draft_to_str', _count_prints)
+    monkeypatch.setattr(pretty_module,
+                        '_maybe_prune_draft_panel', lambda draft_panel, **kwargs: draft_panel)
+
+    def _pretty_repr_and_num_prints() -> tuple[ReflowedTextDraftPanel, int]:
+        nonlocal num_prints
+        num_prints = 0
+        pretty_module._format_draft_panel_cache.clear()
+        return pretty_repr_of_draft_output(panel), num_prints
+
+    searched_panel, num_searched_prints = _pretty_repr_and_num_prints()
+
+    monkeypatch.setattr(pretty_printer_cls, 'get_searchable_stat_req', lambda self, panel: None)
+    iterated_panel, num_iterated_prints = _pretty_repr_and_num_prints()
+
+    assert searched_panel.within_frame.width
+    assert searched_panel.content == iterated_panel.content
+    assert num_searched_prints <= num_iterated_prints
+    if pretty_printer_cls is CompactJsonPrettyPrinter:
+        assert num_searched_prints < num_iterated_prints
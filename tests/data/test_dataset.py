@@ -352,6 +352,28 @@ def test_get_item_with_int_and_slice() -> None:
            == Dataset[Model[int]](data_file_3=789)
 
 
+def test_selected_items_are_shared_without_revalidation() -> None:
+    dataset = Dataset[Model[list[int]]](a=[1], b=[2], c=[3])
+    subset = dataset[1:]
+
+    assert type(subset) is type(dataset)
+    assert subset.to_data() == dict(b=[2], c=[3])
+    assert subset['b'] is dataset['b']
+    assert dataset[['c', 'a']]['a'] is dataset['a']
+
+    subset['b'] = [4]
+    subset['d'] = [5]
+    del subset['c']
+    assert subset.to_data() == dict(b=[4], d=[5])
+    assert dataset.to_data() == dict(a=[1], b=[2], c=[3])
+
+    with pytest.raises(ValidationError):
+        subset['e'] = ['abc']
+
+    with pytest.raises(KeyError):
+        dataset[['a', 'x']]
+
+
 def test_get_items_with_tuple_or_list() -> None:
     dataset = Dataset[Model[int]](data_file_1=123, data_file_2=456, data_file_3=789)
 
@@ -376,6 +398,38 @@ def test_get_items_with_tuple_or_list() -> None:
         dataset[[0, 3]]
 
 
+def test_positional_key_index_follows_mutations() -> None:
+    dataset = Dataset[Model[int]](data_file_1=123, data_file_2=456, data_file_3=789)
+    assert dataset[0] == Model[int](123)
+
+    del dataset['data_file_1']
+    assert dataset[0] == Model[int](456)
+
+    dataset['data_file_1'] = 321
+    assert dataset[-1] == Model[int](321)
+    assert dataset[['data_file_2', 'data_file_1']].keys() == {'data_file_2', 'data_file_1'}
+
+    dataset[0:2] = {'a': 1, 'b': 2, 'c': 3}
+    assert list(dataset[1:].keys()) == ['b', 'c', 'data_file_1']
+
+    dataset.pop('b')
+    dataset.update(dict(d=4))
+    assert list(dataset[1:].keys()) == ['c', 'data_file_1', 'd']
+
+    dataset.data = {'x': Model[int](0)}
+    assert dataset[0] == Model[int](0)
+
+    # Changes bypassing validation are detected when the number of items or the first or last
+    # keys change
+    dataset.data['y'] = Model[int](1)
+    assert dataset[-1] == Model[int](1)
+
+    dataset.data.pop('x')
+    dataset.data['z'] = Model[int](2)
+    assert dataset[0] == Model[int](1)
+    assert dataset[-1] == Model[int](2)
+
+
 def test_set_item_with_int_and_slice() -> None:
     dataset = Dataset[Model[int]](data_file_1=123, data_file_2=456, data_file_3=789)
     dataset[0] = 321
@@ -0,0 +1,143 @@
+"""Tests for data-layer performance metrics."""
+
+from functools import lru_cache
+from typing import Annotated, Iterator
+
+import pytest
+
+from omnipy.data.dataset import Dataset
+from omnipy.data.metrics import data_metrics, DataMetrics, DESERIALIZE, SERIALIZE
+from omnipy.data.model import Model
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+from .helpers.mocks import MockNumberToTarFileSerializer, NumberDataset
+
+
+@pytest.fixture
+def enabled_metrics(runtime: Annotated[IsRuntime, pytest.fixture]) -> Iterator[DataMetrics]:
+    runtime.config.data.metrics.enabled = True
+    runtime.objects.metrics.reset()
+    yield runtime.objects.metrics
+    runtime.config.data.metrics.enabled = False
+    runtime.objects.metrics.reset()
+
+
+def test_metrics_enabled_through_runtime_config(
+        runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    assert runtime.objects.metrics is data_metrics
+    assert data_metrics.enabled is False
+
+    runtime.config.data.metrics.enabled = True
+    assert data_metrics.enabled is True
+    assert data_metrics.config is runtime.config.data.metrics
+
+    runtime.config.data.metrics.enabled = False
+    assert data_metrics.enabled is False
+
+
+def test_no_validation_metrics_when_disabled(runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    data_metrics.reset()
+
+    Model[int](42)
+    assert data_metrics.validation == {}
+    assert data_metrics.snapshot.count == 0
+
+
+def test_validation_metrics(enabled_metrics: Annotated[DataMetrics, pytest.fixture]) -> None:
+    class MyIntModel(Model[int]):
+        ...
+
+    model = MyIntModel(42)
+    model.validate_content()
+
+    stats = enabled_metrics.validation['MyIntModel']
+    assert stats.count >= 2
+    assert stats.total_secs > 0
+    assert stats.mean_secs == stats.total_secs / stats.count
+
+    enabled_metrics.reset()
+    assert enabled_metrics.validation == {}
+
+
+def test_snapshot_metrics(runtime: Annotated[IsRuntime, pytest.fixture],
+                          enabled_metrics: Annotated[DataMetrics, pytest.fixture]) -> None:
+    runtime.config.data.model.interactive = True
+
+    model = Model[list[int]](list(range(100)))
+    model.validate_content()
+
+    assert enabled_metrics.snapshot.count > 0
+    assert enabled_metrics.snapshot.total_bytes > 0
+
+    enabled_metrics.reset()
+    runtime.config.data.metrics.measure_snapshot_bytes = False
+
+    model.validate_content()
+    assert enabled_metrics.snapshot.count > 0
+    assert enabled_metrics.snapshot.total_bytes == 0
+
+
+def test_serialization_metrics(enabled_metrics: Annotated[DataMetrics, pytest.fixture]) -> None:
+    number_data = NumberDataset()
+    number_data['data_file_1'] = 35
+    number_data['data_file_2'] = 12
+
+    serializer = MockNumberToTarFileSerializer()
+    tarfile_bytes = serializer.serialize(number_data)
+    serializer.deserialize(tarfile_bytes)
+
+    serializer_stats = enabled_metrics.serialization['MockNumberToTarFileSerializer']
+    for direction in (SERIALIZE, DESERIALIZE):
+        assert serializer_stats[direction].count == 1
+        assert serializer_stats[direction].total_bytes == len(tarfile_bytes)
+        assert serializer_stats[direction].bytes_per_sec is not None
+
+
+def test_cache_metrics() -> None:
+    @lru_cache
+    def square(x: int) -> int:
+        return x * x
+
+    square(1)
+
+    metrics = DataMetrics()
+    metrics.register_cache('square', square.cache_info)
+    assert metrics.caches['square'].hits == 0
+    assert metrics.caches['square'].misses == 0
+    assert metrics.caches['square'].hit_ratio is None
+
+    square(1)
+    square(2)
+    square(2)
+    square(2)
+    assert metrics.caches['square'].hits == 3
+    assert metrics.caches['square'].misses == 1
+    assert metrics.caches['square'].hit_ratio == 0.75
+
+    metrics.reset()
+    assert metrics.caches['square'].hits == 0
+
+    square.cache_clear()
+    square(3)
+    assert metrics.caches['square'].misses == 1
+
+
+def test_export_metrics(enabled_metrics: Annotated[DataMetrics, pytest.fixture]) -> None:
+    class FirstModel(Model[str]):
+        ...
+
+    class SecondModel(Model[list[str]]):
+        ...
+
+    FirstModel('abc')
+    Dataset[SecondModel](a=['x'] * 1000)
+
+    exported = enabled_metrics.export()
+    assert set(exported) == {'validation', 'snapshot', 'serialization', 'caches'}
+    assert set(exported['validation']) >= {'FirstModel', 'SecondModel'}
+    assert exported['validation']['FirstModel']['count'] == 1
+    assert set(exported['validation']['FirstModel']) == {'count', 'total_secs', 'mean_secs'}
+    assert set(exported['snapshot']) == {'count', 'total_bytes', 'total_secs', 'bytes_per_sec'}
+
+    total_secs = [stats['total_secs'] for stats in exported['validation'].values()]
+    assert total_secs == sorted(total_secs, reverse=True)
@@ -538,6 +538,34 @@ def test_name_qualname_and_module() -> None:
             'tests.data.helpers.models')
 
 
+def test_specialization_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    from omnipy.data.helpers import specialization_cache, specialization_cache_key
+
+    model_cls = Model[list[int]]
+    assert specialization_cache[specialization_cache_key(Model, list[int])] is model_cls
+
+    prepare_calls = []
+    monkeypatch.setattr(Model,
+                        '_prepare_cls_members_to_mimic_model',
+                        lambda created_model: prepare_calls.append(created_model))
+
+    assert Model[list[int]] is model_cls
+    assert Model[(list[int],)] is model_cls
+    assert prepare_calls == []
+
+    for params, other_params in [(Literal[1], Literal[True]),
+                                 (int | str, str | int),
+                                 (list[int], List[int])]:
+        cache_key = specialization_cache_key(Model, params)
+        assert cache_key != specialization_cache_key(Model, other_params)
+    assert specialization_cache_key(Model, int) != specialization_cache_key(Model[list[T]], int)
+
+    assert specialization_cache_key(Model, 'NumberModel') is None
+    assert specialization_cache_key(Model, list[ForwardRef('NumberModel')]) is None
+    assert specialization_cache_key(Model, list[T]) is None
+    assert specialization_cache_key(Model, Annotated[int, []]) is None
+
+
 # TODO: Revisit test_name_qualname_reuse_typevar_known_issue with pydantic v2. Expected to change
 @pytest.mark.skipif(
     os.getenv('OMNIPY_FORCE_SKIPPED_TEST') != '1',
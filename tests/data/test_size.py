@@ -0,0 +1,156 @@
+"""Tests for content versions and cached deep-size accounting."""
+
+from typing import Annotated, Iterator
+
+import objsize
+import pytest
+
+from omnipy.data.dataset import Dataset
+from omnipy.data.model import Model
+from omnipy.data.size import deep_size_accountant, DeepSize, DeepSizeAccountant
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+
+@pytest.fixture
+def size_accountant() -> Iterator[DeepSizeAccountant]:
+    size_accountant = DeepSizeAccountant(sampling_threshold=100, num_samples=10)
+    yield size_accountant
+    size_accountant.clear()
+
+
+def test_model_content_version() -> None:
+    model = Model[list[int]]([1, 2])
+    version = model.content_version
+    assert model.content_version == version
+
+    model.append(3)
+    assert model.content_version > version
+
+    version = model.content_version
+    model.content = [4, 5]
+    assert model.content_version > version
+
+    version = model.content_version
+    with pytest.raises(ValueError):
+        model.append('abc')
+    assert model.content_version > version
+
+    assert Model[list[int]]([4, 5]).content_version != model.content_version
+
+
+def test_model_content_version_kept_when_revalidating_unchanged_content(
+        runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    model = Model[list[int]]([1, 2])
+    model.validate_content()
+    version = model.content_version
+
+    model.validate_content()
+    if runtime.config.data.model.interactive:
+        assert model.content_version == version
+    else:  # Without snapshots, in-place changes of the content cannot be ruled out
+        assert model.content_version > version
+
+    version = model.content_version
+    model.content.append(3)
+    model.validate_content()
+    assert model.content_version > version
+
+
+def test_dataset_content_version() -> None:
+    dataset = Dataset[Model[list[int]]](a=[1], b=[2])
+    version = dataset.content_version
+
+    dataset['c'] = [3]
+    assert dataset.content_version > version
+
+    version = dataset.content_version
+    del dataset['c']
+    assert dataset.content_version > version
+
+    version = dataset.content_version
+    dataset['a'].append(4)
+    assert dataset.content_version > version
+
+    version = dataset.content_version
+    dataset.data = {'d': Model[list[int]]([5])}
+    assert dataset.content_version > version
+
+    other_dataset = Dataset[Model[list[int]]](d=dataset['d'])
+    dataset['d'].append(6)
+    assert dataset.content_version != other_dataset.content_version
+    assert dataset.content_version > dataset['d'].content_version
+    assert dataset.content_version == dataset.content_version
+
+
+def test_deep_size_cached_per_content_version(
+        size_accountant: Annotated[DeepSizeAccountant, pytest.fixture]) -> None:
+    model = Model[list[int]](list(range(10)))
+    deep_size = size_accountant.get_deep_size(model)
+
+    assert deep_size == DeepSize(objsize.get_deep_size(model))
+    assert not deep_size.estimated
+    assert size_accountant.cache_info().misses == 1
+
+    assert size_accountant.get_deep_size(model) is deep_size
+    assert size_accountant.cache_info().hits == 1
+
+    model.extend(range(10, 20))
+    new_deep_size = size_accountant.get_deep_size(model)
+    assert new_deep_size.num_bytes > deep_size.num_bytes
+    assert size_accountant.cache_info().misses == 2
+
+    dataset = Dataset[Model[list[int]]](a=model)
+    dataset_deep_size = size_accountant.get_deep_size(dataset)
+    dataset['a'].append(20)
+    assert size_accountant.get_deep_size(dataset).num_bytes > dataset_deep_size.num_bytes
+
+    plain_list = list(range(10))
+    assert size_accountant.get_deep_size(plain_list) == DeepSize(objsize.get_deep_size(plain_list))
+    assert size_accountant.cache_info().misses == 4
+
+
+def test_deep_size_estimated_for_large_containers(
+        size_accountant: Annotated[DeepSizeAccountant, pytest.fixture]) -> None:
+    model = Model[list[str]]([f'item_{i:04d}' for i in range(1000)])
+    deep_size = size_accountant.get_deep_size(model)
+    assert deep_size.estimated
+    assert deep_size.num_bytes == pytest.approx(objsize.get_deep_size(model), rel=0.01)
+
+    model = Model[dict[str, int]]({f'key_{i:04d}': i * 1000 for i in range(1000)})
+    deep_size = size_accountant.get_deep_size(model)
+    assert deep_size.estimated
+    assert deep_size.num_bytes == pytest.approx(objsize.get_deep_size(model), rel=0.05)
+
+    dataset = Dataset[Model[list[int]]]({f'file_{i}': [i * 1000] for i in range(1000)})
+    deep_size = size_accountant.get_deep_size(dataset)
+    assert deep_size.estimated
+    assert deep_size.num_bytes == pytest.approx(objsize.get_deep_size(dataset), rel=0.05)
+
+    small_model = Model[list[int]](list(range(100)))
+    assert not size_accountant.get_deep_size(small_model).estimated
+
+
+def test_dataset_list_sizes_cached(runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    runtime.objects.metrics.reset()
+    dataset = Dataset[Model[list[int]]](a=[1, 2], b=[3])
+
+    dataset.list()
+    assert runtime.objects.metrics.caches['deep_size'].misses == 2
+    assert runtime.objects.metrics.caches['deep_size'].hits == 0
+
+    dataset.list()
+    assert runtime.objects.metrics.caches['deep_size'].misses == 2
+    assert runtime.objects.metrics.caches['deep_size'].hits == 2
+
+    dataset['a'].append(4)
+    dataset.list()
+    assert runtime.objects.metrics.caches['deep_size'].misses == 3
+    assert runtime.objects.metrics.caches['deep_size'].hits == 3
+
+    # Only the written item is validated, so that the sizes of the other items are still cached
+    dataset['c'] = [5, 6]
+    dataset.list()
+    assert runtime.objects.metrics.caches['deep_size'].misses == 4
+    assert runtime.objects.metrics.caches['deep_size'].hits == 5
+
+    deep_size_accountant.clear()
@@ -7,7 +7,7 @@ from typing import Generic
 
 import pytest
 
-from omnipy.data.snapshot import SnapshotHolder, SnapshotWrapper
+from omnipy.data.snapshot import ContentVersions, SnapshotHolder, SnapshotWrapper
 from omnipy.shared.protocols.data import ContentT, HasContent, IsSnapshotHolder
 import omnipy.util.pydantic as pyd
 from omnipy.util.setdeque import SetDeque
@@ -91,6 +91,31 @@ def test_snapshot_holder_all_are_empty_and_clear() -> None:
     assert snapshot_holder.all_are_empty()
 
 
+def test_content_versions() -> None:
+    content_versions = ContentVersions[MyList]()
+    my_list = MyList([123, 234])
+    my_other_list = MyList([123, 234])
+
+    assert my_list not in content_versions
+    version = content_versions.get_version(my_list)
+    assert my_list in content_versions
+    assert content_versions.get_version(my_list) == version
+
+    other_version = content_versions.get_version(my_other_list)
+    assert other_version > version
+
+    new_version = content_versions.bump(my_list)
+    assert new_version > other_version
+    assert content_versions.get_version(my_list) == new_version
+
+    other_content_versions = ContentVersions[MyList]()
+    assert other_content_versions.get_version(my_list) > new_version
+
+    del my_list
+    gc.collect()
+    assert len(content_versions) == 1
+
+
 # TODO: Refactor into smaller tests
 def test_snapshots() -> None:
     snapshot_holder = SnapshotHolder[MyList | MyDict, list | dict]()
@@ -8,7 +8,8 @@ from typing import Annotated
 
 import pytest
 
-from omnipy.hub._registry import RunStateRegistry
+from omnipy.config.registry import RunStateRegistryConfig
+from omnipy.hub._registry import RUN_SECS_HISTOGRAM_BOUNDS, RunStateRegistry
 from omnipy.shared.enums.job import RunState
 from omnipy.shared.protocols.compute.job import IsDagFlow, IsTask
 from omnipy.shared.protocols.hub.runtime import IsRuntime
@@ -303,3 +304,118 @@ def test_state_change_logging(
         assert log_lines[5].endswith(f'INFO: '
                                      f'Finished running "{job_b.unique_name}"! '
                                      f'(omnipy.hub._registry.RunStateRegistry)')
+
+
+def _run_jobs(registry: RunStateRegistry, *jobs: IsTask, finish: bool = True) -> None:
+    for state in (RunState.INITIALIZED, RunState.RUNNING, RunState.FINISHED):
+        if state != RunState.FINISHED or finish:
+            for job in jobs:
+                registry.set_job_state(job, state)
+
+
+def test_job_stats(
+    task_template_a: Annotated[MockTaskTemplate, pytest.fixture],
+    task_template_b: Annotated[MockTaskTemplate, pytest.fixture],
+):
+    registry = RunStateRegistry()
+    assert registry.all_job_stats() == {}
+
+    with pytest.raises(KeyError):
+        registry.get_job_stats('a')
+
+    task_b = task_template_b.apply()
+    _run_jobs(registry, task_template_a.apply(), task_template_a.apply())
+    _run_jobs(registry, task_b, task_template_a.apply(), finish=False)
+
+    assert list(registry.all_job_stats()) == ['a', 'b']
+
+    stats_a = registry.get_job_stats('a')
+    assert stats_a.state_counts == {
+        RunState.INITIALIZED: 3, RunState.RUNNING: 3, RunState.FINISHED: 2
+    }
+    assert stats_a.num_finished == 2
+    assert stats_a.num_unfinished == 1
+    assert stats_a.num_evicted == 0
+    assert len(stats_a.run_secs_histogram) == len(RUN_SECS_HISTOGRAM_BOUNDS) + 1
+    assert sum(stats_a.run_secs_histogram) == 2
+
+    assert stats_a.min_run_secs is not None and stats_a.max_run_secs is not None
+    assert 0 <= stats_a.min_run_secs <= stats_a.max_run_secs < 1
+    assert stats_a.mean_run_secs == stats_a.total_run_secs / 2
+
+    registry.set_job_state(task_b, RunState.FINISHED)
+    stats_b = registry.get_job_stats('b')
+    assert stats_b.num_finished == 1
+    assert stats_b.num_unfinished == 0
+    assert stats_b.min_run_secs == stats_b.max_run_secs == stats_b.total_run_secs
+
+
+def test_retention_max_jobs(task_template_a: Annotated[MockTaskTemplate, pytest.fixture]):
+    registry = RunStateRegistry()
+    registry.set_config(RunStateRegistryConfig(max_jobs=2))
+
+    jobs = [task_template_a.apply() for _ in range(4)]
+    _run_jobs(registry, jobs[0])
+    _run_jobs(registry, jobs[1])
+    _run_jobs(registry, jobs[2])
+    assert registry.all_jobs() == (jobs[1], jobs[2])
+    assert registry.all_jobs(RunState.FINISHED) == (jobs[1], jobs[2])
+
+    with pytest.raises(KeyError):
+        registry.get_job_state(jobs[0])
+
+    with pytest.raises(KeyError):
+        registry.get_job_state_datetime(jobs[0], RunState.FINISHED)
+
+    # Unfinished jobs are never evicted
+    _run_jobs(registry, jobs[3], finish=False)
+    registry.config.max_jobs = 0
+    registry.set_config(registry.config)
+    assert registry.all_jobs() == (jobs[3],)
+
+    stats = registry.get_job_stats('a')
+    assert stats.num_finished == 3
+    assert stats.num_evicted == 3
+    assert sum(stats.run_secs_histogram) == 3
+
+
+def test_retention_max_age(task_template_a: Annotated[MockTaskTemplate, pytest.fixture]):
+    registry = RunStateRegistry()
+    registry.set_config(RunStateRegistryConfig(max_age_secs=60))
+
+    jobs = [task_template_a.apply() for _ in range(3)]
+    _run_jobs(registry, *jobs)
+    assert registry.all_jobs() == tuple(jobs)
+
+    sleep(0.001)
+    registry.set_config(RunStateRegistryConfig(max_age_secs=0))
+    assert registry.all_jobs() == ()
+    assert registry.get_job_stats('a').num_evicted == 3
+
+
+def test_retention_keep_failed_only(task_template_a: Annotated[MockTaskTemplate, pytest.fixture]):
+    registry = RunStateRegistry()
+    registry.set_config(RunStateRegistryConfig(keep_failed_only=True))
+
+    failed_job = task_template_a.apply()
+    _run_jobs(registry, failed_job, finish=False)
+    _run_jobs(registry, task_template_a.apply(), task_template_a.apply())
+
+    assert registry.all_jobs() == (failed_job,)
+    assert registry.all_jobs(RunState.FINISHED) == ()
+    assert registry.get_job_stats('a').num_unfinished == 1
+
+
+def test_disable_state_change_logging(
+    runtime: Annotated[IsRuntime, pytest.fixture],
+    task_a: Annotated[IsTask, pytest.fixture],
+):
+    my_stdout = StringIO()
+    runtime.config.root_log.stdout = my_stdout
+
+    registry = RunStateRegistry()
+    registry.set_config(RunStateRegistryConfig(log_state_changes=False))
+    registry.set_job_state(task_a, RunState.INITIALIZED)
+
+    assert registry.get_job_state(task_a) == RunState.INITIALIZED
+    assert read_log_lines_from_stream(my_stdout) == []
@@ -11,15 +11,19 @@ import pytest
 import pytest_cases as pc
 
 from omnipy.components.prefect.engine.prefect import PrefectEngine
+from omnipy.components.remote.session_pool import HttpSessionPool
 from omnipy.compute._job import JobBase
 from omnipy.compute._job_creator import JobCreator
 from omnipy.config.data import (BrowserUserInterfaceConfig,
                                 ColorConfig,
                                 DataConfig,
+                                HttpCacheConfig,
                                 HttpConfig,
+                                HttpPoolConfig,
                                 HttpRequestsConfig,
                                 JupyterUserInterfaceConfig,
                                 LayoutConfig,
+                                MetricsConfig,
                                 ModelConfig,
                                 OverflowConfig,
                                 TerminalUserInterfaceConfig,
@@ -30,16 +34,20 @@ from omnipy.config.job import (JobConfig,
                                LocalOutputStorageConfig,
                                OutputStorageConfig,
                                S3OutputStorageConfig)
+from omnipy.config.registry import RunStateRegistryConfig
 from omnipy.config.root_log import RootLogConfig
+from omnipy.config.tracing import TracingConfig
 from omnipy.data._data_class_creator import DataClassBase, DataClassCreator
 from omnipy.data._display.integrations.jupyter.helpers import ReactiveConfigCopy, ReactiveObjects
+from omnipy.data.metrics import DataMetrics
 from omnipy.data.serializer import SerializerRegistry
 from omnipy.engine.local import LocalRunner
 from omnipy.hub._registry import RunStateRegistry
 from omnipy.hub.log._root_log import RootLogObjects
 from omnipy.hub.runtime import RuntimeConfig, RuntimeObjects
+from omnipy.hub.tracing import Tracer
 from omnipy.shared.enums.colorstyles import RecommendedColorStyles
-from omnipy.shared.enums.data import BackoffStrategy
+from omnipy.shared.enums.data import BackoffStrategy, HttpCacheMode
 from omnipy.shared.enums.display import (DisplayColorSystem,
                                          DisplayDimensionsUpdateMode,
                                          HorizontalOverflowMode,
@@ -51,7 +59,8 @@ from omnipy.shared.enums.display import (DisplayColorSystem,
 from omnipy.shared.enums.job import (ConfigOutputStorageProtocolOptions,
                                      ConfigPersistOutputsOptions,
                                      ConfigRestoreOutputsOptions,
-                                     EngineChoice)
+                                     EngineChoice,
+                                     TraceFileFormat)
 from omnipy.shared.enums.ui import (JupyterInBrowserUserInterfaceType,
                                     PlainTerminalUserInterfaceType,
                                     SpecifiedUserInterfaceType)
@@ -88,6 +97,7 @@ def _assert_runtime_config_default(config: IsRuntimeConfig, dir_path: Path):
     assert config.data.ui.jupyter.width == 112
     assert config.data.ui.jupyter.height == 48
     assert config.data.ui.jupyter.dims_mode == DisplayDimensionsUpdateMode.AUTO
+    assert config.data.ui.jupyter.reactive_update_delay_secs == 0.05
     assert isinstance(config.data.ui.jupyter.color, ColorConfig)
     assert config.data.ui.jupyter.color.system is DisplayColorSystem.ANSI_RGB
     assert config.data.ui.jupyter.color.style \
@@ -98,6 +108,9 @@ def _assert_runtime_config_default(config: IsRuntimeConfig, dir_path: Path):
     assert isinstance(config.data.ui.browser, BrowserUserInterfaceConfig)
     assert config.data.ui.browser.width == 160
     assert config.data.ui.browser.height is None
+    assert config.data.ui.browser.windowed_browse_min_items == 1000
+    assert config.data.ui.browser.windowed_browse_page_size == 100
+    assert config.data.ui.browser.windowed_browse_max_servers == 4
     assert not hasattr(config.data.ui.browser, 'dims_mode')
     assert isinstance(config.data.ui.browser.color, ColorConfig)
     assert config.data.ui.browser.color.system is DisplayColorSystem.ANSI_RGB
@@ -139,11 +152,16 @@ def _assert_runtime_config_default(config: IsRuntimeConfig, dir_path: Path):
     assert config.data.model.interactive is True
     assert config.data.model.dynamically_convert_elements_to_models is False
 
+    assert isinstance(config.data.metrics, MetricsConfig)
+    assert config.data.metrics.enabled is False
+    assert config.data.metrics.measure_snapshot_bytes is True
+
     assert isinstance(config.data.http, HttpConfig)
 
     assert isinstance(config.data.http.defaults, HttpRequestsConfig)
     assert config.data.http.defaults.requests_per_time_period == 60
     assert config.data.http.defaults.time_period_in_secs == 60
+    assert config.data.http.defaults.adaptive_rate_limiting is False
     assert config.data.http.defaults.retry_http_statuses == (408, 425, 429, 500, 502, 503, 504)
     assert config.data.http.defaults.retry_attempts == 5
     assert config.data.http.defaults.retry_backoff_strategy is BackoffStrategy.EXPONENTIAL
@@ -153,12 +171,28 @@ def _assert_runtime_config_default(config: IsRuntimeConfig, dir_path: Path):
     assert isinstance(config.data.http.for_host['some_server.com'], HttpRequestsConfig)
     assert config.data.http.for_host['some_server.com'].requests_per_time_period == 60
     assert config.data.http.for_host['some_server.com'].time_period_in_secs == 60
+    assert config.data.http.for_host['some_server.com'].adaptive_rate_limiting is False
     assert config.data.http.for_host['some_server.com'].retry_http_statuses \
            == (408, 425, 429, 500, 502, 503, 504)
     assert config.data.http.for_host['some_server.com'].retry_attempts == 5
     assert config.data.http.for_host['some_server.com'].retry_backoff_strategy \
            is BackoffStrategy.EXPONENTIAL
 
+    assert isinstance(config.data.http.cache, HttpCacheConfig)
+    assert config.data.http.cache.mode is HttpCacheMode.OFF
+    assert config.data.http.cache.cache_dir_path is None
+    assert config.data.http.cache.max_size_in_bytes == 1024**3
+    assert config.data.http.cache.max_entry_size_in_bytes == 128 * 1024**2
+
+    assert isinstance(config.data.http.pool, HttpPoolConfig)
+    assert config.data.http.pool.enabled is True
+    assert config.data.http.pool.max_connections == 100
+    assert config.data.http.pool.max_connections_per_host == 10
+    assert config.data.http.pool.keepalive_timeout_secs == 30.0
+    assert config.data.http.pool.dns_cache_ttl_secs == 300
+
+    assert config.data.http.download_dir_path is None
+
     # engine
     assert isinstance(config.engine, EngineConfig)
 
@@ -179,6 +213,7 @@ def _assert_runtime_config_default(config: IsRuntimeConfig, dir_path: Path):
            ConfigRestoreOutputsOptions.DISABLED
     assert config.job.output_storage.protocol is \
            ConfigOutputStorageProtocolOptions.LOCAL
+    assert config.job.output_storage.prefer_parquet is False
 
     assert isinstance(config.job.output_storage.local, LocalOutputStorageConfig)
     assert config.job.output_storage.local.persist_data_dir_path == str(dir_path / 'outputs')
@@ -190,6 +225,21 @@ def _assert_runtime_config_default(config: IsRuntimeConfig, dir_path: Path):
     assert config.job.output_storage.s3.access_key == ''
     assert config.job.output_storage.s3.secret_key == ''
 
+    # registry
+    assert isinstance(config.registry, RunStateRegistryConfig)
+    assert config.registry.max_jobs is None
+    assert config.registry.max_age_secs is None
+    assert config.registry.keep_failed_only is False
+    assert config.registry.log_state_changes is True
+
+    # tracing
+    assert isinstance(config.tracing, TracingConfig)
+    assert config.tracing.enabled is False
+    assert config.tracing.trace_file_path == str(dir_path / 'traces' / 'omnipy_trace.json')
+    assert config.tracing.trace_file_format is TraceFileFormat.CHROME
+    assert config.tracing.export_at_exit is True
+    assert config.tracing.max_spans == 100_000
+
     # root_log
     assert isinstance(config.root_log, RootLogConfig)
     assert config.root_log.log_format_str \
@@ -233,6 +283,9 @@ def _assert_runtime_objects_default(
     assert isinstance(objects.prefect, PrefectEngine)
     assert isinstance(objects.registry, RunStateRegistry)
     assert isinstance(objects.serializers, SerializerRegistry)
+    assert isinstance(objects.metrics, DataMetrics)
+    assert isinstance(objects.tracer, Tracer)
+    assert isinstance(objects.http_session_pool, HttpSessionPool)
 
     assert isinstance(objects.root_log, RootLogObjects)
 
@@ -354,6 +407,38 @@ def test_init_runtime_config_after_job_creator(
             ('config',),
             False,
         ),
+        (
+            ('config', 'registry'),
+            RunStateRegistryConfig,
+            ('objects', 'registry'),
+            RunStateRegistry,
+            ('config',),
+            False,
+        ),
+        (
+            ('config', 'data', 'metrics'),
+            MetricsConfig,
+            ('objects', 'metrics'),
+            DataMetrics,
+            ('config',),
+            False,
+        ),
+        (
+            ('config', 'data', 'http'),
+            HttpConfig,
+            ('objects', 'http_session_pool'),
+            HttpSessionPool,
+            ('config',),
+            False,
+        ),
+        (
+            ('config', 'tracing'),
+            TracingConfig,
+            ('objects', 'tracer'),
+            Tracer,
+            ('config',),
+            False,
+        ),
         (
             ('config', 'root_log'),
             RootLogConfig,
@@ -430,6 +515,10 @@ def test_init_runtime_config_after_job_creator(
     ids=[
         'config->data => objects->data_class_creator',
         'config->job => objects->job_creator',
+        'config->registry => objects->registry',
+        'config.data->metrics => objects->metrics',
+        'config.data->http => objects->http_session_pool',
+        'config->tracing => objects->tracer',
         'config->root_log => objects->root_log',
         'config.data.ui->jupyter => objects->reactive->jupyter_ui_config',
         'config.data.ui->text => objects->reactive->text_config',
@@ -0,0 +1 @@
+"""Test package for hub tracing."""
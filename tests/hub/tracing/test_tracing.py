@@ -0,0 +1,355 @@
+"""Tests for span-based tracing and trace file export."""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Annotated, Coroutine, Iterator
+
+import pytest
+
+from omnipy.compute.flow import LinearFlowTemplate
+from omnipy.compute.task import TaskTemplate
+from omnipy.data.dataset import Dataset
+from omnipy.data.model import Model
+from omnipy.hub.tracing import Tracer, tracer
+from omnipy.shared.enums.job import ConfigPersistOutputsOptions, EngineChoice, TraceFileFormat
+from omnipy.shared.protocols.hub.runtime import IsRuntime
+
+
+@pytest.fixture
+def enabled_tracer(runtime: Annotated[IsRuntime, pytest.fixture]) -> Iterator[Tracer]:
+    runtime.config.engine.choice = EngineChoice.LOCAL
+    runtime.config.job.output_storage.persist_outputs = ConfigPersistOutputsOptions.DISABLED
+    runtime.config.tracing.export_at_exit = False
+    runtime.config.tracing.enabled = True
+    tracer.reset()
+    yield tracer
+    runtime.config.tracing.enabled = False
+    tracer.reset()
+
+
+def _spans_by_name(tracer: Tracer) -> dict:
+    return {span.name: span for span in tracer.spans}
+
+
+def test_tracing_enabled_through_runtime_config(
+        runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    assert runtime.objects.tracer is tracer
+    assert tracer.enabled is False
+
+    def _func() -> int:
+        return 42
+
+    assert tracer.start_span('span', 'test') is None
+    assert tracer.wrap_call(_func, 'span', 'test') is _func
+    with tracer.span('span', 'test') as span:
+        assert span is None
+    assert tracer.spans == ()
+
+    runtime.config.tracing.export_at_exit = False
+    runtime.config.tracing.enabled = True
+    assert tracer.enabled is True
+    assert tracer.config is runtime.config.tracing
+
+    runtime.config.tracing.enabled = False
+    assert tracer.enabled is False
+
+
+def test_nested_spans(enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    with enabled_tracer.span('outer', 'test', size=3) as outer:
+        with enabled_tracer.span('inner', 'test') as inner:
+            leaf = enabled_tracer.start_span('leaf', 'test')
+            enabled_tracer.end_span(leaf)
+
+    with pytest.raises(ValueError):
+        with enabled_tracer.span('failing', 'test'):
+            raise ValueError('Failed')
+
+    assert outer is not None and inner is not None and leaf is not None
+    assert [span.name for span in enabled_tracer.spans] == ['leaf', 'inner', 'outer', 'failing']
+    assert outer.parent_id is None
+    assert inner.parent_id == outer.span_id
+    assert leaf.parent_id == inner.span_id
+    assert outer.trace_id == inner.trace_id == leaf.trace_id
+    assert outer.attributes == {'size': 3}
+    assert outer.start_ns <= inner.start_ns <= leaf.start_ns
+    assert leaf.end_ns <= inner.end_ns <= outer.end_ns  # type: ignore[operator]
+
+    failing = enabled_tracer.spans[-1]
+    assert failing.parent_id is None
+    assert failing.trace_id != outer.trace_id
+    assert failing.attributes['error'] == 'ValueError: Failed'
+
+
+def test_wrap_call_and_awaitables(enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    def _numbers():
+        yield 1
+        yield 2
+
+    async def _sleep_and_return(number: int) -> int:
+        await asyncio.sleep(0.01)
+        return number
+
+    async def _gather() -> list[int]:
+        return await asyncio.gather(
+            enabled_tracer.wrap_awaitable(_sleep_and_return(1), 'first', 'test'),
+            enabled_tracer.wrap_awaitable(_sleep_and_return(2), 'second', 'test'),
+        )
+
+    numbers = enabled_tracer.wrap_call(_numbers, 'generator', 'test')()
+    assert enabled_tracer.spans == ()
+    assert list(numbers) == [1, 2]
+    assert [span.name for span in enabled_tracer.spans] == ['generator']
+
+    enabled_tracer.reset()
+    traced_gather = enabled_tracer.wrap_call(_gather, 'gather', 'test')
+    assert asyncio.run(traced_gather()) == [1, 2]
+
+    spans = _spans_by_name(enabled_tracer)
+    assert set(spans) == {'gather', 'first', 'second'}
+    assert spans['first'].parent_id == spans['gather'].span_id
+    assert spans['second'].parent_id == spans['gather'].span_id
+    assert len({span.track_id for span in spans.values()}) == 3
+    assert spans['first'].start_ns < spans['second'].end_ns  # type: ignore[operator]
+    assert spans['second'].start_ns < spans['first'].end_ns  # type: ignore[operator]
+
+
+def test_wrap_call_returning_coroutines_and_tasks(
+        enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    async def _sleep_and_return(number: int) -> int:
+        with enabled_tracer.span('inner', 'test'):
+            await asyncio.sleep(0.01)
+        return number
+
+    def _create_coroutine() -> Coroutine[object, object, int]:
+        return _sleep_and_return(1)
+
+    def _create_task() -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(_sleep_and_return(2))
+
+    traced_create_coroutine = enabled_tracer.wrap_call(_create_coroutine, 'coroutine', 'test')
+    assert asyncio.run(traced_create_coroutine()) == 1
+
+    assert [span.name for span in enabled_tracer.spans] == ['inner', 'coroutine']
+    inner, coroutine = enabled_tracer.spans
+    assert inner.parent_id == coroutine.span_id
+
+    enabled_tracer.reset()
+    traced_create_task = enabled_tracer.wrap_call(_create_task, 'task', 'test')
+
+    async def _run_task() -> int:
+        task = traced_create_task()
+        assert isinstance(task, asyncio.Task)
+        assert enabled_tracer.spans == ()
+        return await task
+
+    assert asyncio.run(_run_task()) == 2
+
+    spans = _spans_by_name(enabled_tracer)
+    assert set(spans) == {'inner', 'task'}
+    assert spans['inner'].parent_id == spans['task'].span_id
+    assert spans['inner'].end_ns <= spans['task'].end_ns  # type: ignore[operator]
+
+
+def test_wrap_call_generators_trace_iteration(
+        enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    def _numbers():
+        for number in range(3):
+            with enabled_tracer.span(f'step_{number}', 'test'):
+                pass
+            yield number
+
+    def _failing_numbers():
+        yield 1
+        raise ValueError('Failed')
+
+    async def _async_numbers():
+        for number in range(2):
+            with enabled_tracer.span(f'async_step_{number}', 'test'):
+                await asyncio.sleep(0)
+            yield number
+
+    async def _collect() -> list[int]:
+        return [number async for number in async_numbers]
+
+    numbers = enabled_tracer.wrap_call(_numbers, 'generator', 'test')()
+    assert next(numbers) == 0
+    assert next(numbers) == 1
+    numbers.close()
+
+    spans = _spans_by_name(enabled_tracer)
+    assert set(spans) == {'step_0', 'step_1', 'generator'}
+    assert spans['step_0'].parent_id == spans['generator'].span_id
+    assert spans['step_1'].parent_id == spans['generator'].span_id
+    assert spans['step_1'].end_ns <= spans['generator'].end_ns  # type: ignore[operator]
+    assert not spans['generator'].failed
+
+    enabled_tracer.reset()
+    failing_numbers = enabled_tracer.wrap_call(_failing_numbers, 'failing', 'test')()
+    with pytest.raises(ValueError):
+        list(failing_numbers)
+    assert enabled_tracer.spans[0].attributes['error'] == 'ValueError: Failed'
+
+    enabled_tracer.reset()
+    async_numbers = enabled_tracer.wrap_call(_async_numbers, 'async_generator', 'test')()
+    assert asyncio.run(_collect()) == [0, 1]
+
+    spans = _spans_by_name(enabled_tracer)
+    assert set(spans) == {'async_step_0', 'async_step_1', 'async_generator'}
+    assert spans['async_step_0'].parent_id == spans['async_generator'].span_id
+    assert spans['async_step_1'].parent_id == spans['async_generator'].span_id
+
+
+def test_max_spans(runtime: Annotated[IsRuntime, pytest.fixture],
+                   enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    assert runtime.config.tracing.max_spans == 100_000
+
+    for number in range(5):
+        with enabled_tracer.span(f'span_{number}', 'test'):
+            pass
+
+    runtime.config.tracing.max_spans = 3
+    assert [span.name for span in enabled_tracer.spans] == ['span_2', 'span_3', 'span_4']
+    assert enabled_tracer.num_dropped_spans == 2
+
+    with enabled_tracer.span('span_5', 'test'):
+        pass
+    assert [span.name for span in enabled_tracer.spans] == ['span_3', 'span_4', 'span_5']
+    assert enabled_tracer.num_dropped_spans == 3
+
+    enabled_tracer.reset()
+    assert enabled_tracer.spans == ()
+    assert enabled_tracer.num_dropped_spans == 0
+
+
+def test_job_spans(enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    @TaskTemplate()
+    def plus_one(number: int) -> int:
+        return number + 1
+
+    @TaskTemplate(iterate_over_data_files=True)
+    def double(number: int) -> int:
+        return number * 2
+
+    @LinearFlowTemplate(plus_one, plus_one)
+    def plus_two(number: int) -> int:
+        ...
+
+    assert plus_two.run(1) == 3
+    assert double.run(Dataset[Model[int]](a=1, b=2)).to_data() == {'a': 2, 'b': 4}
+
+    job_spans = [span for span in enabled_tracer.spans if span.category == 'job']
+    assert len(job_spans) == 4
+
+    flow_span = next(span for span in job_spans if span.attributes['job_name'] == 'plus_two')
+    task_spans = [span for span in job_spans if span.attributes['job_name'] == 'plus_one']
+    assert len(task_spans) == 2
+    assert all(span.parent_id == flow_span.span_id for span in task_spans)
+    assert flow_span.attributes['engine'] == 'LocalRunner'
+
+    double_span = next(span for span in job_spans if span.attributes['job_name'] == 'double')
+    item_spans = [span for span in enabled_tracer.spans if span.category == 'iterate_item']
+    assert [span.name for span in item_spans] == ['a', 'b']
+    assert all(span.parent_id == double_span.span_id for span in item_spans)
+    assert all(span.attributes['job'] == double_span.name for span in item_spans)
+
+
+def test_async_iterate_item_spans(enabled_tracer: Annotated[Tracer, pytest.fixture]) -> None:
+    @TaskTemplate(iterate_over_data_files=True)
+    async def async_double(number: int) -> int:
+        await asyncio.sleep(0.01)
+        return number * 2
+
+    result = async_double.run(Dataset[Model[int]](a=1, b=2))
+    assert result.to_data() == {'a': 2, 'b': 4}
+
+    spans = _spans_by_name(enabled_tracer)
+    job_span = next(span for span in spans.values() if span.category == 'job')
+    assert spans['a'].parent_id == job_span.span_id
+    assert spans['b'].parent_id == job_span.span_id
+    assert spans['a'].track_id != spans['b'].track_id
+    assert spans['a'].start_ns < spans['b'].end_ns  # type: ignore[operator]
+
+
+def test_export_chrome_trace(enabled_tracer: Annotated[Tracer, pytest.fixture],
+                             runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    async def _child() -> None:
+        with enabled_tracer.span('child', 'test'):
+            await asyncio.sleep(0)
+
+    async def _parent() -> None:
+        with enabled_tracer.span('parent', 'test', size=2):
+            await asyncio.create_task(_child())
+
+    asyncio.run(_parent())
+
+    trace_file_path = enabled_tracer.export()
+    assert trace_file_path == runtime.config.tracing.trace_file_path
+
+    with open(trace_file_path) as trace_file:
+        trace = json.load(trace_file)
+
+    events = trace['traceEvents']
+    complete_events = {event['name']: event for event in events if event['ph'] == 'X'}
+    assert set(complete_events) == {'parent', 'child'}
+
+    parent, child = complete_events['parent'], complete_events['child']
+    assert parent['cat'] == 'test'
+    assert parent['args']['size'] == 2
+    assert parent['args']['parent_id'] is None
+    assert child['args']['parent_id'] == parent['args']['span_id']
+    assert parent['ts'] <= child['ts']
+    assert child['ts'] + child['dur'] <= parent['ts'] + parent['dur']
+    assert parent['tid'] != child['tid']
+
+    track_tids = {event['tid'] for event in events if event['ph'] == 'M'}
+    assert track_tids == {parent['tid'], child['tid']}
+
+    flow_events = {event['ph']: event for event in events if event['ph'] in ('s', 'f')}
+    assert flow_events['s']['tid'] == parent['tid']
+    assert flow_events['f']['tid'] == child['tid']
+    assert flow_events['s']['id'] == flow_events['f']['id']
+
+
+def test_export_otlp_json(enabled_tracer: Annotated[Tracer, pytest.fixture],
+                          tmp_path: Path) -> None:
+    with enabled_tracer.span('parent', 'test', size=2, ratio=0.5, done=True):
+        with pytest.raises(KeyError):
+            with enabled_tracer.span('child', 'http', url='https://example.com'):
+                raise KeyError('missing')
+
+    trace_file_path = enabled_tracer.export(
+        str(tmp_path / 'trace.json'), file_format=TraceFileFormat.OTLP_JSON)
+    with open(trace_file_path) as trace_file:
+        trace = json.load(trace_file)
+
+    spans = trace['resourceSpans'][0]['scopeSpans'][0]['spans']
+    child, parent = spans
+    assert parent['name'] == 'parent'
+    assert parent['parentSpanId'] == ''
+    assert child['parentSpanId'] == parent['spanId']
+    assert child['traceId'] == parent['traceId']
+    assert len(parent['traceId']) == 32
+    assert len(parent['spanId']) == 16
+    assert int(parent['startTimeUnixNano']) <= int(child['startTimeUnixNano'])
+
+    assert {
+        attr['key']: attr['value'] for attr in parent['attributes']
+    } == {
+        'omnipy.category': {
+            'stringValue': 'test'
+        },
+        'size': {
+            'intValue': '2'
+        },
+        'ratio': {
+            'doubleValue': 0.5
+        },
+        'done': {
+            'boolValue': True
+        },
+    }
+    assert 'status' not in parent
+    assert child['kind'] == 3
+    assert child['status']['code'] == 2
+    assert child['status']['message'] == "KeyError: 'missing'"
@@ -1,10 +1,15 @@
 """Tests for serialization."""
 
+from pathlib import Path
+import tarfile
 from typing import Annotated
 
 import pytest
 import pytest_cases as pc
 
+from omnipy.components.pandas.datasets import PandasDataset
+from omnipy.components.pandas.serializers import is_pyarrow_available
+from omnipy.compute.task import TaskTemplate
 from omnipy.shared.enums.job import (ConfigOutputStorageProtocolOptions,
                                      ConfigPersistOutputsOptions,
                                      ConfigRestoreOutputsOptions,
@@ -243,3 +248,21 @@ def test_persist_and_restore(
     dataset_restore = case_restore_tmpl.run()
 
     assert dataset_restore.to_data() == dataset_persist.to_data()
+
+
+@pytest.mark.skipif(not is_pyarrow_available(), reason='Requires the optional pyarrow package')
+def test_persist_pandas_outputs_as_parquet_if_preferred(
+        runtime: Annotated[IsRuntime, pytest.fixture]) -> None:
+    runtime.config.job.output_storage.prefer_parquet = True
+
+    @TaskTemplate(persist_outputs='enabled')
+    def make_table() -> PandasDataset:
+        return PandasDataset({'table': [{'a': 'abc', 'b': 12}]})
+
+    make_table.run()
+
+    persist_data_dir_path = Path(runtime.config.job.output_storage.local.persist_data_dir_path)
+    tar_file_paths = list(persist_data_dir_path.rglob('*.tar.gz'))
+    assert len(tar_file_paths) == 1
+    with tarfile.open(tar_file_paths[0], 'r:gz') as tarfile_obj:
+        assert tarfile_obj.getnames() == ['table.parquet']
@@ -1,7 +1,90 @@
 """Tests for omnipy."""
 
+from pathlib import Path
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+import omnipy
 from omnipy import __version__
 
 
 def test_version():
     assert __version__ == '0.23.1'
+
+
+def test_lazy_imports_cover_all() -> None:
+    lazy_imports = omnipy._get_lazy_imports()
+    assert set(lazy_imports) == set(omnipy.__all__) - {'PlainModel'}
+    assert set(lazy_imports) <= set(dir(omnipy))
+
+
+def test_lazy_import_of_public_attributes() -> None:
+    from omnipy.data.model import Model
+
+    assert omnipy.Model is Model
+    assert omnipy.__dict__['Model'] is Model
+
+    for name in omnipy._get_lazy_imports():
+        assert getattr(omnipy, name) is not None
+
+
+def test_lazy_import_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match='no_such_attribute'):
+        omnipy.no_such_attribute  # type: ignore[attr-defined]
+
+    with pytest.raises(ImportError):
+        from omnipy import no_such_attribute  # type: ignore[attr-defined] # noqa: F401
+
+
+def test_cold_import_does_not_load_heavy_modules() -> None:
+    heavy_modules = [
+        'omnipy.components.isa',
+        'omnipy.data.model',
+        'omnipy.hub.runtime',
+        'aiohttp',
+        'pandas',
+        'prefect',
+        'rich',
+    ]
+    code = ('import sys; import omnipy; '
+            f'print([mod for mod in {heavy_modules!r} if mod in sys.modules])')
+    output = subprocess.run([sys.executable, '-c', code],
+                            check=True,
+                            capture_output=True,
+                            text=True).stdout
+    assert output.strip() == '[]'
+
+
+def test_flow_runs_without_accessing_runtime_first(tmp_path: Path) -> None:
+    code = dedent("""\
+        from omnipy import JsonDictOfDictsDataset, transpose_dict_of_dicts_2_list_of_dicts
+        dataset = JsonDictOfDictsDataset({'a': {'x': {'k': 1}}})
+        print(transpose_dict_of_dicts_2_list_of_dicts.run(dataset).to_data())
+        """)
+    output = subprocess.run([sys.executable, '-c', code],
+                            cwd=tmp_path,
+                            check=True,
+                            capture_output=True,
+                            text=True).stdout
+    assert output.strip().splitlines()[-1] == "{'x': [{'_omnipy_id': 'a', 'k': 1}]}"
+
+
+def test_data_classes_set_up_runtime_when_first_used(tmp_path: Path) -> None:
+    code = dedent("""\
+        import logging
+        import sys
+        from omnipy.data.dataset import Dataset
+        from omnipy.data.model import Model
+        print('omnipy.hub.runtime' in sys.modules)
+        dataset = Dataset[Model[int]](a=1)
+        print('omnipy.hub.runtime' in sys.modules, len(logging.getLogger().handlers) > 0)
+        """)
+    output = subprocess.run([sys.executable, '-c', code],
+                            cwd=tmp_path,
+                            check=True,
+                            capture_output=True,
+                            text=True).stdout
+    assert output.strip().splitlines()[-2:] == ['False', 'True True']
@@ -0,0 +1,60 @@
+"""Tests for the memory-budget cache."""
+
+import threading
+
+from omnipy.util.budget_cache import MemoryBudgetCache, MemoryBudgetCacheInfo
+
+
+def test_memory_budget_cache() -> None:
+    cache = MemoryBudgetCache[str, str](max_bytes=10, get_num_bytes=len)
+    assert len(cache) == 0
+    assert cache.get('a') is None
+
+    cache['a'] = 'aaaa'
+    cache['b'] = 'bbbb'
+    assert 'a' in cache
+    assert cache.get('a') == 'aaaa'
+    assert cache.cache_info() == MemoryBudgetCacheInfo(
+        hits=1, misses=1, num_entries=2, num_bytes=8, max_bytes=10)
+
+    # 'b' is least recently used
+    cache['c'] = 'cccc'
+    assert 'b' not in cache
+    assert list(cache.get(key) for key in 'ac') == ['aaaa', 'cccc']
+    assert cache.cache_info().num_bytes == 8
+
+    cache['a'] = 'a'
+    assert cache.get('a') == 'a'
+    assert cache.cache_info().num_bytes == 5
+
+    cache['d'] = 'd' * 11
+    assert 'd' not in cache
+    assert len(cache) == 2
+
+    cache['e'] = 'e' * 10
+    assert list(cache.get(key) for key in 'ace') == [None, None, 'e' * 10]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.cache_info().num_bytes == 0
+
+
+def test_memory_budget_cache_shared_lock() -> None:
+    lock = threading.RLock()
+    cache = MemoryBudgetCache[str, str](10, len, lock=lock)
+    other_cache = MemoryBudgetCache[str, str](10, len, lock=lock)
+
+    def _set_from_other_thread() -> None:
+        cache['a'] = 'aaaa'
+        other_cache['b'] = 'bbbb'
+
+    with lock:
+        thread = threading.Thread(target=_set_from_other_thread)
+        thread.start()
+        thread.join(timeout=0.1)
+        assert thread.is_alive()
+        assert len(cache) == len(other_cache) == 0
+
+    thread.join()
+    assert cache.get('a') == 'aaaa'
+    assert other_cache.get('b') == 'bbbb'
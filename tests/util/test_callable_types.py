@@ -235,3 +235,20 @@ def test_decorate_result_by_type(case: CallableTypeCase) -> None:
 
     assert _execute_call(case, decorated_call) == case.expected_result
     assert state == [*case.expected_events, 'finished']
+
+
+def test_decorate_result_by_type_keeps_task() -> None:
+    state: list[str] = []
+
+    async def _return_task() -> None:
+        task = asyncio.create_task(asyncio.sleep(0, result='result'))
+        decorated_call = decorate_result_by_type(
+            on_finished=lambda: state.append('finished'))(lambda: task)
+
+        assert decorated_call() is task
+        assert state == []
+        assert await task == 'result'
+        await asyncio.sleep(0)
+        assert state == ['finished']
+
+    asyncio.run(_return_task())